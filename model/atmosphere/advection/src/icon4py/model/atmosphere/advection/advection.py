@@ -8,8 +8,10 @@
 
 from abc import ABC, abstractmethod
 from enum import Enum, auto
+import copy
 import dataclasses
 import logging
+from collections.abc import Sequence
 from typing import Optional
 
 import icon4py.model.common.grid.states as grid_states
@@ -30,12 +32,14 @@ from icon4py.model.atmosphere.advection.stencils.apply_interpolated_tracer_time_
 from icon4py.model.atmosphere.advection.stencils.copy_cell_kdim_field import copy_cell_kdim_field
 
 from icon4py.model.common import (
+    compilation,
     dimension as dims,
     field_type_aliases as fa,
     type_alias as ta,
 )
 from icon4py.model.common.decomposition import definitions as decomposition
 from icon4py.model.common.grid import horizontal as h_grid, icon as icon_grid, geometry
+from icon4py.model.common.states import tracer_state
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 
@@ -133,7 +137,7 @@ class Advection(ABC):
     Runs one three-dimensional advection step.
 
     Missing advection-specific features:
-        -tracer loops: currently the `run` method only advects one type of tracer at once
+        -tracer-specific configuration: `run_tracers` advects all tracers with the same schemes
         -optional tendency output: depending on the physics package, opt_ddt_tracer_adv might be needed
         -maximum advection height: tracer-specific control over which levels are used for advection
     """
@@ -160,6 +164,106 @@ class Advection(ABC):
         """
         ...
 
+    def run_tracers(
+        self,
+        diagnostic_state: advection_states.AdvectionDiagnosticState,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        tracers_now: tracer_state.TracerState,
+        tracers_new: tracer_state.TracerState,
+        dtime: ta.wpfloat,
+        grf_tend_tracers: Optional[tracer_state.TracerState] = None,
+    ):
+        """
+        Run an advection step for all tracers of a tracer state.
+
+        This default implementation calls :meth:`run` once per tracer. For
+        :class:`GodunovSplittingAdvection` this would flip the order of the Godunov splitting
+        after every tracer, so it overrides this method to advect all tracers in the same order
+        and flips the order once per step, as sequential calls of :meth:`run` on granules with the
+        same order would.
+
+        Args:
+            diagnostic_state: output argument, data class that contains diagnostic variables, the
+                tracer fluxes are the ones of the last tracer
+            prep_adv: input argument, data class that contains precalculated advection fields
+            tracers_now: input argument, current tracer mass fractions
+            tracers_new: output argument, new tracer mass fractions
+            dtime: input argument, the time step
+            grf_tend_tracers: input argument, tracer tendencies for use in grid refinement,
+                by default the tendency of `diagnostic_state` is used for all tracers
+
+        """
+        for p_tracer_now, p_tracer_new, grf_tend_tracer in _zip_tracers(
+            diagnostic_state, tracers_now, tracers_new, grf_tend_tracers
+        ):
+            self.run(
+                dataclasses.replace(diagnostic_state, grf_tend_tracer=grf_tend_tracer),
+                prep_adv,
+                p_tracer_now,
+                p_tracer_new,
+                dtime,
+            )
+
+    def compile_tasks(
+        self,
+        diagnostic_state: advection_states.AdvectionDiagnosticState,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracer_now: fa.CellKField[ta.wpfloat],
+        p_tracer_new: fa.CellKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+    ) -> list[compilation.CompileTask]:
+        """
+        Record the program calls of :meth:`run` for ahead of time compilation.
+
+        Two steps are recorded to cover both orders of the Godunov splitting, see
+        :func:`compilation.record_program_calls`. The arguments are only used to determine the
+        argument types and are not modified.
+        """
+        if getattr(self, "_backend", None) is None:
+            return []
+        diagnostic_state, prep_adv, p_tracer_now, p_tracer_new = copy.deepcopy(
+            (diagnostic_state, prep_adv, p_tracer_now, p_tracer_new)
+        )
+        with compilation.record_program_calls(self) as tasks:
+            for _ in range(2):
+                self.run(diagnostic_state, prep_adv, p_tracer_now, p_tracer_new, dtime)
+        return tasks
+
+    def precompile(
+        self,
+        diagnostic_state: advection_states.AdvectionDiagnosticState,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracer_now: fa.CellKField[ta.wpfloat],
+        p_tracer_new: fa.CellKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Compile all programs used by :meth:`run` concurrently."""
+        compilation.compile_all(
+            self.compile_tasks(diagnostic_state, prep_adv, p_tracer_now, p_tracer_new, dtime),
+            max_workers=max_workers,
+        )
+
+
+def _zip_tracers(
+    diagnostic_state: advection_states.AdvectionDiagnosticState,
+    tracers_now: tracer_state.TracerState,
+    tracers_new: tracer_state.TracerState,
+    grf_tend_tracers: Optional[tracer_state.TracerState],
+) -> list[tuple[fa.CellKField[ta.wpfloat], fa.CellKField[ta.wpfloat], fa.CellKField[ta.wpfloat]]]:
+    """Pair the fields of the tracers with their tendency for grid refinement."""
+    names = [field.name for field in dataclasses.fields(tracer_state.TracerState)]
+    return [
+        (
+            getattr(tracers_now, name),
+            getattr(tracers_new, name),
+            diagnostic_state.grf_tend_tracer
+            if grf_tend_tracers is None
+            else getattr(grf_tend_tracers, name),
+        )
+        for name in names
+    ]
+
 
 class NoAdvection(Advection):
     """Class that implements disabled three-dimensional advection."""
@@ -276,12 +380,54 @@ class GodunovSplittingAdvection(Advection):
         p_tracer_new: fa.CellKField[ta.wpfloat],
         dtime: ta.wpfloat,
     ):
+        self._run(
+            diagnostic_state=diagnostic_state,
+            prep_adv=prep_adv,
+            tracers=[(p_tracer_now, p_tracer_new, diagnostic_state.grf_tend_tracer)],
+            dtime=dtime,
+        )
+
+    def run_tracers(
+        self,
+        diagnostic_state: advection_states.AdvectionDiagnosticState,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        tracers_now: tracer_state.TracerState,
+        tracers_new: tracer_state.TracerState,
+        dtime: ta.wpfloat,
+        grf_tend_tracers: Optional[tracer_state.TracerState] = None,
+    ):
+        """
+        Run an advection step for all tracers of a tracer state.
+
+        The density increment, the backward trajectories and the Courant numbers do not depend
+        on the tracer and are computed once for all tracers, the halos of the new tracers are
+        exchanged together at the end of the step.
+        """
+        self._run(
+            diagnostic_state=diagnostic_state,
+            prep_adv=prep_adv,
+            tracers=_zip_tracers(diagnostic_state, tracers_now, tracers_new, grf_tend_tracers),
+            dtime=dtime,
+        )
+
+    def _run(
+        self,
+        diagnostic_state: advection_states.AdvectionDiagnosticState,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        tracers: Sequence[
+            tuple[fa.CellKField[ta.wpfloat], fa.CellKField[ta.wpfloat], fa.CellKField[ta.wpfloat]]
+        ],
+        dtime: ta.wpfloat,
+    ):
+        """Advect the (now, new, grf tendency) triples of `tracers` in one step."""
         log.debug("advection run - start")
 
         log.debug("communication of prep_adv cell field: mass_flx_ic - start")
         self._exchange.exchange_and_wait(dims.CellDim, prep_adv.mass_flx_ic)
         log.debug("communication of prep_adv cell field: mass_flx_ic - end")
 
+        ## tracer-independent part
+
         # reintegrate density for conservation of mass
         rhodz_in, horizontal_start = (
             (diagnostic_state.airmass_now, self._start_cell_lateral_boundary_level_2)
@@ -305,10 +451,52 @@ class GodunovSplittingAdvection(Advection):
         )
         log.debug("running stencil apply_density_increment - end")
 
+        # backward trajectories and Courant numbers
+        self._horizontal_advection.prepare(prep_adv=prep_adv, dtime=dtime)
+        self._vertical_advection.prepare(
+            prep_adv=prep_adv,
+            rhodz_now=(diagnostic_state.airmass_now if self._even_timestep else self._rhodz_ast2),
+            dtime=dtime,
+            even_timestep=self._even_timestep,
+        )
+
+        ## tracer-specific part
+
+        for p_tracer_now, p_tracer_new, grf_tend_tracer in tracers:
+            self._advect_tracer(
+                diagnostic_state=diagnostic_state,
+                prep_adv=prep_adv,
+                p_tracer_now=p_tracer_now,
+                p_tracer_new=p_tracer_new,
+                grf_tend_tracer=grf_tend_tracer,
+                dtime=dtime,
+            )
+
+        # exchange updated tracer values, originally happens only if iforcing /= inwp
+        log.debug("communication of advection cell fields: p_tracer_new - start")
+        self._exchange.exchange_and_wait(
+            dims.CellDim, *(p_tracer_new for _, p_tracer_new, _ in tracers)
+        )
+        log.debug("communication of advection cell fields: p_tracer_new - end")
+
+        # finalize step
+        self._even_timestep = not self._even_timestep
+
+        log.debug("advection run - end")
+
+    def _advect_tracer(
+        self,
+        diagnostic_state: advection_states.AdvectionDiagnosticState,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracer_now: fa.CellKField[ta.wpfloat],
+        p_tracer_new: fa.CellKField[ta.wpfloat],
+        grf_tend_tracer: fa.CellKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+    ):
         # Godunov splitting
         if self._even_timestep:
             # vertical transport
-            self._vertical_advection.run(
+            self._vertical_advection.advect(
                 prep_adv=prep_adv,
                 p_tracer_now=p_tracer_now,
                 p_tracer_new=p_tracer_new,
@@ -320,7 +508,7 @@ class GodunovSplittingAdvection(Advection):
             )
 
             # horizontal transport
-            self._horizontal_advection.run(
+            self._horizontal_advection.advect(
                 prep_adv=prep_adv,
                 p_tracer_now=p_tracer_new,
                 p_tracer_new=p_tracer_new,
@@ -332,7 +520,7 @@ class GodunovSplittingAdvection(Advection):
 
         else:
             # horizontal transport
-            self._horizontal_advection.run(
+            self._horizontal_advection.advect(
                 prep_adv=prep_adv,
                 p_tracer_now=p_tracer_now,
                 p_tracer_new=p_tracer_new,
@@ -343,7 +531,7 @@ class GodunovSplittingAdvection(Advection):
             )
 
             # vertical transport
-            self._vertical_advection.run(
+            self._vertical_advection.advect(
                 prep_adv=prep_adv,
                 p_tracer_now=p_tracer_new,
                 p_tracer_new=p_tracer_new,
@@ -359,7 +547,7 @@ class GodunovSplittingAdvection(Advection):
             log.debug("running stencil apply_interpolated_tracer_time_tendency - start")
             self._apply_interpolated_tracer_time_tendency(
                 p_tracer_now=p_tracer_now,
-                p_grf_tend_tracer=diagnostic_state.grf_tend_tracer,
+                p_grf_tend_tracer=grf_tend_tracer,
                 p_tracer_new=p_tracer_new,
                 p_dtime=dtime,
                 horizontal_start=self._start_cell_lateral_boundary,
@@ -370,16 +558,6 @@ class GodunovSplittingAdvection(Advection):
             )
             log.debug("running stencil apply_interpolated_tracer_time_tendency - end")
 
-        # exchange updated tracer values, originally happens only if iforcing /= inwp
-        log.debug("communication of advection cell field: p_tracer_new - start")
-        self._exchange.exchange_and_wait(dims.CellDim, p_tracer_new)
-        log.debug("communication of advection cell field: p_tracer_new - end")
-
-        # finalize step
-        self._even_timestep = not self._even_timestep
-
-        log.debug("advection run - end")
-
 
 def convert_config_to_horizontal_vertical_advection(
     config: AdvectionConfig,
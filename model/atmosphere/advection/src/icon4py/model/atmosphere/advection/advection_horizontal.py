@@ -297,7 +297,6 @@ class SecondOrderMiura(SemiLagrangianTracerFlux):
 class HorizontalAdvection(ABC):
     """Class that does one horizontal advection step."""
 
-    @abstractmethod
     def run(
         self,
         prep_adv: advection_states.AdvectionPrepAdvState,
@@ -311,6 +310,51 @@ class HorizontalAdvection(ABC):
         """
         Run a horizontal advection step.
 
+        Args:
+            prep_adv: input argument, data class that contains precalculated advection fields
+            p_tracer_now: input argument, field that contains current tracer mass fraction
+            p_tracer_new: output argument, field that contains new tracer mass fraction
+            rhodz_now: input argument, field that contains current air mass in each layer
+            rhodz_new: input argument, field that contains new air mass in each layer
+            p_mflx_tracer_h: output argument, field that contains new horizontal tracer mass flux
+            dtime: input argument, the time step
+
+        """
+        self.prepare(prep_adv=prep_adv, dtime=dtime)
+        self.advect(
+            prep_adv=prep_adv,
+            p_tracer_now=p_tracer_now,
+            p_tracer_new=p_tracer_new,
+            rhodz_now=rhodz_now,
+            rhodz_new=rhodz_new,
+            p_mflx_tracer_h=p_mflx_tracer_h,
+            dtime=dtime,
+        )
+
+    def prepare(self, prep_adv: advection_states.AdvectionPrepAdvState, dtime: ta.wpfloat):
+        """
+        Compute the tracer-independent fields of a horizontal advection step.
+
+        Args:
+            prep_adv: input argument, data class that contains precalculated advection fields
+            dtime: input argument, the time step
+        """
+        ...
+
+    @abstractmethod
+    def advect(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracer_now: fa.CellKField[ta.wpfloat],
+        p_tracer_new: fa.CellKField[ta.wpfloat],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        rhodz_new: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_h: fa.EdgeKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+    ):
+        """
+        Advect one tracer horizontally, using the fields of the last call of :meth:`prepare`.
+
         Args:
             prep_adv: input argument, data class that contains precalculated advection fields
             p_tracer_now: input argument, field that contains current tracer mass fraction
@@ -344,7 +388,7 @@ class NoAdvection(HorizontalAdvection):
 
         log.debug("horizontal advection class init - end")
 
-    def run(
+    def advect(
         self,
         prep_adv: advection_states.AdvectionPrepAdvState,
         p_tracer_now: fa.CellKField[ta.wpfloat],
@@ -374,7 +418,7 @@ class NoAdvection(HorizontalAdvection):
 class FiniteVolume(HorizontalAdvection):
     """Class that defines a finite volume horizontal advection scheme."""
 
-    def run(
+    def advect(
         self,
         prep_adv: advection_states.AdvectionPrepAdvState,
         p_tracer_now: fa.CellKField[ta.wpfloat],
@@ -494,17 +538,8 @@ class SemiLagrangian(FiniteVolume):
 
         log.debug("horizontal advection class init - end")
 
-    def _compute_numerical_flux(
-        self,
-        prep_adv: advection_states.AdvectionPrepAdvState,
-        p_tracer_now: fa.CellKField[ta.wpfloat],
-        rhodz_now: fa.CellKField[ta.wpfloat],
-        p_mflx_tracer_h: fa.EdgeKField[ta.wpfloat],
-        dtime: ta.wpfloat,
-    ):
-        log.debug("horizontal numerical flux computation - start")
-
-        ## tracer-independent part
+    def prepare(self, prep_adv: advection_states.AdvectionPrepAdvState, dtime: ta.wpfloat):
+        log.debug("horizontal advection preparation - start")
 
         # compute tangential velocity
         log.debug("running stencil compute_edge_tangential - start")
@@ -542,7 +577,17 @@ class SemiLagrangian(FiniteVolume):
         )
         log.debug("running stencil compute_barycentric_backtrajectory_alt - end")
 
-        ## tracer-specific part
+        log.debug("horizontal advection preparation - end")
+
+    def _compute_numerical_flux(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracer_now: fa.CellKField[ta.wpfloat],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_h: fa.EdgeKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+    ):
+        log.debug("horizontal numerical flux computation - start")
 
         self._tracer_flux.compute_tracer_flux(
             prep_adv=prep_adv,
@@ -352,7 +352,6 @@ class SemiMonotonicLimiter(VerticalLimiter):
 class VerticalAdvection(ABC):
     """Class that does one vertical advection step."""
 
-    @abstractmethod
     def run(
         self,
         prep_adv: advection_states.AdvectionPrepAdvState,
@@ -384,6 +383,56 @@ class VerticalAdvection(ABC):
             Horizontal advection is always called with the same indices though, i.e.
                 i_rlstart = grf_bdywidth_c+1, i_rlend = min_rlcell_int
         """
+        self.prepare(
+            prep_adv=prep_adv, rhodz_now=rhodz_now, dtime=dtime, even_timestep=even_timestep
+        )
+        self.advect(
+            prep_adv=prep_adv,
+            p_tracer_now=p_tracer_now,
+            p_tracer_new=p_tracer_new,
+            rhodz_now=rhodz_now,
+            rhodz_new=rhodz_new,
+            p_mflx_tracer_v=p_mflx_tracer_v,
+            dtime=dtime,
+            even_timestep=even_timestep,
+        )
+
+    def prepare(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+        even_timestep: bool = False,
+    ):
+        """
+        Compute the tracer-independent fields of a vertical advection step.
+
+        Args:
+            prep_adv: input argument, data class that contains precalculated advection fields
+            rhodz_now: input argument, field that contains current air mass in each layer
+            dtime: input argument, the time step
+            even_timestep: input argument, determines whether halo points are included
+        """
+        ...
+
+    @abstractmethod
+    def advect(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracer_now: fa.CellKField[ta.wpfloat],
+        p_tracer_new: fa.CellKField[ta.wpfloat],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        rhodz_new: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_v: fa.CellKField[ta.wpfloat],  # TODO (dastrm): should be KHalfDim
+        dtime: ta.wpfloat,
+        even_timestep: bool = False,
+    ):
+        """
+        Advect one tracer vertically, using the fields of the last call of :meth:`prepare`.
+
+        The arguments are the same as for :meth:`run`, `rhodz_now`, `dtime` and `even_timestep`
+        have to be the ones :meth:`prepare` was called with.
+        """
         ...
 
 
@@ -421,7 +470,7 @@ class NoAdvection(VerticalAdvection):
 
         return horizontal_start, horizontal_end
 
-    def run(
+    def advect(
         self,
         prep_adv: advection_states.AdvectionPrepAdvState,
         p_tracer_now: fa.CellKField[ta.wpfloat],
@@ -456,7 +505,7 @@ class NoAdvection(VerticalAdvection):
 class FiniteVolume(VerticalAdvection):
     """Class that defines a finite volume vertical advection scheme."""
 
-    def run(
+    def advect(
         self,
         prep_adv: advection_states.AdvectionPrepAdvState,
         p_tracer_now: fa.CellKField[ta.wpfloat],
@@ -760,16 +809,14 @@ class PiecewiseParabolicMethod(FiniteVolume):
 
         return horizontal_start, horizontal_end
 
-    def _compute_numerical_flux(
+    def prepare(
         self,
         prep_adv: advection_states.AdvectionPrepAdvState,
-        p_tracer_now: fa.CellKField[ta.wpfloat],
         rhodz_now: fa.CellKField[ta.wpfloat],
-        p_mflx_tracer_v: fa.CellKField[ta.wpfloat],  # TODO (dastrm): should be KHalfDim
         dtime: ta.wpfloat,
-        even_timestep: bool,
+        even_timestep: bool = False,
     ):
-        log.debug("vertical numerical flux computation - start")
+        log.debug("vertical advection preparation - start")
 
         horizontal_start, horizontal_end = self._get_horizontal_start_end(
             even_timestep=even_timestep
@@ -807,6 +854,23 @@ class PiecewiseParabolicMethod(FiniteVolume):
         )
         log.debug("running stencil compute_ppm4gpu_courant_number - end")
 
+        log.debug("vertical advection preparation - end")
+
+    def _compute_numerical_flux(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracer_now: fa.CellKField[ta.wpfloat],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_v: fa.CellKField[ta.wpfloat],  # TODO (dastrm): should be KHalfDim
+        dtime: ta.wpfloat,
+        even_timestep: bool,
+    ):
+        log.debug("vertical numerical flux computation - start")
+
+        horizontal_start, horizontal_end = self._get_horizontal_start_end(
+            even_timestep=even_timestep
+        )
+
         ## reconstruct face values
 
         # compute slope
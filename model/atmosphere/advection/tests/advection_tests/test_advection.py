@@ -6,10 +6,17 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import copy
+import dataclasses
+
+import gt4py.next as gtx
+import numpy as np
 import pytest
 
-from icon4py.model.atmosphere.advection import advection
+from icon4py.model.atmosphere.advection import advection, advection_states
 from icon4py.model.common import dimension as dims
+from icon4py.model.common.grid import simple, states as grid_states
+from icon4py.model.common.states import tracer_state
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 from .utils import (
@@ -158,3 +165,221 @@ def test_advection_run_single_step(
         p_tracer_new_ref=p_tracer_new_ref,
         even_timestep=even_timestep,
     )
+
+
+@pytest.mark.embedded_remap_error
+@pytest.mark.datatest
+@pytest.mark.parametrize(
+    "date, even_timestep, ntracer, horizontal_advection_type, horizontal_advection_limiter, vertical_advection_type, vertical_advection_limiter",
+    [
+        (
+            "2021-06-20T12:00:10.000",
+            False,
+            1,
+            advection.HorizontalAdvectionType.LINEAR_2ND_ORDER,
+            advection.HorizontalAdvectionLimiter.POSITIVE_DEFINITE,
+            advection.VerticalAdvectionType.NO_ADVECTION,
+            advection.VerticalAdvectionLimiter.NO_LIMITER,
+        ),
+        (
+            "2021-06-20T12:00:10.000",
+            False,
+            4,
+            advection.HorizontalAdvectionType.NO_ADVECTION,
+            advection.HorizontalAdvectionLimiter.NO_LIMITER,
+            advection.VerticalAdvectionType.PPM_3RD_ORDER,
+            advection.VerticalAdvectionLimiter.SEMI_MONOTONIC,
+        ),
+    ],
+)
+def test_advection_run_tracers(
+    grid_savepoint,
+    icon_grid,
+    interpolation_savepoint,
+    metrics_savepoint,
+    advection_init_savepoint,
+    advection_exit_savepoint,
+    data_provider,
+    backend,
+    even_timestep,
+    ntracer,
+    horizontal_advection_type,
+    horizontal_advection_limiter,
+    vertical_advection_type,
+    vertical_advection_limiter,
+):
+    config = construct_config(
+        horizontal_advection_type=horizontal_advection_type,
+        horizontal_advection_limiter=horizontal_advection_limiter,
+        vertical_advection_type=vertical_advection_type,
+        vertical_advection_limiter=vertical_advection_limiter,
+    )
+    advection_granule = advection.convert_config_to_advection(
+        config=config,
+        grid=icon_grid,
+        interpolation_state=construct_interpolation_state(interpolation_savepoint, backend=backend),
+        least_squares_state=construct_least_squares_state(interpolation_savepoint, backend=backend),
+        metric_state=construct_metric_state(icon_grid, metrics_savepoint, backend=backend),
+        edge_params=grid_savepoint.construct_edge_geometry(),
+        cell_params=grid_savepoint.construct_cell_geometry(),
+        even_timestep=even_timestep,
+        backend=backend,
+    )
+
+    diagnostic_state = construct_diagnostic_init_state(
+        icon_grid, advection_init_savepoint, ntracer, backend=backend
+    )
+    prep_adv = construct_prep_adv(advection_init_savepoint)
+    p_tracer_now = advection_init_savepoint.tracer(ntracer)
+    names = [field.name for field in dataclasses.fields(tracer_state.TracerState)]
+    # the same tracer is advected as every tracer of the state
+    tracers_now = tracer_state.TracerState(
+        **{name: data_alloc.as_field(p_tracer_now, backend=backend) for name in names}
+    )
+    tracers_new = tracer_state.TracerState(
+        **{
+            name: data_alloc.zero_field(icon_grid, dims.CellDim, dims.KDim, backend=backend)
+            for name in names
+        }
+    )
+    dtime = advection_init_savepoint.get_metadata("dtime").get("dtime")
+
+    advection_granule.run_tracers(
+        diagnostic_state=diagnostic_state,
+        prep_adv=prep_adv,
+        tracers_now=tracers_now,
+        tracers_new=tracers_new,
+        dtime=dtime,
+    )
+
+    diagnostic_state_ref = construct_diagnostic_exit_state(
+        icon_grid, advection_exit_savepoint, ntracer, backend=backend
+    )
+    p_tracer_new_ref = advection_exit_savepoint.tracer(ntracer)
+    for name in names:
+        verify_advection_fields(
+            grid=icon_grid,
+            diagnostic_state=diagnostic_state,
+            diagnostic_state_ref=diagnostic_state_ref,
+            p_tracer_new=getattr(tracers_new, name),
+            p_tracer_new_ref=p_tracer_new_ref,
+            even_timestep=even_timestep,
+        )
+
+
+class _GlobalSimpleGrid(simple.SimpleGrid):
+    """SimpleGrid with the `limited_area` attribute of the IconGrid used by the advection."""
+
+    @property
+    def limited_area(self) -> bool:
+        return self.config.limited_area
+
+
+@pytest.mark.parametrize("even_timestep", [False, True])
+def test_run_tracers_equals_sequential_run(backend, even_timestep):
+    grid = _GlobalSimpleGrid()
+
+    def random_field(*dims_, **kwargs):
+        return data_alloc.random_field(grid, *dims_, backend=backend, **kwargs)
+
+    def random_cec_field():
+        # SimpleGrid has no size for CECDim, C2E2C has three neighbors
+        return gtx.as_field(
+            (dims.CECDim,), np.random.default_rng().random(grid.num_cells * 3), allocator=backend
+        )
+
+    config = construct_config(
+        horizontal_advection_type=advection.HorizontalAdvectionType.LINEAR_2ND_ORDER,
+        horizontal_advection_limiter=advection.HorizontalAdvectionLimiter.POSITIVE_DEFINITE,
+        vertical_advection_type=advection.VerticalAdvectionType.PPM_3RD_ORDER,
+        vertical_advection_limiter=advection.VerticalAdvectionLimiter.SEMI_MONOTONIC,
+    )
+    interpolation_state = advection_states.AdvectionInterpolationState(
+        geofac_div=random_field(dims.CEDim),
+        rbf_vec_coeff_e=random_field(dims.EdgeDim, dims.E2C2EDim),
+        pos_on_tplane_e_1=random_field(dims.ECDim),
+        pos_on_tplane_e_2=random_field(dims.ECDim),
+    )
+    least_squares_state = advection_states.AdvectionLeastSquaresState(
+        lsq_pseudoinv_1=random_cec_field(), lsq_pseudoinv_2=random_cec_field()
+    )
+    metric_state = advection_states.AdvectionMetricState(
+        deepatmo_divh=random_field(dims.KDim),
+        deepatmo_divzl=random_field(dims.KDim),
+        deepatmo_divzu=random_field(dims.KDim),
+        ddqz_z_full=random_field(dims.CellDim, dims.KDim, low=1.0, high=2.0),
+    )
+    edge_params = grid_states.EdgeParams(
+        primal_normal_cell_x=random_field(dims.ECDim),
+        primal_normal_cell_y=random_field(dims.ECDim),
+        dual_normal_cell_x=random_field(dims.ECDim),
+        dual_normal_cell_y=random_field(dims.ECDim),
+    )
+
+    def construct_advection():
+        return advection.convert_config_to_advection(
+            config=config,
+            grid=grid,
+            interpolation_state=interpolation_state,
+            least_squares_state=least_squares_state,
+            metric_state=metric_state,
+            edge_params=edge_params,
+            cell_params=grid_states.CellParams(),
+            even_timestep=even_timestep,
+            backend=backend,
+        )
+
+    diagnostic_state = advection_states.AdvectionDiagnosticState(
+        airmass_now=random_field(dims.CellDim, dims.KDim, low=1.0, high=2.0),
+        airmass_new=random_field(dims.CellDim, dims.KDim, low=1.0, high=2.0),
+        grf_tend_tracer=random_field(dims.CellDim, dims.KDim),
+        hfl_tracer=random_field(dims.EdgeDim, dims.KDim),
+        vfl_tracer=random_field(dims.CellDim, dims.KDim, extend={dims.KDim: 1}),
+    )
+    prep_adv = advection_states.AdvectionPrepAdvState(
+        vn_traj=random_field(dims.EdgeDim, dims.KDim),
+        mass_flx_me=random_field(dims.EdgeDim, dims.KDim),
+        mass_flx_ic=random_field(dims.CellDim, dims.KDim, extend={dims.KDim: 1}),
+    )
+    names = [field.name for field in dataclasses.fields(tracer_state.TracerState)]
+    tracers_now = tracer_state.TracerState(
+        **{name: random_field(dims.CellDim, dims.KDim, low=0.0, high=1.0) for name in names}
+    )
+    tracers_new = tracer_state.TracerState(
+        **{
+            name: data_alloc.zero_field(grid, dims.CellDim, dims.KDim, backend=backend)
+            for name in names
+        }
+    )
+    tracers_new_ref = copy.deepcopy(tracers_new)
+    diagnostic_state_ref = copy.deepcopy(diagnostic_state)
+
+    advection_granule = construct_advection()
+    advection_granule.run_tracers(
+        diagnostic_state=diagnostic_state,
+        prep_adv=prep_adv,
+        tracers_now=tracers_now,
+        tracers_new=tracers_new,
+        dtime=2.0,
+    )
+    # every tracer is advected with the same order of the Godunov splitting
+    for name in names:
+        construct_advection().run(
+            diagnostic_state=diagnostic_state_ref,
+            prep_adv=prep_adv,
+            p_tracer_now=getattr(tracers_now, name),
+            p_tracer_new=getattr(tracers_new_ref, name),
+            dtime=2.0,
+        )
+
+    assert advection_granule._even_timestep is not even_timestep
+    for name in names:
+        assert np.allclose(
+            getattr(tracers_new, name).asnumpy(), getattr(tracers_new_ref, name).asnumpy()
+        )
+    assert np.allclose(
+        diagnostic_state.hfl_tracer.asnumpy(), diagnostic_state_ref.hfl_tracer.asnumpy()
+    )
+    assert np.allclose(
+        diagnostic_state.vfl_tracer.asnumpy(), diagnostic_state_ref.vfl_tracer.asnumpy()
+    )
@@ -6,6 +6,7 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import copy
 import dataclasses
 import enum
 import functools
@@ -52,7 +53,12 @@ from icon4py.model.atmosphere.diffusion.stencils.truly_horizontal_diffusion_nabl
 from icon4py.model.atmosphere.diffusion.stencils.update_theta_and_exner import (
     update_theta_and_exner,
 )
-from icon4py.model.common import field_type_aliases as fa, constants, dimension as dims
+from icon4py.model.common import (
+    compilation,
+    field_type_aliases as fa,
+    constants,
+    dimension as dims,
+)
 from icon4py.model.common.decomposition import definitions as decomposition
 from icon4py.model.common.grid import (
     horizontal as h_grid,
@@ -63,7 +69,7 @@ from icon4py.model.common.interpolation.stencils.mo_intp_rbf_rbf_vec_interpol_ve
     mo_intp_rbf_rbf_vec_interpol_vertex,
 )
 
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import data_allocation as data_alloc, scratch_pool
 
 from icon4py.model.common.orchestration import decorator as dace_orchestration
 
@@ -77,6 +83,9 @@ Supports only diffusion_type (=hdiff_order) 5 from the diffusion namelist.
 # flake8: noqa
 log = logging.getLogger(__name__)
 
+#: phase of the temporaries of the granule in the :class:`scratch_pool.ScratchPool`
+_SCRATCH_PHASE: Final = "diffusion"
+
 
 class DiffusionType(int, enum.Enum):
     """
@@ -371,10 +380,12 @@ class Diffusion:
         backend: Optional[gtx_backend.Backend],
         orchestration: bool = False,
         exchange: decomposition.ExchangeRuntime = decomposition.SingleNodeExchange(),
+        scratch: Optional[scratch_pool.ScratchPool] = None,
     ):
         self._backend = backend
         self._orchestration = orchestration
         self._exchange = exchange
+        self._scratch = scratch if scratch is not None else scratch_pool.ScratchPool(backend)
         self.config = config
         self._params = params
         self._grid = grid
@@ -477,23 +488,24 @@ class Diffusion:
         self.diff_multfac_n2w = data_alloc.zero_field(self._grid, dims.KDim, backend=self._backend)
         self.smag_limit = data_alloc.zero_field(self._grid, dims.KDim, backend=self._backend)
         self.enh_smag_fac = data_alloc.zero_field(self._grid, dims.KDim, backend=self._backend)
-        self.u_vert = data_alloc.zero_field(
-            self._grid, dims.VertexDim, dims.KDim, backend=self._backend
+        # temporaries which are only live during a call of the granule
+        self.u_vert = self._scratch.zero_field(
+            self._grid, dims.VertexDim, dims.KDim, phase=_SCRATCH_PHASE
         )
-        self.v_vert = data_alloc.zero_field(
-            self._grid, dims.VertexDim, dims.KDim, backend=self._backend
+        self.v_vert = self._scratch.zero_field(
+            self._grid, dims.VertexDim, dims.KDim, phase=_SCRATCH_PHASE
         )
-        self.kh_smag_e = data_alloc.zero_field(
-            self._grid, dims.EdgeDim, dims.KDim, backend=self._backend
+        self.kh_smag_e = self._scratch.zero_field(
+            self._grid, dims.EdgeDim, dims.KDim, phase=_SCRATCH_PHASE
         )
-        self.kh_smag_ec = data_alloc.zero_field(
-            self._grid, dims.EdgeDim, dims.KDim, backend=self._backend
+        self.kh_smag_ec = self._scratch.zero_field(
+            self._grid, dims.EdgeDim, dims.KDim, phase=_SCRATCH_PHASE
         )
-        self.z_nabla2_e = data_alloc.zero_field(
-            self._grid, dims.EdgeDim, dims.KDim, backend=self._backend
+        self.z_nabla2_e = self._scratch.zero_field(
+            self._grid, dims.EdgeDim, dims.KDim, phase=_SCRATCH_PHASE
         )
-        self.z_temp = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_temp = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_SCRATCH_PHASE
         )
         self.diff_multfac_smag = data_alloc.zero_field(self._grid, dims.KDim, backend=self._backend)
         # TODO(Magdalena): this is KHalfDim
@@ -506,8 +518,8 @@ class Diffusion:
         self.horizontal_edge_index = data_alloc.index_field(
             self._grid, dims.EdgeDim, backend=self._backend
         )
-        self.w_tmp = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=self._backend
+        self.w_tmp = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, phase=_SCRATCH_PHASE
         )
 
     def _determine_horizontal_domains(self):
@@ -572,6 +584,7 @@ class Diffusion:
             smag_limit,
             offset_provider={},
         )
+        self._scratch.enter(_SCRATCH_PHASE)
         self._do_diffusion_step(
             diagnostic_state, prognostic_state, dtime, diff_multfac_vn, smag_limit, 0.0
         )
@@ -588,7 +601,7 @@ class Diffusion:
 
         runs a diffusion step for the parameter linit=False, within regular time loop.
         """
-
+        self._scratch.enter(_SCRATCH_PHASE)
         self._do_diffusion_step(
             diagnostic_state=diagnostic_state,
             prognostic_state=prognostic_state,
@@ -598,6 +611,43 @@ class Diffusion:
             smag_offset=self.smag_offset,
         )
 
+    def compile_tasks(
+        self,
+        diagnostic_state: diffusion_states.DiffusionDiagnosticState,
+        prognostic_state: prognostics.PrognosticState,
+        dtime: float,
+        with_initial_run: bool = True,
+    ) -> list[compilation.CompileTask]:
+        """
+        Record the program calls of :meth:`run` and :meth:`initial_run` for ahead of time compilation.
+
+        See :func:`compilation.record_program_calls`. The states are only used to determine the
+        argument types and are not modified. Orchestrated diffusion is compiled by DaCe and
+        records nothing.
+        """
+        if self._backend is None or self._orchestration:
+            return []
+        diagnostic_state, prognostic_state = copy.deepcopy((diagnostic_state, prognostic_state))
+        with compilation.record_program_calls(self) as tasks:
+            if with_initial_run:
+                self.initial_run(diagnostic_state, prognostic_state, dtime)
+            self.run(diagnostic_state, prognostic_state, dtime)
+        return tasks
+
+    def precompile(
+        self,
+        diagnostic_state: diffusion_states.DiffusionDiagnosticState,
+        prognostic_state: prognostics.PrognosticState,
+        dtime: float,
+        with_initial_run: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Compile all programs used by :meth:`run` and :meth:`initial_run` concurrently."""
+        compilation.compile_all(
+            self.compile_tasks(diagnostic_state, prognostic_state, dtime, with_initial_run),
+            max_workers=max_workers,
+        )
+
     def _sync_cell_fields(self, prognostic_state):
         """
         Communicate theta_v, exner and w.
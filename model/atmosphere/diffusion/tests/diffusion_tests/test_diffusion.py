@@ -413,6 +413,7 @@ def test_verify_diffusion_init_against_savepoint(
 )
 @pytest.mark.parametrize("ndyn_substeps", [2])
 @pytest.mark.parametrize("orchestration", [False, True])
+@pytest.mark.parametrize("precompile", [False, True])
 def test_run_diffusion_single_step(
     savepoint_diffusion_init,
     savepoint_diffusion_exit,
@@ -426,6 +427,7 @@ def test_run_diffusion_single_step(
     ndyn_substeps,
     backend,
     orchestration,
+    precompile,
 ):
     if orchestration and not helpers.is_dace(backend):
         pytest.skip("Orchestration test requires a dace backend.")
@@ -502,6 +504,13 @@ def test_run_diffusion_single_step(
     verify_diffusion_fields(config, diagnostic_state, prognostic_state, savepoint_diffusion_init)
     assert savepoint_diffusion_init.fac_bdydiff_v() == diffusion_granule.fac_bdydiff_v
 
+    if precompile:
+        # recording the program calls must leave the states untouched
+        diffusion_granule.precompile(diagnostic_state, prognostic_state, dtime)
+        verify_diffusion_fields(
+            config, diagnostic_state, prognostic_state, savepoint_diffusion_init
+        )
+
     diffusion_granule.run(
         diagnostic_state=diagnostic_state,
         prognostic_state=prognostic_state,
@@ -7,8 +7,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # ruff: noqa: ERA001, B008
 
+import copy
 import logging
 import dataclasses
+import itertools
 from typing import Final, Optional
 
 import gt4py.next as gtx
@@ -17,9 +19,9 @@ from gt4py.next import backend as gtx_backend
 import icon4py.model.atmosphere.dycore.solve_nonhydro_stencils as nhsolve_stencils
 import icon4py.model.common.grid.states as grid_states
 import icon4py.model.common.utils as common_utils
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import data_allocation as data_alloc, scratch_pool
 
-from icon4py.model.common import constants
+from icon4py.model.common import compilation, constants
 from icon4py.model.atmosphere.dycore.stencils.init_cell_kdim_field_with_zero_wp import (
     init_cell_kdim_field_with_zero_wp,
 )
@@ -161,6 +163,13 @@ import enum
 # flake8: noqa
 log = logging.getLogger(__name__)
 
+#: phases of the temporaries of the granule in the :class:`scratch_pool.ScratchPool`, the velocity
+#: advection of the predictor step has its own phase and the one of the corrector step runs in _CORRECTOR_PHASE
+_PREDICTOR_PHASE: Final = "solve_nonhydro.predictor"
+_CORRECTOR_PHASE: Final = "solve_nonhydro.corrector"
+#: temporaries carrying data from the predictor to the corrector step
+_TIME_STEP_PHASES: Final = (_PREDICTOR_PHASE, _CORRECTOR_PHASE)
+
 
 class TimeSteppingScheme(enum.IntEnum):
     """Parameter called `itime_scheme` in ICON namelist."""
@@ -258,28 +267,30 @@ class IntermediateFields:
         cls,
         grid: grid_def.BaseGrid,
         backend: Optional[gtx_backend.Backend] = None,
+        scratch: Optional[scratch_pool.ScratchPool] = None,
     ):
+        """
+        Allocate the fields, the ones only live during a time step are taken from `scratch` if given.
+        """
+
+        def zero_field(*dims_, **kwargs):
+            if scratch is None:
+                return data_alloc.zero_field(grid, *dims_, **kwargs, backend=backend)
+            return scratch.zero_field(grid, *dims_, **kwargs, phase=_TIME_STEP_PHASES)
+
         return IntermediateFields(
-            z_gradh_exner=data_alloc.zero_field(grid, dims.EdgeDim, dims.KDim, backend=backend),
-            z_alpha=data_alloc.zero_field(
-                grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=backend
-            ),
-            z_beta=data_alloc.zero_field(grid, dims.CellDim, dims.KDim, backend=backend),
-            z_w_expl=data_alloc.zero_field(
-                grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=backend
-            ),
-            z_exner_expl=data_alloc.zero_field(grid, dims.CellDim, dims.KDim, backend=backend),
-            z_q=data_alloc.zero_field(
-                grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=backend
-            ),
-            z_contr_w_fl_l=data_alloc.zero_field(
-                grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=backend
-            ),
-            z_rho_e=data_alloc.zero_field(grid, dims.EdgeDim, dims.KDim, backend=backend),
-            z_theta_v_e=data_alloc.zero_field(grid, dims.EdgeDim, dims.KDim, backend=backend),
-            z_graddiv_vn=data_alloc.zero_field(grid, dims.EdgeDim, dims.KDim, backend=backend),
-            z_rho_expl=data_alloc.zero_field(grid, dims.CellDim, dims.KDim, backend=backend),
-            z_dwdz_dd=data_alloc.zero_field(grid, dims.CellDim, dims.KDim, backend=backend),
+            z_gradh_exner=zero_field(dims.EdgeDim, dims.KDim),
+            z_alpha=zero_field(dims.CellDim, dims.KDim, extend={dims.KDim: 1}),
+            z_beta=zero_field(dims.CellDim, dims.KDim),
+            z_w_expl=zero_field(dims.CellDim, dims.KDim, extend={dims.KDim: 1}),
+            z_exner_expl=zero_field(dims.CellDim, dims.KDim),
+            z_q=zero_field(dims.CellDim, dims.KDim, extend={dims.KDim: 1}),
+            z_contr_w_fl_l=zero_field(dims.CellDim, dims.KDim, extend={dims.KDim: 1}),
+            z_rho_e=zero_field(dims.EdgeDim, dims.KDim),
+            z_theta_v_e=zero_field(dims.EdgeDim, dims.KDim),
+            z_graddiv_vn=zero_field(dims.EdgeDim, dims.KDim),
+            z_rho_expl=zero_field(dims.CellDim, dims.KDim),
+            z_dwdz_dd=zero_field(dims.CellDim, dims.KDim),
             horizontal_kinetic_energy_at_edges_on_model_levels=data_alloc.zero_field(
                 grid, dims.EdgeDim, dims.KDim, backend=backend
             ),
@@ -324,6 +335,9 @@ class NonHydrostaticConfig:
         divdamp_z2: float = 40000.0,
         divdamp_z3: float = 60000.0,
         divdamp_z4: float = 80000.0,
+        reduced_precision_halo_fields: tuple[str, ...] = (),
+        replay_time_steps: bool = False,
+        fuse_programs: bool = False,
     ):
         # parameters from namelist diffusion_nml
         self.itime_scheme: int = itime_scheme
@@ -384,6 +398,18 @@ class NonHydrostaticConfig:
         #: IAU weight for dynamics fields
         self.iau_wgt_dyn: float = iau_wgt_dyn
 
+        #: names of :class:`IntermediateFields` whose halos are exchanged in single precision,
+        #: for example ("z_rho_e", "z_dwdz_dd") in mixed precision runs
+        self.reduced_precision_halo_fields: tuple[str, ...] = tuple(reduced_precision_halo_fields)
+
+        #: capture the compiled program calls of a time step on its first call and replay them for
+        #: later calls with the same arguments, see :class:`compilation.CapturedSteps`
+        self.replay_time_steps: bool = replay_time_steps
+
+        #: run the fused programs for the horizontal pressure gradient (stencils 18 to 22 and 24)
+        #: and the divergence damping (stencils 23 and 25 to 27) instead of the single stencils
+        self.fuse_programs: bool = fuse_programs
+
         self._validate()
 
     def _validate(self):
@@ -404,6 +430,12 @@ class NonHydrostaticConfig:
         if self.divdamp_type == DivergenceDampingType.COMBINED:
             raise NotImplementedError("divdamp_type with value 32 not yet implemented")
 
+        intermediate_fields = {f.name for f in dataclasses.fields(IntermediateFields)}
+        if not set(self.reduced_precision_halo_fields) <= intermediate_fields:
+            raise ValueError(
+                f"reduced_precision_halo_fields {set(self.reduced_precision_halo_fields) - intermediate_fields} are not fields of IntermediateFields"
+            )
+
 
 class NonHydrostaticParams:
     """Calculates derived quantities depending on the NonHydrostaticConfig."""
@@ -445,9 +477,11 @@ class SolveNonhydro:
         owner_mask: fa.CellField[bool],
         backend: Optional[gtx_backend.Backend],
         exchange: decomposition.ExchangeRuntime = decomposition.SingleNodeExchange(),
+        scratch: Optional[scratch_pool.ScratchPool] = None,
     ):
         self._exchange = exchange
         self._backend = backend
+        self._scratch = scratch if scratch is not None else scratch_pool.ScratchPool(backend)
 
         self._grid = grid
         self._config = config
@@ -613,6 +647,9 @@ class SolveNonhydro:
         self._stencils_42_44_45_45b = nhsolve_stencils.stencils_42_44_45_45b.with_backend(
             self._backend
         )
+        self._calculate_divdamp_fields = dycore_utils._calculate_divdamp_fields.with_backend(
+            self._backend
+        )
 
         self.velocity_advection = VelocityAdvection(
             grid,
@@ -622,6 +659,7 @@ class SolveNonhydro:
             edge_geometry,
             owner_mask,
             backend=self._backend,
+            scratch=self._scratch,
         )
         self._allocate_local_fields()
         self._determine_local_domains()
@@ -649,67 +687,69 @@ class SolveNonhydro:
         )
 
         self.p_test_run = True
+        self._captured_time_steps = compilation.CapturedSteps(self)
 
     def _allocate_local_fields(self):
-        self.z_exner_ex_pr = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=self._backend
+        # temporaries which are only live during the predictor and/or the corrector step
+        self.z_exner_ex_pr = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, phase=_PREDICTOR_PHASE
         )
-        self.z_exner_ic = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=self._backend
+        self.z_exner_ic = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, phase=_PREDICTOR_PHASE
         )
-        self.z_dexner_dz_c_1 = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_dexner_dz_c_1 = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_theta_v_pr_ic = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=self._backend
+        self.z_theta_v_pr_ic = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, phase=_TIME_STEP_PHASES
         )
-        self.z_th_ddz_exner_c = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_th_ddz_exner_c = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_TIME_STEP_PHASES
         )
-        self.z_rth_pr_1 = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_rth_pr_1 = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_rth_pr_2 = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_rth_pr_2 = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_grad_rth_1 = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_grad_rth_1 = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_grad_rth_2 = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_grad_rth_2 = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_grad_rth_3 = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_grad_rth_3 = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_grad_rth_4 = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_grad_rth_4 = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_dexner_dz_c_2 = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_dexner_dz_c_2 = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_hydro_corr = data_alloc.zero_field(
-            self._grid, dims.EdgeDim, dims.KDim, backend=self._backend
+        self.z_hydro_corr = self._scratch.zero_field(
+            self._grid, dims.EdgeDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_vn_avg = data_alloc.zero_field(
-            self._grid, dims.EdgeDim, dims.KDim, backend=self._backend
+        self.z_vn_avg = self._scratch.zero_field(
+            self._grid, dims.EdgeDim, dims.KDim, phase=_TIME_STEP_PHASES
         )
-        self.z_theta_v_fl_e = data_alloc.zero_field(
-            self._grid, dims.EdgeDim, dims.KDim, backend=self._backend
+        self.z_theta_v_fl_e = self._scratch.zero_field(
+            self._grid, dims.EdgeDim, dims.KDim, phase=_TIME_STEP_PHASES
         )
-        self.z_flxdiv_mass = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_flxdiv_mass = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_TIME_STEP_PHASES
         )
-        self.z_flxdiv_theta = data_alloc.zero_field(
-            self._grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.z_flxdiv_theta = self._scratch.zero_field(
+            self._grid, dims.CellDim, dims.KDim, phase=_TIME_STEP_PHASES
         )
-        self.z_rho_v = data_alloc.zero_field(
-            self._grid, dims.VertexDim, dims.KDim, backend=self._backend
+        self.z_rho_v = self._scratch.zero_field(
+            self._grid, dims.VertexDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_theta_v_v = data_alloc.zero_field(
-            self._grid, dims.VertexDim, dims.KDim, backend=self._backend
+        self.z_theta_v_v = self._scratch.zero_field(
+            self._grid, dims.VertexDim, dims.KDim, phase=_PREDICTOR_PHASE
         )
-        self.z_graddiv2_vn = data_alloc.zero_field(
-            self._grid, dims.EdgeDim, dims.KDim, backend=self._backend
+        self.z_graddiv2_vn = self._scratch.zero_field(
+            self._grid, dims.EdgeDim, dims.KDim, phase=_CORRECTOR_PHASE
         )
         self.k_field = data_alloc.index_field(
             self._grid, dims.KDim, extend={dims.KDim: 1}, backend=self._backend
@@ -729,8 +769,15 @@ class SolveNonhydro:
         self._bdy_divdamp = data_alloc.zero_field(self._grid, dims.KDim, backend=self._backend)
         self.scal_divdamp = data_alloc.zero_field(self._grid, dims.KDim, backend=self._backend)
         self.intermediate_fields = IntermediateFields.allocate(
-            grid=self._grid, backend=self._backend
+            grid=self._grid, backend=self._backend, scratch=self._scratch
         )
+        if self._config.reduced_precision_halo_fields:
+            self._exchange.use_reduced_precision(
+                *(
+                    getattr(self.intermediate_fields, name)
+                    for name in self._config.reduced_precision_halo_fields
+                )
+            )
 
     def _determine_local_domains(self):
         vertex_domain = h_grid.domain(dims.VertexDim)
@@ -795,9 +842,14 @@ class SolveNonhydro:
         lprep_adv: bool,
         at_first_substep: bool,
         at_last_substep: bool,
+        ndyn_substeps_var: Optional[int] = None,
     ):
         """
         Update prognostic variables (prognostic_states.next) after the dynamical process over one substep.
+
+        If `config.replay_time_steps` is set, the compiled program calls of the first call are
+        captured and replayed by later calls with the same states, scalars and flags.
+
         Args:
             diagnostic_state_nh: diagnostic variables used for solving the governing equations. It includes local variables and the physics tendency term that comes from physics
             prognostic_states: prognostic variables
@@ -808,7 +860,65 @@ class SolveNonhydro:
             lprep_adv: Preparation for tracer advection TODO (Chia Rui): add more detailed information here
             at_first_substep: first substep
             at_last_substep: last substep
+            ndyn_substeps_var: number of substeps of the current time step, it may differ from
+                config.ndyn_substeps_var if the number of substeps is adapted during the run.
+                Defaults to config.ndyn_substeps_var.
         """
+        if self._config.replay_time_steps and self._backend is not None:
+            key = compilation.argument_key(
+                diagnostic_state_nh,
+                prognostic_states,
+                prep_adv,
+                divdamp_fac_o2,
+                dtime,
+                at_initial_timestep,
+                lprep_adv,
+                at_first_substep,
+                at_last_substep,
+                ndyn_substeps_var,
+            )
+            self._captured_time_steps(
+                key,
+                lambda: self._run_time_step(
+                    diagnostic_state_nh,
+                    prognostic_states,
+                    prep_adv,
+                    divdamp_fac_o2,
+                    dtime,
+                    at_initial_timestep,
+                    lprep_adv,
+                    at_first_substep,
+                    at_last_substep,
+                    ndyn_substeps_var,
+                ),
+            )
+        else:
+            self._run_time_step(
+                diagnostic_state_nh,
+                prognostic_states,
+                prep_adv,
+                divdamp_fac_o2,
+                dtime,
+                at_initial_timestep,
+                lprep_adv,
+                at_first_substep,
+                at_last_substep,
+                ndyn_substeps_var,
+            )
+
+    def _run_time_step(
+        self,
+        diagnostic_state_nh: dycore_states.DiagnosticStateNonHydro,
+        prognostic_states: common_utils.TimeStepPair[prognostics.PrognosticState],
+        prep_adv: dycore_states.PrepAdvection,
+        divdamp_fac_o2: float,
+        dtime: float,
+        at_initial_timestep: bool,
+        lprep_adv: bool,
+        at_first_substep: bool,
+        at_last_substep: bool,
+        ndyn_substeps_var: Optional[int] = None,
+    ):
         log.info(
             f"running timestep: dtime = {dtime}, initial_timestep = {at_initial_timestep}, first_substep = {at_first_substep}, last_substep = {at_last_substep}, prep_adv = {lprep_adv}"
         )
@@ -847,6 +957,7 @@ class SolveNonhydro:
             lprep_adv=lprep_adv,
             at_first_substep=at_first_substep,
             at_last_substep=at_last_substep,
+            ndyn_substeps_var=ndyn_substeps_var,
         )
 
         if self._grid.limited_area:
@@ -893,6 +1004,62 @@ class SolveNonhydro:
             offset_provider={},
         )
 
+    def compile_tasks(
+        self,
+        diagnostic_state_nh: dycore_states.DiagnosticStateNonHydro,
+        prognostic_states: common_utils.TimeStepPair[prognostics.PrognosticState],
+        prep_adv: dycore_states.PrepAdvection,
+        divdamp_fac_o2: float,
+        dtime: float,
+        lprep_adv: bool,
+    ) -> list[compilation.CompileTask]:
+        """
+        Record the program calls of all variants of :meth:`time_step` for ahead of time compilation.
+
+        The substep flags of :meth:`time_step` select different programs, all their combinations
+        are recorded, see :func:`compilation.record_program_calls`. The states are only used to
+        determine the argument types and are not modified.
+        """
+        if self._backend is None:
+            return []
+        diagnostic_state_nh, prognostic_states, prep_adv = copy.deepcopy(
+            (diagnostic_state_nh, prognostic_states, prep_adv)
+        )
+        with compilation.record_program_calls(self) as tasks:
+            for at_initial_timestep, at_first_substep, at_last_substep in itertools.product(
+                (True, False), repeat=3
+            ):
+                self._run_time_step(
+                    diagnostic_state_nh,
+                    prognostic_states,
+                    prep_adv=prep_adv,
+                    divdamp_fac_o2=divdamp_fac_o2,
+                    dtime=dtime,
+                    at_initial_timestep=at_initial_timestep,
+                    lprep_adv=lprep_adv,
+                    at_first_substep=at_first_substep,
+                    at_last_substep=at_last_substep,
+                )
+        return tasks
+
+    def precompile(
+        self,
+        diagnostic_state_nh: dycore_states.DiagnosticStateNonHydro,
+        prognostic_states: common_utils.TimeStepPair[prognostics.PrognosticState],
+        prep_adv: dycore_states.PrepAdvection,
+        divdamp_fac_o2: float,
+        dtime: float,
+        lprep_adv: bool,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Compile all programs used by :meth:`time_step` (including velocity advection) concurrently."""
+        compilation.compile_all(
+            self.compile_tasks(
+                diagnostic_state_nh, prognostic_states, prep_adv, divdamp_fac_o2, dtime, lprep_adv
+            ),
+            max_workers=max_workers,
+        )
+
     # flake8: noqa: C901
     def run_predictor_step(
         self,
@@ -929,6 +1096,9 @@ class SolveNonhydro:
                 cell_areas=self._cell_params.area,
             )
 
+        # the temporaries of velocity advection may share fields with the ones of the predictor step
+        self._scratch.enter(_PREDICTOR_PHASE)
+
         #  Precompute Rayleigh damping factor
         self._compute_z_raylfac(
             rayleigh_w=self._metric_state_nonhydro.rayleigh_w,
@@ -1144,48 +1314,8 @@ class SolveNonhydro:
                     offset_provider=self._grid.offset_providers,
                 )
 
-        self._compute_horizontal_gradient_of_exner_pressure_for_flat_coordinates(
-            inv_dual_edge_length=self._edge_geometry.inverse_dual_edge_lengths,
-            z_exner_ex_pr=self.z_exner_ex_pr,
-            z_gradh_exner=z_fields.z_gradh_exner,
-            horizontal_start=self._start_edge_nudging_level_2,
-            horizontal_end=self._end_edge_local,
-            vertical_start=0,
-            vertical_end=self._vertical_params.nflatlev,
-            offset_provider=self._grid.offset_providers,
-        )
-
+        # the hydrostatic correction at the lowest level does not depend on the pressure gradient
         if self._config.igradp_method == HorizontalPressureDiscretizationType.TAYLOR_HYDRO:
-            if self._vertical_params.nflatlev < gtx.int32(self._vertical_params.nflat_gradp + 1):
-                self._compute_horizontal_gradient_of_exner_pressure_for_nonflat_coordinates(
-                    inv_dual_edge_length=self._edge_geometry.inverse_dual_edge_lengths,
-                    z_exner_ex_pr=self.z_exner_ex_pr,
-                    ddxn_z_full=self._metric_state_nonhydro.ddxn_z_full,
-                    c_lin_e=self._interpolation_state.c_lin_e,
-                    z_dexner_dz_c_1=self.z_dexner_dz_c_1,
-                    z_gradh_exner=z_fields.z_gradh_exner,
-                    horizontal_start=self._start_edge_nudging_level_2,
-                    horizontal_end=self._end_edge_local,
-                    vertical_start=self._vertical_params.nflatlev,
-                    vertical_end=gtx.int32(self._vertical_params.nflat_gradp + 1),
-                    offset_provider=self._grid.offset_providers,
-                )
-
-            self._compute_horizontal_gradient_of_exner_pressure_for_multiple_levels(
-                inv_dual_edge_length=self._edge_geometry.inverse_dual_edge_lengths,
-                z_exner_ex_pr=self.z_exner_ex_pr,
-                zdiff_gradp=self._metric_state_nonhydro.zdiff_gradp,
-                ikoffset=self._metric_state_nonhydro.vertoffset_gradp,
-                z_dexner_dz_c_1=self.z_dexner_dz_c_1,
-                z_dexner_dz_c_2=self.z_dexner_dz_c_2,
-                z_gradh_exner=z_fields.z_gradh_exner,
-                horizontal_start=self._start_edge_nudging_level_2,
-                horizontal_end=self._end_edge_local,
-                vertical_start=gtx.int32(self._vertical_params.nflat_gradp + 1),
-                vertical_end=self._grid.num_levels,
-                offset_provider=self._grid.offset_providers,
-            )
-
             self._compute_hydrostatic_correction_term(
                 theta_v=prognostic_states.current.theta_v,
                 ikoffset=self._metric_state_nonhydro.vertoffset_gradp,
@@ -1203,40 +1333,122 @@ class SolveNonhydro:
             )
 
             # TODO (Christoph) check when merging fused stencil
-            lowest_level = self._grid.num_levels - 1
-            hydro_corr_horizontal = gtx.as_field(
-                (dims.EdgeDim,),
-                self.z_hydro_corr.ndarray[:, lowest_level],
-                allocator=self._backend.allocator,
-            )
+            self._copy_lowest_level_of_hydro_corr()
 
-            self._apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure(
+        if self._config.fuse_programs:
+            self._compute_horizontal_pressure_gradient_and_update_vn(
+                inv_dual_edge_length=self._edge_geometry.inverse_dual_edge_lengths,
+                z_exner_ex_pr=self.z_exner_ex_pr,
+                ddxn_z_full=self._metric_state_nonhydro.ddxn_z_full,
+                c_lin_e=self._interpolation_state.c_lin_e,
+                zdiff_gradp=self._metric_state_nonhydro.zdiff_gradp,
+                ikoffset=self._metric_state_nonhydro.vertoffset_gradp,
+                z_dexner_dz_c_1=self.z_dexner_dz_c_1,
+                z_dexner_dz_c_2=self.z_dexner_dz_c_2,
                 ipeidx_dsl=self._metric_state_nonhydro.pg_edgeidx_dsl,
                 pg_exdist=self._metric_state_nonhydro.pg_exdist,
-                z_hydro_corr=hydro_corr_horizontal,
+                z_hydro_corr=self.z_hydro_corr_horizontal,
+                vn_nnow=prognostic_states.current.vn,
+                ddt_vn_apc_ntl1=diagnostic_state_nh.normal_wind_advective_tendency.predictor,
+                ddt_vn_phy=diagnostic_state_nh.ddt_vn_phy,
+                z_theta_v_e=z_fields.z_theta_v_e,
                 z_gradh_exner=z_fields.z_gradh_exner,
+                vn_nnew=prognostic_states.next.vn,
+                k_field=self.k_field,
+                nflatlev=self._vertical_params.nflatlev,
+                nflat_gradp=gtx.int32(self._vertical_params.nflat_gradp),
+                dtime=dtime,
+                cpd=constants.CPD,
                 horizontal_start=self._start_edge_nudging_level_2,
+                horizontal_end=self._end_edge_local,
+                vertical_start=0,
+                vertical_end=self._grid.num_levels,
+                offset_provider=self._grid.offset_providers,
+            )
+            # the single stencils apply the hydrostatic correction up to the end of the halo
+            self._apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure(
+                ipeidx_dsl=self._metric_state_nonhydro.pg_edgeidx_dsl,
+                pg_exdist=self._metric_state_nonhydro.pg_exdist,
+                z_hydro_corr=self.z_hydro_corr_horizontal,
+                z_gradh_exner=z_fields.z_gradh_exner,
+                horizontal_start=self._end_edge_local,
                 horizontal_end=self._end_edge_end,
                 vertical_start=0,
                 vertical_end=self._grid.num_levels,
                 offset_provider={},
             )
+        else:
+            self._compute_horizontal_gradient_of_exner_pressure_for_flat_coordinates(
+                inv_dual_edge_length=self._edge_geometry.inverse_dual_edge_lengths,
+                z_exner_ex_pr=self.z_exner_ex_pr,
+                z_gradh_exner=z_fields.z_gradh_exner,
+                horizontal_start=self._start_edge_nudging_level_2,
+                horizontal_end=self._end_edge_local,
+                vertical_start=0,
+                vertical_end=self._vertical_params.nflatlev,
+                offset_provider=self._grid.offset_providers,
+            )
 
-        self._add_temporal_tendencies_to_vn(
-            vn_nnow=prognostic_states.current.vn,
-            ddt_vn_apc_ntl1=diagnostic_state_nh.normal_wind_advective_tendency.predictor,
-            ddt_vn_phy=diagnostic_state_nh.ddt_vn_phy,
-            z_theta_v_e=z_fields.z_theta_v_e,
-            z_gradh_exner=z_fields.z_gradh_exner,
-            vn_nnew=prognostic_states.next.vn,
-            dtime=dtime,
-            cpd=constants.CPD,
-            horizontal_start=self._start_edge_nudging_level_2,
-            horizontal_end=self._end_edge_local,
-            vertical_start=0,
-            vertical_end=self._grid.num_levels,
-            offset_provider={},
-        )
+            if self._config.igradp_method == HorizontalPressureDiscretizationType.TAYLOR_HYDRO:
+                if self._vertical_params.nflatlev < gtx.int32(
+                    self._vertical_params.nflat_gradp + 1
+                ):
+                    self._compute_horizontal_gradient_of_exner_pressure_for_nonflat_coordinates(
+                        inv_dual_edge_length=self._edge_geometry.inverse_dual_edge_lengths,
+                        z_exner_ex_pr=self.z_exner_ex_pr,
+                        ddxn_z_full=self._metric_state_nonhydro.ddxn_z_full,
+                        c_lin_e=self._interpolation_state.c_lin_e,
+                        z_dexner_dz_c_1=self.z_dexner_dz_c_1,
+                        z_gradh_exner=z_fields.z_gradh_exner,
+                        horizontal_start=self._start_edge_nudging_level_2,
+                        horizontal_end=self._end_edge_local,
+                        vertical_start=self._vertical_params.nflatlev,
+                        vertical_end=gtx.int32(self._vertical_params.nflat_gradp + 1),
+                        offset_provider=self._grid.offset_providers,
+                    )
+
+                self._compute_horizontal_gradient_of_exner_pressure_for_multiple_levels(
+                    inv_dual_edge_length=self._edge_geometry.inverse_dual_edge_lengths,
+                    z_exner_ex_pr=self.z_exner_ex_pr,
+                    zdiff_gradp=self._metric_state_nonhydro.zdiff_gradp,
+                    ikoffset=self._metric_state_nonhydro.vertoffset_gradp,
+                    z_dexner_dz_c_1=self.z_dexner_dz_c_1,
+                    z_dexner_dz_c_2=self.z_dexner_dz_c_2,
+                    z_gradh_exner=z_fields.z_gradh_exner,
+                    horizontal_start=self._start_edge_nudging_level_2,
+                    horizontal_end=self._end_edge_local,
+                    vertical_start=gtx.int32(self._vertical_params.nflat_gradp + 1),
+                    vertical_end=self._grid.num_levels,
+                    offset_provider=self._grid.offset_providers,
+                )
+
+                self._apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure(
+                    ipeidx_dsl=self._metric_state_nonhydro.pg_edgeidx_dsl,
+                    pg_exdist=self._metric_state_nonhydro.pg_exdist,
+                    z_hydro_corr=self.z_hydro_corr_horizontal,
+                    z_gradh_exner=z_fields.z_gradh_exner,
+                    horizontal_start=self._start_edge_nudging_level_2,
+                    horizontal_end=self._end_edge_end,
+                    vertical_start=0,
+                    vertical_end=self._grid.num_levels,
+                    offset_provider={},
+                )
+
+            self._add_temporal_tendencies_to_vn(
+                vn_nnow=prognostic_states.current.vn,
+                ddt_vn_apc_ntl1=diagnostic_state_nh.normal_wind_advective_tendency.predictor,
+                ddt_vn_phy=diagnostic_state_nh.ddt_vn_phy,
+                z_theta_v_e=z_fields.z_theta_v_e,
+                z_gradh_exner=z_fields.z_gradh_exner,
+                vn_nnew=prognostic_states.next.vn,
+                dtime=dtime,
+                cpd=constants.CPD,
+                horizontal_start=self._start_edge_nudging_level_2,
+                horizontal_end=self._end_edge_local,
+                vertical_start=0,
+                vertical_end=self._grid.num_levels,
+                offset_provider={},
+            )
 
         if self._config.is_iau_active:
             self._add_analysis_increments_to_vn(
@@ -1566,6 +1778,12 @@ class SolveNonhydro:
             log.debug("exchanging prognostic field 'w'")
             self._exchange.exchange_and_wait(dims.CellDim, prognostic_states.next.w)
 
+    @compilation.replayable
+    def _copy_lowest_level_of_hydro_corr(self):
+        self.z_hydro_corr_horizontal.ndarray[:] = self.z_hydro_corr.ndarray[
+            :, self._grid.num_levels - 1
+        ]
+
     def run_corrector_step(
         self,
         diagnostic_state_nh: dycore_states.DiagnosticStateNonHydro,
@@ -1577,23 +1795,26 @@ class SolveNonhydro:
         lprep_adv: bool,
         at_first_substep: bool,
         at_last_substep: bool,
+        ndyn_substeps_var: Optional[int] = None,
     ):
+        self._scratch.enter(_CORRECTOR_PHASE)
         log.info(
             f"running corrector step: dtime = {dtime}, prep_adv = {lprep_adv},  "
             f"divdamp_fac_o2 = {divdamp_fac_o2}, at_first_substep = {at_first_substep}, at_last_substep = {at_last_substep}  "
         )
 
-        # TODO (magdalena) is it correct to to use a config parameter here? the actual number of substeps can vary dynmically...
-        #                  should this config parameter exist at all in SolveNonHydro?
+        # the number of substeps can be adapted during the run, the config value is only the default
+        if ndyn_substeps_var is None:
+            ndyn_substeps_var = self._config.ndyn_substeps_var
         # Inverse value of ndyn_substeps for tracer advection precomputations
-        r_nsubsteps = 1.0 / self._config.ndyn_substeps_var
+        r_nsubsteps = 1.0 / ndyn_substeps_var
 
         # scaling factor for second-order divergence damping: divdamp_fac_o2*delta_x**2
         # delta_x**2 is approximated by the mean cell area
         # Coefficient for reduced fourth-order divergence d
         scal_divdamp_o2 = divdamp_fac_o2 * self._cell_params.mean_cell_area
 
-        dycore_utils._calculate_divdamp_fields(
+        self._calculate_divdamp_fields(
             self.enh_divdamp_fac,
             gtx.int32(self._config.divdamp_order),
             self._cell_params.mean_cell_area,
@@ -1662,85 +1883,83 @@ class SolveNonhydro:
             offset_provider=self._grid.offset_providers,
         )
 
-        if self._config.itime_scheme == TimeSteppingScheme.MOST_EFFICIENT:
-            log.debug(f"corrector: start stencil 23")
-            self._add_temporal_tendencies_to_vn_by_interpolating_between_time_levels(
+        if self._config.fuse_programs:
+            log.debug("corrector: start stencils 23 to 27")
+            self._apply_divergence_damping_and_update_vn(
                 vn_nnow=prognostic_states.current.vn,
                 ddt_vn_apc_ntl1=diagnostic_state_nh.normal_wind_advective_tendency.predictor,
                 ddt_vn_apc_ntl2=diagnostic_state_nh.normal_wind_advective_tendency.corrector,
                 ddt_vn_phy=diagnostic_state_nh.ddt_vn_phy,
                 z_theta_v_e=z_fields.z_theta_v_e,
                 z_gradh_exner=z_fields.z_gradh_exner,
+                geofac_grdiv=self._interpolation_state.geofac_grdiv,
+                z_graddiv_vn=z_fields.z_graddiv_vn,
+                scal_divdamp=self.scal_divdamp,
+                bdy_divdamp=self._bdy_divdamp,
+                nudgecoeff_e=self._interpolation_state.nudgecoeff_e,
                 vn_nnew=prognostic_states.next.vn,
                 dtime=dtime,
                 wgt_nnow_vel=self._params.wgt_nnow_vel,
                 wgt_nnew_vel=self._params.wgt_nnew_vel,
                 cpd=constants.CPD,
-                horizontal_start=self._start_edge_nudging_level_2,
-                horizontal_end=self._end_edge_local,
-                vertical_start=0,
-                vertical_end=self._grid.num_levels,
-                offset_provider={},
-            )
-
-        if (
-            self._config.divdamp_order == DivergenceDampingOrder.COMBINED
-            or self._config.divdamp_order == DivergenceDampingOrder.FOURTH_ORDER
-        ):
-            # verified for e-10
-            log.debug(f"corrector start stencil 25")
-            self._compute_graddiv2_of_vn(
-                geofac_grdiv=self._interpolation_state.geofac_grdiv,
-                z_graddiv_vn=z_fields.z_graddiv_vn,
-                z_graddiv2_vn=self.z_graddiv2_vn,
-                horizontal_start=self._start_edge_nudging_level_2,
-                horizontal_end=self._end_edge_local,
-                vertical_start=0,
-                vertical_end=self._grid.num_levels,
-                offset_provider=self._grid.offset_providers,
-            )
-
-        if (
-            self._config.divdamp_order == DivergenceDampingOrder.COMBINED
-            and scal_divdamp_o2 > 1.0e-6
-        ):
-            log.debug(f"corrector: start stencil 26")
-            self._apply_2nd_order_divergence_damping(
-                z_graddiv_vn=z_fields.z_graddiv_vn,
-                vn=prognostic_states.next.vn,
                 scal_divdamp_o2=scal_divdamp_o2,
+                apply_2nd_order_divdamp=scal_divdamp_o2 > 1.0e-6,
+                apply_4th_order_divdamp=divdamp_fac_o2 <= 4 * self._config.divdamp_fac,
+                limited_area=self._grid.limited_area,
                 horizontal_start=self._start_edge_nudging_level_2,
                 horizontal_end=self._end_edge_local,
                 vertical_start=0,
                 vertical_end=self._grid.num_levels,
-                offset_provider={},
+                offset_provider=self._grid.offset_providers,
             )
-
-        # TODO: this does not get accessed in FORTRAN
-        if (
-            self._config.divdamp_order == DivergenceDampingOrder.COMBINED
-            and divdamp_fac_o2 <= 4 * self._config.divdamp_fac
-        ):
-            if self._grid.limited_area:
-                log.debug("corrector: start stencil 27")
-                self._apply_weighted_2nd_and_4th_order_divergence_damping(
-                    scal_divdamp=self.scal_divdamp,
-                    bdy_divdamp=self._bdy_divdamp,
-                    nudgecoeff_e=self._interpolation_state.nudgecoeff_e,
-                    z_graddiv2_vn=self.z_graddiv2_vn,
-                    vn=prognostic_states.next.vn,
+        else:
+            if self._config.itime_scheme == TimeSteppingScheme.MOST_EFFICIENT:
+                log.debug(f"corrector: start stencil 23")
+                self._add_temporal_tendencies_to_vn_by_interpolating_between_time_levels(
+                    vn_nnow=prognostic_states.current.vn,
+                    ddt_vn_apc_ntl1=diagnostic_state_nh.normal_wind_advective_tendency.predictor,
+                    ddt_vn_apc_ntl2=diagnostic_state_nh.normal_wind_advective_tendency.corrector,
+                    ddt_vn_phy=diagnostic_state_nh.ddt_vn_phy,
+                    z_theta_v_e=z_fields.z_theta_v_e,
+                    z_gradh_exner=z_fields.z_gradh_exner,
+                    vn_nnew=prognostic_states.next.vn,
+                    dtime=dtime,
+                    wgt_nnow_vel=self._params.wgt_nnow_vel,
+                    wgt_nnew_vel=self._params.wgt_nnew_vel,
+                    cpd=constants.CPD,
                     horizontal_start=self._start_edge_nudging_level_2,
                     horizontal_end=self._end_edge_local,
                     vertical_start=0,
                     vertical_end=self._grid.num_levels,
                     offset_provider={},
                 )
-            else:
-                log.debug("corrector start stencil 4th order divdamp")
-                self._apply_4th_order_divergence_damping(
-                    scal_divdamp=self.scal_divdamp,
+
+            if (
+                self._config.divdamp_order == DivergenceDampingOrder.COMBINED
+                or self._config.divdamp_order == DivergenceDampingOrder.FOURTH_ORDER
+            ):
+                # verified for e-10
+                log.debug(f"corrector start stencil 25")
+                self._compute_graddiv2_of_vn(
+                    geofac_grdiv=self._interpolation_state.geofac_grdiv,
+                    z_graddiv_vn=z_fields.z_graddiv_vn,
                     z_graddiv2_vn=self.z_graddiv2_vn,
+                    horizontal_start=self._start_edge_nudging_level_2,
+                    horizontal_end=self._end_edge_local,
+                    vertical_start=0,
+                    vertical_end=self._grid.num_levels,
+                    offset_provider=self._grid.offset_providers,
+                )
+
+            if (
+                self._config.divdamp_order == DivergenceDampingOrder.COMBINED
+                and scal_divdamp_o2 > 1.0e-6
+            ):
+                log.debug(f"corrector: start stencil 26")
+                self._apply_2nd_order_divergence_damping(
+                    z_graddiv_vn=z_fields.z_graddiv_vn,
                     vn=prognostic_states.next.vn,
+                    scal_divdamp_o2=scal_divdamp_o2,
                     horizontal_start=self._start_edge_nudging_level_2,
                     horizontal_end=self._end_edge_local,
                     vertical_start=0,
@@ -1748,6 +1967,38 @@ class SolveNonhydro:
                     offset_provider={},
                 )
 
+            # TODO: this does not get accessed in FORTRAN
+            if (
+                self._config.divdamp_order == DivergenceDampingOrder.COMBINED
+                and divdamp_fac_o2 <= 4 * self._config.divdamp_fac
+            ):
+                if self._grid.limited_area:
+                    log.debug("corrector: start stencil 27")
+                    self._apply_weighted_2nd_and_4th_order_divergence_damping(
+                        scal_divdamp=self.scal_divdamp,
+                        bdy_divdamp=self._bdy_divdamp,
+                        nudgecoeff_e=self._interpolation_state.nudgecoeff_e,
+                        z_graddiv2_vn=self.z_graddiv2_vn,
+                        vn=prognostic_states.next.vn,
+                        horizontal_start=self._start_edge_nudging_level_2,
+                        horizontal_end=self._end_edge_local,
+                        vertical_start=0,
+                        vertical_end=self._grid.num_levels,
+                        offset_provider={},
+                    )
+                else:
+                    log.debug("corrector start stencil 4th order divdamp")
+                    self._apply_4th_order_divergence_damping(
+                        scal_divdamp=self.scal_divdamp,
+                        z_graddiv2_vn=self.z_graddiv2_vn,
+                        vn=prognostic_states.next.vn,
+                        horizontal_start=self._start_edge_nudging_level_2,
+                        horizontal_end=self._end_edge_local,
+                        vertical_start=0,
+                        vertical_end=self._grid.num_levels,
+                        offset_provider={},
+                    )
+
         # TODO: this does not get accessed in FORTRAN
         if self._config.is_iau_active:
             log.debug("corrector start stencil 28")
@@ -2050,7 +2301,7 @@ class SolveNonhydro:
                 exner=prognostic_states.next.exner,
                 ddt_exner_phy=diagnostic_state_nh.ddt_exner_phy,
                 exner_dyn_incr=diagnostic_state_nh.exner_dyn_incr,
-                ndyn_substeps_var=float(self._config.ndyn_substeps_var),
+                ndyn_substeps_var=float(ndyn_substeps_var),
                 dtime=dtime,
                 horizontal_start=self._start_cell_nudging,
                 horizontal_end=self._end_cell_local,
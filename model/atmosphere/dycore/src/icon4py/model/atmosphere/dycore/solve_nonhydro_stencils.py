@@ -6,11 +6,29 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 import gt4py.next as gtx
-from gt4py.next.ffront.fbuiltins import where
+from gt4py.next.ffront.fbuiltins import broadcast, where
 
 from icon4py.model.atmosphere.dycore.dycore_utils import (
     _broadcast_zero_to_three_edge_kdim_fields_wp,
 )
+from icon4py.model.atmosphere.dycore.stencils.add_temporal_tendencies_to_vn import (
+    _add_temporal_tendencies_to_vn,
+)
+from icon4py.model.atmosphere.dycore.stencils.add_temporal_tendencies_to_vn_by_interpolating_between_time_levels import (
+    _add_temporal_tendencies_to_vn_by_interpolating_between_time_levels,
+)
+from icon4py.model.atmosphere.dycore.stencils.apply_2nd_order_divergence_damping import (
+    _apply_2nd_order_divergence_damping,
+)
+from icon4py.model.atmosphere.dycore.stencils.apply_4th_order_divergence_damping import (
+    _apply_4th_order_divergence_damping,
+)
+from icon4py.model.atmosphere.dycore.stencils.apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure import (
+    _apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure,
+)
+from icon4py.model.atmosphere.dycore.stencils.apply_weighted_2nd_and_4th_order_divergence_damping import (
+    _apply_weighted_2nd_and_4th_order_divergence_damping,
+)
 from icon4py.model.atmosphere.dycore.stencils.compute_contravariant_correction import (
     _compute_contravariant_correction,
 )
@@ -32,9 +50,21 @@ from icon4py.model.atmosphere.dycore.stencils.compute_explicit_vertical_wind_spe
 from icon4py.model.atmosphere.dycore.stencils.compute_first_vertical_derivative import (
     _compute_first_vertical_derivative,
 )
+from icon4py.model.atmosphere.dycore.stencils.compute_graddiv2_of_vn import (
+    _compute_graddiv2_of_vn,
+)
 from icon4py.model.atmosphere.dycore.stencils.compute_horizontal_advection_of_rho_and_theta import (
     _compute_horizontal_advection_of_rho_and_theta,
 )
+from icon4py.model.atmosphere.dycore.stencils.compute_horizontal_gradient_of_exner_pressure_for_flat_coordinates import (
+    _compute_horizontal_gradient_of_exner_pressure_for_flat_coordinates,
+)
+from icon4py.model.atmosphere.dycore.stencils.compute_horizontal_gradient_of_exner_pressure_for_multiple_levels import (
+    _compute_horizontal_gradient_of_exner_pressure_for_multiple_levels,
+)
+from icon4py.model.atmosphere.dycore.stencils.compute_horizontal_gradient_of_exner_pressure_for_nonflat_coordinates import (
+    _compute_horizontal_gradient_of_exner_pressure_for_nonflat_coordinates,
+)
 from icon4py.model.atmosphere.dycore.stencils.compute_horizontal_kinetic_energy import (
     _compute_horizontal_kinetic_energy,
 )
@@ -402,6 +432,235 @@ def compute_horizontal_advection_of_rho_and_theta(
     )
 
 
+@gtx.field_operator
+def _compute_horizontal_pressure_gradient_and_update_vn(
+    inv_dual_edge_length: fa.EdgeField[float],
+    z_exner_ex_pr: fa.CellKField[float],
+    ddxn_z_full: fa.EdgeKField[float],
+    c_lin_e: gtx.Field[gtx.Dims[dims.EdgeDim, dims.E2CDim], float],
+    zdiff_gradp: gtx.Field[gtx.Dims[dims.ECDim, dims.KDim], float],
+    ikoffset: gtx.Field[gtx.Dims[dims.ECDim, dims.KDim], gtx.int32],
+    z_dexner_dz_c_1: fa.CellKField[float],
+    z_dexner_dz_c_2: fa.CellKField[float],
+    ipeidx_dsl: fa.EdgeKField[bool],
+    pg_exdist: fa.EdgeKField[float],
+    z_hydro_corr: fa.EdgeField[float],
+    vn_nnow: fa.EdgeKField[float],
+    ddt_vn_apc_ntl1: fa.EdgeKField[float],
+    ddt_vn_phy: fa.EdgeKField[float],
+    z_theta_v_e: fa.EdgeKField[float],
+    k_field: fa.KField[gtx.int32],
+    nflatlev: gtx.int32,
+    nflat_gradp: gtx.int32,
+    dtime: float,
+    cpd: float,
+) -> tuple[fa.EdgeKField[float], fa.EdgeKField[float]]:
+    z_gradh_exner = where(
+        k_field < nflatlev,
+        _compute_horizontal_gradient_of_exner_pressure_for_flat_coordinates(
+            inv_dual_edge_length, z_exner_ex_pr
+        ),
+        where(
+            k_field < nflat_gradp + 1,
+            _compute_horizontal_gradient_of_exner_pressure_for_nonflat_coordinates(
+                inv_dual_edge_length, z_exner_ex_pr, ddxn_z_full, c_lin_e, z_dexner_dz_c_1
+            ),
+            _compute_horizontal_gradient_of_exner_pressure_for_multiple_levels(
+                inv_dual_edge_length,
+                z_exner_ex_pr,
+                zdiff_gradp,
+                ikoffset,
+                z_dexner_dz_c_1,
+                z_dexner_dz_c_2,
+            ),
+        ),
+    )
+    z_gradh_exner = _apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure(
+        ipeidx_dsl, pg_exdist, z_hydro_corr, z_gradh_exner
+    )
+    vn_nnew = _add_temporal_tendencies_to_vn(
+        vn_nnow, ddt_vn_apc_ntl1, ddt_vn_phy, z_theta_v_e, z_gradh_exner, dtime, cpd
+    )
+    return z_gradh_exner, vn_nnew
+
+
+@gtx.program(grid_type=gtx.GridType.UNSTRUCTURED)
+def compute_horizontal_pressure_gradient_and_update_vn(
+    inv_dual_edge_length: fa.EdgeField[float],
+    z_exner_ex_pr: fa.CellKField[float],
+    ddxn_z_full: fa.EdgeKField[float],
+    c_lin_e: gtx.Field[gtx.Dims[dims.EdgeDim, dims.E2CDim], float],
+    zdiff_gradp: gtx.Field[gtx.Dims[dims.ECDim, dims.KDim], float],
+    ikoffset: gtx.Field[gtx.Dims[dims.ECDim, dims.KDim], gtx.int32],
+    z_dexner_dz_c_1: fa.CellKField[float],
+    z_dexner_dz_c_2: fa.CellKField[float],
+    ipeidx_dsl: fa.EdgeKField[bool],
+    pg_exdist: fa.EdgeKField[float],
+    z_hydro_corr: fa.EdgeField[float],
+    vn_nnow: fa.EdgeKField[float],
+    ddt_vn_apc_ntl1: fa.EdgeKField[float],
+    ddt_vn_phy: fa.EdgeKField[float],
+    z_theta_v_e: fa.EdgeKField[float],
+    z_gradh_exner: fa.EdgeKField[float],
+    vn_nnew: fa.EdgeKField[float],
+    k_field: fa.KField[gtx.int32],
+    nflatlev: gtx.int32,
+    nflat_gradp: gtx.int32,
+    dtime: float,
+    cpd: float,
+    horizontal_start: gtx.int32,
+    horizontal_end: gtx.int32,
+    vertical_start: gtx.int32,
+    vertical_end: gtx.int32,
+):
+    """
+    Fused stencils 18 to 22 and 24 for the Taylor expansion of the horizontal pressure gradient.
+
+    The hydrostatic correction `z_hydro_corr` has to be computed beforehand (stencil 21).
+    """
+    _compute_horizontal_pressure_gradient_and_update_vn(
+        inv_dual_edge_length,
+        z_exner_ex_pr,
+        ddxn_z_full,
+        c_lin_e,
+        zdiff_gradp,
+        ikoffset,
+        z_dexner_dz_c_1,
+        z_dexner_dz_c_2,
+        ipeidx_dsl,
+        pg_exdist,
+        z_hydro_corr,
+        vn_nnow,
+        ddt_vn_apc_ntl1,
+        ddt_vn_phy,
+        z_theta_v_e,
+        k_field,
+        nflatlev,
+        nflat_gradp,
+        dtime,
+        cpd,
+        out=(z_gradh_exner, vn_nnew),
+        domain={
+            dims.EdgeDim: (horizontal_start, horizontal_end),
+            dims.KDim: (vertical_start, vertical_end),
+        },
+    )
+
+
+@gtx.field_operator
+def _apply_divergence_damping_and_update_vn(
+    vn_nnow: fa.EdgeKField[float],
+    ddt_vn_apc_ntl1: fa.EdgeKField[float],
+    ddt_vn_apc_ntl2: fa.EdgeKField[float],
+    ddt_vn_phy: fa.EdgeKField[float],
+    z_theta_v_e: fa.EdgeKField[float],
+    z_gradh_exner: fa.EdgeKField[float],
+    geofac_grdiv: gtx.Field[gtx.Dims[dims.EdgeDim, dims.E2C2EODim], float],
+    z_graddiv_vn: fa.EdgeKField[float],
+    scal_divdamp: fa.KField[float],
+    bdy_divdamp: fa.KField[float],
+    nudgecoeff_e: fa.EdgeField[float],
+    dtime: float,
+    wgt_nnow_vel: float,
+    wgt_nnew_vel: float,
+    cpd: float,
+    scal_divdamp_o2: float,
+    apply_2nd_order_divdamp: bool,
+    apply_4th_order_divdamp: bool,
+    limited_area: bool,
+) -> fa.EdgeKField[float]:
+    vn = _add_temporal_tendencies_to_vn_by_interpolating_between_time_levels(
+        vn_nnow,
+        ddt_vn_apc_ntl1,
+        ddt_vn_apc_ntl2,
+        ddt_vn_phy,
+        z_theta_v_e,
+        z_gradh_exner,
+        dtime,
+        wgt_nnow_vel,
+        wgt_nnew_vel,
+        cpd,
+    )
+    vn = where(
+        broadcast(apply_2nd_order_divdamp, (dims.EdgeDim, dims.KDim)),
+        _apply_2nd_order_divergence_damping(z_graddiv_vn, vn, scal_divdamp_o2),
+        vn,
+    )
+    z_graddiv2_vn = _compute_graddiv2_of_vn(geofac_grdiv, z_graddiv_vn)
+    vn = where(
+        broadcast(apply_4th_order_divdamp, (dims.EdgeDim, dims.KDim)),
+        where(
+            broadcast(limited_area, (dims.EdgeDim, dims.KDim)),
+            _apply_weighted_2nd_and_4th_order_divergence_damping(
+                scal_divdamp, bdy_divdamp, nudgecoeff_e, z_graddiv2_vn, vn
+            ),
+            _apply_4th_order_divergence_damping(scal_divdamp, z_graddiv2_vn, vn),
+        ),
+        vn,
+    )
+    return vn
+
+
+@gtx.program(grid_type=gtx.GridType.UNSTRUCTURED)
+def apply_divergence_damping_and_update_vn(
+    vn_nnow: fa.EdgeKField[float],
+    ddt_vn_apc_ntl1: fa.EdgeKField[float],
+    ddt_vn_apc_ntl2: fa.EdgeKField[float],
+    ddt_vn_phy: fa.EdgeKField[float],
+    z_theta_v_e: fa.EdgeKField[float],
+    z_gradh_exner: fa.EdgeKField[float],
+    geofac_grdiv: gtx.Field[gtx.Dims[dims.EdgeDim, dims.E2C2EODim], float],
+    z_graddiv_vn: fa.EdgeKField[float],
+    scal_divdamp: fa.KField[float],
+    bdy_divdamp: fa.KField[float],
+    nudgecoeff_e: fa.EdgeField[float],
+    vn_nnew: fa.EdgeKField[float],
+    dtime: float,
+    wgt_nnow_vel: float,
+    wgt_nnew_vel: float,
+    cpd: float,
+    scal_divdamp_o2: float,
+    apply_2nd_order_divdamp: bool,
+    apply_4th_order_divdamp: bool,
+    limited_area: bool,
+    horizontal_start: gtx.int32,
+    horizontal_end: gtx.int32,
+    vertical_start: gtx.int32,
+    vertical_end: gtx.int32,
+):
+    """
+    Fused stencils 23 and 25 to 27 for the combined divergence damping.
+
+    The second order divergence `z_graddiv2_vn` is not stored.
+    """
+    _apply_divergence_damping_and_update_vn(
+        vn_nnow,
+        ddt_vn_apc_ntl1,
+        ddt_vn_apc_ntl2,
+        ddt_vn_phy,
+        z_theta_v_e,
+        z_gradh_exner,
+        geofac_grdiv,
+        z_graddiv_vn,
+        scal_divdamp,
+        bdy_divdamp,
+        nudgecoeff_e,
+        dtime,
+        wgt_nnow_vel,
+        wgt_nnew_vel,
+        cpd,
+        scal_divdamp_o2,
+        apply_2nd_order_divdamp,
+        apply_4th_order_divdamp,
+        limited_area,
+        out=vn_nnew,
+        domain={
+            dims.EdgeDim: (horizontal_start, horizontal_end),
+            dims.KDim: (vertical_start, vertical_end),
+        },
+    )
+
+
 @gtx.field_operator
 def _predictor_stencils_35_36(
     vn: fa.EdgeKField[float],
@@ -9,7 +9,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Final, Optional
 
 import gt4py.next as gtx
 from gt4py.next import backend as gtx_backend
@@ -22,7 +22,7 @@ from icon4py.model.atmosphere.dycore.stencils import (
     compute_edge_diagnostics_for_velocity_advection,
     compute_maximum_cfl_and_clip_contravariant_vertical_velocity,
 )
-from icon4py.model.common import dimension as dims, field_type_aliases as fa
+from icon4py.model.common import compilation, dimension as dims, field_type_aliases as fa
 from icon4py.model.common.grid import (
     horizontal as h_grid,
     icon as icon_grid,
@@ -30,7 +30,15 @@ from icon4py.model.common.grid import (
     vertical as v_grid,
 )
 from icon4py.model.common.states import prognostic_state as prognostics
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import data_allocation as data_alloc, scratch_pool
+
+
+#: phases of the temporaries in the :class:`scratch_pool.ScratchPool`, the temporaries are written
+#: before they are read in both steps. The corrector step runs as part of the one of solve_nonhydro,
+#: the predictor step before the temporaries of the predictor step of solve_nonhydro are live.
+_PREDICTOR_PHASE: Final = "velocity_advection.predictor"
+_CORRECTOR_PHASE: Final = "solve_nonhydro.corrector"
+_SCRATCH_PHASES: Final = (_PREDICTOR_PHASE, _CORRECTOR_PHASE)
 
 
 class VelocityAdvection:
@@ -43,9 +51,11 @@ class VelocityAdvection:
         edge_params: grid_states.EdgeParams,
         owner_mask: fa.CellField[bool],
         backend: Optional[gtx_backend.Backend],
+        scratch: Optional[scratch_pool.ScratchPool] = None,
     ):
         self.grid: icon_grid.IconGrid = grid
         self._backend = backend
+        self._scratch = scratch if scratch is not None else scratch_pool.ScratchPool(backend)
         self.metric_state: dycore_states.MetricStateNonHydro = metric_state
         self.interpolation_state: dycore_states.InterpolationState = interpolation_state
         self.vertical_params = vertical_params
@@ -83,46 +93,47 @@ class VelocityAdvection:
         )
 
     def _allocate_local_fields(self):
-        self._horizontal_advection_of_w_at_edges_on_half_levels = data_alloc.zero_field(
-            self.grid, dims.EdgeDim, dims.KDim, backend=self._backend
+        self._horizontal_advection_of_w_at_edges_on_half_levels = self._scratch.zero_field(
+            self.grid, dims.EdgeDim, dims.KDim, phase=_SCRATCH_PHASES
         )
         """
         Declared as z_v_grad_w in ICON. vn dw/dn + vt dw/dt. NOTE THAT IT ONLY HAS nlev LEVELS because w[nlevp1-1] is diagnostic.
         """
 
-        self._horizontal_kinetic_energy_at_cells_on_model_levels = data_alloc.zero_field(
-            self.grid, dims.CellDim, dims.KDim, backend=self._backend
+        self._horizontal_kinetic_energy_at_cells_on_model_levels = self._scratch.zero_field(
+            self.grid, dims.CellDim, dims.KDim, phase=_SCRATCH_PHASES
         )
         """
         Declared as z_ekinh in ICON.
         """
 
-        self._contravariant_corrected_w_at_cells_on_half_levels = data_alloc.zero_field(
-            self.grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=self._backend
+        self._contravariant_corrected_w_at_cells_on_half_levels = self._scratch.zero_field(
+            self.grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, phase=_SCRATCH_PHASES
         )
         """
         Declared as z_w_con_c in ICON. w - (vn dz/dn + vt dz/dt), z is topography height
         """
 
-        self._contravariant_corrected_w_at_cells_on_model_levels = data_alloc.zero_field(
-            self.grid, dims.CellDim, dims.KDim, backend=self._backend
+        self._contravariant_corrected_w_at_cells_on_model_levels = self._scratch.zero_field(
+            self.grid, dims.CellDim, dims.KDim, phase=_SCRATCH_PHASES
         )
         """
         Declared as z_w_con_c_full in ICON. w - (vn dz/dn + vt dz/dt), z is topography height
         """
 
-        self.cfl_clipping = data_alloc.zero_field(
-            self.grid, dims.CellDim, dims.KDim, dtype=bool, backend=self._backend
+        self.cfl_clipping = self._scratch.zero_field(
+            self.grid, dims.CellDim, dims.KDim, dtype=bool, phase=_SCRATCH_PHASES
         )
         self.levmask = data_alloc.zero_field(
             self.grid, dims.KDim, dtype=bool, backend=self._backend
         )
-        self.vcfl_dsl = data_alloc.zero_field(
-            self.grid, dims.CellDim, dims.KDim, backend=self._backend
+        self.vcfl_dsl = self._scratch.zero_field(
+            self.grid, dims.CellDim, dims.KDim, phase=_SCRATCH_PHASES
         )
         self.k_field = data_alloc.index_field(
             self.grid, dims.KDim, extend={dims.KDim: 1}, backend=self._backend
         )
+        self._max_vertical_cfl = data_alloc.import_array_ns(self._backend).zeros(())
         self.cell_field = data_alloc.index_field(self.grid, dims.CellDim, backend=self._backend)
         self.edge_field = data_alloc.index_field(self.grid, dims.EdgeDim, backend=self._backend)
         self.vertex_field = data_alloc.index_field(self.grid, dims.VertexDim, backend=self._backend)
@@ -186,6 +197,7 @@ class VelocityAdvection:
             cell_areas: cell area [m^2]
         """
 
+        self._scratch.enter(_PREDICTOR_PHASE)
         cfl_w_limit, scalfac_exdiff = self._scale_factors_by_dtime(dtime)
 
         self._compute_derived_horizontal_winds_and_ke_and_horizontal_advection_of_w_and_contravariant_correction(
@@ -330,11 +342,43 @@ class VelocityAdvection:
             offset_provider=self.grid.offset_providers,
         )
 
+    @compilation.replayable
     def _update_levmask_from_cfl_clipping(self):
         xp = data_alloc.import_array_ns(self._backend)
-        self.levmask = gtx.as_field(
-            domain=(dims.KDim,), data=(xp.any(self.cfl_clipping.ndarray, 0)), dtype=bool
-        )
+        self.levmask.ndarray[:] = xp.any(self.cfl_clipping.ndarray, 0)
+
+    @compilation.replayable
+    def _update_max_vertical_cfl(self, dtime: float):
+        xp = data_alloc.import_array_ns(self._backend)
+        cells = slice(self._start_cell_lateral_boundary_level_4, self._end_cell_halo)
+        levels = slice(
+            max(3, self.vertical_params.end_index_of_damping_layer - 2) - 1,
+            self.grid.num_levels - 3,
+        )
+        # velocities are clipped to a CFL number of 0.85, vcfl holds the original CFL number of those points
+        max_cfl = xp.maximum(
+            xp.abs(self.vcfl_dsl.ndarray[cells, levels]).max(),
+            (
+                xp.abs(
+                    self._contravariant_corrected_w_at_cells_on_half_levels.ndarray[cells, levels]
+                )
+                / self.metric_state.ddqz_z_half.ndarray[cells, levels]
+            ).max()
+            * dtime,
+        )
+        self._max_vertical_cfl[...] = xp.maximum(self._max_vertical_cfl, max_cfl)
+
+    def pop_max_vertical_cfl(self) -> float:
+        """
+        Return the maximum vertical CFL number since the last call and reset it.
+
+        Corresponds to max_vcfl_dyn in ICON, but it is taken over all points of the range where
+        the velocities are clipped, in the corrector step. The reduction is done on the device, only
+        this call synchronizes.
+        """
+        max_vertical_cfl = float(self._max_vertical_cfl)
+        self._max_vertical_cfl[...] = 0.0
+        return max_vertical_cfl
 
     def _scale_factors_by_dtime(self, dtime):
         scaled_cfl_w_limit = self.cfl_w_limit / dtime
@@ -363,6 +407,7 @@ class VelocityAdvection:
             cell_areas: cell area [m^2]
         """
 
+        self._scratch.enter(_CORRECTOR_PHASE)
         cfl_w_limit, scalfac_exdiff = self._scale_factors_by_dtime(dtime)
 
         self._compute_horizontal_advection_of_w(
@@ -421,6 +466,7 @@ class VelocityAdvection:
         )
 
         self._update_levmask_from_cfl_clipping()
+        self._update_max_vertical_cfl(dtime)
 
         self._compute_advection_in_vertical_momentum_equation(
             contravariant_corrected_w_at_cells_on_model_levels=self._contravariant_corrected_w_at_cells_on_model_levels,
@@ -0,0 +1,105 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+from typing import Any
+
+import gt4py.next as gtx
+import numpy as np
+import pytest
+
+import icon4py.model.common.utils.data_allocation as data_alloc
+from icon4py.model.atmosphere.dycore.solve_nonhydro_stencils import (
+    apply_divergence_damping_and_update_vn,
+)
+from icon4py.model.common import dimension as dims, type_alias as ta
+from icon4py.model.common.grid import base
+from icon4py.model.common.states import utils as state_utils
+from icon4py.model.testing import helpers
+
+from . import (
+    test_add_temporal_tendencies_to_vn_by_interpolating_between_time_levels as stencil_23,
+    test_apply_2nd_order_divergence_damping as stencil_26,
+    test_apply_4th_order_divergence_damping as stencil_4th_order,
+    test_apply_weighted_2nd_and_4th_order_divergence_damping as stencil_27,
+    test_compute_graddiv2_of_vn as stencil_25,
+)
+
+
+class TestApplyDivergenceDampingAndUpdateVn(helpers.StencilTest):
+    PROGRAM = apply_divergence_damping_and_update_vn
+    OUTPUTS = ("vn_nnew",)
+    MARKERS = (pytest.mark.embedded_remap_error,)
+
+    @staticmethod
+    def reference(
+        connectivities: dict[gtx.Dimension, np.ndarray],
+        apply_2nd_order_divdamp: bool,
+        apply_4th_order_divdamp: bool,
+        limited_area: bool,
+        **kwargs: Any,
+    ) -> dict:
+        vn = stencil_23.TestAddTemporalTendenciesToVnByInterpolatingBetweenTimeLevels.reference(
+            connectivities, **kwargs
+        )["vn_nnew"]
+        if apply_2nd_order_divdamp:
+            vn = stencil_26.TestApply2ndOrderDivergenceDamping.reference(
+                connectivities, vn=vn, **kwargs
+            )["vn"]
+        if apply_4th_order_divdamp:
+            z_graddiv2_vn = stencil_25.TestComputeGraddiv2OfVn.reference(connectivities, **kwargs)[
+                "z_graddiv2_vn"
+            ]
+            fourth_order = (
+                stencil_27.TestApplyWeighted2ndAnd4thOrderDivergenceDamping
+                if limited_area
+                else stencil_4th_order.TestApply4thOrderDivergenceDamping
+            )
+            vn = fourth_order.reference(
+                connectivities, z_graddiv2_vn=z_graddiv2_vn, vn=vn, **kwargs
+            )["vn"]
+        return dict(vn_nnew=vn)
+
+    @pytest.fixture(
+        params=[(True, True, False), (True, True, True), (False, True, True), (True, False, False)],
+        ids=lambda p: "2nd={}-4th={}-limited_area={}".format(*p),
+    )
+    def input_data(
+        self, request: pytest.FixtureRequest, grid: base.BaseGrid
+    ) -> dict[str, gtx.Field | state_utils.ScalarType]:
+        apply_2nd_order_divdamp, apply_4th_order_divdamp, limited_area = request.param
+        return dict(
+            vn_nnow=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.wpfloat),
+            ddt_vn_apc_ntl1=data_alloc.random_field(
+                grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat
+            ),
+            ddt_vn_apc_ntl2=data_alloc.random_field(
+                grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat
+            ),
+            ddt_vn_phy=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat),
+            z_theta_v_e=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.wpfloat),
+            z_gradh_exner=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat),
+            geofac_grdiv=data_alloc.random_field(
+                grid, dims.EdgeDim, dims.E2C2EODim, dtype=ta.wpfloat
+            ),
+            z_graddiv_vn=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat),
+            scal_divdamp=data_alloc.random_field(grid, dims.KDim, dtype=ta.wpfloat),
+            bdy_divdamp=data_alloc.random_field(grid, dims.KDim, dtype=ta.wpfloat),
+            nudgecoeff_e=data_alloc.random_field(grid, dims.EdgeDim, dtype=ta.wpfloat),
+            vn_nnew=data_alloc.zero_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.wpfloat),
+            dtime=ta.wpfloat(0.9),
+            wgt_nnow_vel=ta.wpfloat(0.25),
+            wgt_nnew_vel=ta.wpfloat(0.75),
+            cpd=ta.wpfloat(1004.64),
+            scal_divdamp_o2=ta.wpfloat(0.3),
+            apply_2nd_order_divdamp=apply_2nd_order_divdamp,
+            apply_4th_order_divdamp=apply_4th_order_divdamp,
+            limited_area=limited_area,
+            horizontal_start=0,
+            horizontal_end=gtx.int32(grid.num_edges),
+            vertical_start=0,
+            vertical_end=gtx.int32(grid.num_levels),
+        )
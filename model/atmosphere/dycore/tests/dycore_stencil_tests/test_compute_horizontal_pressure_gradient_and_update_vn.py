@@ -0,0 +1,231 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+from typing import Any
+
+import gt4py.next as gtx
+import numpy as np
+import pytest
+
+import icon4py.model.common.utils.data_allocation as data_alloc
+from icon4py.model.atmosphere.dycore.solve_nonhydro_stencils import (
+    compute_horizontal_pressure_gradient_and_update_vn,
+)
+from icon4py.model.atmosphere.dycore.stencils.add_temporal_tendencies_to_vn import (
+    add_temporal_tendencies_to_vn,
+)
+from icon4py.model.atmosphere.dycore.stencils.apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure import (
+    apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure,
+)
+from icon4py.model.atmosphere.dycore.stencils.compute_horizontal_gradient_of_exner_pressure_for_flat_coordinates import (
+    compute_horizontal_gradient_of_exner_pressure_for_flat_coordinates,
+)
+from icon4py.model.atmosphere.dycore.stencils.compute_horizontal_gradient_of_exner_pressure_for_multiple_levels import (
+    compute_horizontal_gradient_of_exner_pressure_for_multiple_levels,
+)
+from icon4py.model.atmosphere.dycore.stencils.compute_horizontal_gradient_of_exner_pressure_for_nonflat_coordinates import (
+    compute_horizontal_gradient_of_exner_pressure_for_nonflat_coordinates,
+)
+from icon4py.model.common import dimension as dims, type_alias as ta
+from icon4py.model.common.grid import base
+from icon4py.model.common.states import utils as state_utils
+from icon4py.model.testing import helpers
+
+from . import (
+    test_add_temporal_tendencies_to_vn as stencil_24,
+    test_apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure as stencil_22,
+    test_compute_horizontal_gradient_of_exner_pressure_for_flat_coordinates as stencil_18,
+    test_compute_horizontal_gradient_of_exner_pressure_for_multiple_levels as stencil_20,
+    test_compute_horizontal_gradient_of_exner_pressure_for_nonflat_coordinates as stencil_19,
+)
+
+
+class TestComputeHorizontalPressureGradientAndUpdateVn(helpers.StencilTest):
+    PROGRAM = compute_horizontal_pressure_gradient_and_update_vn
+    OUTPUTS = ("z_gradh_exner", "vn_nnew")
+    MARKERS = (pytest.mark.uses_as_offset, pytest.mark.skip_value_error)
+
+    @staticmethod
+    def reference(
+        connectivities: dict[gtx.Dimension, np.ndarray],
+        k_field: np.ndarray,
+        nflatlev: int,
+        nflat_gradp: int,
+        **kwargs: Any,
+    ) -> dict:
+        z_gradh_exner = np.where(
+            k_field < nflatlev,
+            stencil_18.TestComputeHorizontalGradientOfExnerPressureForFlatCoordinates.reference(
+                connectivities, **kwargs
+            )["z_gradh_exner"],
+            np.where(
+                k_field < nflat_gradp + 1,
+                stencil_19.TestComputeHorizontalGradientOfExnerPressureForNonflatCoordinates.reference(
+                    connectivities, **kwargs
+                )["z_gradh_exner"],
+                stencil_20.TestComputeHorizontalGradientOfExnerPressureForMultipleLevels.reference(
+                    connectivities, **kwargs
+                )["z_gradh_exner"],
+            ),
+        )
+        kwargs["z_gradh_exner"] = z_gradh_exner
+        z_gradh_exner = (
+            stencil_22.TestApplyHydrostaticCorrectionToHorizontalGradientOfExnerPressure.reference(
+                connectivities, **kwargs
+            )["z_gradh_exner"]
+        )
+        kwargs["z_gradh_exner"] = z_gradh_exner
+        vn_nnew = stencil_24.TestAddTemporalTendenciesToVn.reference(connectivities, **kwargs)[
+            "vn_nnew"
+        ]
+        return dict(z_gradh_exner=z_gradh_exner, vn_nnew=vn_nnew)
+
+    @pytest.fixture
+    def input_data(self, grid: base.BaseGrid) -> dict[str, gtx.Field | state_utils.ScalarType]:
+        ikoffset = data_alloc.zero_field(
+            grid, dims.EdgeDim, dims.E2CDim, dims.KDim, dtype=gtx.int32
+        ).asnumpy()
+        rng = np.random.default_rng()
+        for k in range(grid.num_levels):
+            ikoffset[:, :, k] = rng.integers(
+                low=0 - k, high=grid.num_levels - k - 1, size=ikoffset.shape[:2]
+            )
+        zdiff_gradp = data_alloc.random_field(
+            grid, dims.EdgeDim, dims.E2CDim, dims.KDim, dtype=ta.vpfloat
+        )
+
+        return dict(
+            inv_dual_edge_length=data_alloc.random_field(grid, dims.EdgeDim, dtype=ta.wpfloat),
+            z_exner_ex_pr=data_alloc.random_field(grid, dims.CellDim, dims.KDim, dtype=ta.vpfloat),
+            ddxn_z_full=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat),
+            c_lin_e=data_alloc.random_field(grid, dims.EdgeDim, dims.E2CDim, dtype=ta.wpfloat),
+            zdiff_gradp=data_alloc.flatten_first_two_dims(dims.ECDim, dims.KDim, field=zdiff_gradp),
+            ikoffset=data_alloc.flatten_first_two_dims(dims.ECDim, dims.KDim, field=ikoffset),
+            z_dexner_dz_c_1=data_alloc.random_field(
+                grid, dims.CellDim, dims.KDim, dtype=ta.vpfloat
+            ),
+            z_dexner_dz_c_2=data_alloc.random_field(
+                grid, dims.CellDim, dims.KDim, dtype=ta.vpfloat
+            ),
+            ipeidx_dsl=data_alloc.random_mask(grid, dims.EdgeDim, dims.KDim),
+            pg_exdist=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat),
+            z_hydro_corr=data_alloc.random_field(grid, dims.EdgeDim, dtype=ta.vpfloat),
+            vn_nnow=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.wpfloat),
+            ddt_vn_apc_ntl1=data_alloc.random_field(
+                grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat
+            ),
+            ddt_vn_phy=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat),
+            z_theta_v_e=data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.wpfloat),
+            z_gradh_exner=data_alloc.zero_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.vpfloat),
+            vn_nnew=data_alloc.zero_field(grid, dims.EdgeDim, dims.KDim, dtype=ta.wpfloat),
+            k_field=data_alloc.index_field(grid, dims.KDim, dtype=gtx.int32),
+            nflatlev=gtx.int32(3),
+            nflat_gradp=gtx.int32(5),
+            dtime=ta.wpfloat(0.9),
+            cpd=ta.wpfloat(1004.64),
+            horizontal_start=0,
+            horizontal_end=gtx.int32(grid.num_edges),
+            vertical_start=0,
+            vertical_end=gtx.int32(grid.num_levels),
+        )
+
+    @pytest.mark.parametrize("fuse_programs", [True, False])
+    def test_fused_and_single_programs_benchmark(
+        self, pytestconfig, grid, backend, input_data, benchmark, fuse_programs
+    ):
+        """Compare the fused program with the single programs of the unfused path of solve_nonhydro."""
+        helpers.apply_markers(self.MARKERS, grid, backend)
+        if pytestconfig.getoption("--benchmark-disable"):
+            pytest.skip("Test skipped due to 'benchmark-disable' option.")
+        args = helpers.allocate_data(backend, input_data)
+        offset_provider = grid.offset_providers
+        domain = dict(
+            horizontal_start=args["horizontal_start"], horizontal_end=args["horizontal_end"]
+        )
+        nflatlev, nflat_gradp = args["nflatlev"], args["nflat_gradp"]
+        gradient = dict(
+            inv_dual_edge_length=args["inv_dual_edge_length"],
+            z_exner_ex_pr=args["z_exner_ex_pr"],
+            z_gradh_exner=args["z_gradh_exner"],
+        )
+        fused = self.PROGRAM.with_backend(backend)
+        flat = compute_horizontal_gradient_of_exner_pressure_for_flat_coordinates.with_backend(
+            backend
+        )
+        nonflat = (
+            compute_horizontal_gradient_of_exner_pressure_for_nonflat_coordinates.with_backend(
+                backend
+            )
+        )
+        multiple_levels = (
+            compute_horizontal_gradient_of_exner_pressure_for_multiple_levels.with_backend(backend)
+        )
+        hydrostatic_correction = (
+            apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure.with_backend(
+                backend
+            )
+        )
+        update_vn = add_temporal_tendencies_to_vn.with_backend(backend)
+
+        def single_programs():
+            flat(
+                **gradient,
+                **domain,
+                vertical_start=0,
+                vertical_end=nflatlev,
+                offset_provider=offset_provider,
+            )
+            nonflat(
+                **gradient,
+                ddxn_z_full=args["ddxn_z_full"],
+                c_lin_e=args["c_lin_e"],
+                z_dexner_dz_c_1=args["z_dexner_dz_c_1"],
+                **domain,
+                vertical_start=nflatlev,
+                vertical_end=nflat_gradp + 1,
+                offset_provider=offset_provider,
+            )
+            multiple_levels(
+                **gradient,
+                zdiff_gradp=args["zdiff_gradp"],
+                ikoffset=args["ikoffset"],
+                z_dexner_dz_c_1=args["z_dexner_dz_c_1"],
+                z_dexner_dz_c_2=args["z_dexner_dz_c_2"],
+                **domain,
+                vertical_start=nflat_gradp + 1,
+                vertical_end=args["vertical_end"],
+                offset_provider=offset_provider,
+            )
+            hydrostatic_correction(
+                ipeidx_dsl=args["ipeidx_dsl"],
+                pg_exdist=args["pg_exdist"],
+                z_hydro_corr=args["z_hydro_corr"],
+                z_gradh_exner=args["z_gradh_exner"],
+                **domain,
+                vertical_start=0,
+                vertical_end=args["vertical_end"],
+                offset_provider={},
+            )
+            update_vn(
+                vn_nnow=args["vn_nnow"],
+                ddt_vn_apc_ntl1=args["ddt_vn_apc_ntl1"],
+                ddt_vn_phy=args["ddt_vn_phy"],
+                z_theta_v_e=args["z_theta_v_e"],
+                z_gradh_exner=args["z_gradh_exner"],
+                vn_nnew=args["vn_nnew"],
+                dtime=args["dtime"],
+                cpd=args["cpd"],
+                **domain,
+                vertical_start=0,
+                vertical_end=args["vertical_end"],
+                offset_provider={},
+            )
+
+        if fuse_programs:
+            benchmark(fused, **args, offset_provider=offset_provider)
+        else:
+            benchmark(single_programs)
@@ -729,6 +729,106 @@ def test_nonhydro_corrector_step(
     )
 
 
+@pytest.mark.embedded_remap_error
+@pytest.mark.datatest
+@pytest.mark.parametrize(
+    "istep_init, substep_init, istep_exit, substep_exit, at_initial_timestep", [(2, 1, 2, 1, True)]
+)
+@pytest.mark.parametrize(
+    "experiment, step_date_init, step_date_exit",
+    [(dt_utils.REGIONAL_EXPERIMENT, "2021-06-20T12:00:10.000", "2021-06-20T12:00:10.000")],
+)
+def test_exner_dyn_incr_with_adapted_substeps(
+    icon_grid,
+    savepoint_nonhydro_init,
+    lowest_layer_thickness,
+    model_top_height,
+    stretch_factor,
+    damping_height,
+    grid_savepoint,
+    metrics_savepoint,
+    interpolation_savepoint,
+    experiment,
+    ndyn_substeps,
+    backend,
+):
+    config = utils.construct_solve_nh_config(experiment, ndyn_substeps)
+    sp = savepoint_nonhydro_init
+    vertical_config = v_grid.VerticalGridConfig(
+        icon_grid.num_levels,
+        lowest_layer_thickness=lowest_layer_thickness,
+        model_top_height=model_top_height,
+        stretch_factor=stretch_factor,
+        rayleigh_damping_height=damping_height,
+    )
+    vertical_params = utils.create_vertical_params(vertical_config, grid_savepoint)
+    dtime = sp.get_metadata("dtime").get("dtime")
+    solve_nonhydro = solve_nh.SolveNonhydro(
+        grid=icon_grid,
+        config=config,
+        params=solve_nh.NonHydrostaticParams(config),
+        metric_state_nonhydro=utils.construct_metric_state(metrics_savepoint, icon_grid.num_levels),
+        interpolation_state=utils.construct_interpolation_state(interpolation_savepoint),
+        vertical_params=vertical_params,
+        edge_geometry=grid_savepoint.construct_edge_geometry(),
+        cell_geometry=grid_savepoint.construct_cell_geometry(),
+        owner_mask=grid_savepoint.c_owner_mask(),
+        backend=backend,
+    )
+
+    def exner_dyn_incr_at_last_substep(ndyn_substeps_var):
+        diagnostic_state_nh = utils.construct_diagnostics(sp)
+        solve_nonhydro.run_corrector_step(
+            diagnostic_state_nh=diagnostic_state_nh,
+            prognostic_states=utils.create_prognostic_states(sp),
+            z_fields=solve_nh.IntermediateFields(
+                z_gradh_exner=sp.z_gradh_exner(),
+                z_alpha=sp.z_alpha(),
+                z_beta=sp.z_beta(),
+                z_w_expl=sp.z_w_expl(),
+                z_exner_expl=sp.z_exner_expl(),
+                z_q=sp.z_q(),
+                z_contr_w_fl_l=sp.z_contr_w_fl_l(),
+                z_rho_e=sp.z_rho_e(),
+                z_theta_v_e=sp.z_theta_v_e(),
+                z_graddiv_vn=sp.z_graddiv_vn(),
+                z_rho_expl=sp.z_rho_expl(),
+                z_dwdz_dd=sp.z_dwdz_dd(),
+                horizontal_kinetic_energy_at_edges_on_model_levels=sp.z_kin_hor_e(),
+                tangential_wind_on_half_levels=sp.z_vt_ie(),
+            ),
+            prep_adv=dycore_states.PrepAdvection(
+                vn_traj=sp.vn_traj(),
+                mass_flx_me=sp.mass_flx_me(),
+                mass_flx_ic=sp.mass_flx_ic(),
+                vol_flx_ic=data_alloc.zero_field(
+                    icon_grid, dims.CellDim, dims.KDim, backend=backend
+                ),
+            ),
+            divdamp_fac_o2=sp.divdamp_fac_o2(),
+            dtime=dtime,
+            lprep_adv=False,
+            at_first_substep=True,
+            at_last_substep=True,
+            ndyn_substeps_var=ndyn_substeps_var,
+        )
+        return diagnostic_state_nh.exner_dyn_incr.asnumpy()
+
+    # the physics tendency is scaled by the number of substeps which were actually run
+    configured = exner_dyn_incr_at_last_substep(None)
+    adapted = exner_dyn_incr_at_last_substep(ndyn_substeps + 1)
+    cells = slice(
+        icon_grid.start_index(h_grid.domain(dims.CellDim)(h_grid.Zone.NUDGING)),
+        icon_grid.end_index(h_grid.domain(dims.CellDim)(h_grid.Zone.LOCAL)),
+    )
+    levels = slice(vertical_params.kstart_moist, None)
+    assert helpers.dallclose(
+        adapted[cells, levels],
+        configured[cells, levels] - dtime * sp.ddt_exner_phy().asnumpy()[cells, levels],
+        atol=1e-14,
+    )
+
+
 @pytest.mark.embedded_remap_error
 @pytest.mark.datatest
 @pytest.mark.parametrize(
@@ -749,6 +849,8 @@ def test_nonhydro_corrector_step(
         ),
     ],
 )
+@pytest.mark.parametrize("precompile", [False, True])
+@pytest.mark.parametrize("fuse_programs", [False, True])
 def test_run_solve_nonhydro_single_step(
     istep_init,
     istep_exit,
@@ -772,9 +874,12 @@ def test_run_solve_nonhydro_single_step(
     at_initial_timestep,
     caplog,
     backend,
+    precompile,
+    fuse_programs,
 ):
     caplog.set_level(logging.WARN)
     config = utils.construct_solve_nh_config(experiment, ndyn_substeps)
+    config.fuse_programs = fuse_programs
 
     sp = savepoint_nonhydro_init
     sp_step_exit = savepoint_nonhydro_step_final
@@ -820,6 +925,15 @@ def test_run_solve_nonhydro_single_step(
     prognostic_states = utils.create_prognostic_states(sp)
 
     initial_divdamp_fac = sp.divdamp_fac_o2()
+    if precompile:
+        solve_nonhydro.precompile(
+            diagnostic_state_nh,
+            prognostic_states,
+            prep_adv,
+            divdamp_fac_o2=initial_divdamp_fac,
+            dtime=dtime,
+            lprep_adv=lprep_adv,
+        )
     solve_nonhydro.time_step(
         diagnostic_state_nh=diagnostic_state_nh,
         prognostic_states=prognostic_states,
@@ -876,6 +990,7 @@ def test_run_solve_nonhydro_single_step(
         (1, 1, "2021-06-20T12:00:20.000", 2, 2, "2021-06-20T12:00:20.000", False),
     ],
 )
+@pytest.mark.parametrize("replay_time_steps", [False, True])
 def test_run_solve_nonhydro_multi_step(
     step_date_init,
     step_date_exit,
@@ -894,8 +1009,10 @@ def test_run_solve_nonhydro_multi_step(
     ndyn_substeps,
     backend,
     at_initial_timestep,
+    replay_time_steps,
 ):
     config = utils.construct_solve_nh_config(experiment, ndyn_substeps)
+    config.replay_time_steps = replay_time_steps
     sp = savepoint_nonhydro_init
     sp_step_exit = savepoint_nonhydro_step_final
     nonhydro_params = solve_nh.NonHydrostaticParams(config)
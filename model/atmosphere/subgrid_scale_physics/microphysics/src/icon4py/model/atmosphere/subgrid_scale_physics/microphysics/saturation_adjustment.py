@@ -6,16 +6,22 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 import dataclasses
+import enum
 from typing import Final, Optional
 
 import gt4py.next as gtx
 import numpy as np
 from gt4py.eve.utils import FrozenNamespace
 from gt4py.next import backend as gtx_backend, broadcast
+from gt4py.next.ffront.experimental import as_offset
 from gt4py.next.ffront.fbuiltins import (
     abs,
+    astype,
     exp,
+    floor,
+    int32,
     maximum,
+    minimum,
     where,
 )
 
@@ -29,7 +35,7 @@ from icon4py.model.common.diagnostic_calculations.stencils import (
     diagnose_pressure as pressure,
     diagnose_surface_pressure as surface_pressure,
 )
-from icon4py.model.common.dimension import CellDim, KDim
+from icon4py.model.common.dimension import CellDim, KDim, Koff
 from icon4py.model.common.grid import horizontal as h_grid, icon as icon_grid, vertical as v_grid
 from icon4py.model.common.states import (
     diagnostic_state as diagnostics,
@@ -37,6 +43,7 @@ from icon4py.model.common.states import (
     prognostic_state as prognostics,
     tracer_state as tracers,
 )
+from icon4py.model.common.type_alias import wpfloat
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 
@@ -83,6 +90,22 @@ class SaturatedPressureConstants(FrozenNamespace):
 satpres_const: Final = SaturatedPressureConstants()
 
 
+class SaturationPressureInterpolation(enum.Enum):
+    """
+    Evaluation of the saturation water vapour pressure in the Newton iteration of the saturation adjustment.
+
+    The maximum relative errors given for the interpolation in the default SaturationPressureTable
+    (0.1 K step) are measured against the Tetens formula, see SaturationPressureTable.max_relative_error.
+    """
+
+    #: Tetens formula
+    TETENS = 0
+    #: linear interpolation of the saturation pressure and its temperature derivative, error < 8e-5 (pressure) and < 7e-5 (derivative)
+    LINEAR = 1
+    #: cubic Hermite interpolation of the saturation pressure, error < 1e-9 (pressure) and < 1e-7 (derivative)
+    CUBIC = 2
+
+
 @dataclasses.dataclass(frozen=True)
 class SaturationAdjustmentConfig:
     #: in ICON, 10 is always used for max iteration when subroutine satad_v_3D is called.
@@ -91,6 +114,12 @@ class SaturationAdjustmentConfig:
     tolerance: ta.wpfloat = 1.0e-3
     #: An extra step of updating the variables from new temperature is done in ICON after satad is called in at the beginning of mo_nh_interface_nwp.f90. This is a new option to update those variables.
     diagnose_variables_from_new_temperature: bool = True
+    #: After the first Newton iteration, the points which have not converged yet are compacted and the remaining iterations only run on them.
+    active_set: bool = False
+    #: The Newton iteration evaluates the Tetens formula for the saturation water vapour pressure in every iteration. With LINEAR or CUBIC, it is interpolated in a table computed once instead.
+    saturation_pressure_interpolation: SaturationPressureInterpolation = (
+        SaturationPressureInterpolation.TETENS
+    )
 
 
 @dataclasses.dataclass
@@ -102,6 +131,89 @@ class ConvergenceError(Exception):
     pass
 
 
+class SaturationPressureTable:
+    """
+    Saturation water vapour pressure of the Tetens formula and its temperature derivative on a uniform temperature grid.
+
+    The table is stored along KDim, so that the field operators can read it with a vertical offset
+    computed from the temperature. Outside of the table, the interpolation of the first or last
+    interval is extrapolated.
+
+    Args:
+        min_temperature: temperature of the first table entry [K]
+        max_temperature: temperature of the last table entry [K]
+        temperature_step: temperature difference of neighboring table entries [K]
+        backend: backend the table is allocated for
+    """
+
+    def __init__(
+        self,
+        min_temperature: ta.wpfloat = 163.15,
+        max_temperature: ta.wpfloat = 343.15,
+        temperature_step: ta.wpfloat = 0.1,
+        backend: Optional[gtx_backend.Backend] = None,
+    ):
+        self.min_temperature = min_temperature
+        self.temperature_step = temperature_step
+        self.size = int(round((max_temperature - min_temperature) / temperature_step)) + 1
+        temperature = min_temperature + temperature_step * np.arange(self.size)
+        sat_pres, dsat_pres_dT = _tetens_sat_pres_water(temperature)
+        self.sat_pres = gtx.as_field((dims.KDim,), sat_pres, allocator=backend)
+        self.dsat_pres_dT = gtx.as_field((dims.KDim,), dsat_pres_dT, allocator=backend)
+        self._backend = backend
+
+    def max_relative_error(
+        self, interpolation: SaturationPressureInterpolation, samples_per_step: int = 10
+    ) -> tuple[float, float]:
+        """
+        Compute the maximum relative error of the interpolation against the Tetens formula.
+
+        The error is sampled at samples_per_step temperatures in each interval of the table.
+
+        Returns:
+            maximum relative error of the saturation pressure and of its temperature derivative
+        """
+        num_samples = (self.size - 1) * samples_per_step + 1
+        temperature = self.min_temperature + (self.temperature_step / samples_per_step) * np.arange(
+            num_samples
+        )
+        sample_domain = {dims.CellDim: (0, num_samples), dims.KDim: (0, 1)}
+        sat_pres = gtx.constructors.zeros(sample_domain, allocator=self._backend)
+        dsat_pres_dT = gtx.constructors.zeros(sample_domain, allocator=self._backend)
+        interpolate_sat_pres_water.with_backend(self._backend)(
+            gtx.as_field(
+                (dims.CellDim, dims.KDim), temperature[:, np.newaxis], allocator=self._backend
+            ),
+            self.sat_pres,
+            self.dsat_pres_dT,
+            gtx.as_field((dims.KDim,), np.zeros(1, dtype=np.int32), allocator=self._backend),
+            self.min_temperature,
+            self.temperature_step,
+            gtx.int32(self.size),
+            interpolation == SaturationPressureInterpolation.CUBIC,
+            sat_pres,
+            dsat_pres_dT,
+            offset_provider={"Koff": dims.KDim},
+        )
+        ref_sat_pres, ref_dsat_pres_dT = _tetens_sat_pres_water(temperature)
+        return (
+            float(np.max(np.abs(sat_pres.asnumpy()[:, 0] / ref_sat_pres - 1.0))),
+            float(np.max(np.abs(dsat_pres_dT.asnumpy()[:, 0] / ref_dsat_pres_dT - 1.0))),
+        )
+
+
+def _tetens_sat_pres_water(temperature: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Saturation water vapour pressure and its temperature derivative of the Tetens formula, see _sat_pres_water."""
+    sat_pres = satpres_const.tetens_p0 * np.exp(
+        satpres_const.tetens_aw
+        * (temperature - satpres_const.tmelt)
+        / (temperature - satpres_const.tetens_bw)
+    )
+    return sat_pres, sat_pres * satpres_const.tetens_der / (
+        temperature - satpres_const.tetens_bw
+    ) ** 2
+
+
 #: CF attributes of saturation adjustment input variables
 _SATURATION_ADJUST_INPUT_ATTRIBUTES: Final[dict[str, model.FieldMetaData]] = dict(
     air_density=dict(
@@ -228,9 +340,21 @@ class SaturationAdjustment:
         metric_state: MetricStateSaturationAdjustment,
         backend: Optional[gtx_backend.Backend],
     ):
+        if (
+            config.saturation_pressure_interpolation != SaturationPressureInterpolation.TETENS
+            and backend is None
+        ):
+            raise ValueError(
+                "The saturation pressure table is read with as_offset, which is not supported by the embedded backend."
+            )
         self._backend = backend
         self.config = config
         self.grid = grid
+        self._sat_pres_table = (
+            None
+            if config.saturation_pressure_interpolation == SaturationPressureInterpolation.TETENS
+            else SaturationPressureTable(backend=backend)
+        )
         self.vertical_params: v_grid.VerticalGrid = vertical_params
         self.metric_state: MetricStateSaturationAdjustment = metric_state
         self._allocate_tendencies()
@@ -263,6 +387,8 @@ class SaturationAdjustment:
         self._lwdocvd = data_alloc.zero_field(
             self.grid, dims.CellDim, dims.KDim, backend=self._backend
         )
+        if self.config.active_set:
+            self._allocate_active_set()
         self._k_field = data_alloc.index_field(
             self.grid, dims.KDim, extend={dims.KDim: 1}, dtype=gtx.int32, backend=self._backend
         )
@@ -311,6 +437,9 @@ class SaturationAdjustment:
         self.update_temperature_by_newton_iteration = (
             update_temperature_by_newton_iteration.with_backend(self._backend)
         )
+        self.update_temperature_by_newton_iteration_from_table = (
+            update_temperature_by_newton_iteration_from_table.with_backend(self._backend)
+        )
         self.compute_newton_iteration_mask = compute_newton_iteration_mask.with_backend(
             self._backend
         )
@@ -334,6 +463,195 @@ class SaturationAdjustment:
             compute_pressure_ifc_tendency_after_saturation_adjustment.with_backend(self._backend)
         )
 
+    def _allocate_active_set(self):
+        """
+        Allocate the fields of the active set, the points that did not converge in the first Newton iteration.
+
+        The active points are stored one after the other along CellDim, with a single level, so that the
+        programs of the Newton iteration run on them unchanged. The fields have room for all points
+        of the grid, so they do not need to be reallocated when the number of active points changes.
+        """
+        active_domain = {
+            dims.CellDim: (0, self.grid.num_cells * self.grid.num_levels),
+            dims.KDim: (0, 1),
+        }
+
+        def zeros(dtype=ta.wpfloat):
+            return gtx.constructors.zeros(active_domain, dtype=dtype, allocator=self._backend)
+
+        self._active_temperature = zeros()
+        self._active_qv = zeros()
+        self._active_rho = zeros()
+        self._active_lwdocvd = zeros()
+        self._active_temperature1 = zeros()
+        self._active_temperature2 = zeros()
+        self._active_newton_iteration_mask = zeros(dtype=bool)
+
+    def _any_newton_iteration(
+        self,
+        newton_iteration_mask: fa.CellKField[bool],
+        horizontal_start: gtx.int32,
+        horizontal_end: gtx.int32,
+        vertical_end: gtx.int32,
+    ) -> bool:
+        """Check whether a point still requires a Newton iteration, only the result of the reduction is copied to the host."""
+        xp = data_alloc.import_array_ns(self._backend)
+        return bool(
+            xp.any(newton_iteration_mask.ndarray[horizontal_start:horizontal_end, :vertical_end])
+        )
+
+    def _newton_iterations(
+        self,
+        max_iter: int,
+        temperature: fa.CellKField[ta.wpfloat],
+        qv: fa.CellKField[ta.wpfloat],
+        rho: fa.CellKField[ta.wpfloat],
+        newton_iteration_mask: fa.CellKField[bool],
+        lwdocvd: fa.CellKField[ta.wpfloat],
+        temperature_list: list[fa.CellKField[ta.wpfloat]],
+        horizontal_start: gtx.int32,
+        horizontal_end: gtx.int32,
+        vertical_end: gtx.int32,
+    ) -> int:
+        """
+        Run at most max_iter Newton iterations, starting from the temperature in temperature_list[1].
+
+        Returns:
+            index of the new temperature in temperature_list
+        """
+        # TODO (Chia Rui): this is inspired by the cpu version of the original ICON saturation_adjustment code. Consider to refactor this code when break and for loop features are ready in gt4py.
+        ncurrent, nnext = 0, 1
+        for _ in range(max_iter):
+            if not self._any_newton_iteration(
+                newton_iteration_mask, horizontal_start, horizontal_end, vertical_end
+            ):
+                break
+            if self._sat_pres_table is None:
+                self.update_temperature_by_newton_iteration(
+                    temperature,
+                    qv,
+                    rho,
+                    newton_iteration_mask,
+                    lwdocvd,
+                    temperature_list[nnext],
+                    temperature_list[ncurrent],
+                    horizontal_start=horizontal_start,
+                    horizontal_end=horizontal_end,
+                    vertical_start=gtx.int32(0),
+                    vertical_end=vertical_end,
+                    offset_provider={},
+                )
+            else:
+                self.update_temperature_by_newton_iteration_from_table(
+                    temperature,
+                    qv,
+                    rho,
+                    newton_iteration_mask,
+                    lwdocvd,
+                    temperature_list[nnext],
+                    self._sat_pres_table.sat_pres,
+                    self._sat_pres_table.dsat_pres_dT,
+                    self._k_field,
+                    self._sat_pres_table.min_temperature,
+                    self._sat_pres_table.temperature_step,
+                    gtx.int32(self._sat_pres_table.size),
+                    self.config.saturation_pressure_interpolation
+                    == SaturationPressureInterpolation.CUBIC,
+                    temperature_list[ncurrent],
+                    horizontal_start=horizontal_start,
+                    horizontal_end=horizontal_end,
+                    vertical_start=gtx.int32(0),
+                    vertical_end=vertical_end,
+                    offset_provider={"Koff": dims.KDim},
+                )
+
+            self.compute_newton_iteration_mask(
+                self.config.tolerance,
+                temperature_list[ncurrent],
+                temperature_list[nnext],
+                newton_iteration_mask,
+                horizontal_start=horizontal_start,
+                horizontal_end=horizontal_end,
+                vertical_start=gtx.int32(0),
+                vertical_end=vertical_end,
+                offset_provider={},
+            )
+
+            self.copy_temperature(
+                newton_iteration_mask,
+                temperature_list[ncurrent],
+                temperature_list[nnext],
+                horizontal_start=horizontal_start,
+                horizontal_end=horizontal_end,
+                vertical_start=gtx.int32(0),
+                vertical_end=vertical_end,
+                offset_provider={},
+            )
+            ncurrent = (ncurrent + 1) % 2
+            nnext = (nnext + 1) % 2
+        return ncurrent
+
+    def _newton_iterations_on_active_set(
+        self,
+        max_iter: int,
+        temperature: fa.CellKField[ta.wpfloat],
+        qv: fa.CellKField[ta.wpfloat],
+        rho: fa.CellKField[ta.wpfloat],
+        temperature_list: list[fa.CellKField[ta.wpfloat]],
+        ncurrent: int,
+        horizontal_start: gtx.int32,
+        horizontal_end: gtx.int32,
+    ) -> None:
+        """
+        Continue the Newton iterations on the points flagged in the Newton iteration mask only.
+
+        The input of those points is gathered into the active set, the iterations run on the active set
+        and the new temperature and the Newton iteration mask are scattered back. The new temperature of
+        all other points is already in temperature_list[ncurrent], the last iterate of the flagged points
+        is in the other field of temperature_list.
+        """
+        xp = data_alloc.import_array_ns(self._backend)
+        cells, levels = xp.nonzero(
+            self._newton_iteration_mask.ndarray[
+                horizontal_start:horizontal_end, : self.grid.num_levels
+            ]
+        )
+        cells += horizontal_start
+        num_active = int(cells.size)
+        if num_active == 0:
+            return
+
+        for active_field, field in (
+            (self._active_temperature, temperature),
+            (self._active_qv, qv),
+            (self._active_rho, rho),
+            (self._active_lwdocvd, self._lwdocvd),
+            (self._active_temperature2, temperature_list[(ncurrent + 1) % 2]),
+        ):
+            active_field.ndarray[:num_active, 0] = field.ndarray[cells, levels]
+        self._active_newton_iteration_mask.ndarray[:num_active, 0] = True
+
+        active_temperature_list = [self._active_temperature1, self._active_temperature2]
+        nactive = self._newton_iterations(
+            max_iter,
+            self._active_temperature,
+            self._active_qv,
+            self._active_rho,
+            self._active_newton_iteration_mask,
+            self._active_lwdocvd,
+            active_temperature_list,
+            horizontal_start=gtx.int32(0),
+            horizontal_end=gtx.int32(num_active),
+            vertical_end=gtx.int32(1),
+        )
+
+        temperature_list[ncurrent].ndarray[cells, levels] = active_temperature_list[
+            nactive
+        ].ndarray[:num_active, 0]
+        self._newton_iteration_mask.ndarray[
+            cells, levels
+        ] = self._active_newton_iteration_mask.ndarray[:num_active, 0]
+
     def run(
         self,
         dtime: ta.wpfloat,
@@ -378,63 +696,36 @@ class SaturationAdjustment:
             offset_provider={},
         )
 
-        # TODO (Chia Rui): this is inspired by the cpu version of the original ICON saturation_adjustment code. Consider to refactor this code when break and for loop features are ready in gt4py.
         temperature_list = [self._temperature1, self._temperature2]
-        ncurrent, nnext = 0, 1
-        for _ in range(self.config.max_iter):
-            if np.any(
-                self._newton_iteration_mask.ndarray[
-                    start_cell_nudging:end_cell_local, 0 : self.grid.num_levels
-                ]
-            ):
-                self.update_temperature_by_newton_iteration(
-                    diagnostic_state.temperature,
-                    tracer_state.qv,
-                    prognostic_state.rho,
-                    self._newton_iteration_mask,
-                    self._lwdocvd,
-                    temperature_list[nnext],
-                    temperature_list[ncurrent],
-                    horizontal_start=start_cell_nudging,
-                    horizontal_end=end_cell_local,
-                    vertical_start=gtx.int32(0),
-                    vertical_end=self.grid.num_levels,
-                    offset_provider={},
-                )
-
-                self.compute_newton_iteration_mask(
-                    self.config.tolerance,
-                    temperature_list[ncurrent],
-                    temperature_list[nnext],
-                    self._newton_iteration_mask,
-                    horizontal_start=start_cell_nudging,
-                    horizontal_end=end_cell_local,
-                    vertical_start=gtx.int32(0),
-                    vertical_end=self.grid.num_levels,
-                    offset_provider={},
-                )
-
-                self.copy_temperature(
-                    self._newton_iteration_mask,
-                    temperature_list[ncurrent],
-                    temperature_list[nnext],
-                    horizontal_start=start_cell_nudging,
-                    horizontal_end=end_cell_local,
-                    vertical_start=gtx.int32(0),
-                    vertical_end=self.grid.num_levels,
-                    offset_provider={},
-                )
-                ncurrent = (ncurrent + 1) % 2
-                nnext = (nnext + 1) % 2
-            else:
-                break
-        if np.any(
-            self._newton_iteration_mask.ndarray[
-                start_cell_nudging:end_cell_local, 0 : self.grid.num_levels
-            ]
+        newton_iteration_args = (
+            diagnostic_state.temperature,
+            tracer_state.qv,
+            prognostic_state.rho,
+        )
+        ncurrent = self._newton_iterations(
+            1 if self.config.active_set else self.config.max_iter,
+            *newton_iteration_args,
+            self._newton_iteration_mask,
+            self._lwdocvd,
+            temperature_list,
+            horizontal_start=start_cell_nudging,
+            horizontal_end=end_cell_local,
+            vertical_end=self.grid.num_levels,
+        )
+        if self.config.active_set:
+            self._newton_iterations_on_active_set(
+                self.config.max_iter - 1,
+                *newton_iteration_args,
+                temperature_list,
+                ncurrent,
+                horizontal_start=start_cell_nudging,
+                horizontal_end=end_cell_local,
+            )
+        if self._any_newton_iteration(
+            self._newton_iteration_mask, start_cell_nudging, end_cell_local, self.grid.num_levels
         ):
             raise ConvergenceError(
-                f"Maximum iteration of saturation adjustment ({self.config.max_iter}) is not enough. The max absolute error is {np.abs(self.new_temperature1.ndarray - self.new_temperature2.ndarray).max()} . Please raise max_iter"
+                f"Maximum iteration of saturation adjustment ({self.config.max_iter}) is not enough. The max absolute error is {np.abs(self._temperature1.ndarray - self._temperature2.ndarray).max()} . Please raise max_iter"
             )
         self.update_temperature_qv_qc_tendencies(
             dtime,
@@ -616,6 +907,93 @@ def _dqsatdT_rho(
     return beta * zqsat
 
 
+@gtx.field_operator
+def _interpolate_sat_pres_water(
+    t: fa.CellKField[ta.wpfloat],
+    sat_pres_table: fa.KField[ta.wpfloat],
+    dsat_pres_dT_table: fa.KField[ta.wpfloat],
+    k_field: fa.KField[gtx.int32],
+    min_temperature: ta.wpfloat,
+    temperature_step: ta.wpfloat,
+    table_size: gtx.int32,
+    cubic: bool,
+) -> tuple[fa.CellKField[ta.wpfloat], fa.CellKField[ta.wpfloat]]:
+    """
+    Interpolate the saturation water vapour pressure and its temperature derivative in a SaturationPressureTable.
+    The interpolation is linear in both, or the cubic Hermite polynomial of the pressure and its derivative.
+        x = (T - T_i) / dT, psat = h00(x) psat_i + h10(x) dT dpsat/dT_i + h01(x) psat_i+1 + h11(x) dT dpsat/dT_i+1
+        h00 = (1 + 2x) (1 - x)^2, h10 = x (1 - x)^2, h01 = x^2 (3 - 2x), h11 = x^2 (x - 1)
+
+    Args:
+        t: temperature [K]
+        sat_pres_table: saturation water vapour pressure at the table temperatures [Pa]
+        dsat_pres_dT_table: temperature derivative of sat_pres_table [Pa K-1]
+        k_field: k level indices
+        min_temperature: temperature of the first table entry [K]
+        temperature_step: temperature difference of neighboring table entries [K]
+        table_size: number of table entries
+        cubic: use cubic Hermite instead of linear interpolation
+    Returns:
+        saturation water vapour pressure [Pa], its temperature derivative [Pa K-1]
+    """
+    position = (t - min_temperature) / temperature_step
+    index = minimum(maximum(astype(floor(position), int32), 0), table_size - 2)
+    x = position - astype(index, wpfloat)
+    # the table is stored along KDim, the entry i is read at level k with an offset of i - k
+    offset = index - k_field
+    sat_pres_table = broadcast(sat_pres_table, (CellDim, KDim))
+    dsat_pres_dT_table = broadcast(dsat_pres_dT_table, (CellDim, KDim))
+    sat_pres0 = sat_pres_table(as_offset(Koff, offset))
+    sat_pres1 = sat_pres_table(as_offset(Koff, offset + 1))
+    dsat_pres_dT0 = dsat_pres_dT_table(as_offset(Koff, offset))
+    dsat_pres_dT1 = dsat_pres_dT_table(as_offset(Koff, offset + 1))
+
+    xm1 = x - 1.0
+    sat_pres, dsat_pres_dT = (
+        (
+            (1.0 + 2.0 * x) * xm1 * xm1 * sat_pres0
+            + x * xm1 * xm1 * temperature_step * dsat_pres_dT0
+            + x * x * (3.0 - 2.0 * x) * sat_pres1
+            + x * x * xm1 * temperature_step * dsat_pres_dT1,
+            6.0 * x * xm1 * (sat_pres0 - sat_pres1) / temperature_step
+            + xm1 * (3.0 * x - 1.0) * dsat_pres_dT0
+            + x * (3.0 * x - 2.0) * dsat_pres_dT1,
+        )
+        if cubic
+        else (
+            sat_pres0 + x * (sat_pres1 - sat_pres0),
+            dsat_pres_dT0 + x * (dsat_pres_dT1 - dsat_pres_dT0),
+        )
+    )
+    return sat_pres, dsat_pres_dT
+
+
+@gtx.program(grid_type=gtx.GridType.UNSTRUCTURED)
+def interpolate_sat_pres_water(
+    t: fa.CellKField[ta.wpfloat],
+    sat_pres_table: fa.KField[ta.wpfloat],
+    dsat_pres_dT_table: fa.KField[ta.wpfloat],
+    k_field: fa.KField[gtx.int32],
+    min_temperature: ta.wpfloat,
+    temperature_step: ta.wpfloat,
+    table_size: gtx.int32,
+    cubic: bool,
+    sat_pres: fa.CellKField[ta.wpfloat],
+    dsat_pres_dT: fa.CellKField[ta.wpfloat],
+):
+    _interpolate_sat_pres_water(
+        t,
+        sat_pres_table,
+        dsat_pres_dT_table,
+        k_field,
+        min_temperature,
+        temperature_step,
+        table_size,
+        cubic,
+        out=(sat_pres, dsat_pres_dT),
+    )
+
+
 @gtx.field_operator
 def _new_temperature_in_newton_iteration(
     temperature: fa.CellKField[ta.wpfloat],
@@ -694,6 +1072,135 @@ def update_temperature_by_newton_iteration(
     )
 
 
+@gtx.field_operator
+def _new_temperature_in_newton_iteration_from_table(
+    temperature: fa.CellKField[ta.wpfloat],
+    qv: fa.CellKField[ta.wpfloat],
+    rho: fa.CellKField[ta.wpfloat],
+    lwdocvd: fa.CellKField[ta.wpfloat],
+    new_temperature2: fa.CellKField[ta.wpfloat],
+    sat_pres_table: fa.KField[ta.wpfloat],
+    dsat_pres_dT_table: fa.KField[ta.wpfloat],
+    k_field: fa.KField[gtx.int32],
+    min_temperature: ta.wpfloat,
+    temperature_step: ta.wpfloat,
+    table_size: gtx.int32,
+    cubic: bool,
+) -> fa.CellKField[ta.wpfloat]:
+    """
+    Update the temperature in saturation adjustment by Newton iteration, see _new_temperature_in_newton_iteration.
+    The saturation water vapour pressure and its derivative are interpolated in a SaturationPressureTable.
+        qsat = 1/Rv psat/(rho T), dqsat/dT = qsat (dpsat/dT / psat - 1/T)
+
+    Args:
+        temperature: initial temperature [K]
+        qv: specific humidity [kg kg-1]
+        rho: total air density [kg m-3]
+        lwdocvd: Lv / cvd [K]
+        new_temperature2: temperature at previous iteration [K]
+        sat_pres_table, dsat_pres_dT_table, k_field, min_temperature, temperature_step, table_size, cubic:
+            see _interpolate_sat_pres_water
+    Returns:
+        updated temperature [K]
+    """
+    sat_pres, dsat_pres_dT = _interpolate_sat_pres_water(
+        new_temperature2,
+        sat_pres_table,
+        dsat_pres_dT_table,
+        k_field,
+        min_temperature,
+        temperature_step,
+        table_size,
+        cubic,
+    )
+    qsat = sat_pres / (rho * satpres_const.rv * new_temperature2)
+    dqsatdT = qsat * (dsat_pres_dT / sat_pres - 1.0 / new_temperature2)
+    ft = new_temperature2 - temperature + lwdocvd * (qsat - qv)
+    dft = 1.0 + lwdocvd * dqsatdT
+
+    return new_temperature2 - ft / dft
+
+
+@gtx.field_operator
+def _update_temperature_by_newton_iteration_from_table(
+    temperature: fa.CellKField[ta.wpfloat],
+    qv: fa.CellKField[ta.wpfloat],
+    rho: fa.CellKField[ta.wpfloat],
+    newton_iteration_mask: fa.CellKField[bool],
+    lwdocvd: fa.CellKField[ta.wpfloat],
+    new_temperature2: fa.CellKField[ta.wpfloat],
+    sat_pres_table: fa.KField[ta.wpfloat],
+    dsat_pres_dT_table: fa.KField[ta.wpfloat],
+    k_field: fa.KField[gtx.int32],
+    min_temperature: ta.wpfloat,
+    temperature_step: ta.wpfloat,
+    table_size: gtx.int32,
+    cubic: bool,
+) -> fa.CellKField[ta.wpfloat]:
+    new_temperature1 = where(
+        newton_iteration_mask,
+        _new_temperature_in_newton_iteration_from_table(
+            temperature,
+            qv,
+            rho,
+            lwdocvd,
+            new_temperature2,
+            sat_pres_table,
+            dsat_pres_dT_table,
+            k_field,
+            min_temperature,
+            temperature_step,
+            table_size,
+            cubic,
+        ),
+        new_temperature2,
+    )
+    return new_temperature1
+
+
+@gtx.program(grid_type=gtx.GridType.UNSTRUCTURED)
+def update_temperature_by_newton_iteration_from_table(
+    temperature: fa.CellKField[ta.wpfloat],
+    qv: fa.CellKField[ta.wpfloat],
+    rho: fa.CellKField[ta.wpfloat],
+    newton_iteration_mask: fa.CellKField[bool],
+    lwdocvd: fa.CellKField[ta.wpfloat],
+    new_temperature2: fa.CellKField[ta.wpfloat],
+    sat_pres_table: fa.KField[ta.wpfloat],
+    dsat_pres_dT_table: fa.KField[ta.wpfloat],
+    k_field: fa.KField[gtx.int32],
+    min_temperature: ta.wpfloat,
+    temperature_step: ta.wpfloat,
+    table_size: gtx.int32,
+    cubic: bool,
+    new_temperature1: fa.CellKField[ta.wpfloat],
+    horizontal_start: gtx.int32,
+    horizontal_end: gtx.int32,
+    vertical_start: gtx.int32,
+    vertical_end: gtx.int32,
+):
+    _update_temperature_by_newton_iteration_from_table(
+        temperature,
+        qv,
+        rho,
+        newton_iteration_mask,
+        lwdocvd,
+        new_temperature2,
+        sat_pres_table,
+        dsat_pres_dT_table,
+        k_field,
+        min_temperature,
+        temperature_step,
+        table_size,
+        cubic,
+        out=new_temperature1,
+        domain={
+            dims.CellDim: (horizontal_start, horizontal_end),
+            dims.KDim: (vertical_start, vertical_end),
+        },
+    )
+
+
 @gtx.field_operator
 def _update_temperature_qv_qc_tendencies(
     dtime: ta.wpfloat,
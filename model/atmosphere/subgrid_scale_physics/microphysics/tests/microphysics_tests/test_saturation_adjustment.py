@@ -148,6 +148,7 @@ def test_saturation_adjustment_in_gscp_call(
         (dt_utils.WEISMAN_KLEMP_EXPERIMENT, 30000.0, 8000.0, 0.85, "56"),
     ],
 )
+@pytest.mark.parametrize("active_set", [False, True])
 def test_saturation_adjustment_in_physics_interface_call(
     experiment,
     model_top_height,
@@ -160,6 +161,7 @@ def test_saturation_adjustment_in_physics_interface_call(
     icon_grid,
     lowest_layer_thickness,
     backend,
+    active_set,
 ):
     entry_microphysics_savepoint = data_provider.from_savepoint_weisman_klemp_graupel_entry(
         date=date
@@ -178,6 +180,7 @@ def test_saturation_adjustment_in_physics_interface_call(
         tolerance=nwp_interface_satad_entry_savepoint.tolerance(),
         max_iter=nwp_interface_satad_entry_savepoint.maxiter(),
         diagnose_variables_from_new_temperature=True,
+        active_set=active_set,
     )
 
     vertical_config = v_grid.VerticalGridConfig(icon_grid.num_levels)
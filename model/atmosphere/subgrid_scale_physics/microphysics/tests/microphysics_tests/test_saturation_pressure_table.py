@@ -0,0 +1,164 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import gt4py.next as gtx
+import numpy as np
+import pytest
+
+from icon4py.model.atmosphere.subgrid_scale_physics.microphysics import (
+    saturation_adjustment as satad,
+)
+from icon4py.model.common import dimension as dims, model_backends
+from icon4py.model.common.grid import horizontal as h_grid, simple
+from icon4py.model.common.states import (
+    diagnostic_state as diagnostics,
+    prognostic_state as prognostics,
+    tracer_state as tracers,
+)
+
+
+class _SaturationAdjustmentGrid(simple.SimpleGrid):
+    """SimpleGrid on which the saturation adjustment runs on all cells, SimpleGrid starts the END zone at 0."""
+
+    def start_index(self, domain: h_grid.Domain) -> gtx.int32:
+        if domain.zone == h_grid.Zone.END:
+            return self.end_index(domain)
+        return super().start_index(domain)
+
+
+def _random_cell_k_field(rng, grid, low, high, backend):
+    return gtx.as_field(
+        (dims.CellDim, dims.KDim),
+        rng.uniform(low, high, (grid.num_cells, grid.num_levels)),
+        allocator=backend,
+    )
+
+
+@pytest.mark.parametrize(
+    "interpolation, sat_pres_error, dsat_pres_dT_error",
+    [
+        (satad.SaturationPressureInterpolation.LINEAR, 8e-5, 7e-5),
+        (satad.SaturationPressureInterpolation.CUBIC, 1e-9, 1e-7),
+    ],
+)
+def test_saturation_pressure_table_error(interpolation, sat_pres_error, dsat_pres_dT_error):
+    table = satad.SaturationPressureTable(backend=model_backends.BACKENDS["roundtrip"])
+    max_sat_pres_error, max_dsat_pres_dT_error = table.max_relative_error(interpolation)
+    assert max_sat_pres_error < sat_pres_error
+    assert max_dsat_pres_dT_error < dsat_pres_dT_error
+
+
+@pytest.mark.parametrize(
+    "interpolation, atol",
+    [
+        (satad.SaturationPressureInterpolation.LINEAR, 1e-3),
+        (satad.SaturationPressureInterpolation.CUBIC, 1e-6),
+    ],
+)
+def test_newton_iteration_from_table(interpolation, atol):
+    backend = model_backends.BACKENDS["roundtrip"]
+    grid = simple.SimpleGrid()
+    rng = np.random.default_rng(42)
+    temperature = _random_cell_k_field(rng, grid, 200.0, 310.0, backend)
+    args = dict(
+        temperature=temperature,
+        qv=_random_cell_k_field(rng, grid, 0.0, 0.02, backend),
+        rho=_random_cell_k_field(rng, grid, 0.3, 1.2, backend),
+        newton_iteration_mask=gtx.as_field(
+            (dims.CellDim, dims.KDim),
+            np.ones((grid.num_cells, grid.num_levels), dtype=bool),
+            allocator=backend,
+        ),
+        lwdocvd=_random_cell_k_field(rng, grid, 3400.0, 3600.0, backend),
+        new_temperature2=temperature,
+        horizontal_start=gtx.int32(0),
+        horizontal_end=gtx.int32(grid.num_cells),
+        vertical_start=gtx.int32(0),
+        vertical_end=gtx.int32(grid.num_levels),
+    )
+    reference = _random_cell_k_field(rng, grid, 0.0, 0.0, backend)
+    new_temperature = _random_cell_k_field(rng, grid, 0.0, 0.0, backend)
+    table = satad.SaturationPressureTable(backend=backend)
+
+    satad.update_temperature_by_newton_iteration.with_backend(backend)(
+        **args, new_temperature1=reference, offset_provider={}
+    )
+    satad.update_temperature_by_newton_iteration_from_table.with_backend(backend)(
+        **args,
+        sat_pres_table=table.sat_pres,
+        dsat_pres_dT_table=table.dsat_pres_dT,
+        k_field=gtx.as_field(
+            (dims.KDim,), np.arange(grid.num_levels, dtype=np.int32), allocator=backend
+        ),
+        min_temperature=table.min_temperature,
+        temperature_step=table.temperature_step,
+        table_size=gtx.int32(table.size),
+        cubic=interpolation == satad.SaturationPressureInterpolation.CUBIC,
+        new_temperature1=new_temperature,
+        offset_provider={"Koff": dims.KDim},
+    )
+
+    assert np.allclose(new_temperature.asnumpy(), reference.asnumpy(), rtol=0.0, atol=atol)
+
+
+def test_saturation_pressure_table_not_supported_by_embedded_backend():
+    config = satad.SaturationAdjustmentConfig(
+        saturation_pressure_interpolation=satad.SaturationPressureInterpolation.LINEAR
+    )
+    with pytest.raises(ValueError, match="as_offset"):
+        satad.SaturationAdjustment(config, simple.SimpleGrid(), None, None, backend=None)
+
+
+@pytest.mark.parametrize(
+    "interpolation",
+    [
+        satad.SaturationPressureInterpolation.TETENS,
+        pytest.param(
+            satad.SaturationPressureInterpolation.LINEAR, marks=pytest.mark.uses_as_offset
+        ),
+        pytest.param(satad.SaturationPressureInterpolation.CUBIC, marks=pytest.mark.uses_as_offset),
+    ],
+)
+def test_saturation_adjustment_benchmark(benchmark, backend, interpolation):
+    grid = _SaturationAdjustmentGrid()
+    rng = np.random.default_rng(42)
+    config = satad.SaturationAdjustmentConfig(
+        diagnose_variables_from_new_temperature=False,
+        saturation_pressure_interpolation=interpolation,
+    )
+    saturation_adjustment = satad.SaturationAdjustment(config, grid, None, None, backend)
+    prognostic_state = prognostics.PrognosticState(
+        rho=_random_cell_k_field(rng, grid, 0.3, 1.2, backend),
+        vn=None,
+        w=None,
+        exner=None,
+        theta_v=None,
+    )
+    diagnostic_state = diagnostics.DiagnosticState(
+        temperature=_random_cell_k_field(rng, grid, 200.0, 310.0, backend),
+        virtual_temperature=None,
+        pressure=None,
+        pressure_ifc=None,
+        u=None,
+        v=None,
+    )
+    tracer_state = tracers.TracerState(
+        qv=_random_cell_k_field(rng, grid, 0.0, 0.02, backend),
+        qc=_random_cell_k_field(rng, grid, 0.0, 2.0e-3, backend),
+        qr=None,
+        qi=None,
+        qs=None,
+        qg=None,
+    )
+
+    benchmark.pedantic(
+        saturation_adjustment.run,
+        args=(10.0, prognostic_state, diagnostic_state, tracer_state),
+        rounds=5,
+    )
+    assert np.any(saturation_adjustment.qc_tendency.asnumpy() != 0.0)
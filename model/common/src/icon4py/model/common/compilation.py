@@ -0,0 +1,419 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Ahead of time compilation of the GT4Py programs used by a granule.
+
+GT4Py compiles a program on its first call for the argument types and offset providers of that
+call, the programs of a granule are therefore compiled one after the other during the first time
+step. The functions in this module allow to compile them before the time loop starts:
+
+1. :func:`record_program_calls` replaces all programs reachable from a granule by versions which
+   record their calls instead of executing them. Running a step of the granule in this context
+   enumerates all programs the configuration uses together with their arguments.
+2. :func:`compile_all` compiles the recorded calls concurrently in a thread pool. This fills the
+   in-memory cache of the backend and, if GT4Py's ``BUILD_CACHE_LIFETIME`` is ``persistent``, the
+   build cache on disk, such that the first real call of each program finds the compiled program.
+
+For repeated calls with the same arguments, :class:`CapturedSteps` removes the Python dispatch
+overhead of the programs (argument processing and lookup of the compiled program): the first
+call of a step is captured by :func:`capture_program_calls`, later calls replay the captured
+compiled programs with their bound arguments. Host side code of a captured step is not repeated
+by a replay unless it is marked as :func:`replayable`.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import enum
+import functools
+import logging
+import numbers
+import time
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent import futures
+from typing import Any, Optional
+
+from gt4py.next.ffront import decorator as gtx_decorator
+from gt4py.next.otf import stages
+from gt4py.next.program_processors import processor_interface as ppi
+
+from icon4py.model.common.decomposition import definitions as decomposition
+
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class CompileTask:
+    """A recorded program call, its arguments determine the types the program is compiled for."""
+
+    name: str
+    executor: ppi.ProgramExecutor
+    program_call: stages.ProgramCall
+
+    @property
+    def _workflow(self):
+        return getattr(self.executor, "otf_workflow", None)
+
+    @property
+    def key(self) -> Hashable:
+        """Calls with the same key share the compiled program."""
+        hash_function = getattr(self._workflow, "hash_function", None)
+        return hash_function(self.program_call) if hash_function is not None else id(self)
+
+    def compile(self) -> None:
+        if self._workflow is None:
+            log.debug(f"{self.executor} does not support ahead of time compilation of {self.name}")
+            return
+        self._workflow(self.program_call)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _RecordingExecutor(ppi.ProgramExecutor):
+    executor: ppi.ProgramExecutor
+    tasks: list[CompileTask]
+
+    def __call__(self, program: Any, *args: Any, **kwargs: Any) -> None:
+        self.tasks.append(
+            CompileTask(
+                name=getattr(program, "id", str(program)),
+                executor=self.executor,
+                program_call=stages.ProgramCall(program=program, args=args, kwargs=kwargs),
+            )
+        )
+
+    @property
+    def __name__(self) -> str:
+        return f"recording_{getattr(self.executor, '__name__', self.executor)}"
+
+
+def _is_compiled_program(value: Any) -> bool:
+    return (
+        isinstance(value, (gtx_decorator.Program, gtx_decorator.FieldOperator))
+        and value.backend is not None
+    )
+
+
+def _reachable_objects(*roots: Any) -> Iterator[Any]:
+    """Objects of icon4py classes reachable from `roots` through instance attributes."""
+    stack = list(roots)
+    seen = set()
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        yield obj
+        stack.extend(
+            value
+            for value in vars(obj).values()
+            if hasattr(value, "__dict__")
+            and not isinstance(value, type)
+            and type(value).__module__.startswith("icon4py.")
+        )
+
+
+def _replace_programs(
+    granules: tuple[Any, ...],
+    executor_factory: Callable[[ppi.ProgramExecutor], ppi.ProgramExecutor],
+    exchange_factory: Callable[[decomposition.ExchangeRuntime], Any],
+) -> list[tuple[Any, str, Any]]:
+    """Replace the executors of the programs and the halo exchanges of `granules`, returns the replaced attributes."""
+    backends = {}
+    exchanges = {}
+    replaced = []
+    # collect the objects first, the replacements must not be traversed
+    for obj in list(_reachable_objects(*granules)):
+        for name, value in list(vars(obj).items()):
+            if _is_compiled_program(value):
+                backend = value.backend
+                if id(backend) not in backends:
+                    backends[id(backend)] = dataclasses.replace(
+                        backend, executor=executor_factory(backend.executor)
+                    )
+                replacement = value.with_backend(backends[id(backend)])
+            elif isinstance(value, decomposition.ExchangeRuntime):
+                if id(value) not in exchanges:
+                    exchanges[id(value)] = exchange_factory(value)
+                replacement = exchanges[id(value)]
+            else:
+                continue
+            replaced.append((obj, name, value))
+            vars(obj)[name] = replacement
+    return replaced
+
+
+@contextlib.contextmanager
+def record_program_calls(*granules: Any) -> Iterator[list[CompileTask]]:
+    """
+    Record instead of execute the GT4Py programs called by `granules`.
+
+    Inside the context all programs (and field operators) found in the attributes of the granules
+    and of the icon4py objects they own only record their calls, halo exchanges are replaced by
+    :class:`~decomposition.SingleNodeExchange`. On exit the attribute bindings of these objects
+    are restored: attributes the recorded step rebound (for example swapped fields or counters)
+    refer to their original values again. The contents of arrays are not restored, host side code
+    of the granule still runs and may write fields of the granule in place.
+
+    Programs running on the embedded backend are not replaced. Arguments are recorded by reference,
+    so callers should pass copies of their states.
+
+    Yields:
+        the list the calls are recorded to
+    """
+    tasks: list[CompileTask] = []
+    saved = [(obj, dict(vars(obj))) for obj in _reachable_objects(*granules)]
+    _replace_programs(
+        granules,
+        lambda executor: _RecordingExecutor(executor, tasks),
+        lambda exchange: decomposition.SingleNodeExchange(),
+    )
+    try:
+        yield tasks
+    finally:
+        for obj, attributes in saved:
+            vars(obj).clear()
+            vars(obj).update(attributes)
+
+
+def compile_all(tasks: Iterable[CompileTask], max_workers: Optional[int] = None) -> int:
+    """
+    Compile the programs of the recorded calls concurrently.
+
+    Args:
+        tasks: recorded program calls, see :func:`record_program_calls`
+        max_workers: number of concurrent compilations, defaults to the
+            `concurrent.futures.ThreadPoolExecutor` default
+
+    Returns:
+        number of compiled programs
+    """
+    unique_tasks: dict[Hashable, CompileTask] = {}
+    num_calls = 0
+    for task in tasks:
+        unique_tasks.setdefault(task.key, task)
+        num_calls += 1
+    start = time.perf_counter()
+    # compilers run in subprocesses, threads share the in-memory cache of the backend with the caller
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for future in futures.as_completed(
+            pool.submit(task.compile) for task in unique_tasks.values()
+        ):
+            future.result()
+    log.info(
+        f"compiled {len(unique_tasks)} programs for {num_calls} calls in "
+        f"{time.perf_counter() - start:.1f} s"
+    )
+    return len(unique_tasks)
+
+
+_captured_calls: contextvars.ContextVar[
+    Optional[list[Callable[[], None]]]
+] = contextvars.ContextVar("captured_calls", default=None)
+
+
+@dataclasses.dataclass(frozen=True)
+class _CompiledCall:
+    program: stages.CompiledProgram
+    args: tuple[Any, ...]
+    offset_provider: dict[str, Any]
+
+    def __call__(self) -> None:
+        self.program(*self.args, offset_provider=self.offset_provider)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _CapturingExecutor(ppi.ProgramExecutor):
+    executor: ppi.ProgramExecutor
+    calls: list[Callable[[], None]]
+
+    def __call__(self, program: Any, *args: Any, **kwargs: Any) -> None:
+        workflow = getattr(self.executor, "otf_workflow", None)
+        if workflow is None:
+            self.executor(program, *args, **kwargs)
+            self.calls.append(functools.partial(self.executor, program, *args, **kwargs))
+            return
+        compiled_call = _CompiledCall(
+            workflow(stages.ProgramCall(program=program, args=args, kwargs=kwargs)),
+            args,
+            kwargs["offset_provider"],
+        )
+        compiled_call()
+        self.calls.append(compiled_call)
+
+    @property
+    def __name__(self) -> str:
+        return f"capturing_{getattr(self.executor, '__name__', self.executor)}"
+
+
+@dataclasses.dataclass(frozen=True)
+class _CapturingExchange:
+    runtime: decomposition.ExchangeRuntime
+    calls: list[Callable[[], None]]
+
+    def exchange_and_wait(self, dim: Any, *fields: Any) -> None:
+        self.runtime.exchange_and_wait(dim, *fields)
+        self.calls.append(functools.partial(self.runtime.exchange_and_wait, dim, *fields))
+
+    def exchange(self, dim: Any, *fields: Any) -> decomposition.ExchangeResult:
+        # the replay starts the exchange at the same point of the step and waits for it where the
+        # captured step waited
+        replayed: list[decomposition.ExchangeResult] = []
+        self.calls.append(lambda: replayed.append(self.runtime.exchange(dim, *fields)))
+        return _CapturedExchangeResult(
+            self.runtime.exchange(dim, *fields),
+            functools.partial(self.calls.append, lambda: replayed.pop().wait()),
+        )
+
+    def __call__(self, *fields: Any, dim: Any = None, wait: bool = True) -> Any:
+        """Perform a halo exchange, see :meth:`~decomposition.SingleNodeExchange.__call__`."""
+        result = self.exchange(dim, *fields)
+        if wait:
+            result.wait()
+        else:
+            return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.runtime, name)
+
+
+@dataclasses.dataclass(frozen=True)
+class _CapturedExchangeResult:
+    result: decomposition.ExchangeResult
+    capture_wait: Callable[[], None]
+
+    def wait(self) -> None:
+        self.result.wait()
+        self.capture_wait()
+
+    def is_ready(self) -> bool:
+        return self.result.is_ready()
+
+
+def replayable(method: Callable[..., None]) -> Callable[..., None]:
+    """
+    Mark host side code of a granule to be repeated when a captured step is replayed.
+
+    The decorated function is called with the same arguments on replay, it therefore has to update
+    fields in place instead of rebinding attributes the programs of the step are called with.
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        method(*args, **kwargs)
+        if (calls := _captured_calls.get()) is not None:
+            calls.append(functools.partial(method, *args, **kwargs))
+
+    return wrapper
+
+
+class CapturedStep:
+    """The compiled program calls, halo exchanges and replayable host code of a captured step."""
+
+    def __init__(self) -> None:
+        self._calls: list[Callable[[], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def replay(self) -> None:
+        for call in self._calls:
+            call()
+
+
+@contextlib.contextmanager
+def capture_program_calls(*granules: Any) -> Iterator[CapturedStep]:
+    """
+    Execute and capture the GT4Py programs called by `granules`.
+
+    Inside the context the programs and halo exchanges of the granules (see
+    :func:`record_program_calls`) run as usual and are captured together with their arguments,
+    as well as host side code marked as :func:`replayable`. On exit the programs and exchanges are
+    restored, all other changes of the step persist.
+
+    Programs running on the embedded backend are executed but not captured.
+
+    Yields:
+        the step the calls are captured to
+    """
+    step = CapturedStep()
+    replaced = _replace_programs(
+        granules,
+        lambda executor: _CapturingExecutor(executor, step._calls),
+        lambda exchange: _CapturingExchange(exchange, step._calls),
+    )
+    token = _captured_calls.set(step._calls)
+    try:
+        yield step
+    finally:
+        _captured_calls.reset(token)
+        for obj, name, value in replaced:
+            vars(obj)[name] = value
+
+
+def argument_key(*args: Any) -> Hashable:
+    """
+    Key of call arguments for :class:`CapturedSteps`.
+
+    Scalars are compared by value, fields and other objects by identity. States (dataclasses and
+    icon4py objects) are compared by the identity of their members, such that rebinding a field
+    of a state changes the key.
+    """
+    return tuple(_argument_key(arg) for arg in args)
+
+
+def _argument_key(value: Any) -> Hashable:
+    if value is None or isinstance(value, (numbers.Number, str, enum.Enum)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(_argument_key(v) for v in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            id(value),
+            tuple(_argument_key(getattr(value, f.name)) for f in dataclasses.fields(value)),
+        )
+    if hasattr(value, "__dict__") and type(value).__module__.startswith("icon4py."):
+        return (id(value), tuple(_argument_key(v) for v in vars(value).values()))
+    return id(value)
+
+
+class CapturedSteps:
+    """
+    Capture a step of granules once per key and replay it for later calls with the same key.
+
+    The key has to determine all arguments of the programs called by the step, see
+    :func:`argument_key`. The captured steps keep their arguments alive, at most `maxsize` steps
+    are kept, the least recently used are discarded first.
+    """
+
+    def __init__(self, *granules: Any, maxsize: int = 32):
+        self._granules = granules
+        self._maxsize = maxsize
+        self._steps: collections.OrderedDict[Hashable, CapturedStep] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __call__(self, key: Hashable, step: Callable[[], None]) -> None:
+        """Run `step` and capture it, or replay the step captured for `key`."""
+        if (captured := self._steps.get(key)) is not None:
+            self._steps.move_to_end(key)
+            captured.replay()
+            return
+        with capture_program_calls(*self._granules) as captured:
+            step()
+        log.debug(f"captured step with {len(captured)} calls")
+        self._steps[key] = captured
+        if len(self._steps) > self._maxsize:
+            self._steps.popitem(last=False)
+
+    def clear(self) -> None:
+        self._steps.clear()
@@ -0,0 +1,222 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Partitioning of a global horizontal grid and construction of the rank local decomposition.
+
+A :class:`Decomposer` assigns each cell of the global grid to a partition (rank). From this
+assignment :func:`create_decomposition_info` constructs the :class:`~definitions.DecompositionInfo`
+of one rank: its owned cells plus `halo_levels` rows of halo cells, and the edges and vertices
+of those cells.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional, Protocol
+
+import numpy as np
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import definitions
+
+
+try:
+    import pymetis
+except ImportError:
+    pymetis = None
+
+log = logging.getLogger(__name__)
+
+
+class Decomposer(Protocol):
+    def __call__(
+        self,
+        adjacency: np.ndarray,
+        num_partitions: int,
+        weights: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Partition the cells of a grid.
+
+        Args:
+            adjacency: cell to neighbour cell table (C2E2C), missing neighbours are marked by
+                negative values
+            num_partitions: number of partitions
+            weights: optional non-negative work estimate per cell, partitions are balanced with
+                respect to the sum of the weights of their cells. If not given all cells have the
+                same weight.
+
+        Returns:
+            the partition (rank) of each cell
+        """
+        ...
+
+
+def _breadth_first_order(adjacency: np.ndarray, seed: int) -> np.ndarray:
+    """Order all cells by breadth first traversal starting from `seed`, component by component."""
+    num_cells = adjacency.shape[0]
+    visited = np.zeros(num_cells, dtype=bool)
+    order = []
+    while True:
+        frontier = np.asarray([seed], dtype=adjacency.dtype)
+        visited[seed] = True
+        while frontier.size > 0:
+            order.append(frontier)
+            neighbors = adjacency[frontier].ravel()
+            neighbors = np.unique(neighbors[neighbors >= 0])
+            frontier = neighbors[~visited[neighbors]]
+            visited[frontier] = True
+        if visited.all():
+            return np.concatenate(order)
+        seed = int(np.argmin(visited))
+
+
+class BreadthFirstDecomposer(Decomposer):
+    """
+    Split a breadth first ordering of the cells into contiguous chunks of equal weight.
+
+    The traversal starts at a pseudo-peripheral cell (the last cell reached by a traversal from
+    cell 0), which results in band shaped partitions. It has no external dependencies but the
+    halos are larger than those of a graph partitioner like METIS.
+    """
+
+    def __call__(
+        self,
+        adjacency: np.ndarray,
+        num_partitions: int,
+        weights: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        num_cells = adjacency.shape[0]
+        if num_partitions == 1:
+            return np.zeros(num_cells, dtype=np.int32)
+        weights = np.ones(num_cells) if weights is None else np.asarray(weights, dtype=float)
+        seed = int(_breadth_first_order(adjacency, 0)[-1])
+        order = _breadth_first_order(adjacency, seed)
+        cumulative = np.cumsum(weights[order]) - weights[order]
+        chunk = np.floor(cumulative * num_partitions / weights.sum()).astype(np.int32)
+        partition = np.empty(num_cells, dtype=np.int32)
+        partition[order] = np.minimum(chunk, num_partitions - 1)
+        return partition
+
+
+class MetisDecomposer(Decomposer):
+    """Partition the cell graph with METIS, needs the optional `pymetis` package."""
+
+    def __call__(
+        self,
+        adjacency: np.ndarray,
+        num_partitions: int,
+        weights: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        if pymetis is None:
+            raise ImportError("MetisDecomposer needs the 'pymetis' package to be installed.")
+        if num_partitions == 1:
+            return np.zeros(adjacency.shape[0], dtype=np.int32)
+        neighbors = [row[row >= 0] for row in adjacency]
+        # METIS only accepts integer weights
+        vertex_weights = (
+            None
+            if weights is None
+            else np.maximum(np.rint(1000.0 * weights / np.max(weights)), 1).astype(int).tolist()
+        )
+        _, partition = pymetis.part_graph(
+            num_partitions, adjacency=neighbors, vweights=vertex_weights
+        )
+        return np.asarray(partition, dtype=np.int32)
+
+
+def _owner_of_entities(cell_owner: np.ndarray, c2x: np.ndarray, num_entities: int) -> np.ndarray:
+    """An edge or vertex belongs to the lowest rank owning one of its neighbouring cells."""
+    owner = np.full(num_entities, np.iinfo(np.int32).max, dtype=np.int32)
+    np.minimum.at(owner, c2x.ravel(), np.repeat(cell_owner, c2x.shape[1]))
+    return owner
+
+
+def _local_and_owner_mask(
+    global_mask: np.ndarray, owner: np.ndarray, rank: int, order: Optional[np.ndarray] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Local global index: owned entries first, then halo entries (in `order` if given)."""
+    owned = np.flatnonzero(global_mask & (owner == rank))
+    if order is None:
+        halo = np.flatnonzero(global_mask & (owner != rank))
+    else:
+        halo = order[owner[order] != rank]
+    global_index = np.concatenate((owned, halo))
+    owner_mask = np.zeros(global_index.shape[0], dtype=bool)
+    owner_mask[: owned.shape[0]] = True
+    return global_index, owner_mask
+
+
+def create_decomposition_info(
+    cell_owner: np.ndarray,
+    rank: int,
+    c2v: np.ndarray,
+    c2e: np.ndarray,
+    num_levels: int,
+    halo_levels: int = 2,
+) -> definitions.DecompositionInfo:
+    """
+    Construct the decomposition info of `rank` from a global cell partitioning.
+
+    The halo consists of `halo_levels` rows of cells around the owned cells, where each row
+    contains the cells sharing a vertex with the previous row. The local ordering is owned
+    entries first followed by the halo entries (row by row for cells).
+
+    Args:
+        cell_owner: rank owning each global cell, as returned by a :class:`Decomposer`
+        rank: rank to construct the decomposition info for
+        c2v: global cell to vertex table
+        c2e: global cell to edge table
+        num_levels: number of vertical levels
+        halo_levels: number of halo rows of cells
+
+    Returns:
+        the decomposition info of `rank`
+    """
+    num_vertices = int(c2v.max()) + 1
+    num_edges = int(c2e.max()) + 1
+
+    local_cells = cell_owner == rank
+    cell_order = [np.flatnonzero(local_cells)]
+    for _ in range(halo_levels):
+        vertex_mask = np.zeros(num_vertices, dtype=bool)
+        vertex_mask[c2v[local_cells]] = True
+        halo_row = vertex_mask[c2v].any(axis=1) & ~local_cells
+        cell_order.append(np.flatnonzero(halo_row))
+        local_cells |= halo_row
+    cell_index, cell_owner_mask = _local_and_owner_mask(
+        local_cells, cell_owner, rank, order=np.concatenate(cell_order)
+    )
+
+    edge_mask = np.zeros(num_edges, dtype=bool)
+    edge_mask[c2e[local_cells]] = True
+    edge_index, edge_owner_mask = _local_and_owner_mask(
+        edge_mask, _owner_of_entities(cell_owner, c2e, num_edges), rank
+    )
+
+    vertex_mask = np.zeros(num_vertices, dtype=bool)
+    vertex_mask[c2v[local_cells]] = True
+    vertex_index, vertex_owner_mask = _local_and_owner_mask(
+        vertex_mask, _owner_of_entities(cell_owner, c2v, num_vertices), rank
+    )
+    log.debug(
+        f"rank={rank}: decomposition with {cell_owner_mask.sum()}/{cell_index.shape[0]} owned/total cells, "
+        f"{edge_owner_mask.sum()}/{edge_index.shape[0]} edges, {vertex_owner_mask.sum()}/{vertex_index.shape[0]} vertices"
+    )
+
+    return (
+        definitions.DecompositionInfo(
+            klevels=num_levels,
+            num_cells=cell_index.shape[0],
+            num_edges=edge_index.shape[0],
+            num_vertices=vertex_index.shape[0],
+        )
+        .with_dimension(dims.CellDim, cell_index, cell_owner_mask)
+        .with_dimension(dims.EdgeDim, edge_index, edge_owner_mask)
+        .with_dimension(dims.VertexDim, vertex_index, vertex_owner_mask)
+    )
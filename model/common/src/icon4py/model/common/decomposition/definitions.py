@@ -10,12 +10,13 @@ from __future__ import annotations
 
 import functools
 import logging
+import weakref
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Any, Optional, Protocol, Sequence, Union, runtime_checkable
+from typing import Any, Callable, Optional, Protocol, Sequence, Union, runtime_checkable
 
 import numpy as np
-from gt4py.next import Dimension
+from gt4py.next import Dimension, Field
 
 from icon4py.model.common import utils
 from icon4py.model.common.utils import data_allocation as data_alloc
@@ -174,6 +175,42 @@ class ExchangeRuntime(Protocol):
     def my_rank(self):
         ...
 
+    def use_reduced_precision(self, *fields: Field) -> None:
+        """Exchange the halos of the given fields in single precision, see :class:`ReducedPrecisionFields`."""
+        ...
+
+
+class ReducedPrecisionFields:
+    """
+    Fields whose halo payload is exchanged in single precision.
+
+    Intended for fields of `vpfloat` type, which only carry single precision information in
+    mixed precision builds but are stored (and would be exchanged) as double. The runtime
+    converts those fields to float32 before the exchange and writes the received halo values
+    back into the field in its own precision, the owned points are not touched. Only double
+    precision fields are exchanged in reduced precision, other fields are ignored.
+
+    Fields are registered by identity and are not kept alive by the registry.
+    """
+
+    payload_dtype: np.dtype = np.dtype(np.float32)
+
+    def __init__(self):
+        self._fields: dict[int, weakref.ref] = {}
+
+    def add(self, *fields: Field) -> None:
+        for field in fields:
+            if np.dtype(field.dtype.scalar_type) == np.float64:
+                self._fields[id(field)] = weakref.ref(field)
+
+    def __contains__(self, field: Field) -> bool:
+        ref = self._fields.get(id(field))
+        return ref is not None and ref() is field
+
+    def payload_itemsize(self, field: Field) -> int:
+        """Number of bytes per value of `field` on the wire."""
+        return self.payload_dtype.itemsize if field in self else field.ndarray.dtype.itemsize
+
 
 @dataclass
 class SingleNodeExchange:
@@ -189,6 +226,10 @@ class SingleNodeExchange:
     def get_size(self):
         return 1
 
+    def use_reduced_precision(self, *fields: Field) -> None:
+        # there are no halos on a single node
+        return
+
     def __call__(self, *args, **kwargs) -> Optional[ExchangeResult]:
         """Perform a halo exchange operation.
 
@@ -392,3 +433,67 @@ def create_single_node_exchange(
     props: SingleNodeProcessProperties, decomp_info: DecompositionInfo
 ) -> ExchangeRuntime:
     return SingleNodeExchange()
+
+
+@runtime_checkable
+class SharedStorage(Protocol):
+    """
+    Storage for large read-only arrays shared by all ranks of a compute node.
+
+    The data of an array is produced once per node and mapped by all ranks of the node, instead
+    of every rank holding a private copy. Arrays returned from the storage are read-only.
+    """
+
+    def share(self, name: str, producer: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Return the node shared array registered under `name`.
+
+        If `name` has not been shared yet, `producer` is called (on one rank per node only) to
+        compute the data. This is a collective operation over all ranks of the node.
+        """
+        ...
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes held by the storage on this node."""
+        ...
+
+    def free(self) -> None:
+        """Release all shared arrays, they must not be accessed afterwards."""
+        ...
+
+
+class SingleNodeSharedStorage:
+    """Trivial shared storage for a single process: arrays are held privately."""
+
+    def __init__(self):
+        self._arrays: dict[str, np.ndarray] = {}
+
+    def share(self, name: str, producer: Callable[[], np.ndarray]) -> np.ndarray:
+        if name not in self._arrays:
+            array = np.ascontiguousarray(producer())
+            array.flags.writeable = False
+            self._arrays[name] = array
+        return self._arrays[name]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self._arrays.values())
+
+    def free(self) -> None:
+        self._arrays.clear()
+
+
+@functools.singledispatch
+def create_shared_storage(props: ProcessProperties) -> SharedStorage:
+    """
+    Create a node local storage for read-only arrays depending on the runtime.
+
+    For multi node runs the arrays are placed in MPI-3 shared memory windows.
+    """
+    raise NotImplementedError(f"Unknown ProcessorProperties type ({type(props)})")
+
+
+@create_shared_storage.register(SingleNodeProcessProperties)
+def create_single_node_shared_storage(props: SingleNodeProcessProperties) -> SharedStorage:
+    return SingleNodeSharedStorage()
@@ -0,0 +1,428 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Instrumentation of halo exchanges.
+
+An :class:`InstrumentedExchange` wraps any :class:`~definitions.ExchangeRuntime` and records,
+per call site and per exchanged field, the number of bytes sent and received, the number of
+neighbouring ranks, the time spent in starting the exchange and the time spent in `wait()`.
+
+The time in `wait()` is recorded as
+- *idle* time if the messages of the neighbours had not all arrived when `wait()` was called
+  (time lost because a neighbour was late or the data was still in flight)
+- *transfer* time otherwise, it is then only the completion of the exchange (unpacking of the
+  received data into the halo of the fields)
+
+At the end of a run the per rank statistics are aggregated across all ranks with
+:func:`reduce_statistics` and can be printed as a table or written to a JSON file.
+
+Usage:
+    >>> exchange = InstrumentedExchange(
+    ...     decomposition.create_exchange(props, decomposition_info), props, decomposition_info
+    ... )  # doctest: +SKIP
+    >>> # for each time step
+    >>> exchange.statistics.next_step()  # doctest: +SKIP
+    >>> # after the time loop
+    >>> report = reduce_statistics(exchange.statistics, props)  # doctest: +SKIP
+    >>> if props.rank == 0:  # doctest: +SKIP
+    ...     log.info(format_table(report))
+    ...     write_json(report, pathlib.Path("exchange_statistics.json"))
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import functools
+import json
+import linecache
+import logging
+import pathlib
+import sys
+import time
+from typing import Any, Final, Optional, Sequence
+
+import numpy as np
+from gt4py.next import Dimension, Field
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import definitions
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+log = logging.getLogger(__name__)
+
+#: names of the exchange methods, used to identify the call in the source of the call site
+_EXCHANGE_METHOD_NAMES: Final[tuple[str, ...]] = ("exchange", "exchange_and_wait", "_exchange")
+
+
+@dataclasses.dataclass(frozen=True)
+class HaloVolume:
+    """Number of horizontal points sent to and received from each neighbour rank for one dimension."""
+
+    send_points: dict[int, int] = dataclasses.field(default_factory=dict)
+    receive_points: dict[int, int] = dataclasses.field(default_factory=dict)
+
+    @property
+    def num_neighbors(self) -> int:
+        return len(
+            {r for r, n in self.send_points.items() if n > 0}
+            | {r for r, n in self.receive_points.items() if n > 0}
+        )
+
+    @property
+    def total_send_points(self) -> int:
+        return sum(self.send_points.values())
+
+    @property
+    def total_receive_points(self) -> int:
+        return sum(self.receive_points.values())
+
+
+def compute_halo_volumes(
+    props: definitions.ProcessProperties,
+    decomposition_info: definitions.DecompositionInfo,
+) -> dict[Dimension, HaloVolume]:
+    """
+    Compute the number of points exchanged with each neighbour rank, for all horizontal dimensions.
+
+    The halo points of all ranks are gathered once and intersected with the owned points of this
+    rank: this is a collective operation and needs to be called by all ranks of `props.comm`.
+    """
+    if props.comm_size == 1:
+        return {dim: HaloVolume() for dim in dims.global_dimensions.values()}
+
+    volumes = {}
+    for dim in dims.global_dimensions.values():
+        owned = data_alloc.as_numpy(
+            decomposition_info.global_index(dim, definitions.DecompositionInfo.EntryType.OWNED)
+        )
+        halo = data_alloc.as_numpy(
+            decomposition_info.global_index(dim, definitions.DecompositionInfo.EntryType.HALO)
+        )
+        all_halos = props.comm.allgather(halo)
+        send_counts = [
+            0 if rank == props.rank else int(np.count_nonzero(np.isin(other_halo, owned)))
+            for rank, other_halo in enumerate(all_halos)
+        ]
+        receive_counts = props.comm.alltoall(send_counts)
+        volumes[dim] = HaloVolume(
+            send_points={r: n for r, n in enumerate(send_counts) if n > 0},
+            receive_points={r: n for r, n in enumerate(receive_counts) if n > 0},
+        )
+    return volumes
+
+
+@dataclasses.dataclass
+class ExchangeRecord:
+    """Accumulated statistics of one field exchanged at one call site."""
+
+    call_site: str
+    field: str
+    dim: str
+    calls: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    num_neighbors: int = 0
+    start_time: float = 0.0
+    wait_idle_time: float = 0.0
+    wait_transfer_time: float = 0.0
+
+    @property
+    def wait_time(self) -> float:
+        return self.wait_idle_time + self.wait_transfer_time
+
+
+class ExchangeStatistics:
+    """Per rank collection of :class:`ExchangeRecord` keyed by call site, field and dimension."""
+
+    def __init__(self):
+        self._records: dict[tuple[str, str, str], ExchangeRecord] = {}
+        self._num_steps = 0
+
+    @property
+    def num_steps(self) -> int:
+        return self._num_steps
+
+    @property
+    def records(self) -> list[ExchangeRecord]:
+        return list(self._records.values())
+
+    def next_step(self) -> None:
+        """Mark the beginning of a new time step, used to compute the number of calls per step."""
+        self._num_steps += 1
+
+    def reset(self) -> None:
+        self._records.clear()
+        self._num_steps = 0
+
+    def record(self, call_site: str, field: str, dim: Dimension) -> ExchangeRecord:
+        key = (call_site, field, dim.value)
+        if key not in self._records:
+            self._records[key] = ExchangeRecord(call_site=call_site, field=field, dim=dim.value)
+        return self._records[key]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "num_steps": self._num_steps,
+            "records": [dataclasses.asdict(r) for r in self._records.values()],
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def _argument_names(filename: str, lineno: int) -> Optional[tuple[str, ...]]:
+    """Return the source text of the field arguments of the exchange call at `filename:lineno`."""
+    source = "".join(linecache.getlines(filename))
+    if not source:
+        return None
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    def _is_exchange_call(node: ast.AST) -> bool:
+        if not isinstance(node, ast.Call):
+            return False
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        return name in _EXCHANGE_METHOD_NAMES and (
+            node.lineno <= lineno <= (node.end_lineno or node.lineno)
+        )
+
+    calls = [node for node in ast.walk(tree) if _is_exchange_call(node)]
+    if not calls:
+        return None
+    call = min(calls, key=lambda c: (c.end_lineno or c.lineno) - c.lineno)
+    # `exchange(dim, *fields)` passes the dimension first, `__call__(*fields, dim=dim)` as keyword
+    args = call.args if any(k.arg == "dim" for k in call.keywords) else call.args[1:]
+    return tuple(ast.unparse(arg) for arg in args)
+
+
+def _call_site() -> tuple[str, int, str]:
+    """Find the first frame outside of this module and return (filename, lineno, label)."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return "", 0, "<unknown>"
+    module = frame.f_globals.get("__name__", frame.f_code.co_filename)
+    label = f"{module}:{frame.f_code.co_name}:{frame.f_lineno}"
+    return frame.f_code.co_filename, frame.f_lineno, label
+
+
+def _field_names(filename: str, lineno: int, num_fields: int) -> list[str]:
+    names = _argument_names(filename, lineno) if filename else None
+    if names is None or len(names) != num_fields or any(n.startswith("*") for n in names):
+        return [f"field_{i}" for i in range(num_fields)]
+    return list(names)
+
+
+def _points_per_horizontal_entry(field: Field, itemsize: int) -> int:
+    return int(np.prod(field.ndarray.shape[1:], dtype=int)) * itemsize
+
+
+@dataclasses.dataclass
+class InstrumentedResult:
+    """Wraps an :class:`~definitions.ExchangeResult` and records the time spent in `wait()`."""
+
+    result: definitions.ExchangeResult
+    records: Sequence[ExchangeRecord]
+    _done: bool = False
+
+    def wait(self):
+        if self._done:
+            return
+        was_ready = self.result.is_ready()
+        start = time.perf_counter()
+        self.result.wait()
+        elapsed = (time.perf_counter() - start) / max(len(self.records), 1)
+        for record in self.records:
+            if was_ready:
+                record.wait_transfer_time += elapsed
+            else:
+                record.wait_idle_time += elapsed
+        self._done = True
+
+    def is_ready(self) -> bool:
+        return self.result.is_ready()
+
+
+class InstrumentedExchange:
+    """
+    :class:`~definitions.ExchangeRuntime` recording communication statistics of a wrapped runtime.
+
+    Times of exchanges of several fields in one call are attributed to the fields in equal parts,
+    bytes are attributed exactly.
+
+    Args:
+        runtime: the exchange runtime doing the actual communication
+        props: process properties of the run
+        decomposition_info: decomposition info the runtime was created with
+        statistics: statistics to record into, a new instance is created if not passed
+    """
+
+    def __init__(
+        self,
+        runtime: definitions.ExchangeRuntime,
+        props: definitions.ProcessProperties,
+        decomposition_info: definitions.DecompositionInfo,
+        statistics: Optional[ExchangeStatistics] = None,
+    ):
+        self._runtime = runtime
+        self._statistics = statistics if statistics is not None else ExchangeStatistics()
+        self._volumes = compute_halo_volumes(props, decomposition_info)
+        self._reduced_precision = definitions.ReducedPrecisionFields()
+
+    @property
+    def statistics(self) -> ExchangeStatistics:
+        return self._statistics
+
+    @property
+    def runtime(self) -> definitions.ExchangeRuntime:
+        return self._runtime
+
+    def get_size(self):
+        return self._runtime.get_size()
+
+    def my_rank(self):
+        return self._runtime.my_rank()
+
+    def use_reduced_precision(self, *fields: Field) -> None:
+        self._reduced_precision.add(*fields)
+        self._runtime.use_reduced_precision(*fields)
+
+    def exchange(self, dim: Dimension, *fields: Field) -> InstrumentedResult:
+        filename, lineno, call_site = _call_site()
+        volume = self._volumes[dim]
+        records = []
+        for name, field in zip(_field_names(filename, lineno, len(fields)), fields):
+            record = self._statistics.record(call_site, name, dim)
+            entry_bytes = _points_per_horizontal_entry(
+                field, self._reduced_precision.payload_itemsize(field)
+            )
+            record.calls += 1
+            record.bytes_sent += volume.total_send_points * entry_bytes
+            record.bytes_received += volume.total_receive_points * entry_bytes
+            record.num_neighbors = volume.num_neighbors
+            records.append(record)
+
+        start = time.perf_counter()
+        result = self._runtime.exchange(dim, *fields)
+        elapsed = time.perf_counter() - start
+        for record in records:
+            record.start_time += elapsed / max(len(records), 1)
+        return InstrumentedResult(result, records)
+
+    def exchange_and_wait(self, dim: Dimension, *fields: Field):
+        self.exchange(dim, *fields).wait()
+
+    def __call__(self, *args, **kwargs) -> Optional[InstrumentedResult]:
+        """Perform a halo exchange operation, see :meth:`~definitions.SingleNodeExchange.__call__`."""
+        dim = kwargs.get("dim", None)
+        if dim is None:
+            raise ValueError("Need to define a dimension.")
+        wait = kwargs.get("wait", True)
+
+        res = self.exchange(dim, *args)
+        if wait:
+            res.wait()
+        else:
+            return res
+
+
+@definitions.create_halo_exchange_wait.register(InstrumentedExchange)
+def create_instrumented_halo_exchange_wait(
+    runtime: InstrumentedExchange,
+) -> definitions.HaloExchangeWait:
+    return definitions.HaloExchangeWait(runtime)
+
+
+_TIMES: Final[tuple[str, ...]] = ("start_time", "wait_idle_time", "wait_transfer_time")
+
+
+def reduce_statistics(
+    statistics: ExchangeStatistics, props: definitions.ProcessProperties
+) -> Optional[dict[str, Any]]:
+    """
+    Aggregate the statistics of all ranks on rank 0.
+
+    Bytes are summed over all ranks, times are reported as minimum, mean and maximum over the
+    ranks that executed the exchange. This is a collective operation, it returns the aggregated
+    statistics on rank 0 and `None` on all other ranks.
+    """
+    local = statistics.to_dict()
+    if props.comm_size > 1:
+        gathered = props.comm.gather(local, root=0)
+        if props.rank != 0:
+            return None
+    else:
+        gathered = [local]
+
+    num_steps = max(max(g["num_steps"] for g in gathered), 1)
+    entries: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
+    for rank_stats in gathered:
+        for r in rank_stats["records"]:
+            entries.setdefault((r["call_site"], r["field"], r["dim"]), []).append(r)
+
+    records = []
+    for (call_site, field, dim), per_rank in entries.items():
+        calls = max(r["calls"] for r in per_rank)
+        aggregated = {
+            "call_site": call_site,
+            "field": field,
+            "dim": dim,
+            "calls": calls,
+            "calls_per_step": calls / num_steps,
+            "num_ranks": len(per_rank),
+            "bytes_sent": sum(r["bytes_sent"] for r in per_rank),
+            "bytes_received": sum(r["bytes_received"] for r in per_rank),
+            "max_neighbors": max(r["num_neighbors"] for r in per_rank),
+        }
+        for t in _TIMES:
+            values = [r[t] for r in per_rank]
+            aggregated[t] = {
+                "min": min(values),
+                "mean": sum(values) / len(values),
+                "max": max(values),
+            }
+        records.append(aggregated)
+
+    records.sort(
+        key=lambda r: sum(r[t]["max"] for t in _TIMES),
+        reverse=True,
+    )
+    return {"num_ranks": props.comm_size, "num_steps": num_steps, "records": records}
+
+
+def format_table(report: dict[str, Any]) -> str:
+    """Format aggregated statistics as returned by :func:`reduce_statistics` as a text table."""
+    header = (
+        f"{'call site':<60} {'field':<32} {'dim':<6} {'calls/step':>10} {'MB sent':>10} "
+        f"{'MB recv':>10} {'nbrs':>5} {'start [s]':>10} {'idle [s]':>10} {'transfer [s]':>12}"
+    )
+    lines = [
+        f"halo exchange statistics: {report['num_ranks']} ranks, {report['num_steps']} steps, "
+        "times are maximum over ranks",
+        header,
+        "-" * len(header),
+    ]
+    for r in report["records"]:
+        lines.append(
+            f"{r['call_site'][-60:]:<60} {r['field'][-32:]:<32} {r['dim']:<6} "
+            f"{r['calls_per_step']:>10.2f} {r['bytes_sent'] / 1e6:>10.3f} "
+            f"{r['bytes_received'] / 1e6:>10.3f} {r['max_neighbors']:>5d} "
+            f"{r['start_time']['max']:>10.4f} {r['wait_idle_time']['max']:>10.4f} "
+            f"{r['wait_transfer_time']['max']:>12.4f}"
+        )
+    return "\n".join(lines)
+
+
+def write_json(report: dict[str, Any], path: pathlib.Path) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    log.info(f"halo exchange statistics written to '{path}'")
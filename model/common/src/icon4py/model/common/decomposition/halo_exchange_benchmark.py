@@ -0,0 +1,373 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Microbenchmark of the halo exchange for increasing number of ranks and halo depths.
+
+The global grid (a synthetic periodic triangular grid or an ICON grid file) is partitioned for
+each rank count, the decomposition info of each rank is constructed and a halo exchange runtime
+is set up on a sub communicator of that size. Then `exchange_and_wait` is timed for bundles of
+fields typical of the dynamical core.
+
+Usage (on a single multi-core node):
+
+    mpirun -np 8 python -m icon4py.model.common.decomposition.halo_exchange_benchmark --torus 256 256
+    mpirun -np 8 python -m icon4py.model.common.decomposition.halo_exchange_benchmark \
+        --grid_file testdata/grids/r02b04_global/icon_grid_0013_R02B04_R.nc --output halo.json
+
+For each rank count, halo depth and field bundle the median over all repetitions of the slowest
+rank's time is reported as latency. The effective bandwidth is the number of bytes received by all
+ranks divided by the latency.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import pathlib
+import time
+from typing import Final, Optional
+
+import click
+import gt4py.next as gtx
+import numpy as np
+
+from icon4py.model.common import dimension as dims, model_backends
+from icon4py.model.common.decomposition import (
+    decomposer as decomp,
+    definitions,
+    exchange_statistics,
+    mpi_decomposition,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldBundle:
+    """Fields exchanged together: one `exchange_and_wait` per horizontal dimension."""
+
+    name: str
+    fields: tuple[tuple[gtx.Dimension, int], ...]  # (horizontal dimension, number of levels)
+
+
+BUNDLES: Final[tuple[FieldBundle, ...]] = (
+    FieldBundle("edge_1x65", ((dims.EdgeDim, 65),)),
+    FieldBundle("edge_2x65", ((dims.EdgeDim, 65), (dims.EdgeDim, 65))),
+    FieldBundle("edge_2x120", ((dims.EdgeDim, 120), (dims.EdgeDim, 120))),
+    FieldBundle("cell_3x65", ((dims.CellDim, 65), (dims.CellDim, 65), (dims.CellDim, 66))),
+    FieldBundle(
+        "mixed_cell_3x65_edge_1x65",
+        ((dims.CellDim, 65), (dims.CellDim, 65), (dims.CellDim, 66), (dims.EdgeDim, 65)),
+    ),
+)
+
+
+def torus_connectivities(nx: int, ny: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Construct C2V, C2E and C2E2C of a periodic grid of `nx` x `ny` parallelograms split into two triangles.
+
+    It uses the same numbering as :class:`~icon4py.model.common.grid.simple.SimpleGrid` (which is
+    the case `nx = ny = 3`).
+    """
+    j, i = np.divmod(np.arange(nx * ny), nx)
+
+    def vertex(i, j):
+        return (j % ny) * nx + (i % nx)
+
+    def edge(i, j, k):
+        # k: 0 = horizontal, 1 = diagonal, 2 = vertical edge starting at vertex (i, j)
+        return 3 * vertex(i, j) + k
+
+    # a row of upper triangles is followed by a row of lower triangles
+    upper = 2 * nx * j + i
+    lower = upper + nx
+    num_cells = 2 * nx * ny
+    c2v = np.empty((num_cells, 3), dtype=gtx.int32)
+    c2e = np.empty((num_cells, 3), dtype=gtx.int32)
+    c2v[upper] = np.stack((vertex(i, j), vertex(i + 1, j), vertex(i + 1, j + 1)), axis=1)
+    c2v[lower] = np.stack((vertex(i, j), vertex(i, j + 1), vertex(i + 1, j + 1)), axis=1)
+    c2e[upper] = np.stack((edge(i, j, 0), edge(i, j, 1), edge(i + 1, j, 2)), axis=1)
+    c2e[lower] = np.stack((edge(i, j, 1), edge(i, j, 2), edge(i, j + 1, 0)), axis=1)
+
+    # every edge has exactly two neighbouring cells on the torus
+    e2c = np.repeat(np.arange(num_cells), 3)[np.argsort(c2e.ravel(), kind="stable")].reshape(-1, 2)
+    first = e2c[c2e, 0]
+    c2e2c = np.where(first == np.arange(num_cells)[:, np.newaxis], e2c[c2e, 1], first)
+    return c2v, c2e, c2e2c.astype(gtx.int32)
+
+
+def _read_grid_file(
+    grid_file: pathlib.Path,
+    limited_area: bool,
+    shared_storage: Optional[definitions.SharedStorage] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    from icon4py.model.common.grid import grid_manager as gm, vertical as v_grid
+
+    with gm.GridManager(
+        gm.ToZeroBasedIndexTransformation(),
+        grid_file,
+        v_grid.VerticalGridConfig(num_levels=1),
+        shared_storage=shared_storage,
+    ) as manager:
+        manager(backend=None, limited_area=limited_area)
+        grid = manager.grid
+    return (
+        grid.connectivities[dims.C2VDim],
+        grid.connectivities[dims.C2EDim],
+        grid.connectivities[dims.C2E2CDim],
+    )
+
+
+def _allocate_bundle(
+    bundle: FieldBundle,
+    decomposition_info: definitions.DecompositionInfo,
+    backend,
+) -> dict[gtx.Dimension, list[gtx.Field]]:
+    sizes = {
+        dims.CellDim: decomposition_info.num_cells,
+        dims.EdgeDim: decomposition_info.num_edges,
+        dims.VertexDim: decomposition_info.num_vertices,
+    }
+    rng = np.random.default_rng()
+    fields: dict[gtx.Dimension, list[gtx.Field]] = {}
+    for dim, levels in bundle.fields:
+        fields.setdefault(dim, []).append(
+            gtx.as_field(
+                (dim, dims.KDim), rng.uniform(size=(sizes[dim], levels)), allocator=backend
+            )
+        )
+    return fields
+
+
+def _received_bytes(
+    fields: dict[gtx.Dimension, list[gtx.Field]],
+    volumes: dict[gtx.Dimension, exchange_statistics.HaloVolume],
+) -> int:
+    return sum(
+        volumes[dim].total_receive_points * f.ndarray.shape[1] * f.ndarray.itemsize
+        for dim, dim_fields in fields.items()
+        for f in dim_fields
+    )
+
+
+def _time_bundle(
+    exchange: definitions.ExchangeRuntime,
+    fields: dict[gtx.Dimension, list[gtx.Field]],
+    comm,
+    warmup: int,
+    repetitions: int,
+) -> np.ndarray:
+    from mpi4py import MPI
+
+    timings = []
+    for rep in range(warmup + repetitions):
+        comm.Barrier()
+        start = time.perf_counter()
+        for dim, dim_fields in fields.items():
+            exchange.exchange_and_wait(dim, *dim_fields)
+        elapsed = time.perf_counter() - start
+        if rep >= warmup:
+            timings.append(comm.allreduce(elapsed, op=MPI.MAX))
+    return np.asarray(timings)
+
+
+def _default_rank_counts(world_size: int) -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= world_size:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != world_size:
+        counts.append(world_size)
+    return counts
+
+
+def run_benchmark(
+    c2v: np.ndarray,
+    c2e: np.ndarray,
+    c2e2c: np.ndarray,
+    rank_counts: list[int],
+    halo_levels: list[int],
+    decomposer: decomp.Decomposer,
+    warmup: int = 5,
+    repetitions: int = 50,
+    backend=None,
+) -> Optional[list[dict]]:
+    """
+    Run the benchmark for all rank counts and halo depths, results are returned on rank 0 only.
+
+    Must be called by all ranks of `MPI.COMM_WORLD`, ranks not taking part in a rank count are
+    idle during that measurement.
+    """
+    from mpi4py import MPI
+
+    world = MPI.COMM_WORLD
+    results = []
+    for num_ranks in rank_counts:
+        color = 0 if world.Get_rank() < num_ranks else MPI.UNDEFINED
+        comm = world.Split(color, world.Get_rank())
+        if comm != MPI.COMM_NULL:
+            props = mpi_decomposition.MPICommProcessProperties(comm)
+            cell_owner = decomposer(c2e2c, num_ranks)
+            for depth in halo_levels:
+                decomposition_info = decomp.create_decomposition_info(
+                    cell_owner, props.rank, c2v, c2e, num_levels=1, halo_levels=depth
+                )
+                exchange = definitions.create_exchange(props, decomposition_info)
+                volumes = exchange_statistics.compute_halo_volumes(props, decomposition_info)
+                for bundle in BUNDLES:
+                    fields = _allocate_bundle(bundle, decomposition_info, backend)
+                    timings = _time_bundle(exchange, fields, comm, warmup, repetitions)
+                    total_bytes = comm.allreduce(_received_bytes(fields, volumes), op=MPI.SUM)
+                    max_neighbors = comm.allreduce(
+                        max(v.num_neighbors for v in volumes.values()), op=MPI.MAX
+                    )
+                    latency = float(np.median(timings))
+                    results.append(
+                        {
+                            "ranks": num_ranks,
+                            "halo_levels": depth,
+                            "bundle": bundle.name,
+                            "max_neighbors": max_neighbors,
+                            "bytes_received": total_bytes,
+                            "latency_median": latency,
+                            "latency_min": float(np.min(timings)),
+                            "latency_max": float(np.max(timings)),
+                            "bandwidth": total_bytes / latency if latency > 0.0 else 0.0,
+                        }
+                    )
+            comm.Free()
+        world.Barrier()
+    return results if world.Get_rank() == 0 else None
+
+
+def format_results(results: list[dict]) -> str:
+    header = (
+        f"{'ranks':>5} {'halo':>4} {'bundle':<28} {'nbrs':>4} {'MB recv':>10} "
+        f"{'median [us]':>12} {'min [us]':>10} {'max [us]':>10} {'GB/s':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['ranks']:>5d} {r['halo_levels']:>4d} {r['bundle']:<28} {r['max_neighbors']:>4d} "
+            f"{r['bytes_received'] / 1e6:>10.3f} {r['latency_median'] * 1e6:>12.1f} "
+            f"{r['latency_min'] * 1e6:>10.1f} {r['latency_max'] * 1e6:>10.1f} "
+            f"{r['bandwidth'] / 1e9:>8.3f}"
+        )
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option(
+    "--torus",
+    nargs=2,
+    type=int,
+    default=(128, 128),
+    show_default=True,
+    help="Size (nx ny) of the synthetic periodic grid, used if no grid file is given.",
+)
+@click.option(
+    "--grid_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path),
+    default=None,
+    help="ICON grid file to be partitioned instead of the synthetic grid.",
+)
+@click.option("--limited_area", is_flag=True, help="The grid file is a limited area grid.")
+@click.option(
+    "--rank_counts",
+    default=None,
+    help="Comma separated rank counts, defaults to powers of two up to the number of MPI ranks.",
+)
+@click.option(
+    "--halo_levels",
+    default="1,2",
+    show_default=True,
+    help="Comma separated number of halo rows of cells.",
+)
+@click.option(
+    "--decomposer",
+    type=click.Choice(["bfs", "metis"]),
+    default="bfs",
+    show_default=True,
+    help="Partitioning algorithm, 'metis' requires pymetis.",
+)
+@click.option("--warmup", default=5, show_default=True)
+@click.option("--repetitions", default=50, show_default=True)
+@click.option(
+    "--backend",
+    type=click.Choice(list(model_backends.BACKENDS.keys())),
+    default=model_backends.DEFAULT_BACKEND,
+    show_default=True,
+    help="Backend (allocator) of the exchanged fields.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    default=None,
+    help="Write the results to this JSON file.",
+)
+def halo_exchange_benchmark(
+    torus,
+    grid_file,
+    limited_area,
+    rank_counts,
+    halo_levels,
+    decomposer,
+    warmup,
+    repetitions,
+    backend,
+    output,
+):
+    mpi_decomposition.init_mpi()
+    from mpi4py import MPI
+
+    world = MPI.COMM_WORLD
+    if grid_file is not None:
+        # the global tables are read once per node and shared by all ranks of the node
+        shared_storage = definitions.create_shared_storage(
+            mpi_decomposition.MPICommProcessProperties(world)
+        )
+        c2v, c2e, c2e2c = _read_grid_file(grid_file, limited_area, shared_storage)
+        grid_name = grid_file.name
+    else:
+        c2v, c2e, c2e2c = torus_connectivities(*torus)
+        grid_name = f"torus_{torus[0]}x{torus[1]}"
+
+    counts = (
+        [int(n) for n in rank_counts.split(",")]
+        if rank_counts
+        else _default_rank_counts(world.Get_size())
+    )
+    if max(counts) > world.Get_size():
+        raise ValueError(f"rank counts {counts} exceed the number of MPI ranks {world.Get_size()}")
+
+    results = run_benchmark(
+        c2v,
+        c2e,
+        c2e2c,
+        rank_counts=counts,
+        halo_levels=[int(n) for n in halo_levels.split(",")],
+        decomposer=decomp.MetisDecomposer()
+        if decomposer == "metis"
+        else decomp.BreadthFirstDecomposer(),
+        warmup=warmup,
+        repetitions=repetitions,
+        backend=model_backends.BACKENDS[backend],
+    )
+    if results is not None:
+        print(f"halo exchange benchmark on grid '{grid_name}' with {c2v.shape[0]} cells")
+        print(format_results(results))
+        if output is not None:
+            with open(output, "w") as f:
+                json.dump(
+                    {"grid": grid_name, "num_cells": c2v.shape[0], "results": results}, f, indent=2
+                )
+
+
+if __name__ == "__main__":
+    halo_exchange_benchmark()
@@ -0,0 +1,507 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Load balance diagnostics and weighted repartitioning.
+
+A :class:`LoadRecorder` measures the compute time each rank spends in the granules (time spent
+waiting in halo exchanges is subtracted if the exchange is instrumented). At the end of a run
+:func:`gather_measurement` collects the times together with the owned and halo sizes of the
+:class:`~definitions.DecompositionInfo` and the owner of every global cell on rank 0.
+
+From a measurement :func:`rebalance` fits a cost per cell for each :class:`CellZone`
+(interior, lateral boundary and nudging zone of limited area grids) plus a cost per halo cell,
+and passes the resulting cell weights to a :class:`~decomposer.Decomposer`. It reports the
+imbalance factor (maximum over mean of the rank times) of the measured run, and the imbalance
+factor predicted by the cost model before and after repartitioning.
+
+Usage:
+    # in the model run
+    >>> recorder = LoadRecorder(decomposition_info, exchange.statistics)  # doctest: +SKIP
+    >>> with recorder.time("solve_nonhydro"):  # doctest: +SKIP
+    ...     solve_nonhydro.time_step(...)
+    >>> measurement = gather_measurement(recorder, props)  # doctest: +SKIP
+    >>> if measurement is not None:  # doctest: +SKIP
+    ...     write_measurement(measurement, pathlib.Path("load_balance.json"))
+
+    # offline, reports the imbalance predicted for a weighted repartitioning
+    $ python -m icon4py.model.common.decomposition.load_balance load_balance.json grid.nc \
+        --report report.json
+
+The driver reads its decomposition from the serialized ICON data, so a partition computed by
+:func:`rebalance` cannot be used for a model run yet. It is meant for a decomposition built with
+:func:`decomposer.create_decomposition_info`; the command line tool therefore only writes the
+report.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import enum
+import json
+import logging
+import pathlib
+import time
+from typing import Any, Iterator, Optional, Sequence
+
+import click
+import numpy as np
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import (
+    decomposer as decomp,
+    definitions,
+    exchange_statistics as exchange_stats,
+)
+from icon4py.model.common.grid import horizontal as h_grid, refinement
+
+
+log = logging.getLogger(__name__)
+
+
+class CellZone(enum.IntEnum):
+    """Classes of cells with a different amount of work per cell."""
+
+    #: fully prognostic cells in the unordered interior of the grid
+    INTERIOR = 0
+    #: lateral boundary rows of a limited area grid
+    LATERAL_BOUNDARY = 1
+    #: nudging zone and remaining ordered rows of a limited area grid
+    NUDGING = 2
+
+
+def cell_zones(refin_ctrl: np.ndarray) -> np.ndarray:
+    """Classify cells into :class:`CellZone` by their refinement control value."""
+    values = refinement.convert_to_unnested_refinement_values(np.asarray(refin_ctrl), dims.CellDim)
+    nudging_start = refinement.refine_control_value(dims.CellDim, h_grid.Zone.NUDGING).value
+    zones = np.full(values.shape, CellZone.INTERIOR, dtype=np.int32)
+    zones[(values > 0) & (values < nudging_start)] = CellZone.LATERAL_BOUNDARY
+    zones[values >= nudging_start] = CellZone.NUDGING
+    return zones
+
+
+def imbalance_factor(rank_times: Sequence[float]) -> float:
+    """Maximum over mean of the per rank times: 1.0 is a perfectly balanced run."""
+    rank_times = np.asarray(rank_times, dtype=float)
+    mean = rank_times.mean()
+    return float(rank_times.max() / mean) if mean > 0.0 else 1.0
+
+
+class LoadRecorder:
+    """
+    Record the compute time of granules on this rank.
+
+    Args:
+        decomposition_info: decomposition of this rank
+        exchange_statistics: statistics of an :class:`~exchange_statistics.InstrumentedExchange`,
+            if given the time spent waiting for halo exchanges is not counted as compute time
+    """
+
+    def __init__(
+        self,
+        decomposition_info: definitions.DecompositionInfo,
+        exchange_statistics: Optional[exchange_stats.ExchangeStatistics] = None,
+    ):
+        self._decomposition_info = decomposition_info
+        self._exchange_statistics = exchange_statistics
+        self._times: dict[str, float] = collections.defaultdict(float)
+        self._calls: dict[str, int] = collections.defaultdict(int)
+
+    @property
+    def decomposition_info(self) -> definitions.DecompositionInfo:
+        return self._decomposition_info
+
+    @property
+    def times(self) -> dict[str, float]:
+        return dict(self._times)
+
+    @property
+    def calls(self) -> dict[str, int]:
+        return dict(self._calls)
+
+    def _exchange_wait_time(self) -> float:
+        if self._exchange_statistics is None:
+            return 0.0
+        return sum(r.wait_time for r in self._exchange_statistics.records)
+
+    @contextlib.contextmanager
+    def time(self, granule: str) -> Iterator[None]:
+        waited = self._exchange_wait_time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._times[granule] += elapsed - (self._exchange_wait_time() - waited)
+            self._calls[granule] += 1
+
+    def reset(self) -> None:
+        self._times.clear()
+        self._calls.clear()
+
+
+@dataclasses.dataclass(frozen=True)
+class RankLoad:
+    """Measured compute times and decomposition sizes of one rank."""
+
+    rank: int
+    granule_times: dict[str, float]
+    owned: dict[str, int]
+    halo: dict[str, int]
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.granule_times.values())
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadMeasurement:
+    """Loads of all ranks of a run and the owner rank of each global cell."""
+
+    loads: list[RankLoad]
+    cell_owner: np.ndarray
+
+    @property
+    def num_ranks(self) -> int:
+        return len(self.loads)
+
+    @property
+    def granules(self) -> list[str]:
+        return sorted({g for load in self.loads for g in load.granule_times})
+
+    def granule_imbalance(self) -> dict[str, float]:
+        return {
+            g: imbalance_factor([load.granule_times.get(g, 0.0) for load in self.loads])
+            for g in self.granules
+        }
+
+    def imbalance(self) -> float:
+        return imbalance_factor([load.total_time for load in self.loads])
+
+
+def _entry_counts(
+    decomposition_info: definitions.DecompositionInfo,
+) -> tuple[dict[str, int], dict[str, int]]:
+    owned, halo = {}, {}
+    for dim in (dims.CellDim, dims.EdgeDim, dims.VertexDim):
+        try:
+            mask = decomposition_info.owner_mask(dim)
+        except KeyError:
+            continue
+        owned[dim.value] = int(np.count_nonzero(mask))
+        halo[dim.value] = int(mask.shape[0] - owned[dim.value])
+    return owned, halo
+
+
+def gather_measurement(
+    recorder: LoadRecorder, props: definitions.ProcessProperties
+) -> Optional[LoadMeasurement]:
+    """
+    Collect the loads of all ranks on rank 0.
+
+    This is a collective operation, it returns the measurement on rank 0 and `None` on all other
+    ranks.
+    """
+    owned, halo = _entry_counts(recorder.decomposition_info)
+    local = (
+        RankLoad(rank=props.rank, granule_times=recorder.times, owned=owned, halo=halo),
+        recorder.decomposition_info.global_index(
+            dims.CellDim, definitions.DecompositionInfo.EntryType.OWNED
+        ),
+    )
+    if props.comm_size > 1:
+        gathered = props.comm.gather(local, root=0)
+        if props.rank != 0:
+            return None
+    else:
+        gathered = [local]
+
+    num_cells = max(int(cells.max()) + 1 for _, cells in gathered if cells.size > 0)
+    cell_owner = np.full(num_cells, -1, dtype=np.int32)
+    for load, cells in gathered:
+        cell_owner[cells] = load.rank
+    return LoadMeasurement(loads=[load for load, _ in gathered], cell_owner=cell_owner)
+
+
+def write_measurement(measurement: LoadMeasurement, path: pathlib.Path) -> None:
+    """Write the loads to the JSON file `path` and the cell owners next to it as `.npy` file."""
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "num_ranks": measurement.num_ranks,
+                "imbalance": measurement.imbalance(),
+                "granule_imbalance": measurement.granule_imbalance(),
+                "loads": [dataclasses.asdict(load) for load in measurement.loads],
+            },
+            f,
+            indent=2,
+        )
+    np.save(path.with_suffix(".npy"), measurement.cell_owner)
+    log.info(f"load balance measurement written to '{path}'")
+
+
+def read_measurement(path: pathlib.Path) -> LoadMeasurement:
+    with open(path) as f:
+        data = json.load(f)
+    return LoadMeasurement(
+        loads=[RankLoad(**load) for load in data["loads"]],
+        cell_owner=np.load(path.with_suffix(".npy")),
+    )
+
+
+def _non_negative_least_squares(matrix: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Least squares solution constrained to non-negative values, by dropping negative unknowns."""
+    active = np.any(matrix != 0, axis=0)
+    solution = np.zeros(matrix.shape[1])
+    while active.any():
+        solution[:] = 0.0
+        solution[active], *_ = np.linalg.lstsq(matrix[:, active], rhs, rcond=None)
+        if (solution >= 0.0).all():
+            break
+        active[np.argmin(solution)] = False
+    return np.maximum(solution, 0.0)
+
+
+def fit_cell_costs(
+    measurement: LoadMeasurement, zones: Optional[np.ndarray] = None
+) -> dict[str, float]:
+    """
+    Fit the compute time per owned cell of each :class:`CellZone` and per halo cell.
+
+    The time of rank `r` is modelled as `t_r = sum_z n_rz * c_z + h_r * c_halo` with `n_rz` the
+    number of owned cells in zone `z` and `h_r` the number of halo cells of rank `r`. The costs
+    are fitted to the measured times in the least squares sense under the constraint that they
+    are non-negative.
+    """
+    cell_owner = measurement.cell_owner
+    zones = np.zeros(cell_owner.shape, dtype=np.int32) if zones is None else zones
+    counts = np.zeros((measurement.num_ranks, len(CellZone) + 1))
+    valid = cell_owner >= 0
+    np.add.at(counts, (cell_owner[valid], zones[valid]), 1.0)
+    counts[:, -1] = [load.halo.get(dims.CellDim.value, 0) for load in measurement.loads]
+    times = np.asarray([load.total_time for load in measurement.loads])
+    costs = _non_negative_least_squares(counts, times)
+    if not costs[:-1].any():
+        # the measurement does not determine any zone cost: distribute the time uniformly
+        costs[:-1] = times.sum() / max(counts[:, :-1].sum(), 1.0)
+        costs[-1] = 0.0
+    return {
+        **{zone.name.lower(): float(costs[zone]) for zone in CellZone},
+        "halo": float(costs[-1]),
+    }
+
+
+def _predicted_times(
+    partition: np.ndarray,
+    num_partitions: int,
+    weights: np.ndarray,
+    halo_cost: float,
+    halo_cells: Sequence[int],
+) -> np.ndarray:
+    valid = partition >= 0
+    owned = np.bincount(partition[valid], weights=weights[valid], minlength=num_partitions)
+    return owned + halo_cost * np.asarray(halo_cells, dtype=float)
+
+
+def _vertex_to_cell(c2v: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Invert the cell to vertex table, returns the cells of vertex v as cells[offsets[v]:offsets[v + 1]]."""
+    vertices = c2v.ravel()
+    order = np.argsort(vertices, kind="stable")
+    cells = np.repeat(np.arange(c2v.shape[0]), c2v.shape[1])[order]
+    offsets = np.zeros(vertices.max() + 2, dtype=np.int64)
+    np.cumsum(np.bincount(vertices, minlength=offsets.size - 1), out=offsets[1:])
+    return cells, offsets
+
+
+def _halo_cells(
+    partition: np.ndarray, num_partitions: int, c2v: np.ndarray, halo_levels: int
+) -> list[int]:
+    """
+    Count the halo cells of all partitions in one pass over the grid.
+
+    The halo rows are the same as in :func:`decomposer.create_decomposition_info`: a halo row
+    consists of the cells that share a vertex with the previous row and are not yet local. The
+    local cells of all partitions are handled together as (partition, cell) pairs.
+    """
+    num_cells = c2v.shape[0]
+    num_vertices = int(c2v.max()) + 1
+    v2c_cells, v2c_offsets = _vertex_to_cell(c2v)
+
+    owned = np.flatnonzero(partition >= 0)
+    local = np.sort(partition[owned].astype(np.int64) * num_cells + owned)
+    row = local
+    for _ in range(halo_levels):
+        ranks, cells = np.divmod(row, num_cells)
+        rank_vertices = np.unique(ranks[:, np.newaxis] * num_vertices + c2v[cells])
+        ranks, vertices = np.divmod(rank_vertices, num_vertices)
+        num_neighbors = v2c_offsets[vertices + 1] - v2c_offsets[vertices]
+        first = np.repeat(
+            v2c_offsets[vertices] - np.cumsum(num_neighbors) + num_neighbors, num_neighbors
+        )
+        neighbors = v2c_cells[first + np.arange(num_neighbors.sum())]
+        candidates = np.unique(np.repeat(ranks, num_neighbors) * num_cells + neighbors)
+        row = np.setdiff1d(candidates, local, assume_unique=True)
+        local = np.union1d(local, row)
+    return (
+        np.bincount(local // num_cells, minlength=num_partitions)
+        - np.bincount(partition[owned], minlength=num_partitions)
+    ).tolist()
+
+
+def rebalance(
+    measurement: LoadMeasurement,
+    c2e2c: np.ndarray,
+    c2v: np.ndarray,
+    decomposer: decomp.Decomposer,
+    zones: Optional[np.ndarray] = None,
+    num_partitions: Optional[int] = None,
+    halo_levels: int = 2,
+) -> tuple[np.ndarray, dict[str, Any]]:
+    """
+    Compute a new cell partition with cell weights fitted to a measurement.
+
+    Args:
+        measurement: loads of a previous run
+        c2e2c: global cell to neighbour cell table
+        c2v: global cell to vertex table
+        decomposer: decomposer used for the weighted partitioning
+        zones: :class:`CellZone` of each global cell, see :func:`cell_zones`. If not given all
+            cells are in the same zone.
+        num_partitions: number of partitions of the new partition, defaults to the number of
+            ranks of the measurement
+        halo_levels: number of halo rows of cells
+
+    Returns:
+        the new partition and a report with the measured and predicted imbalance factors
+    """
+    num_partitions = num_partitions or measurement.num_ranks
+    zones = np.zeros(c2e2c.shape[0], dtype=np.int32) if zones is None else zones
+    costs = fit_cell_costs(measurement, zones)
+    zone_costs = np.asarray([costs[zone.name.lower()] for zone in CellZone])
+    weights = zone_costs[zones]
+
+    partition = decomposer(c2e2c, num_partitions, weights=weights)
+
+    before = _predicted_times(
+        measurement.cell_owner,
+        measurement.num_ranks,
+        weights,
+        costs["halo"],
+        _halo_cells(measurement.cell_owner, measurement.num_ranks, c2v, halo_levels),
+    )
+    after = _predicted_times(
+        partition,
+        num_partitions,
+        weights,
+        costs["halo"],
+        _halo_cells(partition, num_partitions, c2v, halo_levels),
+    )
+    report = {
+        "num_ranks": measurement.num_ranks,
+        "num_partitions": num_partitions,
+        "measured_imbalance": measurement.imbalance(),
+        "granule_imbalance": measurement.granule_imbalance(),
+        "cell_costs": costs,
+        "predicted_imbalance_before": imbalance_factor(before),
+        "predicted_imbalance_after": imbalance_factor(after),
+        "predicted_times_before": before.tolist(),
+        "predicted_times_after": after.tolist(),
+    }
+    log.info(
+        f"load imbalance: measured {report['measured_imbalance']:.3f}, predicted "
+        f"{report['predicted_imbalance_before']:.3f} -> {report['predicted_imbalance_after']:.3f}"
+    )
+    return partition, report
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Format a report as returned by :func:`rebalance` as text."""
+    lines = [
+        f"load balance: {report['num_ranks']} ranks measured, {report['num_partitions']} partitions",
+        f"measured imbalance factor (max/mean): {report['measured_imbalance']:.3f}",
+    ]
+    lines.extend(
+        f"    {granule:<24} {factor:.3f}" for granule, factor in report["granule_imbalance"].items()
+    )
+    lines.append("fitted cost per cell [s]:")
+    lines.extend(f"    {name:<24} {cost:.3e}" for name, cost in report["cell_costs"].items())
+    lines.append(
+        f"predicted imbalance factor: {report['predicted_imbalance_before']:.3f} (before) -> "
+        f"{report['predicted_imbalance_after']:.3f} (after)"
+    )
+    return "\n".join(lines)
+
+
+def _read_grid_file(
+    grid_file: pathlib.Path, limited_area: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    from icon4py.model.common.grid import grid_manager as gm, vertical as v_grid
+
+    with gm.GridManager(
+        gm.ToZeroBasedIndexTransformation(), grid_file, v_grid.VerticalGridConfig(num_levels=1)
+    ) as manager:
+        manager(backend=None, limited_area=limited_area)
+        grid = manager.grid
+        refin_ctrl = manager.refinement[dims.CellDim]
+    return (
+        grid.connectivities[dims.C2E2CDim],
+        grid.connectivities[dims.C2VDim],
+        refin_ctrl,
+    )
+
+
+@click.command()
+@click.argument("measurement", type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path))
+@click.argument("grid_file", type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path))
+@click.option("--limited_area", is_flag=True, help="The grid file is a limited area grid.")
+@click.option(
+    "--num_partitions",
+    type=int,
+    default=None,
+    help="Number of partitions, defaults to the number of ranks of the measured run.",
+)
+@click.option("--halo_levels", default=2, show_default=True, help="Number of halo rows of cells.")
+@click.option(
+    "--decomposer",
+    type=click.Choice(["bfs", "metis"]),
+    default="bfs",
+    show_default=True,
+    help="Partitioner: breadth first chunks or METIS (needs pymetis).",
+)
+@click.option(
+    "--report",
+    "report_file",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    default=None,
+    help="Write the report to this JSON file.",
+)
+def load_balance(
+    measurement, grid_file, limited_area, num_partitions, halo_levels, decomposer, report_file
+):
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    c2e2c, c2v, refin_ctrl = _read_grid_file(grid_file, limited_area)
+    _, report = rebalance(
+        read_measurement(measurement),
+        c2e2c,
+        c2v,
+        decomposer=decomp.MetisDecomposer()
+        if decomposer == "metis"
+        else decomp.BreadthFirstDecomposer(),
+        zones=cell_zones(refin_ctrl) if limited_area else None,
+        num_partitions=num_partitions,
+        halo_levels=halo_levels,
+    )
+    log.info(format_report(report))
+    if report_file is not None:
+        with open(report_file, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    load_balance()
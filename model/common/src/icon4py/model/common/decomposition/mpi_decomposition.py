@@ -11,7 +11,7 @@ from __future__ import annotations
 import functools
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, ClassVar, Final, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Final, Optional, Sequence, Union
 
 import numpy as np
 from gt4py.next import Dimension, Field
@@ -147,6 +147,9 @@ class GHexMultiNodeExchange:
         self._patterns = {dim: self._create_pattern(dim) for dim in dims.global_dimensions.values()}
         log.info(f"patterns for dimensions {self._patterns.keys()} initialized ")
         self._comm = make_communication_object(self._context)
+        self._reduced_precision = definitions.ReducedPrecisionFields()
+        self._payload_buffers: dict[tuple[Dimension, int], data_alloc.NDArray] = {}
+        self._halo_indices: dict[Dimension, data_alloc.NDArray] = {}
 
         # DaCe SDFGConvertible interface
         self.num_of_halo_tasklets = (
@@ -215,12 +218,80 @@ class GHexMultiNodeExchange:
         else:
             raise ValueError(f"Unknown dimension {dim}")
 
+    def use_reduced_precision(self, *fields: Field) -> None:
+        self._reduced_precision.add(*fields)
+
+    def _payload_buffer(
+        self, dim: Dimension, position: int, array: data_alloc.NDArray
+    ) -> data_alloc.NDArray:
+        """
+        Single precision staging buffer for the `position`-th field of an exchange on `dim`.
+
+        The number of levels is padded to an even number such that pairs of single precision
+        values can be sent as one value of the (double precision) field type: GHEX only copies
+        the bytes, and all fields of one exchange need to have the same type.
+        """
+        key = (dim, position)
+        num_levels = array.shape[1] + array.shape[1] % 2
+        buffer = self._payload_buffers.get(key)
+        if (
+            buffer is None
+            or buffer.shape != (array.shape[0], num_levels)
+            or type(buffer) is not type(array)
+        ):
+            xp = data_alloc.array_ns(not isinstance(array, np.ndarray))
+            buffer = xp.zeros(
+                (array.shape[0], num_levels), dtype=self._reduced_precision.payload_dtype
+            )
+            self._payload_buffers[key] = buffer
+        return buffer
+
+    def _halo_index(self, dim: Dimension, array: data_alloc.NDArray) -> data_alloc.NDArray:
+        if dim not in self._halo_indices:
+            xp = data_alloc.array_ns(not isinstance(array, np.ndarray))
+            self._halo_indices[dim] = xp.asarray(
+                self._decomposition_info.local_index(
+                    dim, definitions.DecompositionInfo.EntryType.HALO
+                )
+            )
+        return self._halo_indices[dim]
+
+    def _stage_reduced_precision(
+        self, dim: Dimension, fields: Sequence[Field], sliced_fields: list[data_alloc.NDArray]
+    ) -> Optional[Callable[[], None]]:
+        """
+        Replace the slices of reduced precision fields by single precision copies.
+
+        Returns a function writing the received halo values back into the fields, or `None` if no
+        field is exchanged in reduced precision.
+        """
+        staged = []
+        for i, field in enumerate(fields):
+            if field in self._reduced_precision:
+                array = sliced_fields[i]
+                buffer = self._payload_buffer(dim, i, array)
+                buffer[:, : array.shape[1]] = array
+                staged.append((array, buffer))
+                sliced_fields[i] = buffer.view(array.dtype)
+        if not staged:
+            return None
+
+        def restore():
+            for array, buffer in staged:
+                halo = self._halo_index(dim, array)
+                array[halo] = buffer[halo, : array.shape[1]]
+
+        return restore
+
     def exchange(self, dim: definitions.Dimension, *fields: Sequence[Field]):
         """
         Exchange method that slices the fields based on the dimension and then performs halo exchange.
 
             This operation is *necessary* for the use inside FORTRAN as there fields are larger than the grid (nproma size). where it does not do anything in a purely Python setup.
             the granule context where fields otherwise have length nproma.
+
+        Fields registered with :meth:`use_reduced_precision` are exchanged through single
+        precision staging buffers, the halo values are written back to the fields on `wait()`.
         """
         assert dim in dims.global_dimensions.values()
         pattern = self._patterns[dim]
@@ -230,6 +301,7 @@ class GHexMultiNodeExchange:
 
         # Slice the fields based on the dimension
         sliced_fields = [self._slice_field_based_on_dim(f, dim) for f in fields]
+        restore = self._stage_reduced_precision(dim, fields, sliced_fields)
 
         # Create field descriptors and perform the exchange
         applied_patterns = [
@@ -244,7 +316,7 @@ class GHexMultiNodeExchange:
         ]
         handle = self._comm.exchange(applied_patterns)
         log.debug(f"exchange for {len(fields)} fields of dimension ='{dim.value}' initiated.")
-        return MultiNodeResult(handle, applied_patterns)
+        return MultiNodeResult(handle, applied_patterns, restore)
 
     def exchange_and_wait(self, dim: Dimension, *fields: tuple):
         res = self.exchange(dim, *fields)
@@ -436,10 +508,13 @@ def create_multinode_halo_exchange_wait(runtime: GHexMultiNodeExchange) -> HaloE
 class MultiNodeResult:
     handle: ...
     pattern_refs: ...
+    on_completion: Optional[Callable[[], None]] = None
 
     def wait(self):
         self.handle.wait()
         del self.pattern_refs
+        if self.on_completion is not None:
+            self.on_completion()
 
     def is_ready(self) -> bool:
         return self.handle.is_ready()
@@ -453,3 +528,68 @@ def create_multinode_node_exchange(
         return GHexMultiNodeExchange(props, decomp_info)
     else:
         return SingleNodeExchange()
+
+
+class MPISharedWindowStorage:
+    """
+    Node shared storage of read-only arrays in MPI-3 shared memory windows.
+
+    The first rank of each node computes the data and stores it in a window allocated with
+    `MPI.Win.Allocate_shared`, all other ranks of the node map the same memory zero-copy.
+    """
+
+    def __init__(self, props: MPICommProcessProperties):
+        self._node_comm = props.comm.Split_type(mpi4py.MPI.COMM_TYPE_SHARED, key=props.rank)
+        self._windows: dict[str, mpi4py.MPI.Win] = {}
+        self._arrays: dict[str, np.ndarray] = {}
+        log.info(
+            f"node shared storage initialized for {self._node_comm.Get_size()} ranks on this node"
+        )
+
+    @property
+    def _is_node_root(self) -> bool:
+        return self._node_comm.Get_rank() == 0
+
+    def share(self, name: str, producer: Callable[[], np.ndarray]) -> np.ndarray:
+        if name in self._arrays:
+            return self._arrays[name]
+        data = np.ascontiguousarray(producer()) if self._is_node_root else None
+        shape, dtype = self._node_comm.bcast(
+            (data.shape, data.dtype.str) if self._is_node_root else None, root=0
+        )
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape, dtype=int)) * dtype.itemsize
+        window = mpi4py.MPI.Win.Allocate_shared(
+            nbytes if self._is_node_root else 0, dtype.itemsize, comm=self._node_comm
+        )
+        buffer, _ = window.Shared_query(0)
+        array = np.ndarray(buffer=buffer, dtype=dtype, shape=shape)
+        window.Fence()
+        if self._is_node_root:
+            array[...] = data
+        window.Fence()
+        array.flags.writeable = False
+        self._windows[name] = window
+        self._arrays[name] = array
+        log.debug(f"shared '{name}' ({nbytes} bytes) among ranks of the node")
+        return array
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self._arrays.values())
+
+    def free(self) -> None:
+        self._arrays.clear()
+        for window in self._windows.values():
+            window.Free()
+        self._windows.clear()
+
+
+@definitions.create_shared_storage.register(MPICommProcessProperties)
+def create_multinode_shared_storage(
+    props: MPICommProcessProperties,
+) -> definitions.SharedStorage:
+    if props.comm_size > 1:
+        return MPISharedWindowStorage(props)
+    else:
+        return definitions.SingleNodeSharedStorage()
@@ -140,7 +140,9 @@ class BaseGrid(ABC):
 
     @utils.chainable
     def with_connectivities(self, connectivity: Dict[gtx.Dimension, data_alloc.NDArray]):
-        self.connectivities.update({d: k.astype(gtx.int32) for d, k in connectivity.items()})
+        self.connectivities.update(
+            {d: k.astype(gtx.int32, copy=False) for d, k in connectivity.items()}
+        )
         self.size.update({d: t.shape[1] for d, t in connectivity.items()})
 
     @utils.chainable
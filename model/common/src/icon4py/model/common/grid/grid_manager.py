@@ -9,7 +9,7 @@ import enum
 import logging
 import pathlib
 from types import ModuleType
-from typing import Literal, Optional, Protocol, TypeAlias, Union
+from typing import Callable, Literal, Optional, Protocol, TypeAlias, Union
 
 import gt4py.next as gtx
 import gt4py.next.backend as gtx_backend
@@ -366,8 +366,18 @@ class GridManager:
         transformation: IndexTransformation,
         grid_file: Union[pathlib.Path, str],
         config: v_grid.VerticalGridConfig,  # TODO (@halungge) remove to separate vertical and horizontal grid
+        shared_storage: Optional[decomposition.SharedStorage] = None,
     ):
+        """
+        Args:
+            transformation: transformation applied to the index fields read from the file
+            grid_file: path of the ICON grid file
+            config: vertical grid config
+            shared_storage: optional node shared storage: if given the (global) index fields are
+                read only once per node and mapped read-only by all ranks of the node
+        """
         self._transformation = transformation
+        self._shared_storage = shared_storage
         self._file_name = str(grid_file)
         self._vertical_config = config
         self._grid: Optional[icon.IconGrid] = None
@@ -564,7 +574,16 @@ class GridManager:
             dims.VertexDim: GridRefinementName.CONTROL_VERTICES,
         }
         refinement_control_fields = {
-            dim: xp.asarray(self._reader.int_variable(name, decomposition_info, transpose=False))
+            dim: xp.asarray(
+                self._read_shared(
+                    name,
+                    lambda name=name: self._reader.int_variable(
+                        name, decomposition_info, transpose=False
+                    ),
+                )
+                if decomposition_info is None
+                else self._reader.int_variable(name, decomposition_info, transpose=False)
+            )
             for dim, name in refinement_control_names.items()
         }
         return refinement_control_fields
@@ -622,10 +641,19 @@ class GridManager:
         return grid
 
     def _get_index_field(self, field: GridFileName, transpose=True, apply_offset=True):
-        field = self._reader.int_variable(field, transpose=transpose)
-        if apply_offset:
-            field = field + self._transformation(field)
-        return field
+        def _read():
+            data = self._reader.int_variable(field, transpose=transpose)
+            if apply_offset:
+                data = data + self._transformation(data)
+            return data
+
+        return self._read_shared(f"{field}:transpose={transpose}:offset={apply_offset}", _read)
+
+    def _read_shared(self, name: str, reader: Callable[[], np.ndarray]) -> np.ndarray:
+        """Read a field through the node shared storage if there is one."""
+        if self._shared_storage is None:
+            return reader()
+        return self._shared_storage.share(f"{self._file_name}:{name}", reader)
 
     def _initialize_global(self, limited_area: bool, on_gpu: bool) -> icon.IconGrid:
         """
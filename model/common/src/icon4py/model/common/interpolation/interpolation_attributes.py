@@ -25,6 +25,11 @@ E_FLX_AVG: Final[str] = "e_flux_average"
 POS_ON_TPLANE_E_X: Final[str] = "pos_on_tplane_e_x"
 POS_ON_TPLANE_E_Y: Final[str] = "pos_on_tplane_e_y"
 CELL_AW_VERTS: Final[str] = "cell_to_vertex_interpolation_factor_by_area_weighting"
+RBF_VEC_COEFF_C1: Final[str] = "rbf_interpolation_coefficient_cell_1"
+RBF_VEC_COEFF_C2: Final[str] = "rbf_interpolation_coefficient_cell_2"
+RBF_VEC_COEFF_V1: Final[str] = "rbf_interpolation_coefficient_vertex_1"
+RBF_VEC_COEFF_V2: Final[str] = "rbf_interpolation_coefficient_vertex_2"
+RBF_VEC_COEFF_E: Final[str] = "rbf_interpolation_coefficient_edge"
 
 attrs: dict[str, model.FieldMetaData] = {
     C_LIN_E: dict(
@@ -131,4 +136,44 @@ attrs: dict[str, model.FieldMetaData] = {
         icon_var_name="cells_aw_verts",
         dtype=ta.wpfloat,
     ),
+    RBF_VEC_COEFF_C1: dict(
+        standard_name=RBF_VEC_COEFF_C1,
+        long_name="rbf interpolation coefficient from edge normal to cell center, zonal component",
+        units="",
+        dims=(dims.CellDim, dims.C2E2C2EDim),
+        icon_var_name="rbf_vec_coeff_c",
+        dtype=ta.wpfloat,
+    ),
+    RBF_VEC_COEFF_C2: dict(
+        standard_name=RBF_VEC_COEFF_C2,
+        long_name="rbf interpolation coefficient from edge normal to cell center, meridional component",
+        units="",
+        dims=(dims.CellDim, dims.C2E2C2EDim),
+        icon_var_name="rbf_vec_coeff_c",
+        dtype=ta.wpfloat,
+    ),
+    RBF_VEC_COEFF_V1: dict(
+        standard_name=RBF_VEC_COEFF_V1,
+        long_name="rbf interpolation coefficient from edge normal to vertex, zonal component",
+        units="",
+        dims=(dims.VertexDim, dims.V2EDim),
+        icon_var_name="rbf_vec_coeff_v",
+        dtype=ta.wpfloat,
+    ),
+    RBF_VEC_COEFF_V2: dict(
+        standard_name=RBF_VEC_COEFF_V2,
+        long_name="rbf interpolation coefficient from edge normal to vertex, meridional component",
+        units="",
+        dims=(dims.VertexDim, dims.V2EDim),
+        icon_var_name="rbf_vec_coeff_v",
+        dtype=ta.wpfloat,
+    ),
+    RBF_VEC_COEFF_E: dict(
+        standard_name=RBF_VEC_COEFF_E,
+        long_name="rbf interpolation coefficient from edge normal to edge tangential component",
+        units="",
+        dims=(dims.EdgeDim, dims.E2C2EDim),
+        icon_var_name="rbf_vec_coeff_e",
+        dtype=ta.wpfloat,
+    ),
 }
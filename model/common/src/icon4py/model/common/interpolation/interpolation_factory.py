@@ -6,6 +6,7 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 import functools
+import math
 from typing import Optional
 
 import gt4py.next as gtx
@@ -18,6 +19,7 @@ from icon4py.model.common.grid import (
     geometry_attributes as geometry_attrs,
     horizontal as h_grid,
     icon,
+    states as grid_states,
 )
 from icon4py.model.common.interpolation import (
     interpolation_attributes as attrs,
@@ -50,7 +52,21 @@ class InterpolationFieldsFactory(factory.FieldSource, factory.GridProvider):
         self._providers: dict[str, factory.FieldProvider] = {}
         self._geometry = geometry_source
         # TODO @halungge: Dummy config dict -  to be replaced by real configuration
-        self._config = {"divavg_cntrwgt": 0.5, "weighting_factor": 0.0}
+        self._config = {
+            "divavg_cntrwgt": 0.5,
+            "weighting_factor": 0.0,
+            "rbf_scale": {
+                dim: interpolation_fields.compute_default_rbf_scale(
+                    math.sqrt(
+                        grid_states.compute_mean_cell_area_for_sphere(
+                            constants.EARTH_RADIUS, grid.global_num_cells
+                        )
+                    ),
+                    dim,
+                )
+                for dim in interpolation_fields.RBFDimension
+            },
+        }
         self._register_computed_fields()
 
     def __repr__(self):
@@ -283,6 +299,76 @@ class InterpolationFieldsFactory(factory.FieldSource, factory.GridProvider):
         )
         self.register_provider(cells_aw_verts)
 
+        rbf_vec_coeff_c = factory.NumpyFieldsProvider(
+            func=functools.partial(interpolation_fields.compute_rbf_vec_coeff_c, array_ns=self._xp),
+            fields=(attrs.RBF_VEC_COEFF_C1, attrs.RBF_VEC_COEFF_C2),
+            domain=(dims.CellDim, dims.C2E2C2EDim),
+            deps={
+                "cell_lat": geometry_attrs.CELL_LAT,
+                "cell_lon": geometry_attrs.CELL_LON,
+                "edge_lat": geometry_attrs.EDGE_LAT,
+                "edge_lon": geometry_attrs.EDGE_LON,
+                "edge_normal_x": geometry_attrs.EDGE_NORMAL_X,
+                "edge_normal_y": geometry_attrs.EDGE_NORMAL_Y,
+                "edge_normal_z": geometry_attrs.EDGE_NORMAL_Z,
+            },
+            connectivities={"c2e2c2e": dims.C2E2C2EDim},
+            params={
+                "scale": self._config["rbf_scale"][interpolation_fields.RBFDimension.CELL],
+                "horizontal_start": self.grid.start_index(
+                    cell_domain(h_grid.Zone.LATERAL_BOUNDARY_LEVEL_2)
+                ),
+            },
+        )
+        self.register_provider(rbf_vec_coeff_c)
+
+        rbf_vec_coeff_v = factory.NumpyFieldsProvider(
+            func=functools.partial(interpolation_fields.compute_rbf_vec_coeff_v, array_ns=self._xp),
+            fields=(attrs.RBF_VEC_COEFF_V1, attrs.RBF_VEC_COEFF_V2),
+            domain=(dims.VertexDim, dims.V2EDim),
+            deps={
+                "vertex_lat": geometry_attrs.VERTEX_LAT,
+                "vertex_lon": geometry_attrs.VERTEX_LON,
+                "edge_lat": geometry_attrs.EDGE_LAT,
+                "edge_lon": geometry_attrs.EDGE_LON,
+                "edge_normal_x": geometry_attrs.EDGE_NORMAL_X,
+                "edge_normal_y": geometry_attrs.EDGE_NORMAL_Y,
+                "edge_normal_z": geometry_attrs.EDGE_NORMAL_Z,
+            },
+            connectivities={"v2e": dims.V2EDim},
+            params={
+                "scale": self._config["rbf_scale"][interpolation_fields.RBFDimension.VERTEX],
+                "horizontal_start": self.grid.start_index(
+                    vertex_domain(h_grid.Zone.LATERAL_BOUNDARY_LEVEL_2)
+                ),
+            },
+        )
+        self.register_provider(rbf_vec_coeff_v)
+
+        rbf_vec_coeff_e = factory.NumpyFieldsProvider(
+            func=functools.partial(interpolation_fields.compute_rbf_vec_coeff_e, array_ns=self._xp),
+            fields=(attrs.RBF_VEC_COEFF_E,),
+            domain=(dims.EdgeDim, dims.E2C2EDim),
+            deps={
+                "edge_lat": geometry_attrs.EDGE_LAT,
+                "edge_lon": geometry_attrs.EDGE_LON,
+                "edge_normal_x": geometry_attrs.EDGE_NORMAL_X,
+                "edge_normal_y": geometry_attrs.EDGE_NORMAL_Y,
+                "edge_normal_z": geometry_attrs.EDGE_NORMAL_Z,
+                "edge_tangent_x": geometry_attrs.EDGE_TANGENT_X,
+                "edge_tangent_y": geometry_attrs.EDGE_TANGENT_Y,
+                "edge_tangent_z": geometry_attrs.EDGE_TANGENT_Z,
+            },
+            connectivities={"e2c2e": dims.E2C2EDim},
+            params={
+                "scale": self._config["rbf_scale"][interpolation_fields.RBFDimension.EDGE],
+                "horizontal_start": self.grid.start_index(
+                    edge_domain(h_grid.Zone.LATERAL_BOUNDARY_LEVEL_2)
+                ),
+            },
+        )
+        self.register_provider(rbf_vec_coeff_e)
+
     @property
     def metadata(self) -> dict[str, model.FieldMetaData]:
         return self._attrs
@@ -5,9 +5,13 @@
 #
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
+import dataclasses
+import enum
 import functools
+import logging
 import math
 from types import ModuleType
+from typing import Callable, Optional
 
 import gt4py.next as gtx
 import numpy as np
@@ -23,6 +27,9 @@ from icon4py.model.common.grid.geometry_stencils import compute_primal_cart_norm
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 
+log = logging.getLogger(__name__)
+
+
 def compute_c_lin_e(
     edge_cell_length: data_alloc.NDArray,
     inv_dual_edge_length: data_alloc.NDArray,
@@ -261,6 +268,29 @@ def compute_geofac_grg(
     )
 
 
+def _last_match(
+    candidates: data_alloc.NDArray, target: data_alloc.NDArray, array_ns: ModuleType
+) -> data_alloc.NDArray:
+    """
+    Find the last position along the last axis of `candidates` that equals `target`.
+
+    This gives the same result as a loop over the neighbor slots overwriting the result for each
+    match, but every slot is only compared once.
+
+    Args:
+        candidates: neighbor table, the last axis is the neighbor slot
+        target: value searched for, broadcast against `candidates` without its last axis
+        array_ns: numpy or cupy
+
+    Returns:
+        the position of the last match, -1 where there is none
+    """
+    position = array_ns.where(candidates[..., 0] == target, 0, -1)
+    for k in range(1, candidates.shape[-1]):
+        position = array_ns.where(candidates[..., k] == target, k, position)
+    return position
+
+
 def compute_geofac_grdiv(
     geofac_div: data_alloc.NDArray,
     inv_dual_edge_length: data_alloc.NDArray,
@@ -288,39 +318,36 @@ def compute_geofac_grdiv(
         geofac_grdiv:  ndarray, representing a gtx.Field[gtx.Dims[EdgeDim, E2C2EODim], ta.wpfloat]
     """
     num_edges = e2c.shape[0]
-    geofac_grdiv = array_ns.zeros([num_edges, 1 + 2 * e2c.shape[1]])
+    num_cells_per_edge = e2c.shape[1]
+    geofac_grdiv = array_ns.zeros([num_edges, 1 + 2 * num_cells_per_edge])
     index = array_ns.arange(horizontal_start, num_edges)
+    owned = owner_mask[horizontal_start:]
+    inv_length = inv_dual_edge_length[horizontal_start:]
+    cell_0 = e2c[horizontal_start:, 0]
+    cell_1 = e2c[horizontal_start:, 1]
+    edges_of_cell_0 = c2e[cell_0]
+    edges_of_cell_1 = c2e[cell_1]
+
+    slot = _last_match(edges_of_cell_1, index, array_ns)
+    geofac_grdiv[horizontal_start:, 0] = array_ns.where(
+        (slot >= 0) & owned, geofac_div[cell_1, slot], 0.0
+    )
+    # each update depends on the previous one, keep the loop over the (few) neighbor slots
     for j in range(c2e.shape[1]):
-        mask = array_ns.where(
-            c2e[e2c[horizontal_start:, 1], j] == index, owner_mask[horizontal_start:], False
-        )
         geofac_grdiv[horizontal_start:, 0] = array_ns.where(
-            mask, geofac_div[e2c[horizontal_start:, 1], j], geofac_grdiv[horizontal_start:, 0]
+            (edges_of_cell_0[:, j] == index) & owned,
+            (geofac_grdiv[horizontal_start:, 0] - geofac_div[cell_0, j]) * inv_length,
+            geofac_grdiv[horizontal_start:, 0],
         )
-    for j in range(c2e.shape[1]):
-        mask = array_ns.where(
-            c2e[e2c[horizontal_start:, 0], j] == index, owner_mask[horizontal_start:], False
+    for j in range(num_cells_per_edge):
+        k = _last_match(edges_of_cell_0, e2c2e[horizontal_start:, j], array_ns)
+        geofac_grdiv[horizontal_start:, 1 + j] = array_ns.where(
+            k >= 0, -geofac_div[cell_0, k] * inv_length, 0.0
         )
-        geofac_grdiv[horizontal_start:, 0] = array_ns.where(
-            mask,
-            (geofac_grdiv[horizontal_start:, 0] - geofac_div[e2c[horizontal_start:, 0], j])
-            * inv_dual_edge_length[horizontal_start:],
-            geofac_grdiv[horizontal_start:, 0],
+        k = _last_match(edges_of_cell_1, e2c2e[horizontal_start:, num_cells_per_edge + j], array_ns)
+        geofac_grdiv[horizontal_start:, 1 + num_cells_per_edge + j] = array_ns.where(
+            k >= 0, geofac_div[cell_1, k] * inv_length, 0.0
         )
-    for j in range(e2c.shape[1]):
-        for k in range(c2e.shape[1]):
-            mask = c2e[e2c[horizontal_start:, 0], k] == e2c2e[horizontal_start:, j]
-            geofac_grdiv[horizontal_start:, e2c.shape[1] - 1 + j] = array_ns.where(
-                mask,
-                -geofac_div[e2c[horizontal_start:, 0], k] * inv_dual_edge_length[horizontal_start:],
-                geofac_grdiv[horizontal_start:, e2c.shape[1] - 1 + j],
-            )
-            mask = c2e[e2c[horizontal_start:, 1], k] == e2c2e[horizontal_start:, e2c.shape[1] + j]
-            geofac_grdiv[horizontal_start:, 2 * e2c.shape[1] - 1 + j] = array_ns.where(
-                mask,
-                geofac_div[e2c[horizontal_start:, 1], k] * inv_dual_edge_length[horizontal_start:],
-                geofac_grdiv[horizontal_start:, 2 * e2c.shape[1] - 1 + j],
-            )
     return geofac_grdiv
 
 
@@ -481,6 +508,94 @@ def _compute_c_bln_avg(
     return c_bln_avg
 
 
+@dataclasses.dataclass(frozen=True)
+class MassConservationReport:
+    """Convergence of the iterative mass conservation correction of c_bln_avg."""
+
+    #: largest residual before each iteration
+    max_residual: tuple[float, ...]
+    converged: bool
+
+    @property
+    def iterations(self) -> int:
+        return len(self.max_residual) - 1
+
+    def __str__(self) -> str:
+        status = "converged" if self.converged else "not converged"
+        return f"mass conservation of c_bln_avg {status} after {self.iterations} iterations - max residual={self.max_residual[-1]:.3e}"
+
+
+def _sparse_namespace(array_ns: ModuleType) -> Optional[ModuleType]:
+    """The sparse matrix module matching `array_ns`, None if it is not installed."""
+    try:
+        if array_ns is np:
+            import scipy.sparse as sparse
+        else:
+            import cupyx.scipy.sparse as sparse
+    except ImportError:
+        return None
+    return sparse
+
+
+def _mass_conservation_operators(
+    c2e2c0: data_alloc.NDArray,
+    inverse_neighbor_idx: data_alloc.NDArray,
+    cell_areas: data_alloc.NDArray,
+    array_ns: ModuleType,
+) -> tuple[Callable, Callable]:
+    """
+    Build the linear operators of the mass conservation iteration from the C2E2C0 adjacency.
+
+    They are sparse matrices if scipy (or cupyx for cupy) is available, otherwise the equivalent
+    gather operations.
+
+    Args:
+        c2e2c0: cell to cell connectivity including the cell itself
+        inverse_neighbor_idx: position of a cell in the C2E2C0 table of its neighbors
+        cell_areas: area of cells
+
+    Returns:
+        the operator summing the area weighted weights a cell contributes to all its neighbors
+        (CellDim, C2E2C0Dim) -> CellDim and the operator collecting a cell field from the
+        neighbors CellDim -> (CellDim, C2E2C0Dim)
+    """
+    num_cells, num_neighbors = c2e2c0.shape
+    # missing neighbors (and their position) count from the end, as in indexing with them
+    neighbors = c2e2c0 % num_cells
+    position = inverse_neighbor_idx % num_neighbors
+    sparse = _sparse_namespace(array_ns)
+    if sparse is None:
+        areas = cell_areas[neighbors]
+
+        def local_weights(c_bln_avg):
+            return array_ns.sum(c_bln_avg[neighbors, position] * areas, axis=1)
+
+        def gather(field):
+            return field[neighbors]
+
+        return local_weights, gather
+
+    rows = array_ns.repeat(array_ns.arange(num_cells), num_neighbors)
+    weights_matrix = sparse.csr_matrix(
+        (
+            cell_areas[neighbors].ravel(),
+            (rows, (neighbors * num_neighbors + position).ravel()),
+        ),
+        shape=(num_cells, num_cells * num_neighbors),
+    )
+    gather_matrix = sparse.csr_matrix(
+        (
+            array_ns.ones(num_cells * num_neighbors),
+            (array_ns.arange(num_cells * num_neighbors), neighbors.ravel()),
+        ),
+        shape=(num_cells * num_neighbors, num_cells),
+    )
+    return (
+        lambda c_bln_avg: weights_matrix @ c_bln_avg.ravel(),
+        lambda field: (gather_matrix @ field).reshape(num_cells, num_neighbors),
+    )
+
+
 def _force_mass_conservation_to_c_bln_avg(
     c2e2c0: data_alloc.NDArray,
     c_bln_avg: data_alloc.NDArray,
@@ -490,7 +605,8 @@ def _force_mass_conservation_to_c_bln_avg(
     horizontal_start: gtx.int32,
     array_ns: ModuleType = np,
     niter: int = 1000,
-) -> data_alloc.NDArray:
+    tolerance: float = 1e-9,
+) -> tuple[data_alloc.NDArray, MassConservationReport]:
     """
     Iteratively enforce mass conservation to the input field c_bln_avg.
 
@@ -499,7 +615,9 @@ def _force_mass_conservation_to_c_bln_avg(
 
     Practically, the sum of the  bilinear cell weights  applied to a cell from all neighbors times its area should be exactly one.
 
-    The weights are adjusted iteratively by the condition up to a max of niter iterations
+    The weights are adjusted iteratively by the condition up to a max of niter iterations or
+    until the maximal residual drops below `tolerance`. The neighbor sums of each iteration are
+    sparse matrix vector products with matrices built once from the C2E2C0 connectivity.
 
     Args:
         c2e2c0: cell to cell connectivity
@@ -509,27 +627,12 @@ def _force_mass_conservation_to_c_bln_avg(
         divavg_cntrwgt: configured central weight
         horizontal_start:
         niter: max number of iterations
+        tolerance: the iteration stops once the maximal residual is below this value
 
     Returns:
-
+        the mass conserving c_bln_avg and the convergence report of the iteration
     """
 
-    def _compute_local_weights(
-        c_bln_avg, cell_areas, c2e2c0, inverse_neighbor_idx
-    ) -> data_alloc.NDArray:
-        """
-        Compute the total weight which each local point contributes to the sum.
-
-        Args:
-            c_bln_avg: ndarray representing a weight field of (CellDim, C2E2C0Dim)
-            inverse_neighbor_index: Sequence of to access all weights of a local cell in a field of shape (CellDim, C2E2C0Dim)
-
-        Returns: ndarray of CellDim, containing the sum of weigh contributions for each local cell index
-
-        """
-        weights = array_ns.sum(c_bln_avg[c2e2c0, inverse_neighbor_idx] * cell_areas[c2e2c0], axis=1)
-        return weights
-
     def _compute_residual_to_mass_conservation(
         owner_mask: data_alloc.NDArray,
         local_weight: data_alloc.NDArray,
@@ -544,8 +647,7 @@ def _force_mass_conservation_to_c_bln_avg(
 
     def _apply_correction(
         c_bln_avg: data_alloc.NDArray,
-        residual: data_alloc.NDArray,
-        c2e2c0: data_alloc.NDArray,
+        neighbor_residual: data_alloc.NDArray,
         divavg_cntrwgt: float,
         horizontal_start: gtx.int32,
     ) -> data_alloc.NDArray:
@@ -553,22 +655,18 @@ def _force_mass_conservation_to_c_bln_avg(
         maxwgt_loc = divavg_cntrwgt + 0.003
         minwgt_loc = divavg_cntrwgt - 0.003
         relax_coeff = 0.46
-        c_bln_avg[horizontal_start:, :] = (
-            c_bln_avg[horizontal_start:, :] - relax_coeff * residual[c2e2c0][horizontal_start:, :]
-        )
-        local_weight = array_ns.sum(c_bln_avg, axis=1) - 1.0
-
-        c_bln_avg[horizontal_start:, :] = c_bln_avg[horizontal_start:, :] - (
-            0.25 * local_weight[horizontal_start:, array_ns.newaxis]
-        )
+        # update in place, the iteration is bound by memory traffic
+        weights = c_bln_avg[horizontal_start:, :]
+        weights -= relax_coeff * neighbor_residual[horizontal_start:, :]
+        # summing column by column is faster than reducing the short axis (and gives the same result)
+        local_weight = weights[:, 0].copy()
+        for k in range(1, weights.shape[1]):
+            local_weight += weights[:, k]
+        local_weight -= 1.0
+        weights -= 0.25 * local_weight[:, array_ns.newaxis]
 
         # avoid runaway condition:
-        c_bln_avg[horizontal_start:, 0] = array_ns.maximum(
-            c_bln_avg[horizontal_start:, 0], minwgt_loc
-        )
-        c_bln_avg[horizontal_start:, 0] = array_ns.minimum(
-            c_bln_avg[horizontal_start:, 0], maxwgt_loc
-        )
+        array_ns.clip(weights[:, 0], minwgt_loc, maxwgt_loc, out=weights[:, 0])
         return c_bln_avg
 
     def _enforce_mass_conservation(
@@ -589,33 +687,38 @@ def _force_mass_conservation_to_c_bln_avg(
     local_summed_weights = array_ns.zeros(c_bln_avg.shape[0])
     residual = array_ns.zeros(c_bln_avg.shape[0])
     inverse_neighbor_idx = create_inverse_neighbor_index(c2e2c0, c2e2c0, array_ns=array_ns)
+    compute_local_weights, gather_neighbors = _mass_conservation_operators(
+        c2e2c0, inverse_neighbor_idx, cell_areas, array_ns
+    )
+    max_residual = []
 
     for iteration in range(niter):
-        local_summed_weights[horizontal_start:] = _compute_local_weights(
-            c_bln_avg, cell_areas, c2e2c0, inverse_neighbor_idx
-        )[horizontal_start:]
+        local_summed_weights[horizontal_start:] = compute_local_weights(c_bln_avg)[
+            horizontal_start:
+        ]
 
         residual[horizontal_start:] = _compute_residual_to_mass_conservation(
             cell_owner_mask, local_summed_weights, cell_areas
         )[horizontal_start:]
 
-        max_ = array_ns.max(residual)
-        if iteration >= (niter - 1) or max_ < 1e-9:
-            print(f"number of iterations: {iteration} - max residual={max_}")
+        max_ = float(array_ns.max(residual))
+        max_residual.append(max_)
+        if iteration >= (niter - 1) or max_ < tolerance:
             c_bln_avg = _enforce_mass_conservation(
                 c_bln_avg, residual, cell_owner_mask, horizontal_start
             )
-            return c_bln_avg
+            return c_bln_avg, MassConservationReport(
+                max_residual=tuple(max_residual), converged=max_ < tolerance
+            )
 
         c_bln_avg = _apply_correction(
             c_bln_avg=c_bln_avg,
-            residual=residual,
-            c2e2c0=c2e2c0,
+            neighbor_residual=gather_neighbors(residual),
             divavg_cntrwgt=divavg_cntrwgt,
             horizontal_start=horizontal_start,
         )
 
-    return c_bln_avg
+    return c_bln_avg, MassConservationReport(max_residual=tuple(max_residual), converged=False)
 
 
 def compute_mass_conserving_bilinear_cell_average_weight(
@@ -632,7 +735,7 @@ def compute_mass_conserving_bilinear_cell_average_weight(
     c_bln_avg = _compute_c_bln_avg(
         c2e2c0[:, 1:], lat, lon, divavg_cntrwgt, horizontal_start, array_ns
     )
-    return _force_mass_conservation_to_c_bln_avg(
+    c_bln_avg, report = _force_mass_conservation_to_c_bln_avg(
         c2e2c0,
         c_bln_avg,
         cell_areas,
@@ -641,6 +744,8 @@ def compute_mass_conserving_bilinear_cell_average_weight(
         horizontal_start_level_3,
         array_ns,
     )
+    log.info(report)
+    return c_bln_avg
 
 
 def create_inverse_neighbor_index(
@@ -660,19 +765,20 @@ def create_inverse_neighbor_index(
     Args:
         source_offset:
         inverse_offset:
+        array_ns: module either used or array computations
 
     Returns:
-        ndarray of the same shape as target_offset
+        ndarray of the same shape as inverse_offset, -1 where the neighbor is missing
 
     """
-    inv_neighbor_idx = -1 * array_ns.ones(inverse_offset.shape, dtype=int)
-
-    for jc in range(inverse_offset.shape[0]):
-        for i in range(inverse_offset.shape[1]):
-            if inverse_offset[jc, i] >= 0:
-                inv_neighbor_idx[jc, i] = array_ns.argwhere(
-                    source_offset[inverse_offset[jc, i], :] == jc
-                )[0, 0]
+    valid = inverse_offset >= 0
+    neighbors = source_offset[array_ns.where(valid, inverse_offset, 0)]
+    central = array_ns.arange(inverse_offset.shape[0])[:, array_ns.newaxis, array_ns.newaxis]
+    matches = neighbors == central
+    # first position of the central element, -1 for missing neighbors
+    inv_neighbor_idx = array_ns.where(
+        valid & array_ns.any(matches, axis=-1), array_ns.argmax(matches, axis=-1), -1
+    )
 
     return inv_neighbor_idx
 
@@ -718,46 +824,33 @@ def compute_e_flx_avg(
         array_ns=array_ns,
     )
 
-    llb = 0
     e_flx_avg = array_ns.zeros([e2c.shape[0], 5])
-    index = array_ns.arange(llb, c2e.shape[0])
-    inv_neighbor_id = -array_ns.ones([c2e.shape[0] - llb, 3], dtype=int)
-    for i in range(c2e2c.shape[1]):
-        for j in range(c2e2c.shape[1]):
-            inv_neighbor_id[:, j] = array_ns.where(
-                array_ns.logical_and(c2e2c[c2e2c[llb:, j], i] == index, c2e2c[llb:, j] >= 0),
-                i,
-                inv_neighbor_id[:, j],
-            )
+    inv_neighbor_id = _last_match(
+        c2e2c[c2e2c], array_ns.arange(c2e.shape[0])[:, array_ns.newaxis], array_ns
+    )
+    inv_neighbor_id = array_ns.where(c2e2c >= 0, inv_neighbor_id, -1)
 
     llb = horizontal_start_p3
-    index = array_ns.arange(llb, e2c.shape[0])
-    for j in range(c2e.shape[1]):
-        for i in range(2):
-            e_flx_avg[llb:, i + 1] = array_ns.where(
-                owner_mask[llb:],
-                array_ns.where(
-                    c2e[e2c[llb:, 0], j] == index,
-                    c_bln_avg[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], j] + 1]
-                    * geofac_div[e2c[llb:, 0], array_ns.mod(i + j + 1, 3)]
-                    / geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], j]],
-                    e_flx_avg[llb:, i + 1],
-                ),
-                e_flx_avg[llb:, i + 1],
-            )
-            e_flx_avg[llb:, i + 3] = array_ns.where(
-                owner_mask[llb:],
-                array_ns.where(
-                    c2e[e2c[llb:, 0], j] == index,
-                    c_bln_avg[e2c[llb:, 0], 1 + j]
-                    * geofac_div[
-                        e2c[llb:, 1], array_ns.mod(inv_neighbor_id[e2c[llb:, 0], j] + i + 1, 3)
-                    ]
-                    / geofac_div[e2c[llb:, 0], j],
-                    e_flx_avg[llb:, i + 3],
-                ),
-                e_flx_avg[llb:, i + 3],
-            )
+    cell_0 = e2c[llb:, 0]
+    cell_1 = e2c[llb:, 1]
+    j = _last_match(c2e[cell_0], array_ns.arange(llb, e2c.shape[0]), array_ns)
+    mask = owner_mask[llb:] & (j >= 0)
+    inv_j = inv_neighbor_id[cell_0, j]
+    for i in range(2):
+        e_flx_avg[llb:, i + 1] = array_ns.where(
+            mask,
+            c_bln_avg[cell_1, inv_j + 1]
+            * geofac_div[cell_0, array_ns.mod(i + j + 1, 3)]
+            / geofac_div[cell_1, inv_j],
+            0.0,
+        )
+        e_flx_avg[llb:, i + 3] = array_ns.where(
+            mask,
+            c_bln_avg[cell_0, 1 + j]
+            * geofac_div[cell_1, array_ns.mod(inv_j + i + 1, 3)]
+            / geofac_div[cell_0, j],
+            0.0,
+        )
 
     iie = -array_ns.ones([e2c.shape[0], 4], dtype=int)
     iie[:, 0] = array_ns.where(e2c[e2c2e[:, 0], 0] == e2c[:, 0], 2, -1)
@@ -781,47 +874,35 @@ def compute_e_flx_avg(
     )
 
     llb = horizontal_start_p4
-    index = array_ns.arange(llb, e2c.shape[0])
-    for i in range(c2e.shape[1]):
-        # INVALID_INDEX
-        if i <= gm.GridFile.INVALID_INDEX:
-            continue
-        e_flx_avg[llb:, 0] = array_ns.where(
-            owner_mask[llb:],
-            array_ns.where(
-                c2e[e2c[llb:, 0], i] == index,
-                0.5
-                * (
-                    (
-                        geofac_div[e2c[llb:, 0], i] * c_bln_avg[e2c[llb:, 0], 0]
-                        + geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i]]
-                        * c_bln_avg[e2c[llb:, 0], i + 1]
-                        - e_flx_avg[e2c2e[llb:, 0], iie[llb:, 0]]
-                        * geofac_div[e2c[llb:, 0], array_ns.mod(i + 1, 3)]
-                        - e_flx_avg[e2c2e[llb:, 1], iie[llb:, 1]]
-                        * geofac_div[e2c[llb:, 0], array_ns.mod(i + 2, 3)]
-                    )
-                    / geofac_div[e2c[llb:, 0], i]
-                    + (
-                        geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i]]
-                        * c_bln_avg[e2c[llb:, 1], 0]
-                        + geofac_div[e2c[llb:, 0], i]
-                        * c_bln_avg[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i] + 1]
-                        - e_flx_avg[e2c2e[llb:, 2], iie[llb:, 2]]
-                        * geofac_div[
-                            e2c[llb:, 1], array_ns.mod(inv_neighbor_id[e2c[llb:, 0], i] + 1, 3)
-                        ]
-                        - e_flx_avg[e2c2e[llb:, 3], iie[llb:, 3]]
-                        * geofac_div[
-                            e2c[llb:, 1], array_ns.mod(inv_neighbor_id[e2c[llb:, 0], i] + 2, 3)
-                        ]
-                    )
-                    / geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i]]
-                ),
-                e_flx_avg[llb:, 0],
-            ),
-            e_flx_avg[llb:, 0],
-        )
+    cell_0 = e2c[llb:, 0]
+    cell_1 = e2c[llb:, 1]
+    i = _last_match(c2e[cell_0], array_ns.arange(llb, e2c.shape[0]), array_ns)
+    inv_i = inv_neighbor_id[cell_0, i]
+    e_flx_avg[llb:, 0] = array_ns.where(
+        owner_mask[llb:] & (i >= 0),
+        0.5
+        * (
+            (
+                geofac_div[cell_0, i] * c_bln_avg[cell_0, 0]
+                + geofac_div[cell_1, inv_i] * c_bln_avg[cell_0, i + 1]
+                - e_flx_avg[e2c2e[llb:, 0], iie[llb:, 0]]
+                * geofac_div[cell_0, array_ns.mod(i + 1, 3)]
+                - e_flx_avg[e2c2e[llb:, 1], iie[llb:, 1]]
+                * geofac_div[cell_0, array_ns.mod(i + 2, 3)]
+            )
+            / geofac_div[cell_0, i]
+            + (
+                geofac_div[cell_1, inv_i] * c_bln_avg[cell_1, 0]
+                + geofac_div[cell_0, i] * c_bln_avg[cell_1, inv_i + 1]
+                - e_flx_avg[e2c2e[llb:, 2], iie[llb:, 2]]
+                * geofac_div[cell_1, array_ns.mod(inv_i + 1, 3)]
+                - e_flx_avg[e2c2e[llb:, 3], iie[llb:, 3]]
+                * geofac_div[cell_1, array_ns.mod(inv_i + 2, 3)]
+            )
+            / geofac_div[cell_1, inv_i]
+        ),
+        0.0,
+    )
 
     checksum = e_flx_avg[:, 0]
     for i in range(4):
@@ -831,10 +912,11 @@ def compute_e_flx_avg(
             * e_flx_avg[:, 1 + i]
         )
 
-    for i in range(5):
-        e_flx_avg[llb:, i] = array_ns.where(
-            owner_mask[llb:], e_flx_avg[llb:, i] / checksum[llb:], e_flx_avg[llb:, i]
-        )
+    e_flx_avg[llb:, :] = array_ns.where(
+        owner_mask[llb:, array_ns.newaxis],
+        e_flx_avg[llb:, :] / checksum[llb:, array_ns.newaxis],
+        e_flx_avg[llb:, :],
+    )
 
     return e_flx_avg
 
@@ -868,39 +950,35 @@ def compute_cells_aw_verts(
         aw_verts: numpy array, representing a gtx.Field[gtx.Dims[VertexDim, 6], ta.wpfloat]
     """
     cells_aw_verts = array_ns.zeros(v2e.shape)
-    for jv in range(horizontal_start, cells_aw_verts.shape[0]):
-        cells_aw_verts[jv, :] = 0.0
-        for je in range(v2e.shape[1]):
-            # INVALID_INDEX
-            if v2e[jv, je] == gm.GridFile.INVALID_INDEX or (
-                je > 0 and v2e[jv, je] == v2e[jv, je - 1]
-            ):
-                continue
-            ile = v2e[jv, je]
-            idx_ve = 0 if e2v[ile, 0] == jv else 1
-            cell_offset_idx_0 = e2c[ile, 0]
-            cell_offset_idx_1 = e2c[ile, 1]
-            for jc in range(v2e.shape[1]):
-                if v2c[jv, jc] == gm.GridFile.INVALID_INDEX or (
-                    jc > 0 and v2c[jv, jc] == v2c[jv, jc - 1]
-                ):
-                    continue
-                if cell_offset_idx_0 == v2c[jv, jc]:
-                    cells_aw_verts[jv, jc] = (
-                        cells_aw_verts[jv, jc]
-                        + 0.5
-                        / dual_area[jv]
-                        * edge_vert_length[ile, idx_ve]
-                        * edge_cell_length[ile, 0]
-                    )
-                elif cell_offset_idx_1 == v2c[jv, jc]:
-                    cells_aw_verts[jv, jc] = (
-                        cells_aw_verts[jv, jc]
-                        + 0.5
-                        / dual_area[jv]
-                        * edge_vert_length[ile, idx_ve]
-                        * edge_cell_length[ile, 1]
-                    )
+    vertex = array_ns.arange(horizontal_start, v2e.shape[0])
+    edges = v2e[horizontal_start:]
+    cells = v2c[horizontal_start:, : v2e.shape[1]]
+    # skip missing and repeated (pentagon) neighbors
+    valid_edge = edges != gm.GridFile.INVALID_INDEX
+    valid_edge[:, 1:] &= edges[:, 1:] != edges[:, :-1]
+    valid_cell = cells != gm.GridFile.INVALID_INDEX
+    valid_cell[:, 1:] &= cells[:, 1:] != cells[:, :-1]
+
+    idx_ve = array_ns.where(e2v[edges, 0] == vertex[:, array_ns.newaxis], 0, 1)
+    vert_length = (
+        0.5 / dual_area[horizontal_start:, array_ns.newaxis] * edge_vert_length[edges, idx_ve]
+    )
+    weight_0 = vert_length * edge_cell_length[edges, 0]
+    weight_1 = vert_length * edge_cell_length[edges, 1]
+    cell_0 = e2c[edges, 0]
+    cell_1 = e2c[edges, 1]
+
+    # accumulate edge by edge to keep the order of the floating point additions
+    aw_verts = cells_aw_verts[horizontal_start:]
+    for je in range(v2e.shape[1]):
+        matches_0 = cell_0[:, je : je + 1] == cells
+        matches_1 = cell_1[:, je : je + 1] == cells
+        contribution = array_ns.where(matches_0, weight_0[:, je : je + 1], weight_1[:, je : je + 1])
+        aw_verts[:] = array_ns.where(
+            valid_edge[:, je : je + 1] & valid_cell & (matches_0 | matches_1),
+            aw_verts + contribution,
+            aw_verts,
+        )
 
     return cells_aw_verts
 
@@ -1118,3 +1196,343 @@ def compute_pos_on_tplane_e_x_y(
         pos_on_tplane_e[:, 0:2, 1], (array_ns.size(pos_on_tplane_e[:, 0:2, 1]))
     )
     return pos_on_tplane_e_x, pos_on_tplane_e_y
+
+
+class RBFDimension(enum.Enum):
+    """Location of the reconstructed vector of an RBF vector interpolation."""
+
+    CELL = "cell"
+    EDGE = "edge"
+    VERTEX = "vertex"
+
+
+class RBFKernel(enum.IntEnum):
+    """Radial basis functions, the values are the ones of ICON's `rbf_vec_kern_*` namelist parameters."""
+
+    GAUSSIAN = 1
+    INVERSE_MULTIQUADRIC = 3
+
+
+#: ICON's default kernels (`rbf_vec_kern_c`, `rbf_vec_kern_e`, `rbf_vec_kern_v`)
+DEFAULT_RBF_KERNEL: dict[RBFDimension, RBFKernel] = {
+    RBFDimension.CELL: RBFKernel.GAUSSIAN,
+    RBFDimension.EDGE: RBFKernel.INVERSE_MULTIQUADRIC,
+    RBFDimension.VERTEX: RBFKernel.GAUSSIAN,
+}
+
+
+def compute_default_rbf_scale(mean_characteristic_length: float, dim: RBFDimension) -> float:
+    """
+    Compute ICON's resolution dependent default of the RBF scale factor (`rbf_vec_scale_*`).
+
+    The defaults are tuned for the default kernels in DEFAULT_RBF_KERNEL.
+
+    Args:
+        mean_characteristic_length: square root of the mean cell area [m]
+        dim: location of the reconstructed vector
+
+    Returns:
+        scale factor of the radial basis function with distances measured on the unit sphere
+    """
+    threshold, c1, c2, c3 = {
+        RBFDimension.CELL: (2.5, 1.8, 3.75, 0.9),
+        RBFDimension.VERTEX: (2.0, 1.8, 2.0, 1.0),
+        RBFDimension.EDGE: (2.0, 0.4, 2.0, 0.325),
+    }[dim]
+    resolution = mean_characteristic_length / 1000.0
+    scale = (
+        0.5
+        if resolution >= threshold
+        else 0.5 / (1.0 + c1 * math.log(threshold / resolution) ** c2)
+    )
+    return scale * (resolution / 0.125) ** c3 if resolution <= 0.125 else scale
+
+
+def _rbf_kernel(
+    distance: data_alloc.NDArray, scale: float, kernel: RBFKernel, array_ns: ModuleType
+) -> data_alloc.NDArray:
+    scaled = distance / scale
+    if kernel == RBFKernel.GAUSSIAN:
+        return array_ns.exp(-scaled * scaled)
+    return 1.0 / array_ns.sqrt(1.0 + scaled * scaled)
+
+
+def _cartesian_unit_vector(
+    lat: data_alloc.NDArray, lon: data_alloc.NDArray, array_ns: ModuleType
+) -> data_alloc.NDArray:
+    cos_lat = array_ns.cos(lat)
+    return array_ns.stack(
+        (cos_lat * array_ns.cos(lon), cos_lat * array_ns.sin(lon), array_ns.sin(lat)), axis=-1
+    )
+
+
+def _zonal_and_meridional_unit_vectors(
+    lat: data_alloc.NDArray, lon: data_alloc.NDArray, array_ns: ModuleType
+) -> tuple[data_alloc.NDArray, data_alloc.NDArray]:
+    """Cartesian components of the eastward and northward unit vectors at (lat, lon)."""
+    sin_lat = array_ns.sin(lat)
+    sin_lon = array_ns.sin(lon)
+    cos_lon = array_ns.cos(lon)
+    eastward = array_ns.stack((-sin_lon, cos_lon, array_ns.zeros_like(lon)), axis=-1)
+    northward = array_ns.stack((-sin_lat * cos_lon, -sin_lat * sin_lon, array_ns.cos(lat)), axis=-1)
+    return eastward, northward
+
+
+def _arc_length(
+    p0: data_alloc.NDArray, p1: data_alloc.NDArray, array_ns: ModuleType
+) -> data_alloc.NDArray:
+    """Distance on the unit sphere between the unit vectors p0 and p1 (last axis)."""
+    return array_ns.arccos(array_ns.clip(array_ns.sum(p0 * p1, axis=-1), -1.0, 1.0))
+
+
+def _batched_cholesky_solve(
+    matrix: data_alloc.NDArray, rhs: data_alloc.NDArray, array_ns: ModuleType
+) -> data_alloc.NDArray:
+    """
+    Solve a batch of symmetric positive definite systems by a Cholesky decomposition.
+
+    Args:
+        matrix: batch of matrices, shape (N, n, n)
+        rhs: batch of right hand sides, shape (N, n, m)
+        array_ns: numpy or cupy
+
+    Returns:
+        the solutions, shape (N, n, m)
+    """
+    lower = array_ns.linalg.cholesky(matrix)
+    size = matrix.shape[-1]
+    # forward substitution L y = rhs followed by backward substitution L^T x = y, the loops
+    # run over the (small) stencil size, each step is vectorized over the batch
+    y = array_ns.empty_like(rhs)
+    for i in range(size):
+        known = array_ns.einsum("nj,njm->nm", lower[:, i, :i], y[:, :i])
+        y[:, i] = (rhs[:, i] - known) / lower[:, i, i, array_ns.newaxis]
+    x = array_ns.empty_like(rhs)
+    for i in reversed(range(size)):
+        known = array_ns.einsum("nj,njm->nm", lower[:, i + 1 :, i], x[:, i + 1 :])
+        x[:, i] = (y[:, i] - known) / lower[:, i, i, array_ns.newaxis]
+    return x
+
+
+def _compute_rbf_vec_coeff(
+    center: data_alloc.NDArray,
+    directions: tuple[data_alloc.NDArray, ...],
+    stencil: data_alloc.NDArray,
+    edge_center: data_alloc.NDArray,
+    edge_normal: data_alloc.NDArray,
+    scale: float,
+    kernel: RBFKernel,
+    horizontal_start: gtx.int32,
+    chunk_size: int,
+    array_ns: ModuleType,
+) -> tuple[data_alloc.NDArray, ...]:
+    """
+    Compute the coefficients of the RBF reconstruction of vectors from edge normal components.
+
+    For each entity the kernel matrix of its stencil of edges is assembled, this is the ICON
+    vector RBF interpolation (mo_intp_rbf_coeffs.f90). The matrices of all entities are solved
+    as a batch, `chunk_size` entities at a time to bound the memory use. Missing stencil entries
+    (pentagons, lateral boundary) get an identity row and column and a coefficient of zero.
+
+    Args:
+        center: cartesian unit vector of the location of the reconstructed vector, shape (N, 3)
+        directions: cartesian components of the reconstructed vector, one (N, 3) array each
+        stencil: edges of the stencil (N, n), negative for missing entries
+        edge_center: cartesian unit vector of the edge midpoints, shape (E, 3)
+        edge_normal: cartesian edge normals, shape (E, 3)
+        scale: scale factor of the radial basis function
+        kernel: radial basis function
+        horizontal_start: coefficients of entities below are zero
+        chunk_size: number of entities solved at once
+        array_ns: numpy or cupy
+
+    Returns:
+        one coefficient array of shape (N, n) for each of `directions`
+    """
+    num_entities, stencil_size = stencil.shape
+    direction = array_ns.stack(directions, axis=-1)
+    coefficients = array_ns.zeros((num_entities, stencil_size, len(directions)))
+    identity = array_ns.eye(stencil_size, dtype=bool)
+    for start in range(horizontal_start, num_entities, chunk_size):
+        chunk = slice(start, min(start + chunk_size, num_entities))
+        valid = stencil[chunk] >= 0
+        edges = array_ns.where(valid, stencil[chunk], 0)
+        centers = edge_center[edges]
+        normals = edge_normal[edges]
+        valid_pair = valid[:, :, array_ns.newaxis] & valid[:, array_ns.newaxis, :]
+
+        # stencils are small, batched matrix products are faster than reductions over them
+        distance = array_ns.arccos(
+            array_ns.clip(centers @ array_ns.swapaxes(centers, 1, 2), -1.0, 1.0)
+        )
+        normal_product = normals @ array_ns.swapaxes(normals, 1, 2)
+        matrix = normal_product * _rbf_kernel(distance, scale, kernel, array_ns)
+        matrix = array_ns.where(valid_pair, matrix, identity)
+
+        weight = _rbf_kernel(
+            _arc_length(center[chunk, array_ns.newaxis, :], centers, array_ns),
+            scale,
+            kernel,
+            array_ns,
+        )
+        rhs = (normals @ direction[chunk]) * array_ns.where(valid, weight, 0.0)[
+            :, :, array_ns.newaxis
+        ]
+        coefficients[chunk] = _batched_cholesky_solve(matrix, rhs, array_ns)
+    return tuple(coefficients[:, :, i] for i in range(len(directions)))
+
+
+def compute_rbf_vec_coeff_c(
+    cell_lat: data_alloc.NDArray,
+    cell_lon: data_alloc.NDArray,
+    edge_lat: data_alloc.NDArray,
+    edge_lon: data_alloc.NDArray,
+    edge_normal_x: data_alloc.NDArray,
+    edge_normal_y: data_alloc.NDArray,
+    edge_normal_z: data_alloc.NDArray,
+    c2e2c2e: data_alloc.NDArray,
+    scale: float,
+    horizontal_start: gtx.int32,
+    kernel: RBFKernel = DEFAULT_RBF_KERNEL[RBFDimension.CELL],
+    chunk_size: int = 2**16,
+    array_ns: ModuleType = np,
+) -> tuple[data_alloc.NDArray, data_alloc.NDArray]:
+    """
+    Compute the RBF coefficients reconstructing the cell center velocity from the normal velocity.
+
+    Args:
+        cell_lat: \\ numpy array, representing a gtx.Field[gtx.Dims[CellDim], ta.wpfloat]
+        cell_lon: //
+        edge_lat: \\ numpy array, representing a gtx.Field[gtx.Dims[EdgeDim], ta.wpfloat]
+        edge_lon: //
+        edge_normal_x: \\
+        edge_normal_y:  numpy array, representing a gtx.Field[gtx.Dims[EdgeDim], ta.wpfloat]
+        edge_normal_z: //
+        c2e2c2e: numpy array, representing a gtx.Field[gtx.Dims[CellDim, C2E2C2EDim], gtx.int32]
+        scale: scale factor of the radial basis function, see compute_default_rbf_scale
+        horizontal_start:
+        kernel: radial basis function
+        chunk_size: number of cells solved at once
+        array_ns: module either used or array computations defaults to numpy
+
+    Returns:
+        rbf_vec_coeff_c1: numpy array, representing a gtx.Field[gtx.Dims[CellDim, C2E2C2EDim], ta.wpfloat]
+        rbf_vec_coeff_c2: numpy array, representing a gtx.Field[gtx.Dims[CellDim, C2E2C2EDim], ta.wpfloat]
+    """
+    return _compute_rbf_vec_coeff(
+        center=_cartesian_unit_vector(cell_lat, cell_lon, array_ns),
+        directions=_zonal_and_meridional_unit_vectors(cell_lat, cell_lon, array_ns),
+        stencil=c2e2c2e,
+        edge_center=_cartesian_unit_vector(edge_lat, edge_lon, array_ns),
+        edge_normal=array_ns.stack((edge_normal_x, edge_normal_y, edge_normal_z), axis=-1),
+        scale=scale,
+        kernel=kernel,
+        horizontal_start=horizontal_start,
+        chunk_size=chunk_size,
+        array_ns=array_ns,
+    )
+
+
+def compute_rbf_vec_coeff_v(
+    vertex_lat: data_alloc.NDArray,
+    vertex_lon: data_alloc.NDArray,
+    edge_lat: data_alloc.NDArray,
+    edge_lon: data_alloc.NDArray,
+    edge_normal_x: data_alloc.NDArray,
+    edge_normal_y: data_alloc.NDArray,
+    edge_normal_z: data_alloc.NDArray,
+    v2e: data_alloc.NDArray,
+    scale: float,
+    horizontal_start: gtx.int32,
+    kernel: RBFKernel = DEFAULT_RBF_KERNEL[RBFDimension.VERTEX],
+    chunk_size: int = 2**16,
+    array_ns: ModuleType = np,
+) -> tuple[data_alloc.NDArray, data_alloc.NDArray]:
+    """
+    Compute the RBF coefficients reconstructing the vertex velocity from the normal velocity.
+
+    Args:
+        vertex_lat: \\ numpy array, representing a gtx.Field[gtx.Dims[VertexDim], ta.wpfloat]
+        vertex_lon: //
+        edge_lat: \\ numpy array, representing a gtx.Field[gtx.Dims[EdgeDim], ta.wpfloat]
+        edge_lon: //
+        edge_normal_x: \\
+        edge_normal_y:  numpy array, representing a gtx.Field[gtx.Dims[EdgeDim], ta.wpfloat]
+        edge_normal_z: //
+        v2e: numpy array, representing a gtx.Field[gtx.Dims[VertexDim, V2EDim], gtx.int32]
+        scale: scale factor of the radial basis function, see compute_default_rbf_scale
+        horizontal_start:
+        kernel: radial basis function
+        chunk_size: number of vertices solved at once
+        array_ns: module either used or array computations defaults to numpy
+
+    Returns:
+        rbf_vec_coeff_v1: numpy array, representing a gtx.Field[gtx.Dims[VertexDim, V2EDim], ta.wpfloat]
+        rbf_vec_coeff_v2: numpy array, representing a gtx.Field[gtx.Dims[VertexDim, V2EDim], ta.wpfloat]
+    """
+    return _compute_rbf_vec_coeff(
+        center=_cartesian_unit_vector(vertex_lat, vertex_lon, array_ns),
+        directions=_zonal_and_meridional_unit_vectors(vertex_lat, vertex_lon, array_ns),
+        stencil=v2e,
+        edge_center=_cartesian_unit_vector(edge_lat, edge_lon, array_ns),
+        edge_normal=array_ns.stack((edge_normal_x, edge_normal_y, edge_normal_z), axis=-1),
+        scale=scale,
+        kernel=kernel,
+        horizontal_start=horizontal_start,
+        chunk_size=chunk_size,
+        array_ns=array_ns,
+    )
+
+
+def compute_rbf_vec_coeff_e(
+    edge_lat: data_alloc.NDArray,
+    edge_lon: data_alloc.NDArray,
+    edge_normal_x: data_alloc.NDArray,
+    edge_normal_y: data_alloc.NDArray,
+    edge_normal_z: data_alloc.NDArray,
+    edge_tangent_x: data_alloc.NDArray,
+    edge_tangent_y: data_alloc.NDArray,
+    edge_tangent_z: data_alloc.NDArray,
+    e2c2e: data_alloc.NDArray,
+    scale: float,
+    horizontal_start: gtx.int32,
+    kernel: RBFKernel = DEFAULT_RBF_KERNEL[RBFDimension.EDGE],
+    chunk_size: int = 2**16,
+    array_ns: ModuleType = np,
+) -> data_alloc.NDArray:
+    """
+    Compute the RBF coefficients reconstructing the tangential velocity from the normal velocity of the neighboring edges.
+
+    Args:
+        edge_lat: \\ numpy array, representing a gtx.Field[gtx.Dims[EdgeDim], ta.wpfloat]
+        edge_lon: //
+        edge_normal_x: \\
+        edge_normal_y:  numpy array, representing a gtx.Field[gtx.Dims[EdgeDim], ta.wpfloat]
+        edge_normal_z: //
+        edge_tangent_x: \\
+        edge_tangent_y:  numpy array, representing a gtx.Field[gtx.Dims[EdgeDim], ta.wpfloat]
+        edge_tangent_z: //
+        e2c2e: numpy array, representing a gtx.Field[gtx.Dims[EdgeDim, E2C2EDim], gtx.int32]
+        scale: scale factor of the radial basis function, see compute_default_rbf_scale
+        horizontal_start:
+        kernel: radial basis function
+        chunk_size: number of edges solved at once
+        array_ns: module either used or array computations defaults to numpy
+
+    Returns:
+        rbf_vec_coeff_e: numpy array, representing a gtx.Field[gtx.Dims[EdgeDim, E2C2EDim], ta.wpfloat]
+    """
+    edge_center = _cartesian_unit_vector(edge_lat, edge_lon, array_ns)
+    (rbf_vec_coeff_e,) = _compute_rbf_vec_coeff(
+        center=edge_center,
+        directions=(array_ns.stack((edge_tangent_x, edge_tangent_y, edge_tangent_z), axis=-1),),
+        stencil=e2c2e,
+        edge_center=edge_center,
+        edge_normal=array_ns.stack((edge_normal_x, edge_normal_y, edge_normal_z), axis=-1),
+        scale=scale,
+        kernel=kernel,
+        horizontal_start=horizontal_start,
+        chunk_size=chunk_size,
+        array_ns=array_ns,
+    )
+    return rbf_vec_coeff_e
@@ -0,0 +1,42 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+from types import ModuleType
+
+import numpy as np
+
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+def count_levels_above(
+    heights: data_alloc.NDArray,
+    columns: data_alloc.NDArray,
+    z: data_alloc.NDArray,
+    inclusive: bool,
+    array_ns: ModuleType = np,
+) -> data_alloc.NDArray:
+    """
+    Number of levels of the cells `columns` that lie above the heights `z`.
+
+    Vectorized binary search in the columns of `heights` (cell x level heights of full or half
+    levels), which decrease monotonically with the level index. `columns` and `z` are broadcast
+    against each other. If `inclusive`, levels at the height `z` count as above.
+    """
+    num_levels = heights.shape[1]
+    values = heights.reshape(-1)
+    column_offset, z = array_ns.broadcast_arrays(columns * num_levels, z)
+    lower = array_ns.zeros(z.shape, dtype=int)
+    upper = array_ns.full(z.shape, num_levels, dtype=int)
+    for _ in range(num_levels.bit_length()):
+        middle = (lower + upper) // 2
+        value = values[column_offset + array_ns.minimum(middle, num_levels - 1)]
+        above = (value >= z) if inclusive else (value > z)
+        searching = lower < upper
+        lower = array_ns.where(searching & above, middle + 1, lower)
+        upper = array_ns.where(searching & ~above, middle, upper)
+    return lower
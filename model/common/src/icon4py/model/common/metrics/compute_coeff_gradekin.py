@@ -29,15 +29,12 @@ def compute_coeff_gradekin(
         horizontal_start: horizontal start index
         horizontal_end: horizontal end index
     """
-    coeff_gradekin_0 = array_ns.zeros_like(inv_dual_edge_length)
-    coeff_gradekin_1 = array_ns.zeros_like(inv_dual_edge_length)
-    for e in range(horizontal_start, horizontal_end):
-        coeff_gradekin_0[e] = (
-            edge_cell_length[e, 1] / edge_cell_length[e, 0] * inv_dual_edge_length[e]
-        )
-        coeff_gradekin_1[e] = (
-            edge_cell_length[e, 0] / edge_cell_length[e, 1] * inv_dual_edge_length[e]
-        )
-    coeff_gradekin_full = array_ns.column_stack((coeff_gradekin_0, coeff_gradekin_1))
-    shp = coeff_gradekin_full.shape
-    return coeff_gradekin_full.reshape(shp[0] * shp[1])
+    edges = slice(horizontal_start, horizontal_end)
+    coeff_gradekin_full = array_ns.zeros((inv_dual_edge_length.shape[0], 2))
+    coeff_gradekin_full[edges, 0] = (
+        edge_cell_length[edges, 1] / edge_cell_length[edges, 0] * inv_dual_edge_length[edges]
+    )
+    coeff_gradekin_full[edges, 1] = (
+        edge_cell_length[edges, 0] / edge_cell_length[edges, 1] * inv_dual_edge_length[edges]
+    )
+    return coeff_gradekin_full.reshape(-1)
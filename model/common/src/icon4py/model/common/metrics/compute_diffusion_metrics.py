@@ -10,6 +10,7 @@ from types import ModuleType
 
 import numpy as np
 
+from icon4py.model.common.metrics import column_search
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 
@@ -25,119 +26,58 @@ def compute_max_nbhgt_array_ns(
     return max_nbhgt
 
 
-def _compute_nbidx(
-    k_range: range,
-    z_mc: data_alloc.NDArray,
-    z_mc_off: data_alloc.NDArray,
-    nbidx: data_alloc.NDArray,
-    jc: int,
-    nlev: int,
-) -> data_alloc.NDArray:
-    for ind in range(3):
-        jk_start = nlev - 1
-        for jk in reversed(k_range):
-            for jk1 in reversed(range(jk_start)):
-                if (
-                    z_mc[jc, jk] <= z_mc_off[jc, ind, jk1]
-                    and z_mc[jc, jk] >= z_mc_off[jc, ind, jk1 + 1]
-                ):
-                    nbidx[jc, ind, jk] = jk1
-                    jk_start = jk1 + 1
-                    break
-
-    return nbidx[jc, :, :]
-
-
-def _compute_z_vintcoeff(
-    k_range: range,
+def _compute_k_start_end(
     z_mc: data_alloc.NDArray,
-    z_mc_off: data_alloc.NDArray,
-    z_vintcoeff: data_alloc.NDArray,
-    jc: int,
-    nlev: int,
-) -> data_alloc.NDArray:
-    for ind in range(3):
-        jk_start = nlev - 1
-        for jk in reversed(k_range):
-            for jk1 in reversed(range(jk_start)):
-                if (
-                    z_mc[jc, jk] <= z_mc_off[jc, ind, jk1]
-                    and z_mc[jc, jk] >= z_mc_off[jc, ind, jk1 + 1]
-                ):
-                    z_vintcoeff[jc, ind, jk] = (z_mc[jc, jk] - z_mc_off[jc, ind, jk1 + 1]) / (
-                        z_mc_off[jc, ind, jk1] - z_mc_off[jc, ind, jk1 + 1]
-                    )
-                    jk_start = jk1 + 1
-                    break
-
-    return z_vintcoeff[jc, :, :]
-
-
-def _compute_ls_params(
-    k_start: list,
-    k_end: list,
+    max_nbhgt: data_alloc.NDArray,
     maxslp_avg: data_alloc.NDArray,
     maxhgtd_avg: data_alloc.NDArray,
-    c_owner_mask: data_alloc.NDArray,
     thslp_zdiffu: float,
     thhgtd_zdiffu: float,
-    cell_nudging: int,
-    n_cells: int,
     nlev: int,
-) -> tuple[list, int, int]:
-    indlist = [0] * n_cells
-    listreduce = 0
-    ji = -1
-    ji_ind = -1
-
-    for jc in range(cell_nudging, n_cells):
-        if (
-            maxslp_avg[jc, nlev - 1] >= thslp_zdiffu or maxhgtd_avg[jc, nlev - 1] >= thhgtd_zdiffu
-        ) and c_owner_mask[jc]:
-            ji += 1
-            indlist[ji] = jc
-
-            if all((k_start[jc], k_end[jc])) and k_start[jc] > k_end[jc]:
-                listreduce += 1
-            else:
-                ji_ind += 1
-                indlist[ji_ind] = jc
-
-    return indlist, listreduce, ji
+    array_ns: ModuleType = np,
+) -> tuple[data_alloc.NDArray, data_alloc.NDArray]:
+    """
+    Levels range `k_start <= jk < k_end` of the steep cells with truly horizontal diffusion.
+
+    `k_start` is the first level where the slope or the height difference exceeds its threshold,
+    `k_end` the level below the lowest level above the neighbour cells (0 if there is none).
+    """
+    above_neighbors = z_mc >= max_nbhgt[:, None]
+    k_end = array_ns.where(
+        array_ns.any(above_neighbors, axis=1),
+        nlev - array_ns.argmax(above_neighbors[:, ::-1], axis=1),
+        0,
+    )
+    steep = (maxslp_avg >= thslp_zdiffu) | (maxhgtd_avg >= thhgtd_zdiffu)
+    k_start = array_ns.argmax(steep, axis=1)
+    return k_start, k_end
 
 
-def _compute_k_start_end(
-    z_mc: data_alloc.NDArray,
-    max_nbhgt: data_alloc.NDArray,
+def _compute_diffusion_cells(
+    k_start: data_alloc.NDArray,
+    k_end: data_alloc.NDArray,
     maxslp_avg: data_alloc.NDArray,
     maxhgtd_avg: data_alloc.NDArray,
     c_owner_mask: data_alloc.NDArray,
     thslp_zdiffu: float,
     thhgtd_zdiffu: float,
     cell_nudging: int,
-    n_cells: int,
     nlev: int,
-) -> tuple[list, list]:
-    k_start = [None] * n_cells
-    k_end = [None] * n_cells
-    for jc in range(cell_nudging, n_cells):
-        if (
-            maxslp_avg[jc, nlev - 1] >= thslp_zdiffu or maxhgtd_avg[jc, nlev - 1] >= thhgtd_zdiffu
-        ) and c_owner_mask[jc]:
-            for jk in reversed(range(nlev)):
-                if z_mc[jc, jk] >= max_nbhgt[jc]:
-                    k_end[jc] = jk + 1
-                    break
-
-            for jk in range(nlev):
-                if maxslp_avg[jc, jk] >= thslp_zdiffu or maxhgtd_avg[jc, jk] >= thhgtd_zdiffu:
-                    k_start[jc] = jk
-                    break
-
-            if all((k_start[jc], k_end[jc])) and k_start[jc] > k_end[jc]:
-                k_start[jc] = nlev - 1
-
-    return k_start, k_end
+    array_ns: ModuleType = np,
+) -> data_alloc.NDArray:
+    """Owned cells in the interior (from `cell_nudging` on) with a non empty diffusion range."""
+    n_cells = k_start.shape[0]
+    steep = (
+        (maxslp_avg[:, nlev - 1] >= thslp_zdiffu) | (maxhgtd_avg[:, nlev - 1] >= thhgtd_zdiffu)
+    ) & array_ns.asarray(c_owner_mask, dtype=bool)
+    steep[: min(cell_nudging, n_cells)] = False
+    # cells whose range is inverted are removed from the list
+    inverted = (k_start != 0) & (k_end != 0) & (k_start > k_end)
+    listed = array_ns.flatnonzero(steep & ~inverted)
+    # the last cell of the list is not processed (as in the original loop implementation, where
+    # the list length is computed from a 0-based index)
+    listed = listed[:-1]
+    return listed[(k_start[listed] != 0) & (k_start[listed] < k_end[listed])]
 
 
 def compute_diffusion_metrics(
@@ -153,29 +93,36 @@ def compute_diffusion_metrics(
     nlev: int,
     array_ns: ModuleType = np,
 ) -> tuple[data_alloc.NDArray, data_alloc.NDArray, data_alloc.NDArray, data_alloc.NDArray]:
+    """
+    Metrics for the truly horizontal temperature diffusion over steep slopes.
+
+    For the levels of the steep cells in the diffusion range, the level `jk1` of each neighbour
+    cell containing the cell height `z_mc` is searched upwards, starting from the level found for
+    the level below. All cells are processed at once: the bounds of the candidate levels are found
+    by a vectorized binary search in the neighbour columns (`z_mc` decreases monotonically with the
+    level index), only the dependence on the level below is resolved by a loop over levels.
+    """
     n_cells = c2e2c.shape[0]
     n_c2e2c = c2e2c.shape[1]
-    z_mc_off = z_mc[c2e2c]
-    nbidx = array_ns.ones(shape=(n_cells, n_c2e2c, nlev), dtype=int)
-    z_vintcoeff = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
+    z_mc = z_mc[:, :nlev]
+    maxslp_avg = maxslp_avg[:, :nlev]
+    maxhgtd_avg = maxhgtd_avg[:, :nlev]
     mask_hdiff = array_ns.zeros(shape=(n_cells, nlev), dtype=bool)
     zd_vertoffset_dsl = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
     zd_intcoef_dsl = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
     zd_diffcoef_dsl = array_ns.zeros(shape=(n_cells, nlev))
+
     k_start, k_end = _compute_k_start_end(
         z_mc=z_mc,
         max_nbhgt=max_nbhgt,
         maxslp_avg=maxslp_avg,
         maxhgtd_avg=maxhgtd_avg,
-        c_owner_mask=c_owner_mask,
         thslp_zdiffu=thslp_zdiffu,
         thhgtd_zdiffu=thhgtd_zdiffu,
-        cell_nudging=cell_nudging,
-        n_cells=n_cells,
         nlev=nlev,
+        array_ns=array_ns,
     )
-
-    indlist, listreduce, ji = _compute_ls_params(
+    cells = _compute_diffusion_cells(
         k_start=k_start,
         k_end=k_end,
         maxslp_avg=maxslp_avg,
@@ -184,39 +131,58 @@ def compute_diffusion_metrics(
         thslp_zdiffu=thslp_zdiffu,
         thhgtd_zdiffu=thhgtd_zdiffu,
         cell_nudging=cell_nudging,
-        n_cells=n_cells,
         nlev=nlev,
+        array_ns=array_ns,
+    )
+    levels = array_ns.arange(nlev)
+    in_range = (levels[None, :] >= k_start[cells, None]) & (levels[None, :] < k_end[cells, None])
+
+    # candidate levels jk1 of the neighbours with z_mc_off[jk1] >= z_mc >= z_mc_off[jk1 + 1]
+    neighbors = c2e2c[cells][:, :, None]
+    z = z_mc[cells][:, None, :]
+    lowest = array_ns.maximum(
+        column_search.count_levels_above(z_mc, neighbors, z, inclusive=False, array_ns=array_ns)
+        - 1,
+        0,
+    )
+    highest = (
+        column_search.count_levels_above(z_mc, neighbors, z, inclusive=True, array_ns=array_ns) - 1
     )
 
-    listdim = ji - listreduce
-
-    for ji in range(listdim):
-        jc = indlist[ji]
-        k_range = range(k_start[jc], k_end[jc])
-        if all((k_range)):
-            nbidx[jc, :, :] = _compute_nbidx(k_range, z_mc, z_mc_off, nbidx, jc, nlev)
-            z_vintcoeff[jc, :, :] = _compute_z_vintcoeff(
-                k_range, z_mc, z_mc_off, z_vintcoeff, jc, nlev
-            )
-
-            zd_intcoef_dsl[jc, :, k_range] = z_vintcoeff[jc, :, k_range]
-            zd_vertoffset_dsl[jc, :, k_range] = nbidx[jc, :, k_range] - array_ns.transpose(
-                [k_range] * 3
-            )
-            mask_hdiff[jc, k_range] = True
-
-            zd_diffcoef_dsl_var = array_ns.maximum(
-                0.0,
-                array_ns.maximum(
-                    array_ns.sqrt(array_ns.maximum(0.0, maxslp_avg[jc, k_range] - thslp_zdiffu))
-                    / 250.0,
-                    2.0e-4
-                    * array_ns.sqrt(
-                        array_ns.maximum(0.0, maxhgtd_avg[jc, k_range] - thhgtd_zdiffu)
-                    ),
-                ),
-            )
-            zd_diffcoef_dsl[jc, k_range] = array_ns.minimum(0.002, zd_diffcoef_dsl_var)
+    nbidx = array_ns.ones((cells.shape[0], n_c2e2c, nlev), dtype=int)
+    z_vintcoeff = array_ns.zeros((cells.shape[0], n_c2e2c, nlev))
+    jk_start = array_ns.full((cells.shape[0], n_c2e2c), nlev - 1)
+    neighbors = neighbors[:, :, 0]
+    for jk in reversed(range(nlev)):
+        # the search goes upwards from the level found for the level below
+        jk1 = array_ns.minimum(highest[:, :, jk], jk_start - 1)
+        found = (jk1 >= lowest[:, :, jk]) & in_range[:, jk, None]
+        jk1 = array_ns.where(found, jk1, 0)
+        z_upper = z_mc[neighbors, jk1]
+        z_lower = z_mc[neighbors, jk1 + 1]
+        nbidx[:, :, jk] = array_ns.where(found, jk1, 1)
+        z_vintcoeff[:, :, jk] = array_ns.where(
+            found,
+            (z_mc[cells, jk, None] - z_lower) / array_ns.where(found, z_upper - z_lower, 1.0),
+            0.0,
+        )
+        jk_start = array_ns.where(found, jk1 + 1, jk_start)
+
+    in_range_c2e2c = in_range[:, None, :]
+    zd_intcoef_dsl[cells] = array_ns.where(in_range_c2e2c, z_vintcoeff, 0.0)
+    zd_vertoffset_dsl[cells] = array_ns.where(in_range_c2e2c, nbidx - levels, 0)
+    mask_hdiff[cells] = in_range
+
+    zd_diffcoef_dsl_var = array_ns.maximum(
+        0.0,
+        array_ns.maximum(
+            array_ns.sqrt(array_ns.maximum(0.0, maxslp_avg[cells] - thslp_zdiffu)) / 250.0,
+            2.0e-4 * array_ns.sqrt(array_ns.maximum(0.0, maxhgtd_avg[cells] - thhgtd_zdiffu)),
+        ),
+    )
+    zd_diffcoef_dsl[cells] = array_ns.where(
+        in_range, array_ns.minimum(0.002, zd_diffcoef_dsl_var), 0.0
+    )
 
     # flatten first two dims:
     zd_intcoef_dsl = zd_intcoef_dsl.reshape(
@@ -24,20 +24,21 @@ def compute_flat_idx_max(
     horizontal_upper: int,
     array_ns: ModuleType = np,
 ) -> data_alloc.NDArray:
-    z_me = array_ns.sum(z_mc[e2c] * array_ns.expand_dims(c_lin_e, axis=-1), axis=1)
-    z_ifc_e_0 = z_ifc[e2c[:, 0]]
-    z_ifc_e_k_0 = array_ns.roll(z_ifc_e_0, -1, axis=1)
-    z_ifc_e_1 = z_ifc[e2c[:, 1]]
-    z_ifc_e_k_1 = array_ns.roll(z_ifc_e_1, -1, axis=1)
-    flat_idx = array_ns.zeros_like(z_me)
-    for je in range(horizontal_lower, horizontal_upper):
-        for jk in range(k_lev.shape[0] - 1):
-            if (
-                (z_me[je, jk] <= z_ifc_e_0[je, jk])
-                and (z_me[je, jk] >= z_ifc_e_k_0[je, jk])
-                and (z_me[je, jk] <= z_ifc_e_1[je, jk])
-                and (z_me[je, jk] >= z_ifc_e_k_1[je, jk])
-            ):
-                flat_idx[je, jk] = k_lev[jk]
-    flat_idx_max = array_ns.amax(flat_idx, axis=1)
-    return flat_idx_max.astype(gtx.int32)
+    nlev = k_lev.shape[0] - 1
+    e2c_edges = e2c[horizontal_lower:horizontal_upper]
+    z_me = array_ns.sum(
+        z_mc[e2c_edges, :nlev]
+        * array_ns.expand_dims(c_lin_e[horizontal_lower:horizontal_upper], axis=-1),
+        axis=1,
+    )
+    z_ifc_e = z_ifc[e2c_edges]
+    # z_me lies between the upper and lower half level of both neighbouring cells
+    is_within_cells = array_ns.all(
+        (z_me[:, None, :] <= z_ifc_e[:, :, :nlev]) & (z_me[:, None, :] >= z_ifc_e[:, :, 1:]),
+        axis=1,
+    )
+    flat_idx_max = array_ns.zeros(e2c.shape[0], dtype=gtx.int32)
+    flat_idx_max[horizontal_lower:horizontal_upper] = array_ns.max(
+        array_ns.where(is_within_cells, k_lev[:nlev], 0), axis=1
+    )
+    return flat_idx_max
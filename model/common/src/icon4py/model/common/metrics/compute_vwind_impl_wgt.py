@@ -27,31 +27,31 @@ def compute_vwind_impl_wgt(
 ) -> data_alloc.NDArray:
     init_val = 0.5 + vwind_offctr
     vwind_impl_wgt = array_ns.full(z_ifc.shape[0], init_val)
-    for je in range(horizontal_start_cell, n_cells):
-        zn_off_0 = z_ddxn_z_half_e[c2e[je, 0], nlev]
-        zn_off_1 = z_ddxn_z_half_e[c2e[je, 1], nlev]
-        zn_off_2 = z_ddxn_z_half_e[c2e[je, 2], nlev]
-        zt_off_0 = z_ddxt_z_half_e[c2e[je, 0], nlev]
-        zt_off_1 = z_ddxt_z_half_e[c2e[je, 1], nlev]
-        zt_off_2 = z_ddxt_z_half_e[c2e[je, 2], nlev]
-        z_maxslope = max(
-            abs(zn_off_0), abs(zt_off_0), abs(zn_off_1), abs(zt_off_1), abs(zn_off_2), abs(zt_off_2)
-        )
-        z_diff = max(
-            abs(zn_off_0 * dual_edge_length[c2e[je, 0]]),
-            abs(zn_off_1 * dual_edge_length[c2e[je, 1]]),
-            abs(zn_off_2 * dual_edge_length[c2e[je, 2]]),
-        )
+    cells = slice(horizontal_start_cell, n_cells)
+    c2e_cells = c2e[cells]
+    zn_off = z_ddxn_z_half_e[c2e_cells, nlev]
+    zt_off = z_ddxt_z_half_e[c2e_cells, nlev]
+    z_maxslope = array_ns.maximum(
+        array_ns.max(array_ns.abs(zn_off), axis=1), array_ns.max(array_ns.abs(zt_off), axis=1)
+    )
+    z_diff = array_ns.max(array_ns.abs(zn_off * dual_edge_length[c2e_cells]), axis=1)
 
-        z_offctr = max(
-            vwind_offctr, 0.425 * z_maxslope ** (0.75), min(0.25, 0.00025 * (z_diff - 250.0))
-        )
-        z_offctr = min(max(vwind_offctr, 0.75), z_offctr)
-        vwind_impl_wgt[je] = 0.5 + z_offctr
+    z_offctr = array_ns.maximum(
+        vwind_offctr,
+        array_ns.maximum(
+            0.425 * z_maxslope**0.75, array_ns.minimum(0.25, 0.00025 * (z_diff - 250.0))
+        ),
+    )
+    z_offctr = array_ns.minimum(max(vwind_offctr, 0.75), z_offctr)
+    vwind_impl_wgt[cells] = 0.5 + z_offctr
 
-    for jk in range(max(9, nlev - 9), nlev):
-        for je in range(horizontal_start_cell, n_cells):
-            z_diff_2 = (z_ifc[je, jk] - z_ifc[je, jk + 1]) / (vct_a[jk] - vct_a[jk + 1])
-            if z_diff_2 < 0.6:
-                vwind_impl_wgt[je] = max(vwind_impl_wgt[je], 1.2 - z_diff_2)
+    levels = slice(max(9, nlev - 9), nlev)
+    if levels.start < levels.stop:
+        z_diff_2 = (z_ifc[cells, levels] - z_ifc[cells, levels.start + 1 : nlev + 1]) / (
+            vct_a[levels] - vct_a[levels.start + 1 : nlev + 1]
+        )
+        z_increase = array_ns.max(
+            array_ns.where(z_diff_2 < 0.6, 1.2 - z_diff_2, -array_ns.inf), axis=1
+        )
+        vwind_impl_wgt[cells] = array_ns.maximum(vwind_impl_wgt[cells], z_increase)
     return vwind_impl_wgt
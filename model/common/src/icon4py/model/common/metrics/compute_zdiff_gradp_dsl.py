@@ -10,9 +10,45 @@ from types import ModuleType
 
 import numpy as np
 
+from icon4py.model.common.metrics import column_search
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 
+def _first_level_containing(
+    z_ifc: data_alloc.NDArray,
+    columns: data_alloc.NDArray,
+    z: data_alloc.NDArray,
+    nlev: int,
+    array_ns: ModuleType = np,
+) -> tuple[data_alloc.NDArray, data_alloc.NDArray]:
+    """
+    Range `lowest <= jk1 <= highest` of the levels of the cells `columns` containing the height `z`.
+
+    These are the levels with `z_ifc[jk1] >= z >= z_ifc[jk1 + 1]`, excluding the lowest level,
+    which is the fallback of the search.
+    """
+    lowest = (
+        column_search.count_levels_above(z_ifc, columns, z, inclusive=False, array_ns=array_ns) - 1
+    )
+    highest = array_ns.minimum(
+        column_search.count_levels_above(z_ifc, columns, z, inclusive=True, array_ns=array_ns) - 1,
+        nlev - 2,
+    )
+    return lowest, highest
+
+
+def _first_match(
+    lowest: data_alloc.NDArray,
+    highest: data_alloc.NDArray,
+    start: data_alloc.NDArray,
+    nlev: int,
+    array_ns: ModuleType = np,
+) -> data_alloc.NDArray:
+    """First level at or below `start` containing the height, or the lowest level if there is none."""
+    level = array_ns.maximum(lowest, start)
+    return array_ns.where(level <= highest, level, nlev - 1)
+
+
 def compute_zdiff_gradp_dsl(
     e2c,
     z_mc: data_alloc.NDArray,
@@ -25,6 +61,15 @@ def compute_zdiff_gradp_dsl(
     horizontal_start_1: int,
     array_ns: ModuleType = np,
 ) -> data_alloc.NDArray:
+    """
+    Height differences for the pressure gradient extrapolation.
+
+    For every level below the flat levels of an edge, the level `jk1` of each of its neighbour
+    cells is searched, which contains the edge height `z_me` (or the extrapolation limit `z_aux2`
+    below the ground of the neighbour cells). The search for all edges and levels is done by a
+    vectorized binary search in the neighbour cell columns of `z_ifc`, which requires `z_ifc` to
+    decrease monotonically with the level index.
+    """
     nedges = e2c.shape[0]
     z_me = array_ns.sum(z_mc[e2c] * array_ns.expand_dims(c_lin_e, axis=-1), axis=1)
     z_aux1 = array_ns.maximum(z_ifc_sliced[e2c[:, 0]], z_ifc_sliced[e2c[:, 1]])
@@ -34,83 +79,45 @@ def compute_zdiff_gradp_dsl(
         array_ns.expand_dims(z_me, axis=1)[horizontal_start:, :, :]
         - z_mc[e2c][horizontal_start:, :, :]
     )
-    """
-    First part for loop implementation with gt4py code
-
-    >>> z_ifc_off_koff = zero_field(icon_grid, EdgeDim, KDim, extend={KDim: 1})
-    >>> z_ifc_off = as_field((EdgeDim, KDim,), z_ifc[e2c[:, 0], :])
-    >>> _compute_z_ifc_off_koff(
-    >>>     z_ifc_off=z_ifc_off,
-    >>>     domain={EdgeDim: (horizontal_start, nedges), KDim: (0, nlev)},
-    >>>     out=z_ifc_off_koff,
-    >>>     offset_provider={"Koff": icon_grid.get_offset_provider("Koff")}
-    >>> )
-    """
+    flat = array_ns.asarray(flat_idx, dtype=int)
+    levels = array_ns.arange(nlev)
+
+    # levels of the neighbour cells containing the edge height z_me
+    edges = slice(horizontal_start, nedges)
+    z_edge = z_me[edges]
+    below_flat = levels[None, :] > flat[edges, None]
+
+    # first neighbour: search from the flat level for each level
+    column = e2c[edges, 0][:, None]
+    lowest, highest = _first_level_containing(z_ifc, column, z_edge, nlev, array_ns)
+    jk1 = _first_match(lowest, highest, flat[edges, None], nlev, array_ns)
+    zdiff_gradp[edges, 0, :] = array_ns.where(
+        below_flat, z_edge - z_mc[column, jk1], zdiff_gradp[edges, 0, :]
+    )
+
+    # second neighbour: the search starts at the level found for the level above
+    column = e2c[edges, 1]
+    lowest, highest = _first_level_containing(z_ifc, column[:, None], z_edge, nlev, array_ns)
+    start = flat[edges]
+    for jk in range(nlev):
+        jk1 = _first_match(lowest[:, jk], highest[:, jk], start, nlev, array_ns)
+        zdiff_gradp[edges, 1, jk] = array_ns.where(
+            below_flat[:, jk], z_edge[:, jk] - z_mc[column, jk1], zdiff_gradp[edges, 1, jk]
+        )
+        start = array_ns.where(below_flat[:, jk], jk1, start)
 
-    for je in range(horizontal_start, nedges):
-        for jk in range(int(flat_idx[je]) + 1, nlev):
-            """
-            Second part for loop implementation with gt4py code
-            >>> param_2 = as_field((KDim,), array_ns.asarray([False] * nlev))
-            >>> param_3 = as_field((KDim,), array_ns.arange(nlev))
-            >>> z_ifc_off_e = as_field((KDim,), z_ifc[e2c[je, 0], :])
-            >>> _compute_param.with_backend(backend)(
-            >>>     z_me_jk=z_me[je, jk],
-            >>>     z_ifc_off=z_ifc_off_e,
-            >>>     z_ifc_off_koff=as_field((KDim,), z_ifc_off_koff.ndarray[je, :]),
-            >>>     lower=int(flat_idx[je]),
-            >>>     nlev=nlev - 1,
-            >>>     out=(param_3, param_2),
-            >>>     offset_provider={}
-            >>> )
-            >>> zdiff_gradp[je, 0, jk] = z_me[je, jk] - z_mc[e2c[je, 0], array_ns.where(param_2.ndarray)[0][0]]
-            """
-
-            param = array_ns.zeros((nlev,), dtype=bool)
-            for jk1 in range(int(flat_idx[je]), nlev):
-                if jk1 == nlev - 1 or (
-                    z_me[je, jk] <= z_ifc[e2c[je, 0], jk1]
-                    and z_me[je, jk] >= z_ifc[e2c[je, 0], jk1 + 1]
-                ):
-                    param[jk1] = True
-
-            zdiff_gradp[je, 0, jk] = z_me[je, jk] - z_mc[e2c[je, 0], array_ns.where(param)[0][0]]
-
-        jk_start = int(flat_idx[je])
-        for jk in range(int(flat_idx[je]) + 1, nlev):
-            for jk1 in range(jk_start, nlev):
-                if jk1 == nlev - 1 or (
-                    z_me[je, jk] <= z_ifc[e2c[je, 1], jk1]
-                    and z_me[je, jk] >= z_ifc[e2c[je, 1], jk1 + 1]
-                ):
-                    zdiff_gradp[je, 1, jk] = z_me[je, jk] - z_mc[e2c[je, 1], jk1]
-                    jk_start = jk1
-                    break
-
-    for je in range(horizontal_start_1, nedges):
-        jk_start = int(flat_idx[je])
-        for jk in range(int(flat_idx[je]) + 1, nlev):
-            if z_me[je, jk] < z_aux2[je]:
-                for jk1 in range(jk_start, nlev):
-                    if jk1 == nlev - 1 or (
-                        z_aux2[je] <= z_ifc[e2c[je, 0], jk1]
-                        and z_aux2[je] >= z_ifc[e2c[je, 0], jk1 + 1]
-                    ):
-                        zdiff_gradp[je, 0, jk] = z_aux2[je] - z_mc[e2c[je, 0], jk1]
-                        jk_start = jk1
-                        break
-
-        jk_start = int(flat_idx[je])
-        for jk in range(int(flat_idx[je]) + 1, nlev):
-            if z_me[je, jk] < z_aux2[je]:
-                for jk1 in range(jk_start, nlev):
-                    if jk1 == nlev - 1 or (
-                        z_aux2[je] <= z_ifc[e2c[je, 1], jk1]
-                        and z_aux2[je] >= z_ifc[e2c[je, 1], jk1 + 1]
-                    ):
-                        zdiff_gradp[je, 1, jk] = z_aux2[je] - z_mc[e2c[je, 1], jk1]
-                        jk_start = jk1
-                        break
+    # limit the extrapolation to z_aux2, the search starts at the same level for all levels
+    edges = slice(horizontal_start_1, nedges)
+    extrapolated = (levels[None, :] > flat[edges, None]) & (z_me[edges] < z_aux2[edges, None])
+    for neighbor in range(2):
+        column = e2c[edges, neighbor]
+        lowest, highest = _first_level_containing(z_ifc, column, z_aux2[edges], nlev, array_ns)
+        jk1 = _first_match(lowest, highest, flat[edges], nlev, array_ns)
+        zdiff_gradp[edges, neighbor, :] = array_ns.where(
+            extrapolated,
+            (z_aux2[edges] - z_mc[column, jk1])[:, None],
+            zdiff_gradp[edges, neighbor, :],
+        )
 
     zdiff_gradp_full_field = zdiff_gradp.reshape(
         (zdiff_gradp.shape[0] * zdiff_gradp.shape[1],) + zdiff_gradp.shape[2:]
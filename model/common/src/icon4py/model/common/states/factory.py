@@ -35,16 +35,59 @@ factory.register_provider(bar_provider)
 val = factory.get("foo", RetrievalType.DATA_ARRAY)
 
 
+Instead of computing fields lazily one after the other, a set of fields can be computed eagerly
+with independent providers running concurrently:
+---
+report = factory.materialize(["foo", "bar"], max_workers=8)
+print(report.format())
+---
+
+Intermediate fields that are only needed to compute other fields can be freed as soon as all
+fields depending on them are computed:
+---
+factory.set_eviction(FieldEviction(keep=["foo"]))
+---
+
+The evaluation of the providers can be profiled, the profile contains the dependency graph
+annotated with compute time, size, backend and host/device copies of each provider:
+---
+profiler = ProviderProfiler()
+factory.set_profiler(profiler)
+factory.get("foo")
+profiler.write("factory_profile.dot")
+---
+
+Computed fields can be persisted across runs by attaching a `FieldCache` to a `FieldSource`:
+---
+factory.set_cache(FieldCache(pathlib.Path("~/.cache/icon4py").expanduser()))
+---
+
 TODO: @halungge: allow to read configuration data
 
 """
 import collections
+import concurrent.futures as futures
+import contextlib
+import dataclasses
 import enum
 import functools
+import graphlib
+import hashlib
 import inspect
+import itertools
+import json
+import logging
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+import weakref
 from typing import (
     Any,
     Callable,
+    Collection,
     Mapping,
     MutableMapping,
     Optional,
@@ -55,13 +98,15 @@ from typing import (
     get_args,
 )
 
+import gt4py
 import gt4py.next as gtx
 import gt4py.next.backend as gtx_backend
 import gt4py.next.ffront.decorator as gtx_decorator
+import numpy as np
 import xarray as xa
 from gt4py.next import backend
 
-from icon4py.model.common import dimension as dims, type_alias as ta
+from icon4py.model.common import __version__ as icon4py_version, dimension as dims, type_alias as ta
 from icon4py.model.common.grid import (
     base as base_grid,
     horizontal as h_grid,
@@ -72,6 +117,8 @@ from icon4py.model.common.states import model, utils as state_utils
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 
+log = logging.getLogger(__name__)
+
 DomainType = TypeVar("DomainType", h_grid.Domain, v_grid.Domain)
 
 
@@ -135,11 +182,28 @@ class FieldSource(GridProvider, Protocol):
     """
 
     _providers: MutableMapping[str, FieldProvider] = {}  # noqa:  RUF012 instance variable
+    _cache: Optional["FieldCache"] = None
+    _eviction: Optional["FieldEviction"] = None
+    _profiler: Optional["ProviderProfiler"] = None
 
     @property
     def _sources(self) -> "FieldSource":
         return self
 
+    def set_cache(self, cache: Optional["FieldCache"]) -> None:
+        """Persist the fields computed by this source (and its dependencies) in `cache`."""
+        self._cache = cache
+
+    def set_eviction(self, eviction: Optional["FieldEviction"]) -> None:
+        """Free the intermediate fields of this source as tracked by `eviction`."""
+        if eviction is not None:
+            eviction.attach(self)
+        self._eviction = eviction
+
+    def set_profiler(self, profiler: Optional["ProviderProfiler"]) -> None:
+        """Record the evaluation of the providers of this source (and its dependencies)."""
+        self._profiler = profiler
+
     @property
     def metadata(self) -> MutableMapping[str, model.FieldMetaData]:
         """Returns metadata for the fields that this field source provides."""
@@ -180,7 +244,11 @@ class FieldSource(GridProvider, Protocol):
                         f"Field {field_name} not provided by f{provider.func.__name__}."
                     )
 
-                buffer = provider(field_name, self._sources, self.backend, self)
+                buffer = (
+                    provider(field_name, self._sources, self.backend, self)
+                    if _is_computed(provider)
+                    else self._compute(provider, field_name)
+                )
                 return (
                     buffer
                     if type_ == RetrievalType.FIELD
@@ -189,6 +257,76 @@ class FieldSource(GridProvider, Protocol):
             case _:
                 raise ValueError(f"Invalid retrieval type {type_}")
 
+    def _compute(self, provider: FieldProvider, field_name: str) -> state_utils.FieldType:
+        with (
+            self._profiler.measure(provider, self)
+            if self._profiler is not None
+            else contextlib.nullcontext()
+        ):
+            if self._cache is not None:
+                self._cache.load_or_compute(provider, field_name, self)
+            buffer = provider(field_name, self._sources, self.backend, self)
+        if self._eviction is not None:
+            self._eviction.computed(provider)
+        return buffer
+
+    def materialize(
+        self, field_names: Sequence[str], max_workers: Optional[int] = None
+    ) -> "MaterializationReport":
+        """
+        Compute the fields `field_names` and all fields they depend on eagerly.
+
+        The providers that are not computed yet form a directed acyclic graph through their
+        `dependencies`. It is evaluated in topological order on a thread pool, such that
+        providers whose dependencies are all available run concurrently.
+
+        Args:
+            field_names: names of the fields to compute
+            max_workers: number of threads, defaults to the `concurrent.futures.ThreadPoolExecutor`
+                default. Use 1 for a sequential evaluation.
+
+        Returns:
+            the timings of the computed providers
+        """
+        if self._eviction is not None:
+            self._eviction.keep(*field_names)
+        graph = _provider_graph(self._sources, field_names)
+        sorter = graphlib.TopologicalSorter(graph)
+        sorter.prepare()
+        timings: dict[FieldProvider, ProviderTiming] = {}
+        start = time.perf_counter()
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running: dict[futures.Future, FieldProvider] = {}
+            while sorter.is_active():
+                for provider in sorter.get_ready():
+                    running[executor.submit(self._evaluate, provider, start)] = provider
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    provider = running.pop(future)
+                    timings[provider] = future.result()
+                    sorter.done(provider)
+        wall_time = time.perf_counter() - start
+        return MaterializationReport(
+            timings=tuple(
+                dataclasses.replace(
+                    t, dependencies=tuple(timings[d].fields[0] for d in graph[p] if d in timings)
+                )
+                for p, t in timings.items()
+            ),
+            wall_time=wall_time,
+        )
+
+    def _evaluate(self, provider: FieldProvider, start: float) -> "ProviderTiming":
+        begin = time.perf_counter()
+        self._sources.get(next(iter(provider.fields)))
+        end = time.perf_counter()
+        return ProviderTiming(
+            name=_func_name(provider.func),
+            fields=tuple(provider.fields),
+            start=begin - start,
+            end=end - start,
+        )
+
     def _provided_by_source(self, name):
         return name in self._sources._providers or name in self._sources.metadata.keys()
 
@@ -211,6 +349,31 @@ class CompositeSource(FieldSource):
         self._vertical_grid = me.vertical_grid
         self._metadata = collections.ChainMap(me.metadata, *(s.metadata for s in others))
         self._providers = collections.ChainMap(me._providers, *(s._providers for s in others))
+        self._me = me
+
+    @property
+    def _cache(self) -> Optional["FieldCache"]:
+        return self._me._cache
+
+    @_cache.setter
+    def _cache(self, cache: Optional["FieldCache"]) -> None:
+        self._me._cache = cache
+
+    @property
+    def _eviction(self) -> Optional["FieldEviction"]:
+        return self._me._eviction
+
+    @_eviction.setter
+    def _eviction(self, eviction: Optional["FieldEviction"]) -> None:
+        self._me._eviction = eviction
+
+    @property
+    def _profiler(self) -> Optional["ProviderProfiler"]:
+        return self._me._profiler
+
+    @_profiler.setter
+    def _profiler(self, profiler: Optional["ProviderProfiler"]) -> None:
+        self._me._profiler = profiler
 
     @functools.cached_property
     def metadata(self) -> MutableMapping[str, model.FieldMetaData]:
@@ -530,6 +693,11 @@ class NumpyFieldsProvider(FieldProvider):
     """
     Computes a field defined by a numpy function.
 
+    Functions that have an `array_ns` parameter are considered generic in the array namespace: they
+    are called with the namespace of the backend (`numpy` or `cupy`) and all their array arguments
+    in that namespace, the results are wrapped into fields without copying. This keeps the
+    computation on the device of the backend. Other functions are called with host (numpy) arrays.
+
     Args:
         func: numpy function that computes the fields
         domain: the compute domain used for the stencil computation
@@ -575,18 +743,32 @@ class NumpyFieldsProvider(FieldProvider):
         grid_provider: GridProvider,
     ) -> None:
         self._validate_dependencies()
-        args = {k: factory.get(v).ndarray for k, v in self._dependencies.items()}
-        offsets = {k: grid_provider.grid.connectivities[v] for k, v in self._connectivities.items()}
-        args.update(offsets)
+        if self._is_array_ns_generic():
+            xp = data_alloc.import_array_ns(backend)
+            to_array_ns = xp.asarray
+            args = {"array_ns": xp}
+        else:
+            to_array_ns = data_alloc.as_numpy
+            args = {}
+        args.update({k: to_array_ns(factory.get(v).ndarray) for k, v in self._dependencies.items()})
+        args.update(
+            {
+                k: to_array_ns(grid_provider.grid.connectivities[v])
+                for k, v in self._connectivities.items()
+            }
+        )
         args.update(self._params)
         results = self._func(**args)
         ## TODO: can the order of return values be checked?
         results = (results,) if isinstance(results, data_alloc.NDArray) else results
         self._fields = {
-            k: gtx.as_field(tuple(self._dims), results[i], allocator=backend)
+            k: data_alloc.wrap_array(tuple(self._dims), results[i], backend)
             for i, k in enumerate(self.fields)
         }
 
+    def _is_array_ns_generic(self) -> bool:
+        return "array_ns" in inspect.signature(self._func).parameters
+
     def _validate_dependencies(self):
         func_signature = inspect.signature(self._func)
         parameters = func_signature.parameters
@@ -623,6 +805,560 @@ class NumpyFieldsProvider(FieldProvider):
         return self._fields
 
 
+def _provider_graph(
+    source: FieldSource, field_names: Sequence[str]
+) -> dict[FieldProvider, set[FieldProvider]]:
+    """Providers that still need to compute a field in `field_names`, mapped to their dependencies."""
+    graph: dict[FieldProvider, set[FieldProvider]] = {}
+
+    def provider_of(name: str) -> FieldProvider:
+        if name not in source._providers:
+            raise ValueError(f"Field '{name}' not provided by the source '{source.__class__}'")
+        return source._providers[name]
+
+    pending = [provider_of(name) for name in field_names]
+    while pending:
+        provider = pending.pop()
+        if provider in graph or _is_computed(provider):
+            continue
+        dependencies = {
+            p for p in (provider_of(d) for d in provider.dependencies) if not _is_computed(p)
+        }
+        graph[provider] = dependencies
+        pending.extend(dependencies)
+    return graph
+
+
+@dataclasses.dataclass(frozen=True)
+class ProviderTiming:
+    """Evaluation of one provider during `FieldSource.materialize`, times in seconds since start."""
+
+    name: str
+    fields: tuple[str, ...]
+    start: float
+    end: float
+    #: first field of each of the (evaluated) providers this provider depends on
+    dependencies: tuple[str, ...] = ()
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclasses.dataclass(frozen=True)
+class MaterializationReport:
+    """Timings of the providers evaluated by `FieldSource.materialize`."""
+
+    timings: tuple[ProviderTiming, ...]
+    wall_time: float
+
+    @property
+    def serial_time(self) -> float:
+        """Sum of the provider durations, the wall time of a sequential evaluation."""
+        return sum(t.duration for t in self.timings)
+
+    def critical_path(self) -> list[ProviderTiming]:
+        """The chain of dependent providers with the longest total duration, in evaluation order."""
+        by_field = {t.fields[0]: t for t in self.timings}
+        path = _longest_path(
+            {k: t.duration for k, t in by_field.items()},
+            {k: t.dependencies for k, t in by_field.items()},
+        )
+        return [by_field[k] for k in path]
+
+    def format(self) -> str:
+        path = self.critical_path()
+        lines = [
+            f"computed {len(self.timings)} providers in {self.wall_time:.3f}s "
+            f"(serial {self.serial_time:.3f}s, "
+            f"critical path {sum(t.duration for t in path):.3f}s)",
+            "critical path:",
+        ]
+        lines.extend(f"  {t.duration:10.3f}s  {t.name} -> {', '.join(t.fields)}" for t in path)
+        return "\n".join(lines)
+
+
+def _longest_path(
+    weights: Mapping[str, float], dependencies: Mapping[str, Sequence[str]]
+) -> list[str]:
+    """Path with the largest sum of weights through a DAG, ordered from the sources to the sink."""
+    length: dict[str, float] = {}
+    predecessor: dict[str, Optional[str]] = {}
+    order = graphlib.TopologicalSorter(
+        {k: [d for d in dependencies[k] if d in weights] for k in weights}
+    ).static_order()
+    for k in order:
+        longest = max(
+            (d for d in dependencies[k] if d in weights), key=lambda d: length[d], default=None
+        )
+        length[k] = weights[k] + (length[longest] if longest is not None else 0.0)
+        predecessor[k] = longest
+    if not length:
+        return []
+    path = [max(length, key=length.get)]
+    while predecessor[path[-1]] is not None:
+        path.append(predecessor[path[-1]])
+    return path[::-1]
+
+
+@dataclasses.dataclass(frozen=True)
+class ProviderProfile:
+    """Evaluation of one provider recorded by a `ProviderProfiler`."""
+
+    name: str
+    fields: tuple[str, ...]
+    dependencies: tuple[str, ...]
+    #: time spent in the provider itself, excluding the computation of its dependencies [s]
+    time: float
+    nbytes: int
+    backend: str
+    #: whether the fields are computed on a different device than the one of the target backend
+    device_copy: bool
+
+
+def _backend_name(backend: Optional[gtx_backend.Backend]) -> str:
+    return "embedded" if backend is None else backend.name
+
+
+def _computes_on_device(
+    provider: FieldProvider, compute_backend: Optional[gtx_backend.Backend]
+) -> bool:
+    """Whether `provider` computes its fields on a GPU when run with `compute_backend`."""
+    if isinstance(provider, NumpyFieldsProvider) and not provider._is_array_ns_generic():
+        # the function is called with numpy arrays
+        return False
+    return data_alloc.is_cupy_device(compute_backend)
+
+
+class ProviderProfiler:
+    """
+    Records the evaluation of the providers of a `FieldSource`.
+
+    The recorded times are exclusive: time spent computing the dependencies of a provider is
+    attributed to the dependencies only. The profile can be exported as dependency graph in
+    JSON or DOT (graphviz) format.
+    """
+
+    def __init__(self):
+        self._records: list[ProviderProfile] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def records(self) -> tuple[ProviderProfile, ...]:
+        return tuple(self._records)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records = []
+
+    @contextlib.contextmanager
+    def measure(self, provider: FieldProvider, source: FieldSource):
+        """Measure the evaluation of `provider` requested from `source`."""
+        stack = self._local.__dict__.setdefault("children", [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+        compute_backend = getattr(provider.func, "backend", source.backend)
+        record = ProviderProfile(
+            name=_func_name(provider.func),
+            fields=tuple(provider.fields),
+            dependencies=tuple(provider.dependencies),
+            time=elapsed - children,
+            nbytes=_nbytes(provider),
+            backend=_backend_name(compute_backend),
+            device_copy=_computes_on_device(provider, compute_backend)
+            != data_alloc.is_cupy_device(source.backend),
+        )
+        with self._lock:
+            self._records.append(record)
+
+    def _nodes(self) -> dict[str, dict[str, Any]]:
+        """Providers by their first field, repeated evaluations are accumulated."""
+        nodes: dict[str, dict[str, Any]] = {}
+        for r in self._records:
+            node = nodes.setdefault(
+                r.fields[0], dataclasses.asdict(r) | {"time": 0.0, "evaluations": 0}
+            )
+            node["time"] += r.time
+            node["evaluations"] += 1
+        return nodes
+
+    def _graph(self) -> tuple[dict[str, dict[str, Any]], list[tuple[str, str, str]], list[str]]:
+        nodes = self._nodes()
+        node_of = {f: k for k, node in nodes.items() for f in node["fields"]}
+        edges = [
+            (node_of.get(d, d), k, d) for k, node in nodes.items() for d in node["dependencies"]
+        ]
+        dependencies = {
+            k: [node_of[d] for d in node["dependencies"] if d in node_of]
+            for k, node in nodes.items()
+        }
+        critical_path = _longest_path({k: n["time"] for k, n in nodes.items()}, dependencies)
+        return nodes, edges, critical_path
+
+    def to_json(self) -> dict[str, Any]:
+        nodes, edges, critical_path = self._graph()
+        return {
+            "providers": [
+                n | {"fields": list(n["fields"]), "dependencies": list(n["dependencies"])}
+                for n in nodes.values()
+            ],
+            "edges": [{"from": a, "to": b, "field": f} for a, b, f in edges],
+            "critical_path": critical_path,
+            "total_time": sum(n["time"] for n in nodes.values()),
+        }
+
+    def to_dot(self) -> str:
+        nodes, edges, critical_path = self._graph()
+        on_path = set(critical_path)
+        lines = ["digraph providers {", "  rankdir=LR;", "  node [shape=box];"]
+        for k, n in nodes.items():
+            label = "\\n".join(
+                (
+                    n["name"],
+                    ", ".join(n["fields"]),
+                    f"{n['time']:.3f}s {n['nbytes'] / 2**20:.1f}MiB {n['backend']}",
+                )
+            )
+            attributes = [f'label="{label}"']
+            if k in on_path:
+                attributes.append('color="red"')
+            if n["device_copy"]:
+                attributes.append('style="dashed"')
+            lines.append(f'  "{k}" [{", ".join(attributes)}];')
+        for a in dict.fromkeys(a for a, _, _ in edges if a not in nodes):
+            lines.append(f'  "{a}" [shape=ellipse];')
+        path_edges = set(itertools.pairwise(critical_path))
+        for a, b, _ in edges:
+            attributes = ' [color="red"]' if (a, b) in path_edges else ""
+            lines.append(f'  "{a}" -> "{b}"{attributes};')
+        lines.append("}")
+        return "\n".join(lines)
+
+    def write(self, path: Union[str, pathlib.Path]) -> None:
+        """Write the profile to `path`, in DOT format for a `.dot` suffix and JSON otherwise."""
+        path = pathlib.Path(path)
+        with open(path, "w") as f:
+            if path.suffix == ".dot":
+                f.write(self.to_dot())
+            else:
+                json.dump(self.to_json(), f, indent=2)
+
+
+def _nbytes(provider: FieldProvider) -> int:
+    return sum(
+        (f.ndarray if isinstance(f, gtx.Field) else f).nbytes
+        for f in provider.fields.values()
+        if isinstance(f, (gtx.Field, data_alloc.NDArray))
+    )
+
+
+class FieldEviction:
+    """
+    Reference counting of the computed fields of a `FieldSource`.
+
+    A provider's fields are freed once every provider that depends on one of them has been
+    computed, unless one of them is to be kept. Only computed fields of the source this is attached
+    to are freed, fields provided by other sources of a `CompositeSource` or precomputed fields are
+    left alone. A freed field is recomputed if it is requested again.
+
+    The memory of the computed fields of the source is tracked in `live_bytes` and `peak_bytes`.
+
+    Args:
+        keep: names of the fields that are never freed, the fields passed to
+            `FieldSource.materialize` are added automatically
+        evict: if False, fields are only tracked but never freed, which allows to measure the
+            peak memory without eviction
+    """
+
+    def __init__(self, keep: Collection[str] = (), evict: bool = True):
+        self._keep = set(keep)
+        self._evict = evict
+        self._source: Optional[FieldSource] = None
+        self._computed_once: weakref.WeakSet = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self.live_bytes = 0
+        self.peak_bytes = 0
+        self.evicted: list[str] = []
+
+    def attach(self, source: FieldSource) -> None:
+        self._source = source
+
+    def keep(self, *field_names: str) -> None:
+        self._keep.update(field_names)
+
+    def _owned(self, provider: FieldProvider) -> bool:
+        return not isinstance(provider, PrecomputedFieldProvider) and any(
+            p is provider for p in self._source._providers.values()
+        )
+
+    def _consumers(self) -> dict[str, list[FieldProvider]]:
+        providers = {id(p): p for p in self._source._sources._providers.values()}
+        consumers = collections.defaultdict(list)
+        for provider in providers.values():
+            for dependency in provider.dependencies:
+                consumers[dependency].append(provider)
+        return consumers
+
+    def _releasable(self, provider: FieldProvider, consumers: dict[str, list[FieldProvider]]):
+        return (
+            self._owned(provider)
+            and _is_computed(provider)
+            and self._keep.isdisjoint(provider.fields)
+            and all(c in self._computed_once for f in provider.fields for c in consumers[f])
+        )
+
+    def computed(self, provider: FieldProvider) -> None:
+        """Called after `provider` computed its fields, frees the fields it no longer needs."""
+        with self._lock:
+            self._computed_once.add(provider)
+            if self._owned(provider):
+                self.live_bytes += _nbytes(provider)
+                self.peak_bytes = max(self.peak_bytes, self.live_bytes)
+            if not self._evict:
+                return
+            sources = self._source._sources._providers
+            consumers = self._consumers()
+            for dependency in {id(sources[d]): sources[d] for d in provider.dependencies}.values():
+                if self._releasable(dependency, consumers):
+                    self.live_bytes -= _nbytes(dependency)
+                    dependency._fields = {name: None for name in dependency.fields}
+                    self.evicted.extend(dependency.fields)
+                    log.debug(f"freed intermediate fields {list(dependency.fields)}")
+
+
+def _is_computed(provider: FieldProvider) -> bool:
+    return all(f is not None for f in provider.fields.values())
+
+
+def _module_hash(module_name: str) -> str:
+    """Hash of the source code of a module, it covers the helpers a provider function calls."""
+    module = sys.modules.get(module_name)
+    try:
+        source = inspect.getsource(module) if module is not None else ""
+    except (OSError, TypeError):
+        source = ""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _bound_value_identity(value: Any) -> str:
+    if isinstance(value, (gtx.Field, data_alloc.NDArray)):
+        return _array_hash(value)
+    if callable(value):
+        return _func_identity(value)
+    return repr(value)
+
+
+def _func_identity(func: Callable) -> str:
+    """
+    Identity of the function computing a provider's fields.
+
+    Consists of the qualified name of the function, the hash of the source of the module defining
+    it, the arguments bound by `functools.partial` and the versions of icon4py and gt4py.
+    """
+    bound = []
+    while isinstance(func, functools.partial):
+        bound.append(
+            (
+                [_bound_value_identity(arg) for arg in func.args],
+                {k: _bound_value_identity(v) for k, v in sorted(func.keywords.items())},
+            )
+        )
+        func = func.func
+    definition = getattr(getattr(func, "definition_stage", None), "definition", func)
+    definition = inspect.unwrap(getattr(definition, "definition", definition))
+    module_name = getattr(definition, "__module__", "") or ""
+    name = f"{module_name}.{getattr(definition, '__qualname__', repr(definition))}"
+    digest = hashlib.sha256(_module_hash(module_name).encode())
+    digest.update(json.dumps(bound).encode())
+    digest.update(f"icon4py={icon4py_version}:gt4py={gt4py.__version__}".encode())
+    return f"{name}:{digest.hexdigest()}"
+
+
+def _provider_parameters(provider: FieldProvider) -> str:
+    """Everything except for the function and the dependency values that determines the output."""
+    parameters = {
+        "type": type(provider).__name__,
+        "fields": list(provider.fields.keys()),
+        "deps": getattr(provider, "_dependencies", {}),
+        "output": getattr(provider, "_output", {}),
+        "params": {k: repr(v) for k, v in getattr(provider, "_params", {}).items()},
+        "connectivities": {k: v.value for k, v in getattr(provider, "_connectivities", {}).items()},
+        "domain": {
+            d.value: [str(b) for b in bounds]
+            for d, bounds in getattr(provider, "_compute_domain", {}).items()
+        },
+        "dims": [d.value for d in getattr(provider, "_dims", ())],
+    }
+    return json.dumps(parameters, sort_keys=True, default=str)
+
+
+def _array_hash(array: Any) -> str:
+    array = np.ascontiguousarray(
+        data_alloc.as_numpy(array)
+        if isinstance(array, (gtx.Field, data_alloc.NDArray))
+        else np.asarray(array)
+    )
+    digest = hashlib.sha256(array.view(np.uint8).ravel() if array.size else b"")
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    return digest.hexdigest()
+
+
+class FieldCache:
+    """
+    Persistent on-disk cache of fields computed by the providers of a `FieldSource`.
+
+    All fields of a provider are stored together in one `.npz` file, under a key that hashes
+    - the horizontal grid: its UUID, configuration, sizes and connectivities (which makes the key
+      differ between the ranks of a decomposed grid),
+    - the vertical grid configuration and the `vct_a`, `vct_b` coordinates,
+    - the identity of the provider function (qualified name, source code of its module, bound
+      `functools.partial` arguments, icon4py and gt4py versions) and its parameters,
+    - the keys of the providers of the dependencies, or for fields not computed by a provider
+      (precomputed or read fields), the hash of their values.
+
+    Changing any input or parameter therefore results in a different key, stale files are never
+    read. Fields are stored on the host and loaded onto the backend of the requesting source.
+    Files are written atomically, so several processes can share a cache directory.
+
+    Args:
+        path: cache directory, created if it does not exist
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path]):
+        self._path = pathlib.Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._keys: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._data_hashes: dict[tuple[int, str], tuple[Any, str]] = {}
+        self._grid_hashes: dict[int, tuple[Any, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    def _grid_hash(self, grid: Optional[base_grid.BaseGrid]) -> str:
+        if grid is None:
+            return ""
+        cached = self._grid_hashes.get(id(grid))
+        if cached is not None and cached[0]() is grid:
+            return cached[1]
+        digest = hashlib.sha256(str(grid.id).encode())
+        if grid.config is not None:
+            digest.update(repr(dataclasses.replace(grid.config, on_gpu=False)).encode())
+        for dim, size in sorted(grid.size.items(), key=lambda item: item[0].value):
+            digest.update(f"{dim.value}={size}".encode())
+        for dim, table in sorted(grid.connectivities.items(), key=lambda item: item[0].value):
+            digest.update(f"{dim.value}:{_array_hash(table)}".encode())
+        self._grid_hashes[id(grid)] = (weakref.ref(grid), digest.hexdigest())
+        return digest.hexdigest()
+
+    def _vertical_hash(self, vertical_grid: Optional[v_grid.VerticalGrid]) -> str:
+        if vertical_grid is None:
+            return ""
+        return hashlib.sha256(
+            f"{vertical_grid.config}:{_array_hash(vertical_grid.vct_a)}:{_array_hash(vertical_grid.vct_b)}".encode()
+        ).hexdigest()
+
+    def _dependency_hash(self, name: str, source: FieldSource) -> str:
+        provider = source._sources._providers[name]
+        if isinstance(provider, PrecomputedFieldProvider):
+            value = provider.fields[name]
+            cached = self._data_hashes.get((id(provider), name))
+            if cached is None or cached[0] is not value:
+                cached = (value, _array_hash(value))
+                self._data_hashes[(id(provider), name)] = cached
+            return cached[1]
+        return f"{self.key(provider, source)}:{name}"
+
+    def key(self, provider: FieldProvider, source: FieldSource) -> str:
+        """Cache key of the fields of `provider` computed in the context of `source`."""
+        if provider in self._keys:
+            return self._keys[provider]
+        digest = hashlib.sha256()
+        digest.update(self._grid_hash(source.grid).encode())
+        digest.update(self._vertical_hash(source.vertical_grid).encode())
+        digest.update(_func_identity(provider.func).encode())
+        digest.update(_provider_parameters(provider).encode())
+        for dependency in provider.dependencies:
+            digest.update(self._dependency_hash(dependency, source).encode())
+        key = digest.hexdigest()
+        self._keys[provider] = key
+        return key
+
+    def _file(self, key: str) -> pathlib.Path:
+        return self._path / f"{key}.npz"
+
+    def load(self, provider: FieldProvider, source: FieldSource) -> bool:
+        """Load the fields of `provider` from the cache, return whether they were found."""
+        file = self._file(self.key(provider, source))
+        if not file.exists():
+            return False
+        xp = data_alloc.import_array_ns(source.backend)
+        with np.load(file, allow_pickle=False) as data:
+            field_dims = json.loads(str(data["__dims__"]))
+            fields = {}
+            for name in provider.fields:
+                array = data[f"field:{name}"]
+                if field_dims[name] is None:
+                    fields[name] = array.item() if array.ndim == 0 else xp.asarray(array)
+                else:
+                    domain = tuple(_DIMENSIONS[d] for d in field_dims[name])
+                    fields[name] = gtx.as_field(domain, array, allocator=source.backend)
+        provider._fields = fields
+        log.debug(f"loaded fields {list(fields)} from cache file '{file}'")
+        return True
+
+    def store(self, provider: FieldProvider, source: FieldSource) -> None:
+        """Write the computed fields of `provider` to the cache."""
+        file = self._file(self.key(provider, source))
+        arrays = {}
+        field_dims = {}
+        for name, value in provider.fields.items():
+            if isinstance(value, gtx.Field):
+                field_dims[name] = [d.value for d in value.domain.dims]
+                arrays[f"field:{name}"] = value.asnumpy()
+            else:
+                field_dims[name] = None
+                arrays[f"field:{name}"] = (
+                    data_alloc.as_numpy(value)
+                    if isinstance(value, data_alloc.NDArray)
+                    else np.asarray(value)
+                )
+        arrays["__dims__"] = np.asarray(json.dumps(field_dims))
+        fd, tmp = tempfile.mkstemp(dir=self._path, suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        log.debug(f"stored fields {list(field_dims)} in cache file '{file}'")
+
+    def load_or_compute(self, provider: FieldProvider, field_name: str, source: FieldSource):
+        """Make sure the fields of `provider` are available, load or compute and store them."""
+        if self.load(provider, source):
+            self.hits += 1
+            return
+        self.misses += 1
+        provider(field_name, source._sources, source.backend, source)
+        self.store(provider, source)
+
+
+_DIMENSIONS: dict[str, gtx.Dimension] = {
+    d.value: d for d in vars(dims).values() if isinstance(d, gtx.Dimension)
+}
+
+
 def _check_union_and_type(
     parameter_definition: inspect.Parameter,
     value: Union[state_utils.ScalarType, gtx.Field],
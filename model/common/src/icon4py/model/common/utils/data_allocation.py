@@ -9,13 +9,15 @@
 from __future__ import annotations
 
 import logging as log
-from typing import TYPE_CHECKING, Optional, TypeAlias, Union
+from typing import TYPE_CHECKING, Optional, Sequence, TypeAlias, Union
 
+import gt4py
 import gt4py._core.definitions as gtx_core_defs
 import numpy as np
 import numpy.typing as npt
 from gt4py import next as gtx
-from gt4py.next import backend as gtx_backend
+from gt4py.next import backend as gtx_backend, common as gtx_common
+from packaging import version as pkg_version
 
 from icon4py.model.common import type_alias as ta
 
@@ -83,6 +85,35 @@ def as_field(field: gtx.Field, backend: Optional[gtx_backend.Backend] = None) ->
     return gtx.as_field(field.domain, field.ndarray, allocator=backend)
 
 
+#: gt4py has no public constructor of a field that uses an existing buffer, `gtx.as_field` always
+#: copies. The private `gt4py.next.common._field` does, it is only used with the gt4py versions
+#: it has been checked with, otherwise `wrap_array` falls back to copying.
+_field_from_buffer = (
+    getattr(gtx_common, "_field", None) if pkg_version.parse(gt4py.__version__).major == 1 else None
+)
+
+
+def wrap_array(
+    domain: Sequence[gtx.Dimension], array: NDArray, backend: Optional[gtx_backend.Backend] = None
+) -> gtx.Field:
+    """
+    Wrap an array in a Field of `backend`.
+
+    If the array lives on the device of `backend` and owns its memory (is not a view into another
+    array, which might be the buffer of another field) it is wrapped without copying, otherwise it
+    is copied using `gtx.as_field`.
+    """
+    if (
+        _field_from_buffer is not None
+        and isinstance(array, import_array_ns(backend).ndarray)
+        and array.base is None
+    ):
+        return _field_from_buffer(
+            array, domain=gtx_common.domain(dict(zip(domain, array.shape, strict=True)))
+        )
+    return gtx.as_field(domain, array, allocator=backend)
+
+
 def flatten_first_two_dims(
     *dims: gtx.Dimension, field: gtx.Field | NDArray, backend: Optional[gtx_backend.Backend] = None
 ) -> gtx.Field:
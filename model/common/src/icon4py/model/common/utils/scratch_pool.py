@@ -0,0 +1,124 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Storage of temporary fields shared between granules.
+
+The granules keep their temporaries (the `z_` fields of ICON) for the whole run, even though most
+of them are only live during a part of a call of the granule. A :class:`ScratchPool` hands out
+temporaries which are live in one or several *phases* of the time step, for example the predictor
+or the corrector step of a granule. Phases never overlap, so temporaries of the same shape and type
+which are never live in the same phase share the same field.
+
+A temporary may only hold data while it is live: it has to be written in one of its phases before
+it is read, except for points that are never written, which read zero. A temporary carrying data
+from one phase to a later one therefore has to be live in all phases entered in between. To keep
+the zero initialization true, a shared field is zeroed when it is handed over to another temporary,
+see :meth:`ScratchPool.enter`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from collections import defaultdict
+from typing import Optional, Union
+
+import gt4py.next as gtx
+from gt4py.next import backend as gtx_backend
+
+from icon4py.model.common import compilation, type_alias as ta
+from icon4py.model.common.grid import base as grid_base
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class _Buffer:
+    field: gtx.Field
+    #: phases in which one of the temporaries sharing the field is live
+    phases: set[str]
+    #: temporary the data of the field belongs to
+    owner: int
+
+
+class ScratchPool:
+    """
+    Temporaries of granules, shared between temporaries which are live in different phases.
+
+    Args:
+        backend: backend the temporaries are allocated for
+    """
+
+    def __init__(self, backend: Optional[gtx_backend.Backend] = None):
+        self._backend = backend
+        self._buffers: dict[tuple, list[_Buffer]] = defaultdict(list)
+        self._phase_temporaries: dict[str, list[tuple[_Buffer, int]]] = defaultdict(list)
+        self._num_temporaries = 0
+        self._requested_nbytes = 0
+
+    def zero_field(
+        self,
+        grid: grid_base.BaseGrid,
+        *dims: gtx.Dimension,
+        phase: Union[str, tuple[str, ...]],
+        dtype=ta.wpfloat,
+        extend: Optional[dict[gtx.Dimension, int]] = None,
+    ) -> gtx.Field:
+        """
+        Get a temporary which is only live during `phase`, or during each phase if a tuple is given.
+
+        Arguments are the same as for :func:`data_alloc.zero_field`. The temporary is zero
+        initialized, it may be the same field as temporaries which are live in other phases.
+        """
+        live = {phase} if isinstance(phase, str) else set(phase)
+        temporary = self._num_temporaries
+        self._num_temporaries += 1
+        extend = extend or {}
+        shape = tuple(grid.size[dim] + extend.get(dim, 0) for dim in dims)
+        key = (dims, shape, dtype)
+        buffer = next((b for b in self._buffers[key] if b.phases.isdisjoint(live)), None)
+        if buffer is None:
+            buffer = _Buffer(
+                data_alloc.zero_field(
+                    grid, *dims, dtype=dtype, extend=extend, backend=self._backend
+                ),
+                set(),
+                owner=temporary,
+            )
+            self._buffers[key].append(buffer)
+        buffer.phases |= live
+        for p in live:
+            self._phase_temporaries[p].append((buffer, temporary))
+        self._requested_nbytes += buffer.field.ndarray.nbytes
+        return buffer.field
+
+    @compilation.replayable
+    def enter(self, phase: str) -> None:
+        """Start `phase`: zero the fields whose data belongs to temporaries which are not live in it."""
+        for buffer, temporary in self._phase_temporaries.get(phase, ()):
+            if buffer.owner != temporary:
+                buffer.field.ndarray.fill(0)
+                buffer.owner = temporary
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the allocated fields."""
+        return sum(b.field.ndarray.nbytes for buffers in self._buffers.values() for b in buffers)
+
+    @property
+    def requested_nbytes(self) -> int:
+        """Size of all temporaries handed out, that is without sharing."""
+        return self._requested_nbytes
+
+    def log_summary(self) -> None:
+        log.info(
+            f"scratch pool: {self.nbytes / 2**20:.1f} MiB allocated for temporaries of "
+            f"{self.requested_nbytes / 2**20:.1f} MiB in phases {sorted(self._phase_temporaries)}"
+        )
@@ -0,0 +1,265 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import gt4py.next as gtx
+import numpy as np
+import pytest
+
+from icon4py.model.common import (
+    compilation,
+    dimension as dims,
+    model_backends,
+    utils as common_utils,
+)
+from icon4py.model.common.decomposition import definitions
+from icon4py.model.common.grid import simple
+from icon4py.model.common.math import helpers
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+class _Inverter:
+    def __init__(self, grid, backend):
+        self._grid = grid
+        self._exchange = definitions.SingleNodeExchange()
+        self._compute_inverse_on_edges = helpers.compute_inverse_on_edges.with_backend(backend)
+        self.num_steps = 0
+
+    def run(self, f, f_inverse):
+        self._compute_inverse_on_edges(
+            f=f,
+            f_inverse=f_inverse,
+            horizontal_start=gtx.int32(0),
+            horizontal_end=gtx.int32(self._grid.num_edges),
+            offset_provider={},
+        )
+        self.num_steps += 1
+
+
+class _CountingExchange(definitions.SingleNodeExchange):
+    def __init__(self):
+        self.num_exchanges = 0
+
+    def exchange_and_wait(self, dim, *fields):
+        self.num_exchanges += 1
+
+
+class _DoublingInverter(_Inverter):
+    def __init__(self, grid, backend):
+        super().__init__(grid, backend)
+        self._exchange = _CountingExchange()
+
+    @compilation.replayable
+    def _double(self, f):
+        f.ndarray[:] *= 2.0
+
+    def run(self, f, f_inverse):
+        self._double(f)
+        super().run(f, f_inverse)
+        self._exchange.exchange_and_wait(dims.EdgeDim, f_inverse)
+
+
+@pytest.fixture
+def inverter_and_fields():
+    grid = simple.SimpleGrid()
+    backend = model_backends.BACKENDS["roundtrip"]
+    f = data_alloc.constant_field(grid, 2.0, dims.EdgeDim, backend=backend)
+    f_inverse = data_alloc.zero_field(grid, dims.EdgeDim, backend=backend)
+    return _Inverter(grid, backend), f, f_inverse
+
+
+def test_record_program_calls_does_not_execute(inverter_and_fields):
+    inverter, f, f_inverse = inverter_and_fields
+    program = inverter._compute_inverse_on_edges
+    exchange = inverter._exchange
+    with compilation.record_program_calls(inverter) as tasks:
+        assert inverter._compute_inverse_on_edges is not program
+        inverter.run(f, f_inverse)
+        inverter.run(f, f_inverse)
+        assert inverter.num_steps == 2
+
+    assert len(tasks) == 2
+    assert tasks[0].name == "compute_inverse_on_edges"
+    assert np.all(f_inverse.asnumpy() == 0.0)
+    assert inverter._compute_inverse_on_edges is program
+    assert inverter._exchange is exchange
+    assert inverter.num_steps == 0
+
+    inverter.run(f, f_inverse)
+    assert np.all(f_inverse.asnumpy() == 0.5)
+
+
+def test_record_program_calls_skips_embedded_programs():
+    grid = simple.SimpleGrid()
+    inverter = _Inverter(grid, None)
+    f = data_alloc.constant_field(grid, 4.0, dims.EdgeDim)
+    f_inverse = data_alloc.zero_field(grid, dims.EdgeDim)
+    with compilation.record_program_calls(inverter) as tasks:
+        inverter.run(f, f_inverse)
+    assert tasks == []
+    assert np.all(f_inverse.asnumpy() == 0.25)
+
+
+def test_compile_all_fills_backend_cache(backend):
+    cache = getattr(getattr(backend, "executor", None), "otf_workflow", None)
+    if not hasattr(cache, "hash_function"):
+        pytest.skip("needs a backend caching compiled programs in memory")
+    grid = simple.SimpleGrid()
+    inverter = _Inverter(grid, backend)
+    f = data_alloc.constant_field(grid, 2.0, dims.EdgeDim, backend=backend)
+    f_inverse = data_alloc.zero_field(grid, dims.EdgeDim, backend=backend)
+    with compilation.record_program_calls(inverter) as tasks:
+        inverter.run(f, f_inverse)
+        inverter.run(f, f_inverse)
+    assert len(tasks) == 2
+    assert compilation.compile_all(tasks, max_workers=2) == 1
+
+    assert tasks[0].key in cache._cache
+    num_cached = len(cache._cache)
+    inverter.run(f, f_inverse)
+    assert len(cache._cache) == num_cached
+    assert np.all(f_inverse.asnumpy() == 0.5)
+
+
+def test_compile_all_without_hash_function(inverter_and_fields):
+    inverter, f, f_inverse = inverter_and_fields
+    with compilation.record_program_calls(inverter) as tasks:
+        inverter.run(f, f_inverse)
+        inverter.run(f, f_inverse)
+    # the roundtrip backend has no in-memory cache, every call is compiled
+    assert compilation.compile_all(tasks, max_workers=2) == 2
+
+
+def test_captured_steps_replay_programs_and_replayable_host_code():
+    grid = simple.SimpleGrid()
+    backend = model_backends.BACKENDS["roundtrip"]
+    inverter = _DoublingInverter(grid, backend)
+    program = inverter._compute_inverse_on_edges
+    f = data_alloc.constant_field(grid, 1.0, dims.EdgeDim, backend=backend)
+    f_inverse = data_alloc.zero_field(grid, dims.EdgeDim, backend=backend)
+    captured_steps = compilation.CapturedSteps(inverter)
+    key = compilation.argument_key(f, f_inverse)
+
+    captured_steps(key, lambda: inverter.run(f, f_inverse))
+    assert len(captured_steps) == 1
+    assert inverter._compute_inverse_on_edges is program
+    assert np.all(f_inverse.asnumpy() == 0.5)
+
+    captured_steps(key, lambda: inverter.run(f, f_inverse))
+    captured_steps(key, lambda: inverter.run(f, f_inverse))
+    assert len(captured_steps) == 1
+    assert np.all(f.asnumpy() == 8.0)
+    assert np.all(f_inverse.asnumpy() == 0.125)
+    assert inverter._exchange.num_exchanges == 3
+    # plain host code only runs when the step is captured
+    assert inverter.num_steps == 1
+
+
+class _EventResult:
+    def __init__(self, events, dim):
+        self._events = events
+        self._dim = dim
+
+    def wait(self):
+        self._events.append(("wait", self._dim))
+
+    def is_ready(self):
+        return True
+
+
+class _EventExchange(definitions.SingleNodeExchange):
+    def __init__(self):
+        self.events = []
+
+    def exchange(self, dim, *fields):
+        self.events.append(("start", dim))
+        return _EventResult(self.events, dim)
+
+
+class _OverlappingInverter(_Inverter):
+    def __init__(self, grid, backend):
+        super().__init__(grid, backend)
+        self._exchange = _EventExchange()
+
+    def run(self, f, f_inverse):
+        handle = self._exchange(f, dim=dims.EdgeDim, wait=False)
+        super().run(f, f_inverse)
+        handle.wait()
+        self._exchange(f_inverse, dim=dims.CellDim)
+
+
+def test_captured_steps_replay_asynchronous_exchanges():
+    grid = simple.SimpleGrid()
+    backend = model_backends.BACKENDS["roundtrip"]
+    inverter = _OverlappingInverter(grid, backend)
+    f = data_alloc.constant_field(grid, 2.0, dims.EdgeDim, backend=backend)
+    f_inverse = data_alloc.zero_field(grid, dims.EdgeDim, backend=backend)
+    captured_steps = compilation.CapturedSteps(inverter)
+    key = compilation.argument_key(f, f_inverse)
+    step_events = [
+        ("start", dims.EdgeDim),
+        ("wait", dims.EdgeDim),
+        ("start", dims.CellDim),
+        ("wait", dims.CellDim),
+    ]
+
+    captured_steps(key, lambda: inverter.run(f, f_inverse))
+    assert inverter._exchange.events == step_events
+    captured_steps(key, lambda: inverter.run(f, f_inverse))
+    assert inverter._exchange.events == 2 * step_events
+    assert inverter.num_steps == 1
+    assert np.all(f_inverse.asnumpy() == 0.5)
+
+
+def test_captured_steps_discard_least_recently_used():
+    grid = simple.SimpleGrid()
+    backend = model_backends.BACKENDS["roundtrip"]
+    inverter = _Inverter(grid, backend)
+    captured_steps = compilation.CapturedSteps(inverter, maxsize=2)
+    fields = [data_alloc.constant_field(grid, v, dims.EdgeDim, backend=backend) for v in (1, 2, 4)]
+    f_inverse = data_alloc.zero_field(grid, dims.EdgeDim, backend=backend)
+    for f in fields + fields[-1:]:
+        captured_steps(compilation.argument_key(f), lambda f=f: inverter.run(f, f_inverse))
+    assert len(captured_steps) == 2
+    assert inverter.num_steps == 3
+    captured_steps(compilation.argument_key(fields[0]), lambda: inverter.run(fields[0], f_inverse))
+    assert inverter.num_steps == 4
+    assert np.all(f_inverse.asnumpy() == 1.0)
+
+
+def test_argument_key():
+    grid = simple.SimpleGrid()
+    a = data_alloc.zero_field(grid, dims.EdgeDim)
+    b = data_alloc.zero_field(grid, dims.EdgeDim)
+    pair = common_utils.TimeStepPair(a, b)
+    key = compilation.argument_key(pair, 1.0, True)
+    assert key == compilation.argument_key(pair, 1.0, True)
+    assert key != compilation.argument_key(pair, 2.0, True)
+    assert key != compilation.argument_key(pair, 1.0, False)
+    pair.swap()
+    assert key != compilation.argument_key(pair, 1.0, True)
+    pair.swap()
+    pair.next = data_alloc.zero_field(grid, dims.EdgeDim)
+    assert key != compilation.argument_key(pair, 1.0, True)
+
+
+@pytest.mark.parametrize("replay", [False, True], ids=["dispatch", "replay"])
+def test_captured_steps_benchmark(benchmark, replay):
+    grid = simple.SimpleGrid()
+    backend = model_backends.BACKENDS["roundtrip"]
+    inverter = _Inverter(grid, backend)
+    f = data_alloc.constant_field(grid, 2.0, dims.EdgeDim, backend=backend)
+    f_inverse = data_alloc.zero_field(grid, dims.EdgeDim, backend=backend)
+    if replay:
+        captured_steps = compilation.CapturedSteps(inverter)
+        key = compilation.argument_key(f, f_inverse)
+        step = lambda: captured_steps(key, lambda: inverter.run(f, f_inverse))  # noqa: E731
+        step()
+    else:
+        step = lambda: inverter.run(f, f_inverse)  # noqa: E731
+    benchmark.pedantic(step, rounds=5)
+    assert np.all(f_inverse.asnumpy() == 0.5)
@@ -0,0 +1,93 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import (
+    decomposer as decomp,
+    definitions,
+    halo_exchange_benchmark,
+)
+from icon4py.model.common.grid import simple
+
+
+@pytest.fixture
+def torus():
+    return halo_exchange_benchmark.torus_connectivities(16, 12)
+
+
+def test_torus_connectivities_match_simple_grid():
+    c2v, c2e, c2e2c = halo_exchange_benchmark.torus_connectivities(3, 3)
+    assert np.array_equal(c2v, simple.SimpleGridData.c2v_table)
+    assert np.array_equal(c2e, simple.SimpleGridData.c2e_table)
+    assert np.array_equal(
+        np.sort(c2e2c, axis=1), np.sort(simple.SimpleGridData.c2e2c_table, axis=1)
+    )
+
+
+@pytest.mark.parametrize("num_partitions", [1, 2, 3, 7])
+def test_breadth_first_decomposer_is_balanced(torus, num_partitions):
+    _, _, c2e2c = torus
+    partition = decomp.BreadthFirstDecomposer()(c2e2c, num_partitions)
+    counts = np.bincount(partition, minlength=num_partitions)
+    assert counts.shape[0] == num_partitions
+    assert counts.max() - counts.min() <= 1
+
+
+def test_breadth_first_decomposer_balances_weights(torus):
+    _, _, c2e2c = torus
+    weights = np.ones(c2e2c.shape[0])
+    weights[: c2e2c.shape[0] // 4] = 3.0
+    partition = decomp.BreadthFirstDecomposer()(c2e2c, 4, weights=weights)
+    partition_weights = np.bincount(partition, weights=weights, minlength=4)
+    assert partition_weights.max() / partition_weights.mean() < 1.05
+    assert np.bincount(partition, minlength=4).max() > c2e2c.shape[0] // 4
+
+
+@pytest.mark.parametrize("halo_levels", [1, 2])
+@pytest.mark.parametrize("dim", [dims.CellDim, dims.EdgeDim, dims.VertexDim])
+def test_create_decomposition_info(torus, dim, halo_levels):
+    c2v, c2e, c2e2c = torus
+    num_partitions = 3
+    partition = decomp.BreadthFirstDecomposer()(c2e2c, num_partitions)
+    infos = [
+        decomp.create_decomposition_info(partition, rank, c2v, c2e, 10, halo_levels)
+        for rank in range(num_partitions)
+    ]
+    owned = [
+        info.global_index(dim, definitions.DecompositionInfo.EntryType.OWNED) for info in infos
+    ]
+    all_owned = np.concatenate(owned)
+    num_global = {
+        dims.CellDim: c2v.shape[0],
+        dims.EdgeDim: c2e.max() + 1,
+        dims.VertexDim: c2v.max() + 1,
+    }
+    assert np.array_equal(np.sort(all_owned), np.arange(num_global[dim]))
+
+    for rank, info in enumerate(infos):
+        mask = info.owner_mask(dim)
+        assert mask[: np.count_nonzero(mask)].all()
+        halo = info.global_index(dim, definitions.DecompositionInfo.EntryType.HALO)
+        assert halo.shape[0] > 0
+        # every halo point is owned by some other rank
+        assert not np.isin(halo, owned[rank]).any()
+        assert np.isin(halo, all_owned).all()
+
+
+def test_create_decomposition_info_halo_grows_with_levels(torus):
+    c2v, c2e, c2e2c = torus
+    partition = decomp.BreadthFirstDecomposer()(c2e2c, 2)
+    sizes = [
+        decomp.create_decomposition_info(partition, 0, c2v, c2e, 10, levels).num_cells
+        for levels in (0, 1, 2)
+    ]
+    assert sizes[0] == np.count_nonzero(partition == 0)
+    assert sizes[0] < sizes[1] < sizes[2]
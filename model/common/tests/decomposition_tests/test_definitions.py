@@ -6,10 +6,19 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import gt4py.next as gtx
+import numpy as np
+import pytest
+
+from icon4py.model.common import dimension as dims
 from icon4py.model.common.decomposition.definitions import (
     DecompositionInfo,
+    ReducedPrecisionFields,
     SingleNodeExchange,
+    SingleNodeProcessProperties,
+    SingleNodeSharedStorage,
     create_exchange,
+    create_shared_storage,
 )
 from icon4py.model.testing.datatest_fixtures import (  # noqa: F401 # import fixtures form test_utils
     data_provider,
@@ -32,3 +41,43 @@ def test_create_single_node_runtime_without_mpi(icon_grid, processor_props):  #
     exchange = create_exchange(processor_props, decomposition_info)
 
     assert isinstance(exchange, SingleNodeExchange)
+
+
+def test_single_node_shared_storage():
+    storage = create_shared_storage(SingleNodeProcessProperties())
+    assert isinstance(storage, SingleNodeSharedStorage)
+    calls = []
+
+    def producer():
+        calls.append(1)
+        return np.arange(12, dtype=np.int32).reshape(3, 4).T
+
+    shared = storage.share("c2e", producer)
+    assert np.array_equal(shared, np.arange(12).reshape(3, 4).T)
+    assert shared.flags.c_contiguous
+    assert storage.share("c2e", producer) is shared
+    assert len(calls) == 1
+    assert storage.nbytes == 12 * 4
+    with pytest.raises(ValueError):
+        shared[0, 0] = 42
+
+    storage.free()
+    assert storage.nbytes == 0
+
+
+def test_reduced_precision_fields():
+    vn = gtx.as_field((dims.EdgeDim, dims.KDim), np.zeros((4, 3)))
+    z_rho_e = gtx.as_field((dims.EdgeDim, dims.KDim), np.zeros((4, 3)))
+    vp_field = gtx.as_field((dims.EdgeDim, dims.KDim), np.zeros((4, 3), dtype=np.float32))
+    mask = gtx.as_field((dims.EdgeDim,), np.zeros(4, dtype=bool))
+    reduced = ReducedPrecisionFields()
+    reduced.add(z_rho_e, vp_field, mask)
+
+    assert z_rho_e in reduced
+    assert vn not in reduced
+    assert vp_field not in reduced
+    assert mask not in reduced
+    assert reduced.payload_itemsize(z_rho_e) == 4
+    assert reduced.payload_itemsize(vn) == 8
+
+    SingleNodeExchange().use_reduced_precision(z_rho_e)
@@ -0,0 +1,128 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import time
+
+import pytest
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import definitions, exchange_statistics
+from icon4py.model.common.grid import simple
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+@pytest.fixture
+def instrumented_exchange():
+    grid = simple.SimpleGrid()
+    decomposition_info = definitions.DecompositionInfo(
+        klevels=grid.num_levels,
+        num_cells=grid.num_cells,
+        num_edges=grid.num_edges,
+        num_vertices=grid.num_vertices,
+    )
+    props = definitions.SingleNodeProcessProperties()
+    exchange = exchange_statistics.InstrumentedExchange(
+        definitions.create_exchange(props, decomposition_info), props, decomposition_info
+    )
+    return grid, props, exchange
+
+
+def test_instrumented_exchange_is_exchange_runtime(instrumented_exchange):
+    _, _, exchange = instrumented_exchange
+    assert isinstance(exchange, definitions.ExchangeRuntime)
+    assert exchange.get_size() == 1
+    assert exchange.my_rank() == 0
+
+
+def test_instrumented_exchange_records_per_call_site_and_field(instrumented_exchange):
+    grid, _, exchange = instrumented_exchange
+    vn = data_alloc.zero_field(grid, dims.EdgeDim, dims.KDim)
+    rho = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+    exchange.statistics.next_step()
+    for _ in range(2):
+        exchange.exchange_and_wait(dims.EdgeDim, vn)
+    exchange.exchange_and_wait(dims.EdgeDim, vn)
+    exchange(rho, dim=dims.CellDim, wait=True)
+
+    records = exchange.statistics.records
+    assert len(records) == 3
+    assert [(r.field, r.dim, r.calls) for r in records] == [
+        ("vn", dims.EdgeDim.value, 2),
+        ("vn", dims.EdgeDim.value, 1),
+        ("rho", dims.CellDim.value, 1),
+    ]
+    for r in records:
+        assert "test_instrumented_exchange_records_per_call_site_and_field" in r.call_site
+        assert r.bytes_sent == 0
+        assert r.bytes_received == 0
+        assert r.num_neighbors == 0
+        assert r.wait_time >= 0.0
+
+
+def test_instrumented_exchange_non_blocking(instrumented_exchange):
+    grid, _, exchange = instrumented_exchange
+    w = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+    theta_v = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+    handle = exchange(w, theta_v, dim=dims.CellDim, wait=False)
+    assert handle.is_ready()
+    handle.wait()
+    assert {r.field for r in exchange.statistics.records} == {"w", "theta_v"}
+
+
+class _PendingResult:
+    def __init__(self):
+        self.num_waits = 0
+
+    def is_ready(self):
+        return self.num_waits > 0
+
+    def wait(self):
+        time.sleep(0.01)
+        self.num_waits += 1
+
+
+def test_instrumented_result_blocks_in_wait():
+    records = [exchange_statistics.ExchangeRecord("site", name, "Cell") for name in ("w", "rho")]
+    pending = exchange_statistics.InstrumentedResult(_PendingResult(), records)
+    pending.wait()
+    pending.wait()
+    assert pending.result.num_waits == 1
+    for record in records:
+        assert record.wait_idle_time >= 0.005
+        assert record.wait_transfer_time == 0.0
+
+    ready = exchange_statistics.InstrumentedResult(pending.result, records)
+    ready.wait()
+    for record in records:
+        assert record.wait_transfer_time >= 0.005
+
+
+def test_reduce_statistics_single_node(instrumented_exchange, tmp_path):
+    grid, props, exchange = instrumented_exchange
+    vn = data_alloc.zero_field(grid, dims.EdgeDim, dims.KDim)
+    for _ in range(3):
+        exchange.statistics.next_step()
+        exchange.exchange_and_wait(dims.EdgeDim, vn)
+        exchange.exchange_and_wait(dims.EdgeDim, vn)
+
+    report = exchange_statistics.reduce_statistics(exchange.statistics, props)
+    assert report["num_ranks"] == 1
+    assert report["num_steps"] == 3
+    assert len(report["records"]) == 2
+    for r in report["records"]:
+        assert r["calls_per_step"] == 1.0
+        assert r["start_time"]["min"] <= r["start_time"]["mean"] <= r["start_time"]["max"]
+
+    table = exchange_statistics.format_table(report)
+    assert "vn" in table
+
+    path = tmp_path / "exchange_statistics.json"
+    exchange_statistics.write_json(report, path)
+    with open(path) as f:
+        assert json.load(f) == report
@@ -0,0 +1,117 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import (
+    decomposer as decomp,
+    definitions,
+    exchange_statistics,
+    halo_exchange_benchmark,
+    load_balance,
+)
+
+
+@pytest.fixture
+def torus():
+    return halo_exchange_benchmark.torus_connectivities(24, 16)
+
+
+def _measurement(partition, zones, zone_costs, num_ranks, c2v, c2e):
+    loads = []
+    for rank in range(num_ranks):
+        info = decomp.create_decomposition_info(partition, rank, c2v, c2e, 1)
+        owned, halo = load_balance._entry_counts(info)
+        time = zone_costs[zones[partition == rank]].sum()
+        loads.append(
+            load_balance.RankLoad(rank=rank, granule_times={"dycore": time}, owned=owned, halo=halo)
+        )
+    return load_balance.LoadMeasurement(loads=loads, cell_owner=partition)
+
+
+def test_cell_zones():
+    refin_ctrl = np.asarray([0, -4, 1, 4, 5, 12, 14], dtype=np.int32)
+    zones = load_balance.cell_zones(refin_ctrl)
+    assert zones.tolist() == [
+        load_balance.CellZone.INTERIOR,
+        load_balance.CellZone.INTERIOR,
+        load_balance.CellZone.LATERAL_BOUNDARY,
+        load_balance.CellZone.LATERAL_BOUNDARY,
+        load_balance.CellZone.NUDGING,
+        load_balance.CellZone.NUDGING,
+        load_balance.CellZone.NUDGING,
+    ]
+
+
+def test_imbalance_factor():
+    assert load_balance.imbalance_factor([1.0, 1.0, 1.0]) == 1.0
+    assert load_balance.imbalance_factor([1.0, 3.0]) == pytest.approx(1.5)
+
+
+def test_load_recorder_subtracts_exchange_wait():
+    info = definitions.DecompositionInfo(klevels=1, num_cells=4, num_edges=6, num_vertices=2)
+    info.with_dimension(dims.CellDim, np.arange(4), np.asarray([True, True, True, False]))
+    statistics = exchange_statistics.ExchangeStatistics()
+    recorder = load_balance.LoadRecorder(info, statistics)
+    with recorder.time("diffusion"):
+        record = statistics.record("site", "vn", dims.EdgeDim)
+        record.wait_idle_time += 100.0
+    with recorder.time("diffusion"):
+        pass
+    assert recorder.calls == {"diffusion": 2}
+    assert recorder.times["diffusion"] < 0.0
+
+    measurement = load_balance.gather_measurement(
+        recorder, definitions.SingleNodeProcessProperties()
+    )
+    assert measurement.num_ranks == 1
+    assert measurement.loads[0].owned == {dims.CellDim.value: 3}
+    assert measurement.loads[0].halo == {dims.CellDim.value: 1}
+    assert measurement.cell_owner.tolist() == [0, 0, 0]
+
+
+def test_rebalance_reduces_imbalance(torus, tmp_path):
+    c2v, c2e, c2e2c = torus
+    num_ranks = 4
+    partition = decomp.BreadthFirstDecomposer()(c2e2c, num_ranks)
+    zones = np.full(c2e2c.shape[0], load_balance.CellZone.INTERIOR, dtype=np.int32)
+    zones[partition == 0] = load_balance.CellZone.NUDGING
+    zone_costs = np.asarray([1.0e-3, 0.0, 3.0e-3])
+    measurement = _measurement(partition, zones, zone_costs, num_ranks, c2v, c2e)
+    assert measurement.imbalance() == pytest.approx(2.0)
+
+    path = tmp_path / "load_balance.json"
+    load_balance.write_measurement(measurement, path)
+    measurement = load_balance.read_measurement(path)
+
+    costs = load_balance.fit_cell_costs(measurement, zones)
+    assert costs["interior"] == pytest.approx(1.0e-3)
+    assert costs["nudging"] == pytest.approx(3.0e-3)
+    assert costs["halo"] == pytest.approx(0.0, abs=1e-12)
+
+    new_partition, report = load_balance.rebalance(
+        measurement, c2e2c, c2v, decomp.BreadthFirstDecomposer(), zones=zones
+    )
+    assert new_partition.shape == partition.shape
+    assert report["predicted_imbalance_before"] == pytest.approx(2.0)
+    assert report["predicted_imbalance_after"] < 1.05
+    assert "predicted imbalance factor" in load_balance.format_report(report)
+
+
+@pytest.mark.parametrize("halo_levels", [1, 2])
+def test_halo_cells_matches_decomposition_info(torus, halo_levels):
+    c2v, c2e, c2e2c = torus
+    num_ranks = 5
+    partition = decomp.BreadthFirstDecomposer()(c2e2c, num_ranks)
+    expected = []
+    for rank in range(num_ranks):
+        info = decomp.create_decomposition_info(partition, rank, c2v, c2e, 1, halo_levels)
+        expected.append(info.num_cells - np.count_nonzero(info.owner_mask(dims.CellDim)))
+    assert load_balance._halo_cells(partition, num_ranks, c2v, halo_levels) == expected
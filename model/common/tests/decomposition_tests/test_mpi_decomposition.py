@@ -6,6 +6,7 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import gt4py.next as gtx
 import numpy as np
 import pytest
 
@@ -13,18 +14,24 @@ from icon4py.model.common.utils.data_allocation import constant_field
 
 
 try:
-    import mpi4py  # noqa: F401 # import mpi4py to check for optional mpi dependency
+    import mpi4py  # import mpi4py to check for optional mpi dependency
 except ImportError:
     pytest.skip("Skipping parallel on single node installation", allow_module_level=True)
 
 from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import decomposer, halo_exchange_benchmark
 from icon4py.model.common.decomposition.definitions import (
     DecompositionInfo,
     DomainDescriptorIdGenerator,
     SingleNodeExchange,
+    SingleNodeSharedStorage,
     create_exchange,
+    create_shared_storage,
+)
+from icon4py.model.common.decomposition.mpi_decomposition import (
+    GHexMultiNodeExchange,
+    MPISharedWindowStorage,
 )
-from icon4py.model.common.decomposition.mpi_decomposition import GHexMultiNodeExchange
 from icon4py.model.testing.datatest_fixtures import (  # noqa: F401 # import fixtures from test_utils
     data_provider,
     decomposition_info,
@@ -219,6 +226,29 @@ def test_create_single_node_runtime_without_mpi(
     assert isinstance(exchange, SingleNodeExchange)
 
 
+@pytest.mark.mpi
+@pytest.mark.parametrize("processor_props", [True], indirect=True)
+def test_shared_storage_is_read_once_per_node(processor_props):  # noqa: F811  # fixture
+    storage = create_shared_storage(processor_props)
+    if processor_props.comm_size > 1:
+        assert isinstance(storage, MPISharedWindowStorage)
+    else:
+        assert isinstance(storage, SingleNodeSharedStorage)
+    node_comm = processor_props.comm.Split_type(mpi4py.MPI.COMM_TYPE_SHARED)
+    calls = []
+
+    def producer():
+        calls.append(processor_props.rank)
+        return np.arange(1000, dtype=np.int32).reshape(250, 4)
+
+    shared = storage.share("c2e", producer)
+    assert np.array_equal(shared, np.arange(1000).reshape(250, 4))
+    assert not shared.flags.writeable
+    assert storage.share("c2e", producer) is shared
+    assert node_comm.allreduce(len(calls)) == 1
+    storage.free()
+
+
 @pytest.mark.mpi
 @pytest.mark.parametrize("processor_props", [True], indirect=True)
 @pytest.mark.parametrize("dimension", (dims.CellDim, dims.VertexDim, dims.EdgeDim))
@@ -258,3 +288,34 @@ def test_exchange_on_dummy_data(
     print(f"rank={processor_props.rank} - num changed points {changed_points.shape} ")
 
     print(f"rank={processor_props.rank} - changed points {changed_points} ")
+
+
+@pytest.mark.mpi(min_size=2)
+@pytest.mark.parametrize("processor_props", [True], indirect=True)
+@pytest.mark.parametrize("dimension", (dims.CellDim, dims.EdgeDim))
+def test_exchange_in_reduced_precision(processor_props, dimension):  # noqa: F811  # fixture
+    c2v, c2e, c2e2c = halo_exchange_benchmark.torus_connectivities(12, 8)
+    partition = decomposer.BreadthFirstDecomposer()(c2e2c, processor_props.comm_size)
+    info = decomposer.create_decomposition_info(
+        partition, processor_props.rank, c2v, c2e, num_levels=5
+    )
+    exchange = create_exchange(processor_props, info)
+    size = {dims.CellDim: info.num_cells, dims.EdgeDim: info.num_edges}[dimension]
+    global_index = info.global_index(dimension, DecompositionInfo.EntryType.ALL)
+    owned = info.owner_mask(dimension)
+    # values that are not representable in single precision
+    expected = (global_index[:, np.newaxis] + 1.0) * np.pi + np.arange(5) * 1.0e-9
+
+    def _field():
+        values = np.where(owned[:, np.newaxis], expected, -1.0)
+        return gtx.as_field((dimension, dims.KDim), values[:size])
+
+    double, reduced = _field(), _field()
+    exchange.use_reduced_precision(reduced)
+    exchange.exchange_and_wait(dimension, double, reduced)
+
+    assert np.array_equal(double.asnumpy(), expected)
+    assert np.array_equal(reduced.asnumpy()[owned], expected[owned])
+    halo = reduced.asnumpy()[~owned]
+    assert not np.array_equal(halo, expected[~owned])
+    assert np.allclose(halo, expected[~owned], rtol=np.finfo(np.float32).eps, atol=0.0)
@@ -304,3 +304,26 @@ def test_cells_aw_verts(interpolation_savepoint, grid_file, experiment, backend,
 
     assert field.shape == (grid.num_vertices, 6)
     assert test_helpers.dallclose(field_ref.asnumpy(), field.asnumpy(), rtol=rtol)
+
+
+@pytest.mark.parametrize(
+    "grid_file, experiment",
+    [
+        (dt_utils.REGIONAL_EXPERIMENT, dt_utils.REGIONAL_EXPERIMENT),
+        (dt_utils.R02B04_GLOBAL, dt_utils.GLOBAL_EXPERIMENT),
+    ],
+)
+@pytest.mark.datatest
+def test_rbf_vec_coeff_v(interpolation_savepoint, grid_file, experiment, backend):
+    factory = get_interpolation_factory(backend, experiment, grid_file)
+    grid = factory.grid
+    field_1 = factory.get(attrs.RBF_VEC_COEFF_V1)
+    field_2 = factory.get(attrs.RBF_VEC_COEFF_V2)
+
+    assert field_1.shape == (grid.num_vertices, 6)
+    assert test_helpers.dallclose(
+        interpolation_savepoint.rbf_vec_coeff_v1().asnumpy(), field_1.asnumpy(), atol=1e-8
+    )
+    assert test_helpers.dallclose(
+        interpolation_savepoint.rbf_vec_coeff_v2().asnumpy(), field_2.asnumpy(), atol=1e-8
+    )
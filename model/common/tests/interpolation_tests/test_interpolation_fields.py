@@ -7,12 +7,17 @@
 # SPDX-License-Identifier: BSD-3-Clause
 import functools
 
+import gt4py.next as gtx
+import numpy as np
 import pytest
 
 import icon4py.model.common.dimension as dims
 import icon4py.model.common.grid.horizontal as h_grid
 import icon4py.model.testing.helpers as test_helpers
 from icon4py.model.common import constants
+from icon4py.model.common.decomposition import halo_exchange_benchmark
+from icon4py.model.common.grid import geometry_stencils, grid_manager as gm
+from icon4py.model.common.interpolation import interpolation_fields
 from icon4py.model.common.interpolation.interpolation_fields import (
     compute_c_lin_e,
     compute_cells_aw_verts,
@@ -25,6 +30,7 @@ from icon4py.model.common.interpolation.interpolation_fields import (
     compute_geofac_rot,
     compute_mass_conserving_bilinear_cell_average_weight,
     compute_pos_on_tplane_e_x_y,
+    create_inverse_neighbor_index,
 )
 from icon4py.model.common.utils import data_allocation as data_alloc
 from icon4py.model.testing import datatest_utils as dt_utils
@@ -364,3 +370,789 @@ def test_compute_pos_on_tplane_e(grid_savepoint, interpolation_savepoint, icon_g
     )
     assert test_helpers.dallclose(pos_on_tplane_e_x, pos_on_tplane_e_x_ref, atol=1e-6, rtol=1e-7)
     assert test_helpers.dallclose(pos_on_tplane_e_y, pos_on_tplane_e_y_ref, atol=1e-6, rtol=1e-7)
+
+
+def _reference_compute_geofac_grdiv(
+    geofac_div: data_alloc.NDArray,
+    inv_dual_edge_length: data_alloc.NDArray,
+    owner_mask: data_alloc.NDArray,
+    c2e: data_alloc.NDArray,
+    e2c: data_alloc.NDArray,
+    e2c2e: data_alloc.NDArray,
+    horizontal_start: int,
+    array_ns=np,
+) -> data_alloc.NDArray:
+    num_edges = e2c.shape[0]
+    geofac_grdiv = array_ns.zeros([num_edges, 1 + 2 * e2c.shape[1]])
+    index = array_ns.arange(horizontal_start, num_edges)
+    for j in range(c2e.shape[1]):
+        mask = array_ns.where(
+            c2e[e2c[horizontal_start:, 1], j] == index, owner_mask[horizontal_start:], False
+        )
+        geofac_grdiv[horizontal_start:, 0] = array_ns.where(
+            mask, geofac_div[e2c[horizontal_start:, 1], j], geofac_grdiv[horizontal_start:, 0]
+        )
+    for j in range(c2e.shape[1]):
+        mask = array_ns.where(
+            c2e[e2c[horizontal_start:, 0], j] == index, owner_mask[horizontal_start:], False
+        )
+        geofac_grdiv[horizontal_start:, 0] = array_ns.where(
+            mask,
+            (geofac_grdiv[horizontal_start:, 0] - geofac_div[e2c[horizontal_start:, 0], j])
+            * inv_dual_edge_length[horizontal_start:],
+            geofac_grdiv[horizontal_start:, 0],
+        )
+    for j in range(e2c.shape[1]):
+        for k in range(c2e.shape[1]):
+            mask = c2e[e2c[horizontal_start:, 0], k] == e2c2e[horizontal_start:, j]
+            geofac_grdiv[horizontal_start:, e2c.shape[1] - 1 + j] = array_ns.where(
+                mask,
+                -geofac_div[e2c[horizontal_start:, 0], k] * inv_dual_edge_length[horizontal_start:],
+                geofac_grdiv[horizontal_start:, e2c.shape[1] - 1 + j],
+            )
+            mask = c2e[e2c[horizontal_start:, 1], k] == e2c2e[horizontal_start:, e2c.shape[1] + j]
+            geofac_grdiv[horizontal_start:, 2 * e2c.shape[1] - 1 + j] = array_ns.where(
+                mask,
+                geofac_div[e2c[horizontal_start:, 1], k] * inv_dual_edge_length[horizontal_start:],
+                geofac_grdiv[horizontal_start:, 2 * e2c.shape[1] - 1 + j],
+            )
+    return geofac_grdiv
+
+
+def _reference_create_inverse_neighbor_index(
+    source_offset, inverse_offset, array_ns=np
+) -> data_alloc.NDArray:
+    inv_neighbor_idx = -1 * array_ns.ones(inverse_offset.shape, dtype=int)
+
+    for jc in range(inverse_offset.shape[0]):
+        for i in range(inverse_offset.shape[1]):
+            if inverse_offset[jc, i] >= 0:
+                inv_neighbor_idx[jc, i] = array_ns.argwhere(
+                    source_offset[inverse_offset[jc, i], :] == jc
+                )[0, 0]
+
+    return inv_neighbor_idx
+
+
+def _reference_compute_e_flx_avg(
+    c_bln_avg: data_alloc.NDArray,
+    geofac_div: data_alloc.NDArray,
+    owner_mask: data_alloc.NDArray,
+    primal_cart_normal_x: data_alloc.NDArray,
+    primal_cart_normal_y: data_alloc.NDArray,
+    primal_cart_normal_z: data_alloc.NDArray,
+    e2c: data_alloc.NDArray,
+    c2e: data_alloc.NDArray,
+    c2e2c: data_alloc.NDArray,
+    e2c2e: data_alloc.NDArray,
+    horizontal_start_p3: int,
+    horizontal_start_p4: int,
+    array_ns=np,
+) -> data_alloc.NDArray:
+    primal_cart_normal = geometry_stencils.compute_primal_cart_normal(
+        primal_cart_normal_x,
+        primal_cart_normal_y,
+        primal_cart_normal_z,
+        array_ns=array_ns,
+    )
+
+    llb = 0
+    e_flx_avg = array_ns.zeros([e2c.shape[0], 5])
+    index = array_ns.arange(llb, c2e.shape[0])
+    inv_neighbor_id = -array_ns.ones([c2e.shape[0] - llb, 3], dtype=int)
+    for i in range(c2e2c.shape[1]):
+        for j in range(c2e2c.shape[1]):
+            inv_neighbor_id[:, j] = array_ns.where(
+                array_ns.logical_and(c2e2c[c2e2c[llb:, j], i] == index, c2e2c[llb:, j] >= 0),
+                i,
+                inv_neighbor_id[:, j],
+            )
+
+    llb = horizontal_start_p3
+    index = array_ns.arange(llb, e2c.shape[0])
+    for j in range(c2e.shape[1]):
+        for i in range(2):
+            e_flx_avg[llb:, i + 1] = array_ns.where(
+                owner_mask[llb:],
+                array_ns.where(
+                    c2e[e2c[llb:, 0], j] == index,
+                    c_bln_avg[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], j] + 1]
+                    * geofac_div[e2c[llb:, 0], array_ns.mod(i + j + 1, 3)]
+                    / geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], j]],
+                    e_flx_avg[llb:, i + 1],
+                ),
+                e_flx_avg[llb:, i + 1],
+            )
+            e_flx_avg[llb:, i + 3] = array_ns.where(
+                owner_mask[llb:],
+                array_ns.where(
+                    c2e[e2c[llb:, 0], j] == index,
+                    c_bln_avg[e2c[llb:, 0], 1 + j]
+                    * geofac_div[
+                        e2c[llb:, 1], array_ns.mod(inv_neighbor_id[e2c[llb:, 0], j] + i + 1, 3)
+                    ]
+                    / geofac_div[e2c[llb:, 0], j],
+                    e_flx_avg[llb:, i + 3],
+                ),
+                e_flx_avg[llb:, i + 3],
+            )
+
+    iie = -array_ns.ones([e2c.shape[0], 4], dtype=int)
+    iie[:, 0] = array_ns.where(e2c[e2c2e[:, 0], 0] == e2c[:, 0], 2, -1)
+    iie[:, 0] = array_ns.where(
+        array_ns.logical_and(e2c[e2c2e[:, 0], 1] == e2c[:, 0], iie[:, 0] != 2), 4, iie[:, 0]
+    )
+
+    iie[:, 1] = array_ns.where(e2c[e2c2e[:, 1], 0] == e2c[:, 0], 1, -1)
+    iie[:, 1] = array_ns.where(
+        array_ns.logical_and(e2c[e2c2e[:, 1], 1] == e2c[:, 0], iie[:, 1] != 1), 3, iie[:, 1]
+    )
+
+    iie[:, 2] = array_ns.where(e2c[e2c2e[:, 2], 0] == e2c[:, 1], 2, -1)
+    iie[:, 2] = array_ns.where(
+        array_ns.logical_and(e2c[e2c2e[:, 2], 1] == e2c[:, 1], iie[:, 2] != 2), 4, iie[:, 2]
+    )
+
+    iie[:, 3] = array_ns.where(e2c[e2c2e[:, 3], 0] == e2c[:, 1], 1, -1)
+    iie[:, 3] = array_ns.where(
+        array_ns.logical_and(e2c[e2c2e[:, 3], 1] == e2c[:, 1], iie[:, 3] != 1), 3, iie[:, 3]
+    )
+
+    llb = horizontal_start_p4
+    index = array_ns.arange(llb, e2c.shape[0])
+    for i in range(c2e.shape[1]):
+        if i <= gm.GridFile.INVALID_INDEX:
+            continue
+        e_flx_avg[llb:, 0] = array_ns.where(
+            owner_mask[llb:],
+            array_ns.where(
+                c2e[e2c[llb:, 0], i] == index,
+                0.5
+                * (
+                    (
+                        geofac_div[e2c[llb:, 0], i] * c_bln_avg[e2c[llb:, 0], 0]
+                        + geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i]]
+                        * c_bln_avg[e2c[llb:, 0], i + 1]
+                        - e_flx_avg[e2c2e[llb:, 0], iie[llb:, 0]]
+                        * geofac_div[e2c[llb:, 0], array_ns.mod(i + 1, 3)]
+                        - e_flx_avg[e2c2e[llb:, 1], iie[llb:, 1]]
+                        * geofac_div[e2c[llb:, 0], array_ns.mod(i + 2, 3)]
+                    )
+                    / geofac_div[e2c[llb:, 0], i]
+                    + (
+                        geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i]]
+                        * c_bln_avg[e2c[llb:, 1], 0]
+                        + geofac_div[e2c[llb:, 0], i]
+                        * c_bln_avg[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i] + 1]
+                        - e_flx_avg[e2c2e[llb:, 2], iie[llb:, 2]]
+                        * geofac_div[
+                            e2c[llb:, 1], array_ns.mod(inv_neighbor_id[e2c[llb:, 0], i] + 1, 3)
+                        ]
+                        - e_flx_avg[e2c2e[llb:, 3], iie[llb:, 3]]
+                        * geofac_div[
+                            e2c[llb:, 1], array_ns.mod(inv_neighbor_id[e2c[llb:, 0], i] + 2, 3)
+                        ]
+                    )
+                    / geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i]]
+                ),
+                e_flx_avg[llb:, 0],
+            ),
+            e_flx_avg[llb:, 0],
+        )
+
+    checksum = e_flx_avg[:, 0]
+    for i in range(4):
+        checksum = (
+            checksum
+            + array_ns.sum(primal_cart_normal * primal_cart_normal[e2c2e[:, i], :], axis=1)
+            * e_flx_avg[:, 1 + i]
+        )
+
+    for i in range(5):
+        e_flx_avg[llb:, i] = array_ns.where(
+            owner_mask[llb:], e_flx_avg[llb:, i] / checksum[llb:], e_flx_avg[llb:, i]
+        )
+
+    return e_flx_avg
+
+
+def _reference_compute_cells_aw_verts(
+    dual_area: data_alloc.NDArray,
+    edge_vert_length: data_alloc.NDArray,
+    edge_cell_length: data_alloc.NDArray,
+    v2e: data_alloc.NDArray,
+    e2v: data_alloc.NDArray,
+    v2c: data_alloc.NDArray,
+    e2c: data_alloc.NDArray,
+    horizontal_start: int,
+    array_ns=np,
+) -> data_alloc.NDArray:
+    cells_aw_verts = array_ns.zeros(v2e.shape)
+    for jv in range(horizontal_start, cells_aw_verts.shape[0]):
+        cells_aw_verts[jv, :] = 0.0
+        for je in range(v2e.shape[1]):
+            if v2e[jv, je] == gm.GridFile.INVALID_INDEX or (
+                je > 0 and v2e[jv, je] == v2e[jv, je - 1]
+            ):
+                continue
+            ile = v2e[jv, je]
+            idx_ve = 0 if e2v[ile, 0] == jv else 1
+            cell_offset_idx_0 = e2c[ile, 0]
+            cell_offset_idx_1 = e2c[ile, 1]
+            for jc in range(v2e.shape[1]):
+                if v2c[jv, jc] == gm.GridFile.INVALID_INDEX or (
+                    jc > 0 and v2c[jv, jc] == v2c[jv, jc - 1]
+                ):
+                    continue
+                if cell_offset_idx_0 == v2c[jv, jc]:
+                    cells_aw_verts[jv, jc] = (
+                        cells_aw_verts[jv, jc]
+                        + 0.5
+                        / dual_area[jv]
+                        * edge_vert_length[ile, idx_ve]
+                        * edge_cell_length[ile, 0]
+                    )
+                elif cell_offset_idx_1 == v2c[jv, jc]:
+                    cells_aw_verts[jv, jc] = (
+                        cells_aw_verts[jv, jc]
+                        + 0.5
+                        / dual_area[jv]
+                        * edge_vert_length[ile, idx_ve]
+                        * edge_cell_length[ile, 1]
+                    )
+
+    return cells_aw_verts
+
+
+def _torus_grid(nx: int, ny: int) -> dict[str, np.ndarray]:
+    """Connectivities of a periodic triangular grid, the vertex neighbors are not ordered."""
+    c2v, c2e, c2e2c = halo_exchange_benchmark.torus_connectivities(nx, ny)
+    num_cells = c2v.shape[0]
+    e2c = np.repeat(np.arange(num_cells), 3)[np.argsort(c2e.ravel(), kind="stable")].reshape(-1, 2)
+    num_edges = e2c.shape[0]
+    edge = np.arange(num_edges)
+    # edges k = 0, 1, 2 starting at vertex (i, j) end at vertex (i + 1, j), (i + 1, j + 1), (i, j + 1)
+    i, j = np.divmod(edge // 3, nx)[::-1]
+    di = np.asarray([1, 1, 0])[edge % 3]
+    dj = np.asarray([0, 1, 1])[edge % 3]
+    e2v = np.stack((edge // 3, ((j + dj) % ny) * nx + (i + di) % nx), axis=1)
+    num_vertices = nx * ny
+    v2c = np.repeat(np.arange(num_cells), 3)[np.argsort(c2v.ravel(), kind="stable")]
+    v2e = np.repeat(edge, 2)[np.argsort(e2v.ravel(), kind="stable")]
+    neighbor_edges = c2e[e2c].reshape(num_edges, -1)
+    e2c2e = neighbor_edges[neighbor_edges != edge[:, np.newaxis]].reshape(num_edges, 4)
+    return dict(
+        c2e=c2e,
+        c2e2c=c2e2c,
+        e2c=e2c.astype(gtx.int32),
+        e2v=e2v.astype(gtx.int32),
+        e2c2e=e2c2e.astype(gtx.int32),
+        v2c=v2c.reshape(num_vertices, 6).astype(gtx.int32),
+        v2e=v2e.reshape(num_vertices, 6).astype(gtx.int32),
+    )
+
+
+def _synthetic_interpolation_inputs(grid: dict[str, np.ndarray], seed: int = 42) -> dict:
+    rng = np.random.default_rng(seed)
+    num_cells = grid["c2e"].shape[0]
+    num_edges = grid["e2c"].shape[0]
+    num_vertices = grid["v2e"].shape[0]
+    return dict(
+        geofac_div=rng.uniform(0.5, 1.5, (num_cells, 3)) * rng.choice((-1.0, 1.0), (num_cells, 3)),
+        c_bln_avg=rng.uniform(0.1, 0.5, (num_cells, 4)),
+        inv_dual_edge_length=rng.uniform(0.5, 2.0, num_edges),
+        edge_owner_mask=rng.uniform(size=num_edges) > 0.1,
+        primal_cart_normal=rng.normal(size=(3, num_edges)),
+        dual_area=rng.uniform(0.5, 2.0, num_vertices),
+        edge_vert_length=rng.uniform(0.5, 1.0, (num_edges, 2)),
+        edge_cell_length=rng.uniform(0.5, 1.0, (num_edges, 2)),
+    )
+
+
+def _geofac_grdiv_args(grid, inputs, horizontal_start=0):
+    return dict(
+        geofac_div=inputs["geofac_div"],
+        inv_dual_edge_length=inputs["inv_dual_edge_length"],
+        owner_mask=inputs["edge_owner_mask"],
+        c2e=grid["c2e"],
+        e2c=grid["e2c"],
+        e2c2e=grid["e2c2e"],
+        horizontal_start=horizontal_start,
+    )
+
+
+def _e_flx_avg_args(grid, inputs, horizontal_start_p3=0, horizontal_start_p4=0):
+    normal_x, normal_y, normal_z = inputs["primal_cart_normal"]
+    return dict(
+        c_bln_avg=inputs["c_bln_avg"],
+        geofac_div=inputs["geofac_div"],
+        owner_mask=inputs["edge_owner_mask"],
+        primal_cart_normal_x=normal_x,
+        primal_cart_normal_y=normal_y,
+        primal_cart_normal_z=normal_z,
+        e2c=grid["e2c"],
+        c2e=grid["c2e"],
+        c2e2c=grid["c2e2c"],
+        e2c2e=grid["e2c2e"],
+        horizontal_start_p3=horizontal_start_p3,
+        horizontal_start_p4=horizontal_start_p4,
+    )
+
+
+def _cells_aw_verts_args(grid, inputs, horizontal_start=0):
+    return dict(
+        dual_area=inputs["dual_area"],
+        edge_vert_length=inputs["edge_vert_length"],
+        edge_cell_length=inputs["edge_cell_length"],
+        v2e=grid["v2e"],
+        e2v=grid["e2v"],
+        v2c=grid["v2c"],
+        e2c=grid["e2c"],
+        horizontal_start=horizontal_start,
+    )
+
+
+@pytest.fixture
+def torus_grid():
+    grid = _torus_grid(12, 8)
+    # turn some vertices into pentagons: repeated last edge and missing last cell
+    grid["v2e"][::7, 5] = grid["v2e"][::7, 4]
+    grid["v2c"][::7, 5] = gm.GridFile.INVALID_INDEX
+    return grid
+
+
+@pytest.mark.parametrize("horizontal_start", [0, 17])
+def test_compute_geofac_grdiv_matches_loop_implementation(torus_grid, horizontal_start):
+    args = _geofac_grdiv_args(
+        torus_grid, _synthetic_interpolation_inputs(torus_grid), horizontal_start
+    )
+    assert np.array_equal(compute_geofac_grdiv(**args), _reference_compute_geofac_grdiv(**args))
+
+
+@pytest.mark.parametrize("horizontal_start_p3, horizontal_start_p4", [(0, 0), (11, 23)])
+def test_compute_e_flx_avg_matches_loop_implementation(
+    torus_grid, horizontal_start_p3, horizontal_start_p4
+):
+    args = _e_flx_avg_args(
+        torus_grid,
+        _synthetic_interpolation_inputs(torus_grid),
+        horizontal_start_p3,
+        horizontal_start_p4,
+    )
+    assert np.array_equal(compute_e_flx_avg(**args), _reference_compute_e_flx_avg(**args))
+
+
+@pytest.mark.parametrize("horizontal_start", [0, 9])
+def test_compute_cells_aw_verts_matches_loop_implementation(torus_grid, horizontal_start):
+    args = _cells_aw_verts_args(
+        torus_grid, _synthetic_interpolation_inputs(torus_grid), horizontal_start
+    )
+    cells_aw_verts = compute_cells_aw_verts(**args)
+    assert np.array_equal(cells_aw_verts, _reference_compute_cells_aw_verts(**args))
+    assert np.all(cells_aw_verts[::7, 5] == 0.0)
+
+
+def test_create_inverse_neighbor_index_matches_loop_implementation(torus_grid):
+    e2c = torus_grid["e2c"]
+    c2e = torus_grid["c2e"]
+    c2e2c = torus_grid["c2e2c"].copy()
+    # cut the grid along some edges: both cells lose their neighbor
+    cells = np.arange(0, c2e2c.shape[0], 5)
+    neighbors = c2e2c[cells, 1]
+    rows, slots = np.nonzero(c2e2c[neighbors] == cells[:, np.newaxis])
+    c2e2c[cells, 1] = gm.GridFile.INVALID_INDEX
+    c2e2c[neighbors[rows], slots] = gm.GridFile.INVALID_INDEX
+    c2e2c0 = np.column_stack((np.arange(c2e2c.shape[0]), c2e2c))
+    for source, inverse in ((e2c, c2e), (c2e2c0, c2e2c0), (torus_grid["e2v"], torus_grid["v2e"])):
+        assert np.array_equal(
+            create_inverse_neighbor_index(source, inverse, np),
+            _reference_create_inverse_neighbor_index(source, inverse, np),
+        )
+
+
+#: number of cells of the icosahedral grids R2B4 to R2B8, the grid is a torus of the same size
+GRID_SIZES = {f"R2B{level}": 20 * 4 ** (level + 1) for level in range(4, 9)}
+
+#: benchmark resolutions, grids larger than R2B4 are only run with `--slow`
+BENCHMARK_RESOLUTIONS = [
+    resolution if resolution == "R2B4" else pytest.param(resolution, marks=pytest.mark.slow)
+    for resolution in GRID_SIZES
+]
+
+
+@functools.cache
+def _benchmark_grid(resolution: str) -> tuple[dict, dict]:
+    num_cells = GRID_SIZES[resolution]
+    nx = int(np.sqrt(num_cells * 5 / 4))
+    grid = _torus_grid(nx, num_cells // (2 * nx))
+    return grid, _synthetic_interpolation_inputs(grid)
+
+
+@pytest.mark.parametrize("resolution", BENCHMARK_RESOLUTIONS)
+@pytest.mark.parametrize(
+    "func, make_args",
+    [
+        (compute_geofac_grdiv, _geofac_grdiv_args),
+        (compute_e_flx_avg, _e_flx_avg_args),
+        (compute_cells_aw_verts, _cells_aw_verts_args),
+    ],
+    ids=["geofac_grdiv", "e_flx_avg", "cells_aw_verts"],
+)
+def test_interpolation_fields_benchmark(benchmark, func, make_args, resolution):
+    args = make_args(*_benchmark_grid(resolution))
+    benchmark.pedantic(func, kwargs=args, rounds=1 if GRID_SIZES[resolution] > 10**6 else 3)
+
+
+def _reference_force_mass_conservation_to_c_bln_avg(
+    c2e2c0: data_alloc.NDArray,
+    c_bln_avg: data_alloc.NDArray,
+    cell_areas: data_alloc.NDArray,
+    cell_owner_mask: data_alloc.NDArray,
+    divavg_cntrwgt: float,
+    horizontal_start: int,
+    array_ns=np,
+    niter: int = 1000,
+) -> data_alloc.NDArray:
+    def _compute_local_weights(
+        c_bln_avg, cell_areas, c2e2c0, inverse_neighbor_idx
+    ) -> data_alloc.NDArray:
+        """
+        Compute the total weight which each local point contributes to the sum.
+
+        Args:
+            c_bln_avg: ndarray representing a weight field of (CellDim, C2E2C0Dim)
+            inverse_neighbor_index: Sequence of to access all weights of a local cell in a field of shape (CellDim, C2E2C0Dim)
+
+        Returns: ndarray of CellDim, containing the sum of weigh contributions for each local cell index
+
+        """
+        weights = array_ns.sum(c_bln_avg[c2e2c0, inverse_neighbor_idx] * cell_areas[c2e2c0], axis=1)
+        return weights
+
+    def _compute_residual_to_mass_conservation(
+        owner_mask: data_alloc.NDArray,
+        local_weight: data_alloc.NDArray,
+        cell_area: data_alloc.NDArray,
+    ) -> data_alloc.NDArray:
+        """The local_weight weighted by the area should be 1. We compute how far we are off that weight."""
+        horizontal_size = local_weight.shape[0]
+        assert horizontal_size == owner_mask.shape[0], "Fields do not have the same shape"
+        assert horizontal_size == cell_area.shape[0], "Fields do not have the same shape"
+        residual = array_ns.where(owner_mask, local_weight / cell_area - 1.0, 0.0)
+        return residual
+
+    def _apply_correction(
+        c_bln_avg: data_alloc.NDArray,
+        residual: data_alloc.NDArray,
+        c2e2c0: data_alloc.NDArray,
+        divavg_cntrwgt: float,
+        horizontal_start: int,
+    ) -> data_alloc.NDArray:
+        """Apply correction to local weigths based on the computed residuals."""
+        maxwgt_loc = divavg_cntrwgt + 0.003
+        minwgt_loc = divavg_cntrwgt - 0.003
+        relax_coeff = 0.46
+        c_bln_avg[horizontal_start:, :] = (
+            c_bln_avg[horizontal_start:, :] - relax_coeff * residual[c2e2c0][horizontal_start:, :]
+        )
+        local_weight = array_ns.sum(c_bln_avg, axis=1) - 1.0
+
+        c_bln_avg[horizontal_start:, :] = c_bln_avg[horizontal_start:, :] - (
+            0.25 * local_weight[horizontal_start:, array_ns.newaxis]
+        )
+
+        # avoid runaway condition:
+        c_bln_avg[horizontal_start:, 0] = array_ns.maximum(
+            c_bln_avg[horizontal_start:, 0], minwgt_loc
+        )
+        c_bln_avg[horizontal_start:, 0] = array_ns.minimum(
+            c_bln_avg[horizontal_start:, 0], maxwgt_loc
+        )
+        return c_bln_avg
+
+    def _enforce_mass_conservation(
+        c_bln_avg: data_alloc.NDArray,
+        residual: data_alloc.NDArray,
+        owner_mask: data_alloc.NDArray,
+        horizontal_start: int,
+    ) -> data_alloc.NDArray:
+        """Enforce the mass conservation condition on the local cells by forcefully subtracting the
+        residual from the central field contribution."""
+        c_bln_avg[horizontal_start:, 0] = array_ns.where(
+            owner_mask[horizontal_start:],
+            c_bln_avg[horizontal_start:, 0] - residual[horizontal_start:],
+            c_bln_avg[horizontal_start:, 0],
+        )
+        return c_bln_avg
+
+    local_summed_weights = array_ns.zeros(c_bln_avg.shape[0])
+    residual = array_ns.zeros(c_bln_avg.shape[0])
+    inverse_neighbor_idx = create_inverse_neighbor_index(c2e2c0, c2e2c0, array_ns=array_ns)
+
+    for iteration in range(niter):
+        local_summed_weights[horizontal_start:] = _compute_local_weights(
+            c_bln_avg, cell_areas, c2e2c0, inverse_neighbor_idx
+        )[horizontal_start:]
+
+        residual[horizontal_start:] = _compute_residual_to_mass_conservation(
+            cell_owner_mask, local_summed_weights, cell_areas
+        )[horizontal_start:]
+
+        max_ = array_ns.max(residual)
+        if iteration >= (niter - 1) or max_ < 1e-9:
+            c_bln_avg = _enforce_mass_conservation(
+                c_bln_avg, residual, cell_owner_mask, horizontal_start
+            )
+            return c_bln_avg
+
+        c_bln_avg = _apply_correction(
+            c_bln_avg=c_bln_avg,
+            residual=residual,
+            c2e2c0=c2e2c0,
+            divavg_cntrwgt=divavg_cntrwgt,
+            horizontal_start=horizontal_start,
+        )
+
+    return c_bln_avg
+
+
+def _synthetic_c_bln_avg(nx: int, ny: int, seed: int = 7) -> dict:
+    rng = np.random.default_rng(seed)
+    _, _, c2e2c = halo_exchange_benchmark.torus_connectivities(nx, ny)
+    num_cells = c2e2c.shape[0]
+    divavg_cntrwgt = 0.5
+    c_bln_avg = np.empty((num_cells, 4))
+    c_bln_avg[:, 0] = divavg_cntrwgt
+    c_bln_avg[:, 1:] = (1.0 - divavg_cntrwgt) / 3.0 * rng.uniform(0.95, 1.05, (num_cells, 3))
+    owner_mask = np.ones(num_cells, dtype=bool)
+    owner_mask[::11] = False
+    return dict(
+        c2e2c0=np.column_stack((np.arange(num_cells, dtype=c2e2c.dtype), c2e2c)),
+        c_bln_avg=c_bln_avg,
+        cell_areas=rng.uniform(0.9, 1.1, num_cells),
+        cell_owner_mask=owner_mask,
+        divavg_cntrwgt=divavg_cntrwgt,
+        horizontal_start=0,
+        niter=1000,
+    )
+
+
+@pytest.mark.parametrize("sparse", [True, False], ids=["sparse", "gather"])
+def test_force_mass_conservation_to_c_bln_avg_matches_loop_implementation(monkeypatch, sparse):
+    args = _synthetic_c_bln_avg(12, 8)
+    if not sparse:
+        monkeypatch.setattr(interpolation_fields, "_sparse_namespace", lambda array_ns: None)
+    c_bln_avg, report = interpolation_fields._force_mass_conservation_to_c_bln_avg(
+        **{**args, "c_bln_avg": args["c_bln_avg"].copy()}
+    )
+    c_bln_avg_ref = _reference_force_mass_conservation_to_c_bln_avg(**args)
+    assert test_helpers.dallclose(c_bln_avg, c_bln_avg_ref, rtol=1e-12, atol=1e-14)
+    assert report.converged
+    assert 0 < report.iterations < args["niter"]
+    assert report.max_residual[-1] < 1e-9 < report.max_residual[0]
+
+
+def test_force_mass_conservation_to_c_bln_avg_report_not_converged():
+    args = _synthetic_c_bln_avg(12, 8)
+    _, report = interpolation_fields._force_mass_conservation_to_c_bln_avg(**{**args, "niter": 3})
+    assert not report.converged
+    assert report.iterations == 2
+    assert "not converged after 2 iterations" in str(report)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("implementation", ["loop", "sparse"])
+def test_force_mass_conservation_to_c_bln_avg_benchmark(benchmark, implementation):
+    # number of cells of R2B5
+    args = {**_synthetic_c_bln_avg(320, 128), "niter": 100}
+    func = (
+        _reference_force_mass_conservation_to_c_bln_avg
+        if implementation == "loop"
+        else interpolation_fields._force_mass_conservation_to_c_bln_avg
+    )
+    benchmark.pedantic(
+        lambda: func(**{**args, "c_bln_avg": args["c_bln_avg"].copy()}),
+        rounds=3,
+    )
+
+
+@pytest.mark.datatest
+@pytest.mark.parametrize("experiment", [dt_utils.REGIONAL_EXPERIMENT, dt_utils.GLOBAL_EXPERIMENT])
+def test_compute_rbf_vec_coeff_c(grid_savepoint, interpolation_savepoint, icon_grid, backend):
+    rbf_vec_coeff_c1_ref = interpolation_savepoint.rbf_vec_coeff_c1()
+    rbf_vec_coeff_c2_ref = interpolation_savepoint.rbf_vec_coeff_c2()
+    if rbf_vec_coeff_c1_ref is None or rbf_vec_coeff_c2_ref is None:
+        pytest.skip("rbf_vec_coeff_c1/2 are not serialized for this experiment")
+    xp = data_alloc.import_array_ns(backend)
+    mean_characteristic_length = grid_savepoint.construct_cell_geometry().characteristic_length
+    horizontal_start = icon_grid.start_index(cell_domain(h_grid.Zone.LATERAL_BOUNDARY_LEVEL_2))
+    rbf_vec_coeff_c1, rbf_vec_coeff_c2 = interpolation_fields.compute_rbf_vec_coeff_c(
+        grid_savepoint.cell_center_lat().ndarray,
+        grid_savepoint.cell_center_lon().ndarray,
+        grid_savepoint.edges_center_lat().ndarray,
+        grid_savepoint.edges_center_lon().ndarray,
+        grid_savepoint.primal_cart_normal_x().ndarray,
+        grid_savepoint.primal_cart_normal_y().ndarray,
+        grid_savepoint.primal_cart_normal_z().ndarray,
+        icon_grid.connectivities[dims.C2E2C2EDim],
+        scale=interpolation_fields.compute_default_rbf_scale(
+            mean_characteristic_length, interpolation_fields.RBFDimension.CELL
+        ),
+        horizontal_start=horizontal_start,
+        array_ns=xp,
+    )
+    assert test_helpers.dallclose(
+        data_alloc.as_numpy(rbf_vec_coeff_c1)[horizontal_start:],
+        rbf_vec_coeff_c1_ref.asnumpy()[horizontal_start:],
+        atol=1e-8,
+    )
+    assert test_helpers.dallclose(
+        data_alloc.as_numpy(rbf_vec_coeff_c2)[horizontal_start:],
+        rbf_vec_coeff_c2_ref.asnumpy()[horizontal_start:],
+        atol=1e-8,
+    )
+
+
+@pytest.mark.datatest
+@pytest.mark.parametrize("experiment", [dt_utils.REGIONAL_EXPERIMENT, dt_utils.GLOBAL_EXPERIMENT])
+def test_compute_rbf_vec_coeff_v(grid_savepoint, interpolation_savepoint, icon_grid, backend):
+    xp = data_alloc.import_array_ns(backend)
+    mean_characteristic_length = grid_savepoint.construct_cell_geometry().characteristic_length
+    horizontal_start = icon_grid.start_index(vertex_domain(h_grid.Zone.LATERAL_BOUNDARY_LEVEL_2))
+    rbf_vec_coeff_v1, rbf_vec_coeff_v2 = interpolation_fields.compute_rbf_vec_coeff_v(
+        grid_savepoint.verts_vertex_lat().ndarray,
+        grid_savepoint.verts_vertex_lon().ndarray,
+        grid_savepoint.edges_center_lat().ndarray,
+        grid_savepoint.edges_center_lon().ndarray,
+        grid_savepoint.primal_cart_normal_x().ndarray,
+        grid_savepoint.primal_cart_normal_y().ndarray,
+        grid_savepoint.primal_cart_normal_z().ndarray,
+        icon_grid.connectivities[dims.V2EDim],
+        scale=interpolation_fields.compute_default_rbf_scale(
+            mean_characteristic_length, interpolation_fields.RBFDimension.VERTEX
+        ),
+        horizontal_start=horizontal_start,
+        array_ns=xp,
+    )
+    assert test_helpers.dallclose(
+        data_alloc.as_numpy(rbf_vec_coeff_v1)[horizontal_start:],
+        interpolation_savepoint.rbf_vec_coeff_v1().asnumpy()[horizontal_start:],
+        atol=1e-8,
+    )
+    assert test_helpers.dallclose(
+        data_alloc.as_numpy(rbf_vec_coeff_v2)[horizontal_start:],
+        interpolation_savepoint.rbf_vec_coeff_v2().asnumpy()[horizontal_start:],
+        atol=1e-8,
+    )
+
+
+@pytest.mark.datatest
+@pytest.mark.parametrize("experiment", [dt_utils.REGIONAL_EXPERIMENT, dt_utils.GLOBAL_EXPERIMENT])
+def test_compute_rbf_vec_coeff_e(grid_savepoint, interpolation_savepoint, icon_grid, backend):
+    xp = data_alloc.import_array_ns(backend)
+    mean_characteristic_length = grid_savepoint.construct_cell_geometry().characteristic_length
+    horizontal_start = icon_grid.start_index(edge_domain(h_grid.Zone.LATERAL_BOUNDARY_LEVEL_2))
+    rbf_vec_coeff_e = interpolation_fields.compute_rbf_vec_coeff_e(
+        grid_savepoint.edges_center_lat().ndarray,
+        grid_savepoint.edges_center_lon().ndarray,
+        grid_savepoint.primal_cart_normal_x().ndarray,
+        grid_savepoint.primal_cart_normal_y().ndarray,
+        grid_savepoint.primal_cart_normal_z().ndarray,
+        grid_savepoint.dual_cart_normal_x().ndarray,
+        grid_savepoint.dual_cart_normal_y().ndarray,
+        grid_savepoint.dual_cart_normal_z().ndarray,
+        icon_grid.connectivities[dims.E2C2EDim],
+        scale=interpolation_fields.compute_default_rbf_scale(
+            mean_characteristic_length, interpolation_fields.RBFDimension.EDGE
+        ),
+        horizontal_start=horizontal_start,
+        array_ns=xp,
+    )
+    assert test_helpers.dallclose(
+        data_alloc.as_numpy(rbf_vec_coeff_e)[horizontal_start:],
+        interpolation_savepoint.rbf_vec_coeff_e().asnumpy()[horizontal_start:],
+        atol=1e-8,
+    )
+
+
+def _rbf_hexagon_stencils(num_vertices: int, edge_distance: float, num_pentagons: int = 0):
+    """
+    Vertices at random positions, each surrounded by six edges at `edge_distance` with normals
+    perpendicular to the direction towards the vertex. The last edge of the first
+    `num_pentagons` vertices is missing.
+    """
+    rng = np.random.default_rng(3)
+    lat = np.arcsin(rng.uniform(-0.9, 0.9, num_vertices))
+    lon = rng.uniform(-np.pi, np.pi, num_vertices)
+    center = interpolation_fields._cartesian_unit_vector(lat, lon, np)
+    east, north = interpolation_fields._zonal_and_meridional_unit_vectors(lat, lon, np)
+    theta = (np.arange(6) * np.pi / 3 + 0.1)[None, :, None]
+    direction = np.cos(theta) * east[:, None] + np.sin(theta) * north[:, None]
+    normal = (-np.sin(theta) * east[:, None] + np.cos(theta) * north[:, None]).reshape(-1, 3)
+    edge_center = (center[:, None] + edge_distance * direction).reshape(-1, 3)
+    edge_center /= np.linalg.norm(edge_center, axis=-1, keepdims=True)
+    v2e = np.arange(6 * num_vertices, dtype=gtx.int32).reshape(num_vertices, 6)
+    v2e[:num_pentagons, 5] = -1
+    return dict(
+        vertex_lat=lat,
+        vertex_lon=lon,
+        edge_lat=np.arcsin(edge_center[:, 2]),
+        edge_lon=np.arctan2(edge_center[:, 1], edge_center[:, 0]),
+        edge_normal_x=normal[:, 0],
+        edge_normal_y=normal[:, 1],
+        edge_normal_z=normal[:, 2],
+        v2e=v2e,
+    )
+
+
+def test_batched_cholesky_solve():
+    rng = np.random.default_rng(0)
+    a = rng.uniform(size=(50, 9, 9))
+    matrix = a @ np.swapaxes(a, 1, 2) + 9 * np.eye(9)
+    rhs = rng.uniform(size=(50, 9, 2))
+    solution = interpolation_fields._batched_cholesky_solve(matrix, rhs, np)
+    assert np.allclose(solution, np.linalg.solve(matrix, rhs), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("horizontal_start", [0, 7])
+def test_compute_rbf_vec_coeff_v_reconstructs_uniform_wind(horizontal_start):
+    args = _rbf_hexagon_stencils(100, edge_distance=3e-4, num_pentagons=10)
+    rbf_vec_coeff_v1, rbf_vec_coeff_v2 = interpolation_fields.compute_rbf_vec_coeff_v(
+        **args, scale=0.5, horizontal_start=horizontal_start, chunk_size=32
+    )
+    edge_normal = np.stack(
+        (args["edge_normal_x"], args["edge_normal_y"], args["edge_normal_z"]), axis=-1
+    )
+    east, north = interpolation_fields._zonal_and_meridional_unit_vectors(
+        args["edge_lat"], args["edge_lon"], np
+    )
+    v2e = args["v2e"]
+    for direction, u_ref, v_ref in ((east, 1.0, 0.0), (north, 0.0, 1.0)):
+        vn = np.where(v2e >= 0, np.sum(direction * edge_normal, axis=-1)[v2e], 0.0)
+        u = np.sum(rbf_vec_coeff_v1 * vn, axis=1)[horizontal_start:]
+        v = np.sum(rbf_vec_coeff_v2 * vn, axis=1)[horizontal_start:]
+        assert np.allclose(u, u_ref, atol=1e-5)
+        assert np.allclose(v, v_ref, atol=1e-5)
+    assert np.all(rbf_vec_coeff_v1[:horizontal_start] == 0.0)
+    assert np.all(rbf_vec_coeff_v1[:10, 5] == 0.0)
+    assert np.all(rbf_vec_coeff_v2[:10, 5] == 0.0)
+
+
+def test_compute_default_rbf_scale():
+    dim = interpolation_fields.RBFDimension
+    assert interpolation_fields.compute_default_rbf_scale(160e3, dim.CELL) == 0.5
+    scales = [
+        interpolation_fields.compute_default_rbf_scale(length, dim.VERTEX)
+        for length in (2e3, 1e3, 100.0)
+    ]
+    assert 0.5 == scales[0] > scales[1] > scales[2] > 0.0
+
+
+@pytest.mark.parametrize("resolution", BENCHMARK_RESOLUTIONS)
+def test_compute_rbf_vec_coeff_v_benchmark(benchmark, resolution):
+    args = _rbf_hexagon_stencils(GRID_SIZES[resolution] // 2, edge_distance=0.01)
+    benchmark.pedantic(
+        interpolation_fields.compute_rbf_vec_coeff_v,
+        kwargs={**args, "scale": 0.5, "horizontal_start": 0},
+        rounds=1,
+    )
@@ -6,6 +6,7 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import numpy as np
 import pytest
 
 import icon4py.model.common.grid.horizontal as h_grid
@@ -29,3 +30,26 @@ def test_compute_coeff_gradekin(icon_grid, grid_savepoint, metrics_savepoint):
         edge_cell_length, inv_dual_edge_length, horizontal_start, horizontal_end
     )
     assert helpers.dallclose(coeff_gradekin_ref.asnumpy(), coeff_gradekin_full)
+
+
+def _reference_compute_coeff_gradekin(
+    edge_cell_length, inv_dual_edge_length, horizontal_start, horizontal_end
+):
+    coeff_gradekin_0 = np.zeros_like(inv_dual_edge_length)
+    coeff_gradekin_1 = np.zeros_like(inv_dual_edge_length)
+    for e in range(horizontal_start, horizontal_end):
+        coeff_gradekin_0[e] = (
+            edge_cell_length[e, 1] / edge_cell_length[e, 0] * inv_dual_edge_length[e]
+        )
+        coeff_gradekin_1[e] = (
+            edge_cell_length[e, 0] / edge_cell_length[e, 1] * inv_dual_edge_length[e]
+        )
+    return np.column_stack((coeff_gradekin_0, coeff_gradekin_1)).reshape(-1)
+
+
+def test_compute_coeff_gradekin_matches_loop_implementation():
+    rng = np.random.default_rng(17)
+    edge_cell_length = rng.uniform(1000.0, 2000.0, size=(3000, 2))
+    inv_dual_edge_length = 1.0 / rng.uniform(2000.0, 4000.0, size=3000)
+    args = (edge_cell_length, inv_dual_edge_length, 120, 2990)
+    assert np.array_equal(compute_coeff_gradekin(*args), _reference_compute_coeff_gradekin(*args))
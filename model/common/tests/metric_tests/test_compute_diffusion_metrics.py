@@ -7,6 +7,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import gt4py.next as gtx
+import numpy as np
 import pytest
 
 import icon4py.model.common.grid.horizontal as h_grid
@@ -24,16 +25,9 @@ from icon4py.model.common.utils import data_allocation as data_alloc
 from icon4py.model.testing import datatest_utils as dt_utils, helpers
 
 
-@pytest.mark.cpu_only
-@pytest.mark.embedded_remap_error
-@pytest.mark.datatest
-@pytest.mark.parametrize("experiment", [dt_utils.REGIONAL_EXPERIMENT, dt_utils.GLOBAL_EXPERIMENT])
-def test_compute_diffusion_metrics(
-    metrics_savepoint, experiment, interpolation_savepoint, icon_grid, grid_savepoint, backend
-):
-    if experiment == dt_utils.GLOBAL_EXPERIMENT:
-        pytest.skip(f"Fields not computed for {experiment}")
-
+def _diffusion_metrics_inputs(
+    metrics_savepoint, interpolation_savepoint, icon_grid, grid_savepoint, backend
+) -> dict:
     maxslp_avg = data_alloc.zero_field(icon_grid, dims.CellDim, dims.KDim, backend=backend)
     maxhgtd_avg = data_alloc.zero_field(icon_grid, dims.CellDim, dims.KDim, backend=backend)
     maxslp = data_alloc.zero_field(icon_grid, dims.CellDim, dims.KDim, backend=backend)
@@ -100,17 +94,34 @@ def test_compute_diffusion_metrics(
         offset_provider={"C2E2C": icon_grid.get_offset_provider("C2E2C")},
     )
 
+    return {
+        "c2e2c": c2e2c,
+        "z_mc": z_mc.asnumpy(),
+        "max_nbhgt": max_nbhgt.asnumpy(),
+        "c_owner_mask": grid_savepoint.c_owner_mask().asnumpy(),
+        "maxslp_avg": maxslp_avg.asnumpy(),
+        "maxhgtd_avg": maxhgtd_avg.asnumpy(),
+        "thslp_zdiffu": thslp_zdiffu,
+        "thhgtd_zdiffu": thhgtd_zdiffu,
+        "cell_nudging": cell_nudging,
+        "nlev": nlev,
+    }
+
+
+@pytest.mark.cpu_only
+@pytest.mark.embedded_remap_error
+@pytest.mark.datatest
+@pytest.mark.parametrize("experiment", [dt_utils.REGIONAL_EXPERIMENT, dt_utils.GLOBAL_EXPERIMENT])
+def test_compute_diffusion_metrics(
+    metrics_savepoint, experiment, interpolation_savepoint, icon_grid, grid_savepoint, backend
+):
+    if experiment == dt_utils.GLOBAL_EXPERIMENT:
+        pytest.skip(f"Fields not computed for {experiment}")
+
     mask_hdiff, zd_diffcoef_dsl, zd_intcoef_dsl, zd_vertoffset_dsl = compute_diffusion_metrics(
-        c2e2c=c2e2c,
-        z_mc=z_mc.asnumpy(),
-        max_nbhgt=max_nbhgt.asnumpy(),
-        c_owner_mask=grid_savepoint.c_owner_mask().asnumpy(),
-        maxslp_avg=maxslp_avg.asnumpy(),
-        maxhgtd_avg=maxhgtd_avg.asnumpy(),
-        thslp_zdiffu=thslp_zdiffu,
-        thhgtd_zdiffu=thhgtd_zdiffu,
-        cell_nudging=cell_nudging,
-        nlev=nlev,
+        **_diffusion_metrics_inputs(
+            metrics_savepoint, interpolation_savepoint, icon_grid, grid_savepoint, backend
+        )
     )
     assert helpers.dallclose(mask_hdiff, metrics_savepoint.mask_hdiff().asnumpy())
     assert helpers.dallclose(
@@ -118,3 +129,273 @@ def test_compute_diffusion_metrics(
     )
     assert helpers.dallclose(zd_vertoffset_dsl, metrics_savepoint.zd_vertoffset().asnumpy())
     assert helpers.dallclose(zd_intcoef_dsl, metrics_savepoint.zd_intcoef().asnumpy())
+
+
+def _synthetic_diffusion_inputs(num_cells: int, nlev: int, seed: int = 7):
+    """Terrain following levels over random topography, with random cell neighbours."""
+    rng = np.random.default_rng(seed)
+    topography = rng.uniform(0.0, 2500.0, num_cells)
+    z_flat = np.linspace(20000.0, 0.0, nlev + 1)
+    z_ifc = z_flat[None, :] + topography[:, None] * np.maximum(1.0 - z_flat / 12000.0, 0.0)
+    z_mc = 0.5 * (z_ifc[:, :-1] + z_ifc[:, 1:])
+    c2e2c = rng.integers(0, num_cells, (num_cells, 3))
+    slope = rng.uniform(0.0, 0.1, num_cells)
+    decay = np.linspace(0.0, 1.0, nlev) ** 2
+    return {
+        "c2e2c": c2e2c,
+        "z_mc": z_mc,
+        "max_nbhgt": np.max(z_mc[c2e2c, nlev - 1], axis=1),
+        "c_owner_mask": rng.uniform(size=num_cells) < 0.9,
+        "maxslp_avg": slope[:, None] * decay[None, :],
+        "maxhgtd_avg": 10.0 * topography[:, None] * decay[None, :] * slope[:, None],
+        "thslp_zdiffu": 0.02,
+        "thhgtd_zdiffu": 125.0,
+        "cell_nudging": num_cells // 10,
+        "nlev": nlev,
+    }
+
+
+# loop implementation replaced by the vectorized compute_diffusion_metrics
+def _reference_nbidx(
+    k_range: range,
+    z_mc: np.ndarray,
+    z_mc_off: np.ndarray,
+    nbidx: np.ndarray,
+    jc: int,
+    nlev: int,
+) -> np.ndarray:
+    for ind in range(3):
+        jk_start = nlev - 1
+        for jk in reversed(k_range):
+            for jk1 in reversed(range(jk_start)):
+                if (
+                    z_mc[jc, jk] <= z_mc_off[jc, ind, jk1]
+                    and z_mc[jc, jk] >= z_mc_off[jc, ind, jk1 + 1]
+                ):
+                    nbidx[jc, ind, jk] = jk1
+                    jk_start = jk1 + 1
+                    break
+
+    return nbidx[jc, :, :]
+
+
+def _reference_z_vintcoeff(
+    k_range: range,
+    z_mc: np.ndarray,
+    z_mc_off: np.ndarray,
+    z_vintcoeff: np.ndarray,
+    jc: int,
+    nlev: int,
+) -> np.ndarray:
+    for ind in range(3):
+        jk_start = nlev - 1
+        for jk in reversed(k_range):
+            for jk1 in reversed(range(jk_start)):
+                if (
+                    z_mc[jc, jk] <= z_mc_off[jc, ind, jk1]
+                    and z_mc[jc, jk] >= z_mc_off[jc, ind, jk1 + 1]
+                ):
+                    z_vintcoeff[jc, ind, jk] = (z_mc[jc, jk] - z_mc_off[jc, ind, jk1 + 1]) / (
+                        z_mc_off[jc, ind, jk1] - z_mc_off[jc, ind, jk1 + 1]
+                    )
+                    jk_start = jk1 + 1
+                    break
+
+    return z_vintcoeff[jc, :, :]
+
+
+def _reference_ls_params(
+    k_start: list,
+    k_end: list,
+    maxslp_avg: np.ndarray,
+    maxhgtd_avg: np.ndarray,
+    c_owner_mask: np.ndarray,
+    thslp_zdiffu: float,
+    thhgtd_zdiffu: float,
+    cell_nudging: int,
+    n_cells: int,
+    nlev: int,
+) -> tuple[list, int, int]:
+    indlist = [0] * n_cells
+    listreduce = 0
+    ji = -1
+    ji_ind = -1
+
+    for jc in range(cell_nudging, n_cells):
+        if (
+            maxslp_avg[jc, nlev - 1] >= thslp_zdiffu or maxhgtd_avg[jc, nlev - 1] >= thhgtd_zdiffu
+        ) and c_owner_mask[jc]:
+            ji += 1
+            indlist[ji] = jc
+
+            if all((k_start[jc], k_end[jc])) and k_start[jc] > k_end[jc]:
+                listreduce += 1
+            else:
+                ji_ind += 1
+                indlist[ji_ind] = jc
+
+    return indlist, listreduce, ji
+
+
+def _reference_k_start_end(
+    z_mc: np.ndarray,
+    max_nbhgt: np.ndarray,
+    maxslp_avg: np.ndarray,
+    maxhgtd_avg: np.ndarray,
+    c_owner_mask: np.ndarray,
+    thslp_zdiffu: float,
+    thhgtd_zdiffu: float,
+    cell_nudging: int,
+    n_cells: int,
+    nlev: int,
+) -> tuple[list, list]:
+    k_start = [None] * n_cells
+    k_end = [None] * n_cells
+    for jc in range(cell_nudging, n_cells):
+        if (
+            maxslp_avg[jc, nlev - 1] >= thslp_zdiffu or maxhgtd_avg[jc, nlev - 1] >= thhgtd_zdiffu
+        ) and c_owner_mask[jc]:
+            for jk in reversed(range(nlev)):
+                if z_mc[jc, jk] >= max_nbhgt[jc]:
+                    k_end[jc] = jk + 1
+                    break
+
+            for jk in range(nlev):
+                if maxslp_avg[jc, jk] >= thslp_zdiffu or maxhgtd_avg[jc, jk] >= thhgtd_zdiffu:
+                    k_start[jc] = jk
+                    break
+
+            if all((k_start[jc], k_end[jc])) and k_start[jc] > k_end[jc]:
+                k_start[jc] = nlev - 1
+
+    return k_start, k_end
+
+
+def _reference_diffusion_metrics(
+    c2e2c: np.ndarray,
+    z_mc: np.ndarray,
+    max_nbhgt: np.ndarray,
+    c_owner_mask: np.ndarray,
+    maxslp_avg: np.ndarray,
+    maxhgtd_avg: np.ndarray,
+    thslp_zdiffu: float,
+    thhgtd_zdiffu: float,
+    cell_nudging: int,
+    nlev: int,
+    array_ns=np,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    n_cells = c2e2c.shape[0]
+    n_c2e2c = c2e2c.shape[1]
+    z_mc_off = z_mc[c2e2c]
+    nbidx = array_ns.ones(shape=(n_cells, n_c2e2c, nlev), dtype=int)
+    z_vintcoeff = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
+    mask_hdiff = array_ns.zeros(shape=(n_cells, nlev), dtype=bool)
+    zd_vertoffset_dsl = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
+    zd_intcoef_dsl = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
+    zd_diffcoef_dsl = array_ns.zeros(shape=(n_cells, nlev))
+    k_start, k_end = _reference_k_start_end(
+        z_mc=z_mc,
+        max_nbhgt=max_nbhgt,
+        maxslp_avg=maxslp_avg,
+        maxhgtd_avg=maxhgtd_avg,
+        c_owner_mask=c_owner_mask,
+        thslp_zdiffu=thslp_zdiffu,
+        thhgtd_zdiffu=thhgtd_zdiffu,
+        cell_nudging=cell_nudging,
+        n_cells=n_cells,
+        nlev=nlev,
+    )
+
+    indlist, listreduce, ji = _reference_ls_params(
+        k_start=k_start,
+        k_end=k_end,
+        maxslp_avg=maxslp_avg,
+        maxhgtd_avg=maxhgtd_avg,
+        c_owner_mask=c_owner_mask,
+        thslp_zdiffu=thslp_zdiffu,
+        thhgtd_zdiffu=thhgtd_zdiffu,
+        cell_nudging=cell_nudging,
+        n_cells=n_cells,
+        nlev=nlev,
+    )
+
+    listdim = ji - listreduce
+
+    for ji in range(listdim):
+        jc = indlist[ji]
+        k_range = range(k_start[jc], k_end[jc])
+        if all((k_range)):
+            nbidx[jc, :, :] = _reference_nbidx(k_range, z_mc, z_mc_off, nbidx, jc, nlev)
+            z_vintcoeff[jc, :, :] = _reference_z_vintcoeff(
+                k_range, z_mc, z_mc_off, z_vintcoeff, jc, nlev
+            )
+
+            zd_intcoef_dsl[jc, :, k_range] = z_vintcoeff[jc, :, k_range]
+            zd_vertoffset_dsl[jc, :, k_range] = nbidx[jc, :, k_range] - array_ns.transpose(
+                [k_range] * 3
+            )
+            mask_hdiff[jc, k_range] = True
+
+            zd_diffcoef_dsl_var = array_ns.maximum(
+                0.0,
+                array_ns.maximum(
+                    array_ns.sqrt(array_ns.maximum(0.0, maxslp_avg[jc, k_range] - thslp_zdiffu))
+                    / 250.0,
+                    2.0e-4
+                    * array_ns.sqrt(
+                        array_ns.maximum(0.0, maxhgtd_avg[jc, k_range] - thhgtd_zdiffu)
+                    ),
+                ),
+            )
+            zd_diffcoef_dsl[jc, k_range] = array_ns.minimum(0.002, zd_diffcoef_dsl_var)
+
+    # flatten first two dims:
+    zd_intcoef_dsl = zd_intcoef_dsl.reshape(
+        (zd_intcoef_dsl.shape[0] * zd_intcoef_dsl.shape[1],) + zd_intcoef_dsl.shape[2:]
+    )
+    zd_vertoffset_dsl = zd_vertoffset_dsl.reshape(
+        (zd_vertoffset_dsl.shape[0] * zd_vertoffset_dsl.shape[1],) + zd_vertoffset_dsl.shape[2:]
+    )
+
+    return mask_hdiff, zd_diffcoef_dsl, zd_intcoef_dsl, zd_vertoffset_dsl
+
+
+def test_compute_diffusion_metrics_matches_loop_implementation():
+    args = _synthetic_diffusion_inputs(num_cells=400, nlev=30)
+    reference = _reference_diffusion_metrics(**args)
+    result = compute_diffusion_metrics(**args)
+    assert np.count_nonzero(reference[0]) > 0
+    for computed, expected in zip(result, reference, strict=True):
+        assert computed.dtype == expected.dtype
+        assert np.array_equal(computed, expected)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("implementation", ["loop", "vectorized"])
+def test_compute_diffusion_metrics_benchmark(benchmark, implementation):
+    args = _synthetic_diffusion_inputs(num_cells=4000, nlev=65)
+    func = _reference_diffusion_metrics if implementation == "loop" else compute_diffusion_metrics
+    benchmark.pedantic(func, kwargs=args, rounds=1 if implementation == "loop" else 5)
+
+
+@pytest.mark.slow
+@pytest.mark.cpu_only
+@pytest.mark.embedded_remap_error
+@pytest.mark.datatest
+@pytest.mark.parametrize("experiment", [dt_utils.REGIONAL_EXPERIMENT, dt_utils.GLOBAL_EXPERIMENT])
+@pytest.mark.parametrize("implementation", ["loop", "vectorized"])
+def test_compute_diffusion_metrics_grid_benchmark(
+    metrics_savepoint,
+    experiment,
+    interpolation_savepoint,
+    icon_grid,
+    grid_savepoint,
+    backend,
+    benchmark,
+    implementation,
+):
+    args = _diffusion_metrics_inputs(
+        metrics_savepoint, interpolation_savepoint, icon_grid, grid_savepoint, backend
+    )
+    func = _reference_diffusion_metrics if implementation == "loop" else compute_diffusion_metrics
+    benchmark.pedantic(func, kwargs=args, rounds=1 if implementation == "loop" else 5)
@@ -0,0 +1,78 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import gt4py.next as gtx
+import numpy as np
+import pytest
+
+from icon4py.model.common.metrics.compute_flat_idx_max import compute_flat_idx_max
+
+
+def _reference_compute_flat_idx_max(
+    e2c,
+    z_mc,
+    c_lin_e,
+    z_ifc,
+    k_lev,
+    horizontal_lower,
+    horizontal_upper,
+):
+    z_me = np.sum(z_mc[e2c] * np.expand_dims(c_lin_e, axis=-1), axis=1)
+    z_ifc_e_0 = z_ifc[e2c[:, 0]]
+    z_ifc_e_k_0 = np.roll(z_ifc_e_0, -1, axis=1)
+    z_ifc_e_1 = z_ifc[e2c[:, 1]]
+    z_ifc_e_k_1 = np.roll(z_ifc_e_1, -1, axis=1)
+    flat_idx = np.zeros_like(z_me)
+    for je in range(horizontal_lower, horizontal_upper):
+        for jk in range(k_lev.shape[0] - 1):
+            if (
+                (z_me[je, jk] <= z_ifc_e_0[je, jk])
+                and (z_me[je, jk] >= z_ifc_e_k_0[je, jk])
+                and (z_me[je, jk] <= z_ifc_e_1[je, jk])
+                and (z_me[je, jk] >= z_ifc_e_k_1[je, jk])
+            ):
+                flat_idx[je, jk] = k_lev[jk]
+    flat_idx_max = np.amax(flat_idx, axis=1)
+    return flat_idx_max.astype(gtx.int32)
+
+
+def _synthetic_flat_idx_max_inputs(num_cells: int, nlev: int, seed: int = 5) -> dict:
+    rng = np.random.default_rng(seed)
+    num_edges = 3 * num_cells // 2
+    vct_a = np.linspace(20000.0, 0.0, nlev + 1)
+    # terrain following levels which become flat above 12 km
+    decay = np.clip(1.0 - vct_a / 12000.0, 0.0, None)
+    topography = rng.uniform(0.0, 3000.0, size=num_cells)
+    z_ifc = vct_a[None, :] + topography[:, None] * decay[None, :]
+    return dict(
+        e2c=rng.integers(0, num_cells, size=(num_edges, 2)),
+        z_mc=0.5 * (z_ifc[:, :-1] + z_ifc[:, 1:]),
+        c_lin_e=np.full((num_edges, 2), 0.5)
+        + rng.uniform(-0.1, 0.1, size=(num_edges, 1)) * [1, -1],
+        z_ifc=z_ifc,
+        k_lev=np.arange(nlev + 1, dtype=gtx.int32),
+        horizontal_lower=num_edges // 10,
+        horizontal_upper=num_edges - 7,
+    )
+
+
+def test_compute_flat_idx_max_matches_loop_implementation():
+    args = _synthetic_flat_idx_max_inputs(1000, 65)
+    reference = _reference_compute_flat_idx_max(**args)
+    flat_idx_max = compute_flat_idx_max(**args)
+    assert flat_idx_max.dtype == reference.dtype
+    assert np.array_equal(flat_idx_max, reference)
+    assert np.unique(reference).shape[0] > 2
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("implementation", ["loop", "vectorized"])
+def test_compute_flat_idx_max_benchmark(benchmark, implementation):
+    args = _synthetic_flat_idx_max_inputs(20480, 65)
+    func = _reference_compute_flat_idx_max if implementation == "loop" else compute_flat_idx_max
+    benchmark.pedantic(func, kwargs=args, rounds=1 if implementation == "loop" else 5)
@@ -0,0 +1,96 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from icon4py.model.common.metrics.compute_vwind_impl_wgt import compute_vwind_impl_wgt
+
+
+def _reference_compute_vwind_impl_wgt(
+    c2e,
+    vct_a,
+    z_ifc,
+    z_ddxn_z_half_e,
+    z_ddxt_z_half_e,
+    dual_edge_length,
+    vwind_offctr,
+    nlev,
+    horizontal_start_cell,
+    n_cells,
+):
+    init_val = 0.5 + vwind_offctr
+    vwind_impl_wgt = np.full(z_ifc.shape[0], init_val)
+    for je in range(horizontal_start_cell, n_cells):
+        zn_off_0 = z_ddxn_z_half_e[c2e[je, 0], nlev]
+        zn_off_1 = z_ddxn_z_half_e[c2e[je, 1], nlev]
+        zn_off_2 = z_ddxn_z_half_e[c2e[je, 2], nlev]
+        zt_off_0 = z_ddxt_z_half_e[c2e[je, 0], nlev]
+        zt_off_1 = z_ddxt_z_half_e[c2e[je, 1], nlev]
+        zt_off_2 = z_ddxt_z_half_e[c2e[je, 2], nlev]
+        z_maxslope = max(
+            abs(zn_off_0), abs(zt_off_0), abs(zn_off_1), abs(zt_off_1), abs(zn_off_2), abs(zt_off_2)
+        )
+        z_diff = max(
+            abs(zn_off_0 * dual_edge_length[c2e[je, 0]]),
+            abs(zn_off_1 * dual_edge_length[c2e[je, 1]]),
+            abs(zn_off_2 * dual_edge_length[c2e[je, 2]]),
+        )
+
+        z_offctr = max(
+            vwind_offctr, 0.425 * z_maxslope ** (0.75), min(0.25, 0.00025 * (z_diff - 250.0))
+        )
+        z_offctr = min(max(vwind_offctr, 0.75), z_offctr)
+        vwind_impl_wgt[je] = 0.5 + z_offctr
+
+    for jk in range(max(9, nlev - 9), nlev):
+        for je in range(horizontal_start_cell, n_cells):
+            z_diff_2 = (z_ifc[je, jk] - z_ifc[je, jk + 1]) / (vct_a[jk] - vct_a[jk + 1])
+            if z_diff_2 < 0.6:
+                vwind_impl_wgt[je] = max(vwind_impl_wgt[je], 1.2 - z_diff_2)
+    return vwind_impl_wgt
+
+
+def _synthetic_vwind_impl_wgt_inputs(num_cells: int, nlev: int, seed: int = 11) -> dict:
+    rng = np.random.default_rng(seed)
+    num_edges = 3 * num_cells // 2
+    vct_a = np.linspace(20000.0, 0.0, nlev + 1)
+    # thin near surface layers in some cells trigger the increase of the off centering
+    thickness = (vct_a[:-1] - vct_a[1:]) * rng.uniform(0.3, 1.2, size=(num_cells, nlev))
+    z_ifc = np.concatenate(
+        (np.cumsum(thickness[:, ::-1], axis=1)[:, ::-1], np.zeros((num_cells, 1))), axis=1
+    )
+    return dict(
+        c2e=rng.integers(0, num_edges, size=(num_cells, 3)),
+        vct_a=vct_a,
+        z_ifc=z_ifc,
+        z_ddxn_z_half_e=rng.normal(scale=0.2, size=(num_edges, nlev + 1)),
+        z_ddxt_z_half_e=rng.normal(scale=0.2, size=(num_edges, nlev + 1)),
+        dual_edge_length=rng.uniform(1000.0, 5000.0, size=num_edges),
+        vwind_offctr=0.15,
+        nlev=nlev,
+        horizontal_start_cell=num_cells // 10,
+        n_cells=num_cells,
+    )
+
+
+# with 5 levels the range of lowest levels checked for thin layers is empty
+@pytest.mark.parametrize("nlev", [5, 65])
+def test_compute_vwind_impl_wgt_matches_loop_implementation(nlev):
+    args = _synthetic_vwind_impl_wgt_inputs(300, nlev)
+    reference = _reference_compute_vwind_impl_wgt(**args)
+    # the vectorized power differs from the scalar one in the last bit
+    np.testing.assert_array_max_ulp(compute_vwind_impl_wgt(**args), reference, maxulp=1)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("implementation", ["loop", "vectorized"])
+def test_compute_vwind_impl_wgt_benchmark(benchmark, implementation):
+    args = _synthetic_vwind_impl_wgt_inputs(20480, 65)
+    func = _reference_compute_vwind_impl_wgt if implementation == "loop" else compute_vwind_impl_wgt
+    benchmark.pedantic(func, kwargs=args, rounds=1 if implementation == "loop" else 5)
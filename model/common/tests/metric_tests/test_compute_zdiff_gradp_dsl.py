@@ -6,6 +6,7 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 import gt4py.next as gtx
+import numpy as np
 import pytest
 
 import icon4py.model.common.grid.horizontal as h_grid
@@ -78,3 +79,111 @@ def test_compute_zdiff_gradp_dsl(
         atol=1e-10,
         rtol=1.0e-9,
     )
+
+
+def _reference_zdiff_gradp_dsl(
+    e2c, z_mc, c_lin_e, z_ifc, flat_idx, z_ifc_sliced, nlev, horizontal_start, horizontal_start_1
+):
+    """Loop implementation the vectorized compute_zdiff_gradp_dsl replaced."""
+    nedges = e2c.shape[0]
+    z_me = np.sum(z_mc[e2c] * np.expand_dims(c_lin_e, axis=-1), axis=1)
+    z_aux1 = np.maximum(z_ifc_sliced[e2c[:, 0]], z_ifc_sliced[e2c[:, 1]])
+    z_aux2 = z_aux1 - 5.0
+    zdiff_gradp = np.zeros_like(z_mc[e2c])
+    zdiff_gradp[horizontal_start:, :, :] = (
+        np.expand_dims(z_me, axis=1)[horizontal_start:, :, :] - z_mc[e2c][horizontal_start:, :, :]
+    )
+
+    for je in range(horizontal_start, nedges):
+        for jk in range(int(flat_idx[je]) + 1, nlev):
+            param = np.zeros((nlev,), dtype=bool)
+            for jk1 in range(int(flat_idx[je]), nlev):
+                if jk1 == nlev - 1 or (
+                    z_me[je, jk] <= z_ifc[e2c[je, 0], jk1]
+                    and z_me[je, jk] >= z_ifc[e2c[je, 0], jk1 + 1]
+                ):
+                    param[jk1] = True
+
+            zdiff_gradp[je, 0, jk] = z_me[je, jk] - z_mc[e2c[je, 0], np.where(param)[0][0]]
+
+        jk_start = int(flat_idx[je])
+        for jk in range(int(flat_idx[je]) + 1, nlev):
+            for jk1 in range(jk_start, nlev):
+                if jk1 == nlev - 1 or (
+                    z_me[je, jk] <= z_ifc[e2c[je, 1], jk1]
+                    and z_me[je, jk] >= z_ifc[e2c[je, 1], jk1 + 1]
+                ):
+                    zdiff_gradp[je, 1, jk] = z_me[je, jk] - z_mc[e2c[je, 1], jk1]
+                    jk_start = jk1
+                    break
+
+    for je in range(horizontal_start_1, nedges):
+        jk_start = int(flat_idx[je])
+        for jk in range(int(flat_idx[je]) + 1, nlev):
+            if z_me[je, jk] < z_aux2[je]:
+                for jk1 in range(jk_start, nlev):
+                    if jk1 == nlev - 1 or (
+                        z_aux2[je] <= z_ifc[e2c[je, 0], jk1]
+                        and z_aux2[je] >= z_ifc[e2c[je, 0], jk1 + 1]
+                    ):
+                        zdiff_gradp[je, 0, jk] = z_aux2[je] - z_mc[e2c[je, 0], jk1]
+                        jk_start = jk1
+                        break
+
+        jk_start = int(flat_idx[je])
+        for jk in range(int(flat_idx[je]) + 1, nlev):
+            if z_me[je, jk] < z_aux2[je]:
+                for jk1 in range(jk_start, nlev):
+                    if jk1 == nlev - 1 or (
+                        z_aux2[je] <= z_ifc[e2c[je, 1], jk1]
+                        and z_aux2[je] >= z_ifc[e2c[je, 1], jk1 + 1]
+                    ):
+                        zdiff_gradp[je, 1, jk] = z_aux2[je] - z_mc[e2c[je, 1], jk1]
+                        jk_start = jk1
+                        break
+
+    return zdiff_gradp.reshape((-1,) + zdiff_gradp.shape[2:])
+
+
+def _synthetic_metrics(num_cells: int, num_edges: int, nlev: int, seed: int = 42):
+    """Terrain following levels over random topography, with edges between random cells."""
+    rng = np.random.default_rng(seed)
+    topography = rng.uniform(0.0, 3000.0, num_cells)
+    z_flat = np.linspace(20000.0, 0.0, nlev + 1)
+    decay = np.maximum(1.0 - z_flat / 12000.0, 0.0)
+    z_ifc = z_flat[None, :] + topography[:, None] * decay[None, :]
+    z_mc = 0.5 * (z_ifc[:, :-1] + z_ifc[:, 1:])
+    e2c = rng.integers(0, num_cells, (num_edges, 2))
+    c_lin_e = rng.uniform(0.2, 0.8, (num_edges, 1))
+    c_lin_e = np.concatenate((c_lin_e, 1.0 - c_lin_e), axis=1)
+    flat_idx = np.full(num_edges, np.searchsorted(-z_flat, -12000.0) - 1) + rng.integers(
+        -1, 2, num_edges
+    )
+    return {
+        "e2c": e2c,
+        "z_mc": z_mc,
+        "c_lin_e": c_lin_e,
+        "z_ifc": z_ifc,
+        "flat_idx": flat_idx,
+        "z_ifc_sliced": z_ifc[:, nlev],
+        "nlev": nlev,
+        "horizontal_start": num_edges // 10,
+        "horizontal_start_1": num_edges // 5,
+    }
+
+
+def test_compute_zdiff_gradp_dsl_matches_loop_implementation():
+    args = _synthetic_metrics(num_cells=200, num_edges=300, nlev=30)
+    # include edges whose neighbours share interface heights (exact boundary hits)
+    args["z_ifc"][1] = args["z_ifc"][0]
+    args["e2c"][-20:] = [0, 1]
+    reference = _reference_zdiff_gradp_dsl(**args)
+    assert dallclose(compute_zdiff_gradp_dsl(**args), reference, atol=0.0, rtol=0.0)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("implementation", ["loop", "vectorized"])
+def test_compute_zdiff_gradp_dsl_benchmark(benchmark, implementation):
+    args = _synthetic_metrics(num_cells=1000, num_edges=1500, nlev=65)
+    func = _reference_zdiff_gradp_dsl if implementation == "loop" else compute_zdiff_gradp_dsl
+    benchmark.pedantic(func, kwargs=args, rounds=1 if implementation == "loop" else 5)
@@ -15,6 +15,7 @@ from icon4py.model.common.metrics import (
     metrics_attributes as attrs,
     metrics_factory,
 )
+from icon4py.model.common.states import factory as states_factory
 from icon4py.model.testing import (
     datatest_utils as dt_utils,
     grid_utils as gridtest_utils,
@@ -68,56 +69,64 @@ def get_metrics_factory(
     factory = metrics_factories.get(name)
 
     if not factory:
-        geometry = gridtest_utils.get_grid_geometry(backend, experiment, grid_file)
-        (
-            lowest_layer_thickness,
-            model_top_height,
-            stretch_factor,
-            damping_height,
-            rayleigh_coeff,
-            exner_expol,
-            vwind_offctr,
-            rayleigh_type,
-        ) = metrics_config(experiment)
-
-        vertical_config = v_grid.VerticalGridConfig(
-            geometry.grid.num_levels,
-            lowest_layer_thickness=lowest_layer_thickness,
-            model_top_height=model_top_height,
-            stretch_factor=stretch_factor,
-            rayleigh_damping_height=damping_height,
-        )
-        vertical_grid = v_grid.VerticalGrid(
-            vertical_config, grid_savepoint.vct_a(), grid_savepoint.vct_b()
-        )
-        interpolation_fact = interpolation_factory.InterpolationFieldsFactory(
-            grid=geometry.grid,
-            decomposition_info=geometry._decomposition_info,
-            geometry_source=geometry,
-            backend=backend,
-            metadata=interpolation_attributes.attrs,
-        )
-        factory = metrics_factory.MetricsFieldsFactory(
-            grid=geometry.grid,
-            vertical_grid=vertical_grid,
-            decomposition_info=geometry._decomposition_info,
-            geometry_source=geometry,
-            interpolation_source=interpolation_fact,
-            backend=backend,
-            metadata=attrs.attrs,
-            interface_model_height=metrics_savepoint.z_ifc(),
-            e_refin_ctrl=grid_savepoint.refin_ctrl(dims.EdgeDim),
-            c_refin_ctrl=grid_savepoint.refin_ctrl(dims.CellDim),
-            damping_height=damping_height,
-            rayleigh_type=rayleigh_type,
-            rayleigh_coeff=rayleigh_coeff,
-            exner_expol=exner_expol,
-            vwind_offctr=vwind_offctr,
+        factory = create_metrics_factory(
+            backend, experiment, grid_file, grid_savepoint, metrics_savepoint
         )
         metrics_factories[name] = factory
     return factory
 
 
+def create_metrics_factory(
+    backend, experiment, grid_file, grid_savepoint, metrics_savepoint
+) -> metrics_factory.MetricsFieldsFactory:
+    geometry = gridtest_utils.get_grid_geometry(backend, experiment, grid_file)
+    (
+        lowest_layer_thickness,
+        model_top_height,
+        stretch_factor,
+        damping_height,
+        rayleigh_coeff,
+        exner_expol,
+        vwind_offctr,
+        rayleigh_type,
+    ) = metrics_config(experiment)
+
+    vertical_config = v_grid.VerticalGridConfig(
+        geometry.grid.num_levels,
+        lowest_layer_thickness=lowest_layer_thickness,
+        model_top_height=model_top_height,
+        stretch_factor=stretch_factor,
+        rayleigh_damping_height=damping_height,
+    )
+    vertical_grid = v_grid.VerticalGrid(
+        vertical_config, grid_savepoint.vct_a(), grid_savepoint.vct_b()
+    )
+    interpolation_fact = interpolation_factory.InterpolationFieldsFactory(
+        grid=geometry.grid,
+        decomposition_info=geometry._decomposition_info,
+        geometry_source=geometry,
+        backend=backend,
+        metadata=interpolation_attributes.attrs,
+    )
+    return metrics_factory.MetricsFieldsFactory(
+        grid=geometry.grid,
+        vertical_grid=vertical_grid,
+        decomposition_info=geometry._decomposition_info,
+        geometry_source=geometry,
+        interpolation_source=interpolation_fact,
+        backend=backend,
+        metadata=attrs.attrs,
+        interface_model_height=metrics_savepoint.z_ifc(),
+        e_refin_ctrl=grid_savepoint.refin_ctrl(dims.EdgeDim),
+        c_refin_ctrl=grid_savepoint.refin_ctrl(dims.CellDim),
+        damping_height=damping_height,
+        rayleigh_type=rayleigh_type,
+        rayleigh_coeff=rayleigh_coeff,
+        exner_expol=exner_expol,
+        vwind_offctr=vwind_offctr,
+    )
+
+
 @pytest.mark.parametrize(
     "grid_file, experiment",
     [
@@ -549,3 +558,72 @@ def test_factory_diffusion(grid_savepoint, metrics_savepoint, grid_file, experim
     assert test_helpers.dallclose(field_ref_2.asnumpy(), field_2.asnumpy(), rtol=1.0e-4)
     assert test_helpers.dallclose(field_ref_3.asnumpy(), field_3.asnumpy())
     assert test_helpers.dallclose(field_ref_4.asnumpy(), field_4.asnumpy())
+
+
+@pytest.mark.parametrize(
+    "grid_file, experiment",
+    [
+        (dt_utils.REGIONAL_EXPERIMENT, dt_utils.REGIONAL_EXPERIMENT),
+        (dt_utils.R02B04_GLOBAL, dt_utils.GLOBAL_EXPERIMENT),
+    ],
+)
+@pytest.mark.datatest
+def test_factory_eviction_reduces_peak_memory(
+    grid_savepoint, metrics_savepoint, grid_file, experiment, backend
+):
+    outputs = [
+        attrs.ZD_INTCOEF_DSL,
+        attrs.ZD_DIFFCOEF_DSL,
+        attrs.MASK_HDIFF,
+        attrs.ZDIFF_GRADP,
+        attrs.COEFF_GRADEKIN,
+        attrs.VWIND_IMPL_WGT,
+        attrs.INV_DDQZ_Z_FULL,
+    ]
+    peak_bytes = {}
+    for evict in (False, True):
+        factory = create_metrics_factory(
+            backend, experiment, grid_file, grid_savepoint, metrics_savepoint
+        )
+        eviction = states_factory.FieldEviction(evict=evict)
+        factory.set_eviction(eviction)
+        factory.materialize(outputs, max_workers=1)
+        peak_bytes[evict] = eviction.peak_bytes
+    assert 0 < peak_bytes[True] < peak_bytes[False]
+    assert test_helpers.dallclose(
+        factory.get(attrs.INV_DDQZ_Z_FULL).asnumpy(), metrics_savepoint.inv_ddqz_z_full().asnumpy()
+    )
+
+
+@pytest.mark.parametrize(
+    "grid_file, experiment",
+    [
+        (dt_utils.REGIONAL_EXPERIMENT, dt_utils.REGIONAL_EXPERIMENT),
+        (dt_utils.R02B04_GLOBAL, dt_utils.GLOBAL_EXPERIMENT),
+    ],
+)
+@pytest.mark.datatest
+def test_factory_startup_benchmark(
+    grid_savepoint, metrics_savepoint, grid_file, experiment, backend, benchmark
+):
+    outputs = [
+        attrs.VWIND_IMPL_WGT,
+        attrs.FLAT_IDX_MAX,
+        attrs.COEFF_GRADEKIN,
+        attrs.ZDIFF_GRADP,
+        attrs.ZD_INTCOEF_DSL,
+        attrs.ZD_DIFFCOEF_DSL,
+        attrs.MASK_HDIFF,
+    ]
+
+    def startup():
+        factory = create_metrics_factory(
+            backend, experiment, grid_file, grid_savepoint, metrics_savepoint
+        )
+        factory.materialize(outputs, max_workers=1)
+        return factory
+
+    factory = benchmark.pedantic(startup, rounds=1)
+    assert test_helpers.dallclose(
+        factory.get(attrs.VWIND_IMPL_WGT).asnumpy(), metrics_savepoint.vwind_impl_wgt().asnumpy()
+    )
@@ -6,13 +6,19 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import functools
+import importlib
+import json
+import sys
+import threading
 from typing import Optional
 
 import gt4py.next as gtx
+import numpy as np
 import pytest
 
 from icon4py.model.common import dimension as dims, utils as common_utils
-from icon4py.model.common.grid import horizontal as h_grid, icon, vertical as v_grid
+from icon4py.model.common.grid import horizontal as h_grid, icon, simple, vertical as v_grid
 from icon4py.model.common.math import helpers as math_helpers
 from icon4py.model.common.metrics import metric_fields as metrics
 from icon4py.model.common.states import factory, model, utils as state_utils
@@ -236,3 +242,337 @@ def test_composite_field_source_raises_upon_get_unknown_field(
     with pytest.raises(ValueError) as err:
         composite.get("alice")
         assert "not provided by source " in err.value
+
+
+def _scaled_sum(a: data_alloc.NDArray, b: data_alloc.NDArray, factor: float) -> data_alloc.NDArray:
+    _scaled_sum.calls += 1
+    return factor * (a + b)
+
+
+def _cached_source(grid, a, b, factor, cache):
+    source = SimpleFieldSource(
+        data_={
+            "a": (a, {"standard_name": "a", "units": ""}),
+            "b": (b, {"standard_name": "b", "units": ""}),
+        },
+        backend=None,
+        grid=grid,
+    )
+    source.register_provider(
+        factory.NumpyFieldsProvider(
+            func=_scaled_sum,
+            domain=(dims.CellDim, dims.KDim),
+            fields=("c",),
+            deps={"a": "a", "b": "b"},
+            params={"factor": factor},
+        )
+    )
+    source.set_cache(cache)
+    return source
+
+
+def test_field_cache_skips_computation_on_hit(tmp_path):
+    grid = simple.SimpleGrid()
+    a = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    b = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    cache = factory.FieldCache(tmp_path)
+    _scaled_sum.calls = 0
+
+    computed = _cached_source(grid, a, b, 2.0, cache).get("c").asnumpy()
+    assert _scaled_sum.calls == 1
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    loaded = _cached_source(grid, a, b, 2.0, factory.FieldCache(tmp_path)).get("c")
+    assert _scaled_sum.calls == 1
+    assert loaded.domain.dims == (dims.CellDim, dims.KDim)
+    assert np.array_equal(loaded.asnumpy(), computed)
+
+
+def test_field_cache_is_invalidated_by_parameters_and_inputs(tmp_path):
+    grid = simple.SimpleGrid()
+    a = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    b = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    _scaled_sum.calls = 0
+
+    _cached_source(grid, a, b, 2.0, factory.FieldCache(tmp_path)).get("c")
+    c = _cached_source(grid, a, b, 3.0, factory.FieldCache(tmp_path)).get("c")
+    assert _scaled_sum.calls == 2
+    assert np.allclose(c.asnumpy(), 3.0 * (a.asnumpy() + b.asnumpy()))
+
+    a_modified = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    c = _cached_source(grid, a_modified, b, 3.0, factory.FieldCache(tmp_path)).get("c")
+    assert _scaled_sum.calls == 3
+    assert np.allclose(c.asnumpy(), 3.0 * (a_modified.asnumpy() + b.asnumpy()))
+    assert len(list(tmp_path.glob("*.npz"))) == 3
+
+
+_HELPER_MODULE = """
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+def _helper(a: data_alloc.NDArray) -> data_alloc.NDArray:
+    return {expression}
+
+
+def scaled(a: data_alloc.NDArray, b: data_alloc.NDArray) -> data_alloc.NDArray:
+    return _helper(a) + b
+"""
+
+
+def _helper_source(grid, a, b, func, cache):
+    source = SimpleFieldSource(
+        data_={
+            "a": (a, {"standard_name": "a", "units": ""}),
+            "b": (b, {"standard_name": "b", "units": ""}),
+        },
+        backend=None,
+        grid=grid,
+    )
+    source.register_provider(
+        factory.NumpyFieldsProvider(
+            func=func, domain=(dims.CellDim, dims.KDim), fields=("c",), deps={"a": "a", "b": "b"}
+        )
+    )
+    source.set_cache(cache)
+    return source
+
+
+def test_field_cache_is_invalidated_by_changed_helper(tmp_path, monkeypatch):
+    module_dir = tmp_path / "modules"
+    module_dir.mkdir()
+    module_file = module_dir / "_cached_helper_module.py"
+    module_file.write_text(_HELPER_MODULE.format(expression="2.0 * a"))
+    monkeypatch.syspath_prepend(str(module_dir))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    module = importlib.import_module("_cached_helper_module")
+    try:
+        grid = simple.SimpleGrid()
+        a = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+        b = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+        cache_dir = tmp_path / "cache"
+
+        _helper_source(grid, a, b, module.scaled, factory.FieldCache(cache_dir)).get("c")
+        module_file.write_text(_HELPER_MODULE.format(expression="3.0 * a + 0.0"))
+        module = importlib.reload(module)
+        cache = factory.FieldCache(cache_dir)
+        c = _helper_source(grid, a, b, module.scaled, cache).get("c")
+    finally:
+        sys.modules.pop("_cached_helper_module", None)
+
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert np.allclose(c.asnumpy(), 3.0 * a.asnumpy() + b.asnumpy())
+
+
+def test_field_cache_is_invalidated_by_partial_arguments(tmp_path):
+    grid = simple.SimpleGrid()
+    a = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    b = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    _scaled_sum.calls = 0
+
+    for factor in (2.0, 3.0):
+        func = functools.partial(_scaled_sum, factor=factor)
+        c = _helper_source(grid, a, b, func, factory.FieldCache(tmp_path)).get("c")
+        assert np.allclose(c.asnumpy(), factor * (a.asnumpy() + b.asnumpy()))
+    assert _scaled_sum.calls == 2
+
+
+def _diamond_source(grid, barrier):
+    def left(a: data_alloc.NDArray) -> data_alloc.NDArray:
+        barrier.wait()
+        return a + 1.0
+
+    def right(a: data_alloc.NDArray) -> data_alloc.NDArray:
+        barrier.wait()
+        return 2.0 * a
+
+    def join(x: data_alloc.NDArray, y: data_alloc.NDArray) -> data_alloc.NDArray:
+        return x + y
+
+    a = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    source = SimpleFieldSource(
+        data_={"a": (a, {"standard_name": "a", "units": ""})}, backend=None, grid=grid
+    )
+    for func, field, deps in (
+        (left, "x", {"a": "a"}),
+        (right, "y", {"a": "a"}),
+        (join, "z", {"x": "x", "y": "y"}),
+    ):
+        source.register_provider(
+            factory.NumpyFieldsProvider(
+                func=func, domain=(dims.CellDim, dims.KDim), fields=(field,), deps=deps
+            )
+        )
+    return source, a
+
+
+def test_materialize_runs_independent_providers_concurrently():
+    # both branches of the diamond wait for each other: this only finishes if they run in parallel
+    barrier = threading.Barrier(2, timeout=10)
+    source, a = _diamond_source(simple.SimpleGrid(), barrier)
+
+    report = source.materialize(["z"], max_workers=2)
+
+    assert np.allclose(source.get("z").asnumpy(), 3.0 * a.asnumpy() + 1.0)
+    assert {t.name for t in report.timings} == {"left", "right", "join"}
+    join = next(t for t in report.timings if t.name == "join")
+    assert set(join.dependencies) == {"x", "y"}
+    assert all(t.end <= join.start for t in report.timings if t is not join)
+    path = report.critical_path()
+    assert len(path) == 2
+    assert path[-1] is join
+    assert "join -> z" in report.format()
+
+    assert source.materialize(["z", "x"]).timings == ()
+
+
+def test_materialize_raises_on_unknown_field():
+    source, _ = _diamond_source(simple.SimpleGrid(), threading.Barrier(1))
+    with pytest.raises(ValueError, match="not provided by the source"):
+        source.materialize(["z", "alice"])
+
+
+def _chain_source(grid):
+    def increment(a: data_alloc.NDArray) -> data_alloc.NDArray:
+        return a + 1.0
+
+    a = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    source = SimpleFieldSource(
+        data_={"a": (a, {"standard_name": "a", "units": ""})}, backend=None, grid=grid
+    )
+    for dependency, field in (("a", "x"), ("x", "y"), ("y", "z")):
+        source.register_provider(
+            factory.NumpyFieldsProvider(
+                func=increment,
+                domain=(dims.CellDim, dims.KDim),
+                fields=(field,),
+                deps={"a": dependency},
+            )
+        )
+    return source, a
+
+
+@pytest.mark.parametrize("evict", [False, True])
+def test_field_eviction_frees_intermediate_fields(evict):
+    source, a = _chain_source(simple.SimpleGrid())
+    eviction = factory.FieldEviction(evict=evict)
+    source.set_eviction(eviction)
+    field_bytes = a.ndarray.nbytes
+
+    source.materialize(["z"], max_workers=1)
+
+    assert np.allclose(source.get("z").asnumpy(), a.asnumpy() + 3.0)
+    if evict:
+        assert eviction.evicted == ["x", "y"]
+        assert eviction.live_bytes == field_bytes
+        assert eviction.peak_bytes == 2 * field_bytes
+        assert source._providers["x"].fields["x"] is None
+    else:
+        assert eviction.evicted == []
+        assert eviction.live_bytes == eviction.peak_bytes == 3 * field_bytes
+    assert source._providers["a"].fields["a"] is a
+
+    # freed fields are recomputed on request
+    assert np.allclose(source.get("y").asnumpy(), a.asnumpy() + 2.0)
+
+
+def test_provider_profiler_records_exclusive_times_and_exports_graph(tmp_path):
+    source, a = _chain_source(simple.SimpleGrid())
+    profiler = factory.ProviderProfiler()
+    source.set_profiler(profiler)
+
+    source.get("z")
+
+    records = profiler.records
+    assert [r.fields for r in records] == [("x",), ("y",), ("z",)]
+    for r in records:
+        assert r.name == "increment"
+        assert r.time >= 0.0
+        assert r.nbytes == a.ndarray.nbytes
+        assert r.backend == "embedded"
+        assert not r.device_copy
+
+    graph = profiler.to_json()
+    assert graph["critical_path"] == ["x", "y", "z"]
+    assert {(e["from"], e["to"]) for e in graph["edges"]} == {("a", "x"), ("x", "y"), ("y", "z")}
+    assert graph["total_time"] == pytest.approx(sum(r.time for r in records))
+
+    profiler.write(tmp_path / "profile.json")
+    with open(tmp_path / "profile.json") as f:
+        assert json.load(f) == graph
+    profiler.write(tmp_path / "profile.dot")
+    dot = (tmp_path / "profile.dot").read_text()
+    assert dot.startswith("digraph")
+    assert '"a" [shape=ellipse];' in dot
+    assert '"y" -> "z" [color="red"];' in dot
+
+
+class _DeviceAllocator:
+    __gt_device_type__ = data_alloc.CUDA_DEVICE_TYPES[0]
+
+
+class _DeviceBackend:
+    name = "gpu"
+    allocator = _DeviceAllocator()
+
+
+def test_provider_profiler_records_device_copy_of_numpy_providers():
+    def increment(a: data_alloc.NDArray) -> data_alloc.NDArray:
+        return a + 1.0
+
+    def generic_increment(a: data_alloc.NDArray, array_ns) -> data_alloc.NDArray:
+        return a + 1.0
+
+    source = SimpleFieldSource(data_={}, backend=_DeviceBackend(), grid=simple.SimpleGrid())
+    profiler = factory.ProviderProfiler()
+    for func in (increment, generic_increment):
+        provider = factory.NumpyFieldsProvider(
+            func=func, domain=(dims.CellDim, dims.KDim), fields=("x",), deps={"a": "a"}
+        )
+        with profiler.measure(provider, source):
+            pass
+
+    assert [(r.name, r.backend, r.device_copy) for r in profiler.records] == [
+        ("increment", "gpu", True),
+        ("generic_increment", "gpu", False),
+    ]
+
+
+def test_numpy_provider_runs_array_ns_generic_functions_without_copies():
+    grid = simple.SimpleGrid()
+    results = {}
+
+    def generic(a: data_alloc.NDArray, c2e: data_alloc.NDArray, array_ns=np) -> data_alloc.NDArray:
+        results["array_ns"] = array_ns
+        results["c2e"] = c2e
+        results["out"] = array_ns.sum(a[:, c2e.shape[1] :], axis=1)
+        return results["out"]
+
+    a = data_alloc.random_field(grid, dims.EdgeDim, dims.KDim)
+    source = SimpleFieldSource(
+        data_={"a": (a, {"standard_name": "a", "units": ""})}, backend=None, grid=grid
+    )
+    source.register_provider(
+        factory.NumpyFieldsProvider(
+            func=generic,
+            domain=(dims.EdgeDim,),
+            fields=("b",),
+            deps={"a": "a"},
+            connectivities={"c2e": dims.C2EDim},
+        )
+    )
+    b = source.get("b")
+    assert results["array_ns"] is data_alloc.import_array_ns(source.backend)
+    assert isinstance(results["c2e"], np.ndarray)
+    assert np.shares_memory(b.ndarray, results["out"])
+    assert np.allclose(b.asnumpy(), a.asnumpy()[:, 3:].sum(axis=1))
+
+
+def test_wrap_array_copies_without_buffer_constructor(monkeypatch):
+    array = np.ones((2, 3))
+    assert np.shares_memory(data_alloc.wrap_array((dims.CellDim, dims.KDim), array).ndarray, array)
+
+    monkeypatch.setattr(data_alloc, "_field_from_buffer", None)
+    field = data_alloc.wrap_array((dims.CellDim, dims.KDim), array)
+    assert not np.shares_memory(field.ndarray, array)
+    assert np.array_equal(field.asnumpy(), array)
@@ -0,0 +1,97 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.grid import simple
+from icon4py.model.common.utils import scratch_pool
+
+
+def test_temporaries_of_different_phases_share_fields():
+    grid = simple.SimpleGrid()
+    pool = scratch_pool.ScratchPool()
+    a = pool.zero_field(grid, dims.CellDim, dims.KDim, phase="a")
+    b = pool.zero_field(grid, dims.CellDim, dims.KDim, phase="b")
+    a_half = pool.zero_field(grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, phase="a")
+    b_half = pool.zero_field(grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, phase="b")
+    b_int = pool.zero_field(grid, dims.CellDim, dims.KDim, dtype=np.int32, phase="b")
+
+    assert a is b
+    assert a_half is b_half
+    assert a is not a_half
+    assert b_int is not b
+    allocated = a.ndarray.nbytes + a_half.ndarray.nbytes + b_int.ndarray.nbytes
+    assert pool.nbytes == allocated
+    assert pool.requested_nbytes == allocated + a.ndarray.nbytes + a_half.ndarray.nbytes
+
+
+def test_temporaries_of_same_phase_do_not_share_fields():
+    grid = simple.SimpleGrid()
+    pool = scratch_pool.ScratchPool()
+    a1 = pool.zero_field(grid, dims.EdgeDim, dims.KDim, phase="a")
+    a2 = pool.zero_field(grid, dims.EdgeDim, dims.KDim, phase="a")
+    b1 = pool.zero_field(grid, dims.EdgeDim, dims.KDim, phase="b")
+    b2 = pool.zero_field(grid, dims.EdgeDim, dims.KDim, phase="b")
+    b3 = pool.zero_field(grid, dims.EdgeDim, dims.KDim, phase="b")
+
+    assert a1 is not a2
+    assert {id(b1), id(b2)} == {id(a1), id(a2)}
+    assert b3 is not a1 and b3 is not a2
+    assert pool.nbytes == 3 * a1.ndarray.nbytes
+    assert pool.requested_nbytes == 5 * a1.ndarray.nbytes
+
+
+def test_enter_zeroes_fields_of_other_phases():
+    grid = simple.SimpleGrid()
+    pool = scratch_pool.ScratchPool()
+    a = pool.zero_field(grid, dims.CellDim, dims.KDim, phase="a")
+    b = pool.zero_field(grid, dims.CellDim, dims.KDim, phase="b")
+    only_b = pool.zero_field(grid, dims.CellDim, phase="b")
+
+    pool.enter("a")
+    a.ndarray[:] = 1.0
+    pool.enter("a")
+    assert np.all(a.asnumpy() == 1.0)
+
+    pool.enter("b")
+    assert np.all(b.asnumpy() == 0.0)
+    b.ndarray[:] = 2.0
+    only_b.ndarray[:] = 3.0
+    pool.enter("b")
+    assert np.all(b.asnumpy() == 2.0)
+
+    pool.enter("a")
+    assert np.all(a.asnumpy() == 0.0)
+    pool.enter("b")
+    assert np.all(only_b.asnumpy() == 3.0)
+
+
+def test_temporaries_live_in_several_phases():
+    grid = simple.SimpleGrid()
+    pool = scratch_pool.ScratchPool()
+    predictor = pool.zero_field(grid, dims.CellDim, dims.KDim, phase="predictor")
+    both = pool.zero_field(grid, dims.CellDim, dims.KDim, phase=("predictor", "corrector"))
+    corrector = pool.zero_field(grid, dims.CellDim, dims.KDim, phase="corrector")
+    advection = pool.zero_field(grid, dims.CellDim, dims.KDim, phase=("advection", "corrector"))
+
+    assert corrector is predictor
+    assert both is not predictor
+    assert advection is not predictor and advection is not both
+    assert pool.nbytes == 3 * predictor.ndarray.nbytes
+
+    pool.enter("predictor")
+    predictor.ndarray[:] = 1.0
+    both.ndarray[:] = 2.0
+    pool.enter("corrector")
+    assert np.all(corrector.asnumpy() == 0.0)
+    assert np.all(both.asnumpy() == 2.0)
+    corrector.ndarray[:] = 3.0
+    pool.enter("advection")
+    pool.enter("corrector")
+    assert np.all(corrector.asnumpy() == 3.0)
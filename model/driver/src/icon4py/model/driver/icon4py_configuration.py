@@ -9,6 +9,7 @@ import dataclasses
 import datetime
 import functools
 import logging
+from typing import Optional
 
 from icon4py.model.atmosphere.diffusion import diffusion
 from icon4py.model.atmosphere.dycore import solve_nonhydro as solve_nh
@@ -33,6 +34,18 @@ class Icon4pyRunConfig:
     n_substeps: int = 5
     """ndyn_substeps in ICON"""
 
+    adaptive_substeps: bool = False
+    """
+    Adapt the number of dynamics substeps to the maximum vertical CFL number of the previous time step.
+        Corresponds to set_dyn_substeps in ICON, which however never uses fewer than n_substeps.
+    """
+
+    min_substeps: Optional[int] = None
+    """Lower bound of the adaptive number of substeps, defaults to n_substeps."""
+
+    max_substeps: Optional[int] = None
+    """Upper bound of the adaptive number of substeps (ndyn_substeps_max in ICON), defaults to n_substeps + 3."""
+
     apply_initial_stabilization: bool = True
     """
     ltestcase in ICON
@@ -43,12 +56,23 @@ class Icon4pyRunConfig:
     restart_mode: bool = False
 
     def __post_init__(self):
+        if not 1 <= self.substep_bounds[0] <= self.n_substeps <= self.substep_bounds[1]:
+            raise ValueError(
+                f"Invalid bounds of the adaptive substeps: {self.substep_bounds} for n_substeps={self.n_substeps}."
+            )
         if self.backend_name not in model_backends.BACKENDS:
             raise ValueError(
                 f"Invalid driver backend: {self.backend_name}. \n"
                 f"Available backends are {', '.join([f'{k}' for k in model_backends.BACKENDS.keys()])}"
             )
 
+    @property
+    def substep_bounds(self) -> tuple[int, int]:
+        return (
+            self.min_substeps if self.min_substeps is not None else self.n_substeps,
+            self.max_substeps if self.max_substeps is not None else self.n_substeps + 3,
+        )
+
     @functools.cached_property
     def backend(self):
         return model_backends.BACKENDS[self.backend_name]
@@ -6,11 +6,12 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import contextlib
 import datetime
 import logging
 import pathlib
 import uuid
-from typing import Callable, NamedTuple
+from typing import Callable, Final, NamedTuple, Optional
 
 import click
 import numpy as np
@@ -22,11 +23,17 @@ from icon4py.model.atmosphere.diffusion import (
     diffusion_states,
 )
 from icon4py.model.atmosphere.dycore import dycore_states, solve_nonhydro as solve_nh
-from icon4py.model.common.decomposition import definitions as decomposition
+from icon4py.model.common import compilation
+from icon4py.model.common.decomposition import (
+    definitions as decomposition,
+    exchange_statistics as exchange_stats,
+    load_balance,
+)
 from icon4py.model.common.states import (
     diagnostic_state as diagnostics,
     prognostic_state as prognostics,
 )
+from icon4py.model.common.utils import scratch_pool
 from icon4py.model.driver import (
     icon4py_configuration as driver_config,
     initialization_utils as driver_init,
@@ -35,6 +42,11 @@ from icon4py.model.driver import (
 
 log = logging.getLogger(__name__)
 
+#: vertical CFL number at which velocity advection clips the contravariant vertical velocity
+_CLIPPING_VERTICAL_CFL: Final[float] = 0.85
+#: vertical CFL number the adaptive substepping keeps below when it removes a substep
+_TARGET_VERTICAL_CFL: Final[float] = 0.75
+
 
 class TimeLoop:
     @classmethod
@@ -46,17 +58,24 @@ class TimeLoop:
         run_config: driver_config.Icon4pyRunConfig,
         diffusion_granule: diffusion.Diffusion,
         solve_nonhydro_granule: solve_nh.SolveNonhydro,
+        exchange_statistics: Optional[exchange_stats.ExchangeStatistics] = None,
+        load_recorder: Optional[load_balance.LoadRecorder] = None,
+        process_props: Optional[decomposition.ProcessProperties] = None,
     ):
         self.run_config: driver_config.Icon4pyRunConfig = run_config
         self.diffusion = diffusion_granule
         self.solve_nonhydro = solve_nonhydro_granule
+        self.exchange_statistics = exchange_statistics
+        self.load_recorder = load_recorder
+        self._process_props = process_props
 
         self._n_time_steps: int = int(
             (self.run_config.end_date - self.run_config.start_date) / self.run_config.dtime
         )
         self.dtime_in_seconds: float = self.run_config.dtime.total_seconds()
-        self._n_substeps_var: int = self.run_config.n_substeps
-        self._substep_timestep: float = float(self.dtime_in_seconds / self._n_substeps_var)
+        self._n_substeps_var: int
+        self._substep_timestep: float
+        self._set_n_substeps_var(self.run_config.n_substeps)
 
         self._validate_config()
 
@@ -68,7 +87,7 @@ class TimeLoop:
     def re_init(self):
         self._simulation_date = self.run_config.start_date
         self._is_first_step_in_simulation = True
-        self._n_substeps_var = self.run_config.n_substeps
+        self._set_n_substeps_var(self.run_config.n_substeps)
 
     def _validate_config(self):
         if self._n_time_steps < 0:
@@ -92,6 +111,41 @@ class TimeLoop:
     def n_substeps_var(self):
         return self._n_substeps_var
 
+    def _set_n_substeps_var(self, n_substeps: int):
+        self._n_substeps_var = n_substeps
+        self._substep_timestep = float(self.dtime_in_seconds / n_substeps)
+
+    def _global_max_vertical_cfl(self) -> float:
+        max_vertical_cfl = self.solve_nonhydro.velocity_advection.pop_max_vertical_cfl()
+        if self._process_props is not None and self._process_props.comm_size > 1:
+            max_vertical_cfl = max(self._process_props.comm.allgather(max_vertical_cfl))
+        return max_vertical_cfl
+
+    def _adapt_n_substeps(self, max_vertical_cfl: float):
+        """
+        Adapt the number of dynamics substeps of the next time step to the vertical CFL number.
+
+        Similar to set_dyn_substeps in ICON: a substep is added when the vertical CFL number of the
+        last time step exceeded the clipping limit of velocity advection, and one is removed when the
+        CFL number, scaled to the longer substeps, stays below _TARGET_VERTICAL_CFL. The number of
+        substeps is kept within `Icon4pyRunConfig.substep_bounds`.
+        """
+        n_substeps = self._n_substeps_var
+        min_substeps, max_substeps = self.run_config.substep_bounds
+        if max_vertical_cfl > _CLIPPING_VERTICAL_CFL:
+            n_substeps = min(n_substeps + 1, max_substeps)
+        elif (
+            n_substeps > min_substeps
+            and max_vertical_cfl * n_substeps / (n_substeps - 1) < _TARGET_VERTICAL_CFL
+        ):
+            n_substeps -= 1
+        if n_substeps != self._n_substeps_var:
+            log.info(
+                f"maximum vertical CFL number {max_vertical_cfl:.3f}, changing the number of dynamics "
+                f"substeps from {self._n_substeps_var} to {n_substeps}"
+            )
+            self._set_n_substeps_var(n_substeps)
+
     @property
     def simulation_date(self):
         return self._simulation_date
@@ -104,9 +158,52 @@ class TimeLoop:
     def substep_timestep(self):
         return self._substep_timestep
 
+    def _timed(self, granule: str) -> contextlib.AbstractContextManager:
+        return (
+            self.load_recorder.time(granule)
+            if self.load_recorder is not None
+            else contextlib.nullcontext()
+        )
+
     def _full_name(self, func: Callable):
         return ":".join((self.__class__.__name__, func.__name__))
 
+    def precompile(
+        self,
+        diffusion_diagnostic_state: diffusion_states.DiffusionDiagnosticState,
+        solve_nonhydro_diagnostic_state: dycore_states.DiagnosticStateNonHydro,
+        prognostic_states: common_utils.TimeStepPair[prognostics.PrognosticState],
+        prep_adv: dycore_states.PrepAdvection,
+        initial_divdamp_fac_o2: float,
+        do_prep_adv: bool,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Compile all programs of the granules used in :meth:`time_integration` concurrently.
+
+        Takes the same arguments as :meth:`time_integration`, which are not modified.
+        """
+        log.info("precompiling programs of the granules")
+        tasks = self.solve_nonhydro.compile_tasks(
+            solve_nonhydro_diagnostic_state,
+            prognostic_states,
+            prep_adv,
+            divdamp_fac_o2=initial_divdamp_fac_o2,
+            dtime=self._substep_timestep,
+            lprep_adv=do_prep_adv,
+        )
+        if self.diffusion.config.apply_to_horizontal_wind:
+            tasks.extend(
+                self.diffusion.compile_tasks(
+                    diffusion_diagnostic_state,
+                    prognostic_states.current,
+                    self.dtime_in_seconds,
+                    with_initial_run=self.run_config.apply_initial_stabilization
+                    and self._is_first_step_in_simulation,
+                )
+            )
+        compilation.compile_all(tasks, max_workers=max_workers)
+
     def time_integration(
         self,
         diffusion_diagnostic_state: diffusion_states.DiffusionDiagnosticState,
@@ -157,6 +254,8 @@ class TimeLoop:
             # TODO (Chia Rui): check with Anurag about printing of max and min of variables. Currently, these max values are only output at debug level. There should be namelist parameters to control which variable max should be output.
 
             self._next_simulation_date()
+            if self.exchange_statistics is not None:
+                self.exchange_statistics.next_step()
 
             # update boundary condition
 
@@ -173,7 +272,8 @@ class TimeLoop:
 
             self._is_first_step_in_simulation = False
 
-            # TODO (Chia Rui): modify n_substeps_var if cfl condition is not met. (set_dyn_substeps subroutine)
+            if self.run_config.adaptive_substeps:
+                self._adapt_n_substeps(self._global_max_vertical_cfl())
 
             # TODO (Chia Rui): compute diagnostic variables: P, T, zonal and meridonial winds, necessary for JW test output (diag_for_output_dyn subroutine)
 
@@ -201,11 +301,12 @@ class TimeLoop:
         )
 
         if self.diffusion.config.apply_to_horizontal_wind:
-            self.diffusion.run(
-                diffusion_diagnostic_state,
-                prognostic_states.next,
-                self.dtime_in_seconds,
-            )
+            with self._timed("diffusion"):
+                self.diffusion.run(
+                    diffusion_diagnostic_state,
+                    prognostic_states.next,
+                    self.dtime_in_seconds,
+                )
 
         prognostic_states.swap()
 
@@ -272,17 +373,19 @@ class TimeLoop:
                 at_initial_timestep=self._is_first_step_in_simulation,
             )
 
-            self.solve_nonhydro.time_step(
-                solve_nonhydro_diagnostic_state,
-                prognostic_states,
-                prep_adv=prep_adv,
-                divdamp_fac_o2=initial_divdamp_fac_o2,
-                dtime=self._substep_timestep,
-                at_initial_timestep=self._is_first_step_in_simulation,
-                lprep_adv=do_prep_adv,
-                at_first_substep=self._is_first_substep(dyn_substep),
-                at_last_substep=self._is_last_substep(dyn_substep),
-            )
+            with self._timed("solve_nonhydro"):
+                self.solve_nonhydro.time_step(
+                    solve_nonhydro_diagnostic_state,
+                    prognostic_states,
+                    prep_adv=prep_adv,
+                    divdamp_fac_o2=initial_divdamp_fac_o2,
+                    dtime=self._substep_timestep,
+                    at_initial_timestep=self._is_first_step_in_simulation,
+                    lprep_adv=do_prep_adv,
+                    at_first_substep=self._is_first_substep(dyn_substep),
+                    at_last_substep=self._is_last_substep(dyn_substep),
+                    ndyn_substeps_var=self._n_substeps_var,
+                )
 
             if not self._is_last_substep(dyn_substep):
                 prognostic_states.swap()
@@ -329,6 +432,8 @@ def initialize(
     grid_root,
     grid_level,
     icon4py_driver_backend: str,
+    record_exchange_statistics: bool = False,
+    record_load_balance: bool = False,
 ) -> tuple[TimeLoop, DriverStates, DriverParams]:
     """
     Initialize the driver run.
@@ -348,6 +453,8 @@ def initialize(
         grid_id: Grid ID.
         grid_root: Grid root.
         grid_level: Grid level.
+        record_exchange_statistics: Record communication statistics of all halo exchanges.
+        record_load_balance: Record the compute time per granule of this rank.
 
     Returns:
         TimeLoop: Time loop object.
@@ -411,6 +518,11 @@ def initialize(
     log.info("initializing diffusion")
     diffusion_params = diffusion.DiffusionParams(config.diffusion_config)
     exchange = decomposition.create_exchange(props, decomp_info)
+    if record_exchange_statistics or record_load_balance:
+        # the load recorder uses the exchange statistics to exclude halo exchange waits
+        exchange = exchange_stats.InstrumentedExchange(exchange, props, decomp_info)
+    # diffusion and solve_nonhydro never run at the same time and share their temporaries
+    scratch = scratch_pool.ScratchPool(config.run_config.backend)
     diffusion_granule = diffusion.Diffusion(
         icon_grid,
         config.diffusion_config,
@@ -422,6 +534,7 @@ def initialize(
         cell_geometry,
         exchange=exchange,
         backend=config.run_config.backend,
+        scratch=scratch,
     )
 
     nonhydro_params = solve_nh.NonHydrostaticParams(config.solve_nonhydro_config)
@@ -437,7 +550,10 @@ def initialize(
         edge_geometry=edge_geometry,
         cell_geometry=cell_geometry,
         owner_mask=c_owner_mask,
+        exchange=exchange,
+        scratch=scratch,
     )
+    scratch.log_summary()
 
     (
         diffusion_diagnostic_state,
@@ -462,6 +578,11 @@ def initialize(
         run_config=config.run_config,
         diffusion_granule=diffusion_granule,
         solve_nonhydro_granule=solve_nonhydro_granule,
+        exchange_statistics=exchange.statistics if record_exchange_statistics else None,
+        load_recorder=load_balance.LoadRecorder(decomp_info, exchange.statistics)
+        if record_load_balance
+        else None,
+        process_props=props,
     )
 
     return (
@@ -532,6 +653,24 @@ def initialize(
     required=True,
     help="Backend for all components executed in icon4py driver. For performance and stability, it is advised to choose between gtfn_cpu or gtfn_cpu. Please see abs_path_to_icon4py/model/common/src/icon4py/model/common/model_backends.py) ",
 )
+@click.option(
+    "--exchange_statistics",
+    is_flag=True,
+    help="Record communication statistics of the halo exchanges and write them to 'exchange_statistics.json' in the run_path.",
+)
+@click.option(
+    "--load_balance",
+    "record_load_balance",
+    is_flag=True,
+    help="Record the compute time per granule and rank and write it to 'load_balance.json' in the run_path, "
+    "see 'python -m icon4py.model.common.decomposition.load_balance' for repartitioning.",
+)
+@click.option(
+    "--precompile",
+    is_flag=True,
+    help="Compile all programs of the granules concurrently before the time loop starts instead of on their "
+    "first call. Set GT4PY_BUILD_CACHE_LIFETIME=persistent to reuse the compiled programs in later runs.",
+)
 def icon4py_driver(
     input_path,
     run_path,
@@ -543,6 +682,9 @@ def icon4py_driver(
     grid_level,
     enable_output,
     icon4py_driver_backend,
+    exchange_statistics,
+    record_load_balance,
+    precompile,
 ) -> None:
     """
     usage: python dycore_driver.py abs_path_to_icon4py/testdata/ser_icondata/mpitask1/mch_ch_r04b09_dsl/ser_data
@@ -580,6 +722,8 @@ def icon4py_driver(
         grid_root,
         grid_level,
         icon4py_driver_backend,
+        record_exchange_statistics=exchange_statistics,
+        record_load_balance=record_load_balance,
     )
     log.info(f"Starting ICON dycore run: {time_loop.simulation_date.isoformat()}")
     log.info(
@@ -589,6 +733,17 @@ def icon4py_driver(
     log.info(f"input args: input_path={input_path}, n_time_steps={time_loop.n_time_steps}")
 
     log.info("dycore configuring: DONE")
+
+    if precompile:
+        time_loop.precompile(
+            ds.diffusion_diagnostic,
+            ds.solve_nonhydro_diagnostic,
+            ds.prognostics,
+            ds.prep_advection_prognostic,
+            dp.divdamp_fac_o2,
+            do_prep_adv=False,
+        )
+
     log.info("time loop: START")
 
     time_loop.time_integration(
@@ -602,6 +757,23 @@ def icon4py_driver(
 
     log.info("time loop:  DONE")
 
+    if time_loop.exchange_statistics is not None:
+        report = exchange_stats.reduce_statistics(time_loop.exchange_statistics, parallel_props)
+        if report is not None:
+            log.info(exchange_stats.format_table(report))
+            exchange_stats.write_json(report, pathlib.Path(run_path) / "exchange_statistics.json")
+
+    if time_loop.load_recorder is not None:
+        measurement = load_balance.gather_measurement(time_loop.load_recorder, parallel_props)
+        if measurement is not None:
+            log.info(
+                f"load imbalance factor (max/mean): {measurement.imbalance():.3f}, per granule: "
+                f"{measurement.granule_imbalance()}"
+            )
+            load_balance.write_measurement(
+                measurement, pathlib.Path(run_path) / "load_balance.json"
+            )
+
 
 if __name__ == "__main__":
     icon4py_driver()
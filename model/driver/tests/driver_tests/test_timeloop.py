@@ -6,6 +6,9 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import datetime
+import types
+
 import pytest
 
 import icon4py.model.common.grid.states as grid_states
@@ -13,9 +16,10 @@ import icon4py.model.common.utils as common_utils
 from icon4py.model.atmosphere.diffusion import diffusion
 from icon4py.model.atmosphere.dycore import dycore_states, solve_nonhydro as solve_nh
 from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import definitions as decomposition
 from icon4py.model.common.grid import vertical as v_grid
 from icon4py.model.common.states import prognostic_state as prognostics
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import data_allocation as data_alloc, scratch_pool
 from icon4py.model.driver import (
     icon4py_configuration,
     icon4py_driver,
@@ -30,6 +34,24 @@ from .utils import (
 )
 
 
+class _RecordingExchange(decomposition.SingleNodeExchange):
+    """Single node exchange that records the fields it exchanges and those in reduced precision."""
+
+    def __init__(self):
+        self.reduced_precision = decomposition.ReducedPrecisionFields()
+        self.exchanged_fields = []
+
+    def use_reduced_precision(self, *fields):
+        self.reduced_precision.add(*fields)
+
+    def exchange(self, dim, *fields):
+        self.exchanged_fields.extend(fields)
+        return super().exchange(dim, *fields)
+
+    def exchange_and_wait(self, dim, *fields):
+        self.exchange(dim, *fields).wait()
+
+
 @pytest.mark.embedded_remap_error
 @pytest.mark.datatest
 @pytest.mark.parametrize(
@@ -107,6 +129,10 @@ from .utils import (
         ),
     ],
 )
+@pytest.mark.parametrize(
+    "shared_scratch, reduced_precision_halo_fields",
+    [(False, ()), (True, ()), (True, ("z_rho_e", "z_dwdz_dd"))],
+)
 def test_run_timeloop_single_step(
     experiment,
     timeloop_date_init,
@@ -127,6 +153,8 @@ def test_run_timeloop_single_step(
     savepoint_nonhydro_init,
     savepoint_nonhydro_exit,
     vn_only,
+    shared_scratch,
+    reduced_precision_halo_fields,
     backend,
 ):
     if experiment == dt_utils.GAUSS3D_EXPERIMENT:
@@ -149,6 +177,7 @@ def test_run_timeloop_single_step(
             timeloop_diffusion_linit_init,
             ndyn_substeps=ndyn_substeps,
         )
+    nonhydro_config.reduced_precision_halo_fields = reduced_precision_halo_fields
 
     edge_geometry: grid_states.EdgeParams = grid_savepoint.construct_edge_geometry()
     cell_geometry: grid_states.CellParams = grid_savepoint.construct_cell_geometry()
@@ -172,6 +201,8 @@ def test_run_timeloop_single_step(
         _min_index_flat_horizontal_grad_pressure=grid_savepoint.nflat_gradp(),
     )
     additional_parameters = diffusion.DiffusionParams(diffusion_config)
+    scratch = scratch_pool.ScratchPool(backend) if shared_scratch else None
+    exchange = _RecordingExchange()
 
     diffusion_granule = diffusion.Diffusion(
         grid=icon_grid,
@@ -183,6 +214,7 @@ def test_run_timeloop_single_step(
         edge_params=edge_geometry,
         cell_params=cell_geometry,
         backend=backend,
+        scratch=scratch,
     )
 
     sp = savepoint_nonhydro_init
@@ -266,7 +298,12 @@ def test_run_timeloop_single_step(
         cell_geometry=cell_geometry,
         owner_mask=grid_savepoint.c_owner_mask(),
         backend=backend,
+        exchange=exchange,
+        scratch=scratch,
     )
+    if shared_scratch:
+        scratch.log_summary()
+        assert scratch.nbytes < scratch.requested_nbytes
 
     diffusion_diagnostic_state = driver_sb.construct_diagnostics_for_diffusion(
         timeloop_diffusion_savepoint_init,
@@ -376,3 +413,99 @@ def test_run_timeloop_single_step(
         prognostic_states.current.rho.asnumpy(),
         rho_sp.asnumpy(),
     )
+
+    reduced_precision_fields = [
+        getattr(solve_nonhydro_granule.intermediate_fields, name)
+        for name in reduced_precision_halo_fields
+    ]
+    assert all(field in exchange.reduced_precision for field in reduced_precision_fields)
+    assert any(
+        field is solve_nonhydro_granule.intermediate_fields.z_rho_e
+        for field in exchange.exchanged_fields
+    )
+    assert all(
+        field not in exchange.reduced_precision
+        for field in exchange.exchanged_fields
+        if not any(field is reduced for reduced in reduced_precision_fields)
+    )
+
+
+def test_adaptive_substeps():
+    run_config = icon4py_configuration.Icon4pyRunConfig(
+        backend_name="roundtrip",
+        dtime=datetime.timedelta(seconds=12.0),
+        n_substeps=5,
+        adaptive_substeps=True,
+        min_substeps=3,
+        max_substeps=6,
+    )
+    timeloop = icon4py_driver.TimeLoop(run_config, None, None)
+    assert timeloop.n_substeps_var == 5
+
+    timeloop._adapt_n_substeps(0.9)
+    assert timeloop.n_substeps_var == 6
+    assert timeloop.substep_timestep == 2.0
+    timeloop._adapt_n_substeps(1.2)
+    assert timeloop.n_substeps_var == 6
+    # 0.7 would become 0.84 with 5 substeps
+    timeloop._adapt_n_substeps(0.7)
+    assert timeloop.n_substeps_var == 6
+
+    for _ in range(5):
+        timeloop._adapt_n_substeps(0.0)
+    assert timeloop.n_substeps_var == 3
+    assert timeloop.substep_timestep == 4.0
+
+    timeloop.re_init()
+    assert timeloop.n_substeps_var == 5
+    assert timeloop.substep_timestep == 2.4
+
+
+class _RecordingSolveNonhydro:
+    """Stands in for SolveNonhydro and records the arguments of the substeps."""
+
+    def __init__(self):
+        self.substeps = []
+
+    def time_step(self, *args, **kwargs):
+        self.substeps.append(kwargs)
+
+
+def test_adapted_substeps_are_passed_to_solve_nonhydro():
+    run_config = icon4py_configuration.Icon4pyRunConfig(
+        backend_name="roundtrip",
+        dtime=datetime.timedelta(seconds=12.0),
+        n_substeps=5,
+        adaptive_substeps=True,
+        max_substeps=6,
+    )
+    solve_nonhydro = _RecordingSolveNonhydro()
+    timeloop = icon4py_driver.TimeLoop(run_config, None, solve_nonhydro)
+    diagnostic_state = types.SimpleNamespace(
+        vertical_wind_advective_tendency=common_utils.PredictorCorrectorPair(None, None),
+        normal_wind_advective_tendency=common_utils.PredictorCorrectorPair(None, None),
+    )
+
+    timeloop._adapt_n_substeps(0.9)
+    timeloop._do_dyn_substepping(
+        diagnostic_state,
+        common_utils.TimeStepPair(None, None),
+        prep_adv=None,
+        initial_divdamp_fac_o2=0.0,
+        do_prep_adv=True,
+    )
+
+    # the mass fluxes for advection and exner_dyn_incr are scaled by the adapted number of substeps
+    assert len(solve_nonhydro.substeps) == 6
+    assert all(substep["ndyn_substeps_var"] == 6 for substep in solve_nonhydro.substeps)
+    assert all(substep["dtime"] == 2.0 for substep in solve_nonhydro.substeps)
+    assert [substep["at_last_substep"] for substep in solve_nonhydro.substeps] == [False] * 5 + [
+        True
+    ]
+
+
+def test_invalid_substep_bounds():
+    with pytest.raises(ValueError):
+        icon4py_configuration.Icon4pyRunConfig(
+            backend_name="roundtrip", n_substeps=5, max_substeps=4
+        )
@@ -79,6 +79,7 @@ def apply_markers(
     grid: base.BaseGrid,
     backend: gtx_backend.Backend | None,
     is_datatest: bool = False,
+    is_slow: bool = False,
 ):
     for marker in markers:
         match marker.name:
@@ -101,6 +102,8 @@ def apply_markers(
                     )
             case "datatest" if not is_datatest:
                 pytest.skip("need '--datatest' option to run")
+            case "slow" if not is_slow:
+                pytest.skip("need '--slow' option to run")
 
 
 @dataclass(frozen=True)
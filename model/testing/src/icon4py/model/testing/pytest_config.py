@@ -67,6 +67,9 @@ def grid(request, backend):
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "datatest: this test uses binary data")
+    config.addinivalue_line(
+        "markers", "slow: this test takes long, for example a benchmark on a large grid"
+    )
     config.addinivalue_line(
         "markers", "with_netcdf: test uses netcdf which is an optional dependency"
     )
@@ -92,6 +95,16 @@ def pytest_addoption(parser):
     except ValueError:
         pass
 
+    try:
+        parser.addoption(
+            "--slow",
+            action="store_true",
+            help="Run slow tests, for example benchmarks of reference loop implementations on large grids.",
+            default=False,
+        )
+    except ValueError:
+        pass
+
     try:
         # TODO (samkellerhals): set embedded to default as soon as all tests run in embedded mode
         parser.addoption(
@@ -162,6 +175,7 @@ def pytest_runtest_setup(item):
         grid,
         backend,
         is_datatest=item.config.getoption("--datatest"),
+        is_slow=item.config.getoption("--slow"),
     )
 
 
@@ -60,6 +60,7 @@ def benchmark_model(session: nox.Session, subpackage: ModelSubpackagePath) -> No
             *f"pytest \
             -v \
             --benchmark-only \
+            --slow \
             --benchmark-warmup=on \
             --benchmark-warmup-iterations=30 \
             --benchmark-json={results_json_path}".split(),